@@ -84,8 +84,9 @@ def get_current_user(
 ) -> User:
     """Get current user from JWT token"""
     user_id = token_payload.get("sub")
-    user = session.query(User).filter_by(id=user_id, active_status=True).first()
-    if user is None:
+    # Identity map lookup, so the sub-requests of a batch sharing the session reuse the loaded user
+    user = session.get(User, user_id)
+    if user is None or not user.active_status:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="User not found or inactive",
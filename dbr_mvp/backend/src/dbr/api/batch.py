@@ -0,0 +1,207 @@
+# src/dbr/api/batch.py
+import json
+import re
+from typing import Any, Dict, List, Optional, Tuple
+from urllib.parse import urlencode
+from fastapi import APIRouter, Depends, HTTPException, Request
+from pydantic import BaseModel, Field
+from dbr.core import database
+from dbr.core.database import BatchSession, batch_session
+from dbr.models.user import User
+
+# Import auth dependency
+try:
+    from dbr.api.auth import get_current_user
+except ImportError:
+    # Handle circular import during testing
+    def get_current_user():
+        from dbr.api.auth import get_current_user as _get_current_user
+        return _get_current_user
+
+
+router = APIRouter(prefix="/batch", tags=["Batch"])
+
+# Maximum number of sub-requests in one batch
+MAX_BATCH_SIZE = 100
+
+API_PREFIX = "/api/v1/"
+# Streaming and nested batch requests cannot be answered inside a batch
+EXCLUDED_PREFIXES = ("/api/v1/batch", "/api/v1/events")
+
+# "${<index>.<field>.<field>}" refers to a field of an earlier sub-request's response body
+REFERENCE_PATTERN = re.compile(r"\$\{(\d+)((?:\.[\w-]+)+)\}")
+
+
+class BatchOperation(BaseModel):
+    method: str = Field(..., description="HTTP method (GET, POST, PUT, PATCH or DELETE)")
+    path: str = Field(..., description="API path, e.g. /api/v1/workitems; may contain ${index.field} references")
+    query: Optional[Dict[str, Any]] = Field(None, description="Query parameters")
+    body: Optional[Any] = Field(None, description="JSON request body")
+    headers: Optional[Dict[str, str]] = Field(None, description="Additional request headers")
+
+
+class BatchRequest(BaseModel):
+    operations: List[BatchOperation] = Field(..., min_length=1, max_length=MAX_BATCH_SIZE, description="Sub-requests, run in order")
+    atomic: bool = Field(False, description="Run all sub-requests in one transaction and roll it back if any fails")
+
+
+class BatchOperationResult(BaseModel):
+    status: int
+    headers: Dict[str, str]
+    body: Any
+
+
+class BatchResponse(BaseModel):
+    atomic: bool
+    committed: bool
+    results: List[BatchOperationResult]
+
+
+def _lookup(results: List[BatchOperationResult], index: int, fields: str) -> Any:
+    """Value of a dotted field in an earlier sub-request's response body"""
+    if index >= len(results):
+        raise ValueError(f"Reference to sub-request {index} before it ran")
+    value = results[index].body
+    for field in fields.strip(".").split("."):
+        if isinstance(value, list) and field.isdigit() and int(field) < len(value):
+            value = value[int(field)]
+        elif isinstance(value, dict) and field in value:
+            value = value[field]
+        else:
+            raise ValueError(f"Sub-request {index} response has no field {fields.strip('.')}")
+    return value
+
+
+def _resolve(value: Any, results: List[BatchOperationResult]) -> Any:
+    """Replace ${index.field} references in strings, lists and dicts"""
+    if isinstance(value, str):
+        match = REFERENCE_PATTERN.fullmatch(value)
+        if match:
+            # A lone reference keeps the referenced value's type
+            return _lookup(results, int(match.group(1)), match.group(2))
+        return REFERENCE_PATTERN.sub(lambda m: str(_lookup(results, int(m.group(1)), m.group(2))), value)
+    if isinstance(value, list):
+        return [_resolve(item, results) for item in value]
+    if isinstance(value, dict):
+        return {key: _resolve(item, results) for key, item in value.items()}
+    return value
+
+
+async def _dispatch(request: Request, method: str, path: str, query: Dict[str, Any],
+                    body: Any, headers: Dict[str, str]) -> BatchOperationResult:
+    """Run one sub-request through the application in-process"""
+    payload = json.dumps(body).encode() if body is not None else b""
+    raw_headers = [(b"content-type", b"application/json")]
+    authorization = request.headers.get("authorization")
+    if authorization:
+        raw_headers.append((b"authorization", authorization.encode()))
+    raw_headers.extend((name.lower().encode(), value.encode()) for name, value in headers.items())
+    path, _, path_query = path.partition("?")
+    query_string = "&".join(part for part in (path_query, urlencode(query, doseq=True)) if part)
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": method,
+        "scheme": request.url.scheme,
+        "path": path,
+        "raw_path": path.encode(),
+        "root_path": "",
+        "query_string": query_string.encode(),
+        "headers": raw_headers,
+        "client": request.scope.get("client"),
+        "server": request.scope.get("server"),
+    }
+
+    async def receive():
+        return {"type": "http.request", "body": payload, "more_body": False}
+
+    start: Dict[str, Any] = {}
+    chunks: List[bytes] = []
+
+    async def send(message):
+        if message["type"] == "http.response.start":
+            start.update(message)
+        elif message["type"] == "http.response.body":
+            chunks.append(message.get("body", b""))
+
+    try:
+        await request.app(scope, receive, send)
+    except Exception:
+        # Unhandled errors have already been answered with a 500 by the error middleware
+        if not start:
+            return BatchOperationResult(status=500, headers={}, body={"detail": "Internal Server Error"})
+
+    response_headers = {
+        name.decode(): value.decode() for name, value in start.get("headers", [])
+        if name.lower() not in (b"content-length",)
+    }
+    content = b"".join(chunks)
+    if content and response_headers.get("content-type", "").startswith("application/json"):
+        response_body = json.loads(content)
+    else:
+        response_body = content.decode() or None
+    return BatchOperationResult(status=start.get("status", 500), headers=response_headers, body=response_body)
+
+
+def _validate_operation(operation: BatchOperation) -> Tuple[str, str]:
+    method = operation.method.upper()
+    if method not in ("GET", "POST", "PUT", "PATCH", "DELETE"):
+        raise HTTPException(status_code=422, detail=f"Invalid method: {operation.method}")
+    if not operation.path.startswith(API_PREFIX) or operation.path.startswith(EXCLUDED_PREFIXES):
+        raise HTTPException(status_code=422, detail=f"Path not allowed in a batch: {operation.path}")
+    return method, operation.path
+
+
+@router.post("", response_model=BatchResponse)
+async def run_batch(
+    batch: BatchRequest,
+    request: Request,
+    current_user: User = Depends(get_current_user)
+):
+    """Run several API requests in one round trip
+
+    Sub-requests run in order through the regular endpoints, with the
+    caller's credentials and one shared database session. Strings of the
+    form ``${index.field}`` are replaced with a field of an earlier
+    sub-request's response, e.g. ``${0.id}`` for the ID created by the first
+    one. With ``atomic`` the batch stops at the first sub-request that fails
+    (status 400 or above) and rolls back everything; otherwise every
+    sub-request runs and commits on its own, and the writes of a failed
+    one are rolled back.
+    """
+    operations = [_validate_operation(operation) for operation in batch.operations]
+
+    session = BatchSession(**database.SessionLocal.kw) if batch.atomic else database.SessionLocal()
+    token = batch_session.set(session)
+    results: List[BatchOperationResult] = []
+    committed = False
+    try:
+        for operation, (method, path) in zip(batch.operations, operations):
+            try:
+                resolved_path = _resolve(path, results)
+                query = _resolve(operation.query or {}, results)
+                body = _resolve(operation.body, results)
+            except ValueError as e:
+                result = BatchOperationResult(status=422, headers={}, body={"detail": str(e)})
+            else:
+                result = await _dispatch(request, method, resolved_path, query, body, operation.headers or {})
+            results.append(result)
+            if result.status >= 400:
+                if batch.atomic:
+                    break
+                # Discard what the failed sub-request wrote before failing, so the next one does not commit it
+                session.rollback()
+        if batch.atomic:
+            if all(result.status < 400 for result in results):
+                session.commit_batch()
+                committed = True
+            else:
+                session.rollback()
+        else:
+            committed = True
+    finally:
+        batch_session.reset(token)
+        session.close()
+
+    return BatchResponse(atomic=batch.atomic, committed=committed, results=results)
@@ -0,0 +1,106 @@
+# src/dbr/api/boards.py
+from typing import List, Optional, Dict
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
+from sqlalchemy.orm import Session
+from pydantic import BaseModel
+from dbr.core.database import get_db
+from dbr.core.data_version import TIME_UNITS
+from dbr.core.etag import conditional_get
+from dbr.models.organization import Organization
+from dbr.models.board_config import BoardConfig
+from dbr.services.dbr_engine import DBREngine
+
+
+router = APIRouter(prefix="/boards", tags=["Boards"])
+
+# Tables the ETag-tagged snapshot is derived from
+BOARD_SNAPSHOT_TABLES = ("schedules", "work_items", "board_configs", "ccrs", TIME_UNITS)
+
+
+# Pydantic schemas for response
+class BoardWorkItemSummary(BaseModel):
+    id: str
+    title: str
+    status: str
+    priority: str
+    due_date: Optional[str]
+    total_ccr_hours: float
+    throughput: float
+    progress_percentage: float
+    responsible_user_id: Optional[str]
+
+
+class BoardScheduleSummary(BaseModel):
+    id: str
+    status: str
+    work_item_count: int
+    total_ccr_hours: float
+    work_items: List[BoardWorkItemSummary]
+
+
+class BoardConfigSummary(BaseModel):
+    id: str
+    name: str
+    description: Optional[str]
+    ccr_id: str
+    pre_constraint_buffer_size: int
+    post_constraint_buffer_size: int
+    buffer_yellow_ratio: float
+    buffer_green_ratio: float
+    time_unit: str
+    is_active: bool
+
+
+class BoardCCRSummary(BaseModel):
+    id: str
+    name: str
+    ccr_type: str
+    capacity_per_time_unit: float
+    time_unit: str
+    is_active: bool
+
+
+class BoardSnapshotResponse(BaseModel):
+    organization_id: str
+    board_config: BoardConfigSummary
+    ccr: Optional[BoardCCRSummary]
+    total_active_schedules: int
+    status_counts: Dict[str, int]
+    position_map: Dict[int, List[BoardScheduleSummary]]
+    current_time: str
+
+
+def _validate_organization_access(session: Session, organization_id: str) -> Organization:
+    """Validate that the organization exists and user has access"""
+    org = session.query(Organization).filter_by(id=organization_id).first()
+    if not org:
+        raise HTTPException(status_code=403, detail="Access denied to organization")
+    return org
+
+
+@router.get("/{board_config_id}/snapshot", response_model=BoardSnapshotResponse)
+def get_board_snapshot(
+    request: Request,
+    response: Response,
+    board_config_id: str,
+    organization_id: str = Query(..., description="Organization ID to scope the request"),
+    session: Session = Depends(get_db)
+):
+    """Get the board config, its CCR and the active schedules by position with their work items, in one call"""
+
+    # Validate organization access
+    _validate_organization_access(session, organization_id)
+
+    # Answer polls for an unchanged version without building the payload
+    not_modified = conditional_get(request, response, organization_id, BOARD_SNAPSHOT_TABLES)
+    if not_modified:
+        return not_modified
+
+    board_config = session.query(BoardConfig).filter_by(
+        id=board_config_id,
+        organization_id=organization_id
+    ).first()
+    if not board_config:
+        raise HTTPException(status_code=404, detail="Board configuration not found")
+
+    return DBREngine(session).get_board_snapshot(board_config)
@@ -1,13 +1,15 @@
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Set
 from fastapi import APIRouter, Depends, HTTPException, Query, status
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, selectinload
 from pydantic import BaseModel, Field, ConfigDict
 from dbr.core.database import get_db
+from dbr.core.includes import parse_include
 from dbr.models.collection import Collection, CollectionStatus
 from dbr.models.organization import Organization
 from dbr.models.organization_membership import OrganizationMembership, InvitationStatus
 from dbr.models.user import User
 from dbr.models.role import Role, RoleName
+from dbr.api.work_items import WorkItemResponse, _convert_work_item_to_response
 
 # Import auth dependency
 try:
@@ -21,6 +23,9 @@ except ImportError:
 # API Router
 router = APIRouter(prefix="/collections", tags=["Collections"])
 
+# Related resources that can be embedded with include=
+COLLECTION_INCLUDES = ("work_items",)
+
 # Pydantic schemas for request/response
 class CollectionCreate(BaseModel):
     organization_id: str = Field(..., description="Organization ID")
@@ -52,6 +57,8 @@ class CollectionResponse(BaseModel):
     throughput: float
     created_date: str
     updated_date: str
+    # Only present when requested with include=
+    work_items: Optional[List[WorkItemResponse]] = None
 
 
 def _validate_organization_access(session: Session, organization_id: str) -> Organization:
@@ -98,9 +105,9 @@ def _check_collection_access_permissions(current_user: User, session: Session, o
             raise HTTPException(status_code=403, detail="Insufficient permissions to view collections")
 
 
-def _convert_collection_to_response(collection: Collection) -> Dict[str, Any]:
-    """Convert Collection model to response dictionary"""
-    return {
+def _convert_collection_to_response(collection: Collection, includes: Set[str] = frozenset()) -> Dict[str, Any]:
+    """Convert Collection model to response dictionary, embedding the related resources in ``includes``"""
+    response = {
         "id": collection.id,
         "organization_id": collection.organization_id,
         "name": collection.name,
@@ -112,12 +119,21 @@ def _convert_collection_to_response(collection: Collection) -> Dict[str, Any]:
         "created_date": collection.created_date.isoformat(),
         "updated_date": collection.updated_date.isoformat()
     }
+    if "work_items" in includes:
+        response["work_items"] = [_convert_work_item_to_response(work_item) for work_item in collection.work_items]
+    return response
+
+
+def _include_options(includes: Set[str]) -> List[Any]:
+    """Loader options that fetch the included work items with one IN query"""
+    return [selectinload(Collection.work_items)] if "work_items" in includes else []
 
 
-@router.get("/", response_model=List[CollectionResponse])
+@router.get("/", response_model=List[CollectionResponse], response_model_exclude_unset=True)
 def get_collections(
     organization_id: str = Query(..., description="Organization ID to filter by"),
     status: Optional[str] = Query(None, description="Filter by collection status"),
+    include: Optional[str] = Query(None, description="Related resources to embed, comma separated: work_items"),
     session: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ):
@@ -128,9 +144,10 @@ def get_collections(
     
     # Check user permissions
     _check_collection_access_permissions(current_user, session, organization_id, "read")
+    includes = parse_include(include, COLLECTION_INCLUDES)
     
     # Build query
-    query = session.query(Collection).filter_by(organization_id=organization_id)
+    query = session.query(Collection).filter_by(organization_id=organization_id).options(*_include_options(includes))
     
     # Apply status filter if provided
     if status:
@@ -143,7 +160,7 @@ def get_collections(
     collections = query.all()
     
     # Convert to response format
-    return [_convert_collection_to_response(collection) for collection in collections]
+    return [_convert_collection_to_response(collection, includes) for collection in collections]
 
 
 @router.post("/", response_model=CollectionResponse, status_code=status.HTTP_201_CREATED)
@@ -177,10 +194,11 @@ def create_collection(
     return _convert_collection_to_response(new_collection)
 
 
-@router.get("/{collection_id}", response_model=CollectionResponse)
+@router.get("/{collection_id}", response_model=CollectionResponse, response_model_exclude_unset=True)
 def get_collection(
     collection_id: str,
     organization_id: str = Query(..., description="Organization ID to scope the request"),
+    include: Optional[str] = Query(None, description="Related resources to embed, comma separated: work_items"),
     session: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ):
@@ -191,17 +209,18 @@ def get_collection(
     
     # Check user permissions
     _check_collection_access_permissions(current_user, session, organization_id, "read")
+    includes = parse_include(include, COLLECTION_INCLUDES)
     
     # Get collection
     collection = session.query(Collection).filter_by(
         id=collection_id,
         organization_id=organization_id
-    ).first()
+    ).options(*_include_options(includes)).first()
     
     if not collection:
         raise HTTPException(status_code=404, detail="Collection not found")
     
-    return _convert_collection_to_response(collection)
+    return _convert_collection_to_response(collection, includes)
 
 
 @router.put("/{collection_id}", response_model=CollectionResponse)
@@ -0,0 +1,74 @@
+# src/dbr/api/events.py
+from typing import AsyncIterator, Optional
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
+from fastapi.responses import StreamingResponse
+from sqlalchemy.orm import Session
+from dbr.core.database import get_db
+from dbr.core.events import event_broker, format_sse
+from dbr.models.organization import Organization
+from dbr.models.board_config import BoardConfig
+
+
+router = APIRouter(prefix="/events", tags=["Events"])
+
+# Seconds between keep-alive comments on an idle stream
+HEARTBEAT_SECONDS = 15.0
+
+
+def _validate_organization_access(session: Session, organization_id: str) -> Organization:
+    """Validate that the organization exists and user has access"""
+    org = session.query(Organization).filter_by(id=organization_id).first()
+    if not org:
+        raise HTTPException(status_code=403, detail="Access denied to organization")
+    return org
+
+
+async def _event_stream(
+    request: Request,
+    organization_id: str,
+    board_config_id: Optional[str],
+    heartbeat: float
+) -> AsyncIterator[str]:
+    """Relay broker events to one client until it disconnects"""
+    subscription = event_broker.subscribe(organization_id, board_config_id)
+    try:
+        yield "retry: 3000\n\n"
+        while not await request.is_disconnected():
+            event_data = await subscription.get(timeout=heartbeat)
+            if subscription.overflowed:
+                # The client fell behind and missed events; it should refetch board state
+                subscription.overflowed = False
+                yield f"event: overflow\ndata: {{\"dropped\": {subscription.dropped}}}\n\n"
+            if event_data is None:
+                yield ": keep-alive\n\n"
+            else:
+                yield format_sse(event_data)
+    finally:
+        event_broker.unsubscribe(subscription)
+
+
+@router.get("", response_class=StreamingResponse)
+def stream_board_events(
+    request: Request,
+    organization_id: str = Query(..., description="Organization ID to scope the request"),
+    board_config_id: Optional[str] = Query(None, description="Only stream events of this board (plus organization-wide events)"),
+    session: Session = Depends(get_db)
+):
+    """Server-sent events for schedule moves, status changes, ready work items and new buffer alerts"""
+
+    # Validate organization access
+    _validate_organization_access(session, organization_id)
+
+    if board_config_id:
+        board_config = session.query(BoardConfig).filter_by(
+            id=board_config_id,
+            organization_id=organization_id
+        ).first()
+        if not board_config:
+            raise HTTPException(status_code=404, detail="Board configuration not found")
+
+    return StreamingResponse(
+        _event_stream(request, organization_id, board_config_id, HEARTBEAT_SECONDS),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
@@ -0,0 +1,13 @@
+# src/dbr/api/metrics.py
+from fastapi import APIRouter
+from fastapi.responses import PlainTextResponse
+from dbr.core.metrics import registry
+
+
+router = APIRouter(tags=["Metrics"])
+
+
+@router.get("/metrics", response_class=PlainTextResponse, include_in_schema=False)
+def get_metrics():
+    """Request, database, tick and buffer metrics in the Prometheus text exposition format"""
+    return PlainTextResponse(registry.render(), media_type="text/plain; version=0.0.4; charset=utf-8")
@@ -1,5 +1,5 @@
 # src/dbr/api/organizations.py
-from typing import List, Optional
+from typing import Any, Dict, List, Optional
 from fastapi import APIRouter, Depends, HTTPException, Query, status
 from sqlalchemy.orm import Session
 from sqlalchemy.exc import IntegrityError
@@ -11,6 +11,13 @@ from dbr.models.user import User
 from dbr.models.organization import Organization, OrganizationStatus
 from dbr.models.organization_membership import OrganizationMembership, InvitationStatus
 from dbr.models.role import Role, RoleName
+from dbr.models.change_log import ChangeLogEntry
+from dbr.models.collection import Collection
+from dbr.models.work_item import WorkItem
+from dbr.models.schedule import Schedule
+from dbr.api.collections import _convert_collection_to_response
+from dbr.api.work_items import _convert_work_item_to_response
+from dbr.api.schedules import _convert_schedule_to_response
 
 # Import auth dependency
 try:
@@ -61,6 +68,31 @@ class OrganizationResponse(BaseModel):
     updated_date: str
 
 
+class ChangeResponse(BaseModel):
+    """Schema for one changed entity in a change log page"""
+    seq: int
+    entity_type: str
+    entity_id: str
+    op: str
+    data: Optional[Dict[str, Any]] = None
+
+
+class ChangesResponse(BaseModel):
+    """Schema for a page of the organization change log"""
+    organization_id: str
+    changes: List[ChangeResponse]
+    next_since: int
+    has_more: bool
+
+
+# Entity type -> model and response converter of the entities in the change log
+_CHANGE_ENTITIES = {
+    "collection": (Collection, _convert_collection_to_response),
+    "work_item": (WorkItem, _convert_work_item_to_response),
+    "schedule": (Schedule, _convert_schedule_to_response),
+}
+
+
 def _convert_organization_to_response(org: Organization) -> OrganizationResponse:
     """Convert Organization model to OrganizationResponse"""
     return OrganizationResponse(
@@ -372,4 +404,78 @@ async def delete_organization(
         raise HTTPException(
             status_code=500,
             detail=f"Error deleting organization: {str(e)}"
-        )
\ No newline at end of file
+        )
+
+
+@router.get("/{org_id}/changes", response_model=ChangesResponse)
+async def get_organization_changes(
+    org_id: str,
+    since: int = Query(0, ge=0, description="Return changes after this sequence number (next_since of the previous page)"),
+    limit: int = Query(500, ge=1, le=5000, description="Maximum number of change log entries to read"),
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    """Get collections, work items and schedules changed since a change log cursor
+
+    Each entity appears once per page with its latest operation and, unless
+    deleted, its current state. Start with since=0 for a full copy and pass
+    next_since back until has_more is false.
+    """
+    
+    # Validate UUID format
+    try:
+        uuid.UUID(org_id)
+    except ValueError:
+        raise HTTPException(
+            status_code=422,
+            detail="Invalid organization_id format. Must be a valid UUID."
+        )
+    
+    # Any member of the organization can read its changes
+    accessible_org_ids = _get_user_accessible_organizations(current_user, db)
+    if accessible_org_ids is not None and org_id not in accessible_org_ids:
+        raise HTTPException(
+            status_code=403,
+            detail="Access denied to this organization"
+        )
+    
+    entries = db.query(ChangeLogEntry).filter(
+        ChangeLogEntry.organization_id == org_id,
+        ChangeLogEntry.seq > since
+    ).order_by(ChangeLogEntry.seq).limit(limit + 1).all()
+    has_more = len(entries) > limit
+    entries = entries[:limit]
+    
+    # Keep the latest entry of each entity
+    latest: Dict[tuple, ChangeLogEntry] = {}
+    for entry in entries:
+        latest.pop((entry.entity_type, entry.entity_id), None)
+        latest[(entry.entity_type, entry.entity_id)] = entry
+    
+    # Load the current rows with one query per entity type
+    rows: Dict[tuple, Any] = {}
+    for entity_type, (model, _) in _CHANGE_ENTITIES.items():
+        ids = [entity_id for (kind, entity_id), entry in latest.items() if kind == entity_type and entry.op != "delete"]
+        if ids:
+            for obj in db.query(model).filter(model.id.in_(ids)).all():
+                rows[(entity_type, obj.id)] = obj
+    
+    changes = []
+    for key, entry in latest.items():
+        obj = rows.get(key)
+        converter = _CHANGE_ENTITIES[entry.entity_type][1]
+        changes.append(ChangeResponse(
+            seq=entry.seq,
+            entity_type=entry.entity_type,
+            entity_id=entry.entity_id,
+            # A row deleted after this page's entry is reported as deleted
+            op=entry.op if obj is not None else "delete",
+            data=converter(obj) if obj is not None else None
+        ))
+    
+    return ChangesResponse(
+        organization_id=org_id,
+        changes=changes,
+        next_since=entries[-1].seq if entries else since,
+        has_more=has_more
+    )
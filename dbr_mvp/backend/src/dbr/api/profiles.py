@@ -0,0 +1,89 @@
+# src/dbr/api/profiles.py
+from typing import Dict, List, Optional
+import jwt
+from fastapi import APIRouter, Depends, HTTPException, Request
+from fastapi.responses import PlainTextResponse
+from pydantic import BaseModel
+from sqlalchemy.orm import Session
+from dbr.api.auth import ALGORITHM, SECRET_KEY, get_current_user
+from dbr.core.database import get_db, get_session
+from dbr.core.profiling import ProfileStore
+from dbr.models.role import Role, RoleName
+from dbr.models.user import User
+
+
+router = APIRouter(prefix="/profiles", tags=["Profiling"])
+
+
+class ProfileSummary(BaseModel):
+    """A stored request profile"""
+    id: str
+    created_date: str
+    method: str
+    path: str
+    status_code: int
+    duration_ms: float
+    samples: int
+    interval_ms: float
+
+
+def _is_super_admin(session: Session, user: Optional[User]) -> bool:
+    if user is None or not user.active_status:
+        return False
+    user_role = session.query(Role).filter_by(id=user.system_role_id).first()
+    return user_role is not None and user_role.name == RoleName.SUPER_ADMIN
+
+
+def authorize_profiling(headers: Dict[bytes, bytes]) -> bool:
+    """Whether the bearer token of a request with the X-Profile header belongs to a Super Admin"""
+    scheme, _, token = headers.get(b"authorization", b"").decode("latin-1").partition(" ")
+    if scheme.lower() != "bearer" or not token:
+        return False
+    try:
+        payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
+    except jwt.PyJWTError:
+        return False
+    session = get_session()
+    try:
+        return _is_super_admin(session, session.get(User, payload.get("sub")))
+    finally:
+        session.close()
+
+
+def _get_profile_store(request: Request, db: Session, current_user: User) -> ProfileStore:
+    if not _is_super_admin(db, current_user):
+        raise HTTPException(status_code=403, detail="Only Super Admins can access profiles")
+    store = getattr(request.app.state, "profile_store", None)
+    if store is None:
+        raise HTTPException(status_code=404, detail="Profiling is not enabled")
+    return store
+
+
+@router.get("/", response_model=List[ProfileSummary])
+def list_profiles(
+    request: Request,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    """List stored request profiles, newest first (Super Admin only)
+
+    Requests are profiled when a Super Admin sends the X-Profile header, or
+    at random at the configured PROFILE_SAMPLE_RATE.
+    """
+    store = _get_profile_store(request, db, current_user)
+    return store.list()
+
+
+@router.get("/{profile_id}", response_class=PlainTextResponse)
+def get_profile(
+    profile_id: str,
+    request: Request,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    """Get a profile as collapsed stacks, for flamegraph.pl or speedscope (Super Admin only)"""
+    store = _get_profile_store(request, db, current_user)
+    collapsed = store.get(profile_id)
+    if collapsed is None:
+        raise HTTPException(status_code=404, detail="Profile not found")
+    return PlainTextResponse(collapsed)
@@ -1,20 +1,42 @@
 # src/dbr/api/schedules.py
-from typing import List, Optional, Dict, Any
-from fastapi import APIRouter, Depends, HTTPException, Query
+from typing import List, Optional, Dict, Any, Set
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
 from sqlalchemy.orm import Session
 from pydantic import BaseModel, Field, ConfigDict
 from datetime import datetime, timezone
 from dbr.core.database import get_db
 from dbr.models.schedule import Schedule, ScheduleStatus
+from dbr.models.schedule_item import ScheduleItem
 from dbr.models.work_item import WorkItem, WorkItemStatus
 from dbr.models.organization import Organization
 from dbr.models.board_config import BoardConfig
 from dbr.models.ccr import CCR
+from dbr.models.work_item_ccr_hours import sum_ccr_hours
+from dbr.models.ccr_capacity_ledger import get_booked_hours
 from dbr.services.dbr_engine import DBREngine
+from dbr.services.delivery_forecaster import DeliveryForecaster
+from dbr.services.buffer_optimizer import BufferOptimizer
+from dbr.services.buffer_zone_manager import BufferZoneManager, BufferZoneStatus, BUFFER_TABLES
+from dbr.services.capacity_calendar import CapacityCalendar
+from dbr.services.ccr_load_matrix import CCRLoadMatrixService
+from dbr.services.release_queue import ReleaseQueue
+from dbr.core.data_version import TIME_UNITS
+from dbr.core.response_cache import analytics_cache
+from dbr.core.etag import conditional_get
+from dbr.core.includes import parse_include
+from dbr.api.work_items import WorkItemResponse, _convert_work_item_to_response
 
 
 router = APIRouter(prefix="/schedules", tags=["Schedules"])
 
+# Tables the cached and ETag-tagged responses are derived from
+SCHEDULE_LIST_TABLES = ("schedules",)
+
+# Related resources that can be embedded with include=
+SCHEDULE_INCLUDES = ("work_items",)
+BOARD_ANALYTICS_TABLES = ("schedules", "board_configs", "ccrs", TIME_UNITS)
+SCHEDULE_ANALYTICS_TABLES = ("schedules", "work_items", "board_configs", "ccrs", TIME_UNITS)
+
 
 # Pydantic schemas for request/response
 class ScheduleCreate(BaseModel):
@@ -47,6 +69,25 @@ class ScheduleResponse(BaseModel):
     created_date: str
     released_date: Optional[str]
     completion_date: Optional[str]
+    is_queued: bool = False
+    # Only present when requested with include=
+    work_items: Optional[List[WorkItemResponse]] = None
+
+
+class QueuedSchedule(BaseModel):
+    schedule_id: str
+    queue_position: int
+    release_priority: int
+    release_due_date: Optional[str]
+    queued_date: Optional[str]
+    work_item_count: int
+    total_ccr_hours: float
+
+
+class ReleaseQueueResponse(BaseModel):
+    board_config_id: str
+    free_slots: int
+    queued_schedules: List[QueuedSchedule]
 
 
 class ScheduleAnalytics(BaseModel):
@@ -57,6 +98,118 @@ class ScheduleAnalytics(BaseModel):
     throughput_metrics: Dict[str, Any]
 
 
+class DeliveryForecast(BaseModel):
+    organization_id: str
+    board_config_id: Optional[str]
+    runs: int
+    ccr_hours_cv: float
+    slip_probability: float
+    forecast_time: str
+    schedules: List[Dict[str, Any]]
+    collections: List[Dict[str, Any]]
+
+
+class OrganizationBufferHealth(BaseModel):
+    organization_id: str
+    board_count: int
+    overall_status: BufferZoneStatus
+    alert_count: int
+    boards: List[Dict[str, Any]]
+
+
+class CCRCapacitySlot(BaseModel):
+    slot: int
+    time_units_ahead: int
+    capacity: float
+    booked_hours: float
+    headroom_hours: float
+
+
+class CCRCapacityHeadroom(BaseModel):
+    organization_id: str
+    ccr_id: str
+    current_time_unit: int
+    slots: List[CCRCapacitySlot]
+
+
+class CCRCapacityLoad(BaseModel):
+    organization_id: str
+    start_slot: int
+    slots: List[int]
+    ccrs: List[Dict[str, Any]]
+    overloaded_ccr_count: int
+
+
+class SharedCCRBoardLoad(BaseModel):
+    board_config_id: str
+    name: Optional[str]
+    booked_hours: List[float]
+    schedule_counts: List[int]
+    total_booked_hours: float
+
+
+class SharedCCRLoad(BaseModel):
+    organization_id: str
+    ccr_id: str
+    ccr_name: str
+    start_slot: int
+    slots: List[int]
+    capacity: List[float]
+    booked_hours: List[float]
+    headroom_hours: List[float]
+    utilization: List[Optional[float]]
+    overloaded_slots: List[int]
+    boards: List[SharedCCRBoardLoad]
+
+
+class CCRBottlenecks(BaseModel):
+    organization_id: str
+    work_item_count: int
+    ccr_count: int
+    active_bottleneck_id: Optional[str]
+    bottlenecks: List[Dict[str, Any]]
+
+
+class FeasibilityRequest(BaseModel):
+    organization_id: str = Field(..., description="Organization ID")
+    candidate_sets: List[List[str]] = Field(..., description="Candidate sets of work item IDs")
+    slot: Optional[int] = Field(None, description="Check against the remaining headroom of this time unit slot")
+
+
+class FeasibilityResponse(BaseModel):
+    organization_id: str
+    slot: Optional[int]
+    results: List[Dict[str, Any]]
+
+
+class BufferHistoryPoint(BaseModel):
+    recorded_at: str
+    pre_constraint_count: int
+    pre_constraint_percentage: float
+    ccr_occupied: bool
+    post_constraint_count: int
+    post_constraint_percentage: float
+    overflow_count: int
+    completed_count: int
+    cumulative_completed_count: int
+
+
+class BufferHistoryResponse(BaseModel):
+    board_config_id: str
+    points: List[BufferHistoryPoint]
+
+
+class BufferOptimization(BaseModel):
+    board_config_id: str
+    history_schedules: int
+    history_time_units: Optional[int] = None
+    current: Dict[str, Any]
+    pre_constraint_candidates: List[Dict[str, Any]]
+    post_constraint_candidates: List[Dict[str, Any]]
+    threshold_candidates: List[Dict[str, Any]]
+    recommendation: Optional[Dict[str, Any]]
+
+
 class BoardAnalytics(BaseModel):
     total_schedules: int
     status_distribution: Dict[str, int]
@@ -72,10 +225,26 @@ def _validate_organization_access(session: Session, organization_id: str) -> Org
     return org
 
 
-def _convert_schedule_to_response(schedule: Schedule) -> Dict[str, Any]:
-    """Convert Schedule model to response dictionary"""
+def _validate_not_in_active_schedule(session: Session, work_item_ids: List[str], schedule_id: Optional[str] = None) -> None:
+    """Reject work items that already sit in another active schedule"""
+    query = session.query(ScheduleItem.work_item_id).filter(
+        ScheduleItem.work_item_id.in_(work_item_ids),
+        ScheduleItem.is_active.is_(True)
+    )
+    if schedule_id:
+        query = query.filter(ScheduleItem.schedule_id != schedule_id)
+    scheduled = [row.work_item_id for row in query.all()]
+    if scheduled:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Work items already in an active schedule: {', '.join(scheduled)}"
+        )
+
+
+def _convert_schedule_to_response(schedule: Schedule, work_items: Optional[Dict[str, WorkItem]] = None) -> Dict[str, Any]:
+    """Convert Schedule model to response dictionary, embedding its work items when ``work_items`` is given"""
     
-    return {
+    response = {
         "id": schedule.id,
         "organization_id": schedule.organization_id,
         "board_config_id": schedule.board_config_id,
@@ -87,21 +256,51 @@ def _convert_schedule_to_response(schedule: Schedule) -> Dict[str, Any]:
         "timezone": "UTC",  # TODO: Add timezone field to Schedule model
         "created_date": schedule.created_date.isoformat(),
         "released_date": schedule.released_date.isoformat() if schedule.released_date else None,
-        "completion_date": schedule.completed_date.isoformat() if schedule.completed_date else None
+        "completion_date": schedule.completed_date.isoformat() if schedule.completed_date else None,
+        "is_queued": bool(schedule.is_queued)
+    }
+    if work_items is not None:
+        response["work_items"] = [
+            _convert_work_item_to_response(work_items[work_item_id])
+            for work_item_id in schedule.work_item_ids if work_item_id in work_items
+        ]
+    return response
+
+
+def _load_included_work_items(session: Session, schedules: List[Schedule], includes: Set[str]) -> Optional[Dict[str, WorkItem]]:
+    """Work items of all the schedules by ID, loaded with one IN query, or None when not included"""
+    if "work_items" not in includes:
+        return None
+    work_item_ids = {work_item_id for schedule in schedules for work_item_id in schedule.work_item_ids}
+    if not work_item_ids:
+        return {}
+    return {
+        work_item.id: work_item
+        for work_item in session.query(WorkItem).filter(WorkItem.id.in_(work_item_ids)).all()
     }
 
 
-@router.get("", response_model=List[ScheduleResponse])
+@router.get("", response_model=List[ScheduleResponse], response_model_exclude_unset=True)
 def get_schedules(
+    request: Request,
+    response: Response,
     organization_id: str = Query(..., description="Organization ID to filter by"),
     board_config_id: Optional[str] = Query(None, description="Board configuration ID to filter by"),
     status: Optional[List[str]] = Query(None, description="Status to filter by"),
+    include: Optional[str] = Query(None, description="Related resources to embed, comma separated: work_items"),
     session: Session = Depends(get_db)
 ):
     """Get all schedules with optional filtering"""
     
     # Validate organization access
     _validate_organization_access(session, organization_id)
+    includes = parse_include(include, SCHEDULE_INCLUDES)
+    
+    # Answer polls for an unchanged version without building the payload
+    tables = SCHEDULE_LIST_TABLES + (("work_items",) if "work_items" in includes else ())
+    not_modified = conditional_get(request, response, organization_id, tables)
+    if not_modified:
+        return not_modified
     
     # Build query
     query = session.query(Schedule).filter_by(organization_id=organization_id)
@@ -135,9 +334,165 @@ def get_schedules(
     query = query.order_by(Schedule.created_date.desc())
     
     schedules = query.all()
+    work_items = _load_included_work_items(session, schedules, includes)
     
     # Convert to response format
-    return [_convert_schedule_to_response(schedule) for schedule in schedules]
+    return [_convert_schedule_to_response(schedule, work_items) for schedule in schedules]
+
+
+@router.get("/forecast", response_model=DeliveryForecast)
+def get_delivery_forecast(
+    organization_id: str = Query(..., description="Organization ID to scope the request"),
+    board_config_id: Optional[str] = Query(None, description="Board configuration ID to forecast"),
+    runs: int = Query(10000, ge=1, le=100000, description="Number of Monte Carlo runs"),
+    ccr_hours_cv: float = Query(0.2, ge=0.0, le=5.0, description="Coefficient of variation of CCR hours"),
+    slip_probability: float = Query(0.1, ge=0.0, lt=1.0, description="Probability that a tick does not advance a board"),
+    seed: Optional[int] = Query(None, description="Random seed for reproducible forecasts"),
+    session: Session = Depends(get_db)
+):
+    """Forecast P50/P85/P95 completion dates for active schedules and collections"""
+    
+    # Validate organization access
+    _validate_organization_access(session, organization_id)
+    
+    forecaster = DeliveryForecaster(session)
+    return forecaster.forecast(
+        organization_id,
+        board_config_id=board_config_id,
+        runs=runs,
+        ccr_hours_cv=ccr_hours_cv,
+        slip_probability=slip_probability,
+        seed=seed
+    )
+
+
+@router.get("/buffer-health", response_model=OrganizationBufferHealth)
+def get_organization_buffer_health(
+    request: Request,
+    response: Response,
+    organization_id: str = Query(..., description="Organization ID to scope the request"),
+    session: Session = Depends(get_db)
+):
+    """Get buffer health, penetration and alerts for every active board in the organization"""
+    
+    # Validate organization access
+    _validate_organization_access(session, organization_id)
+    
+    # Answer polls for an unchanged version without building the payload
+    not_modified = conditional_get(request, response, organization_id, BUFFER_TABLES)
+    if not_modified:
+        return not_modified
+    
+    buffer_manager = BufferZoneManager(session)
+    return buffer_manager.get_organization_buffer_health(organization_id)
+
+
+@router.get("/capacity", response_model=CCRCapacityHeadroom)
+def get_ccr_capacity_headroom(
+    organization_id: str = Query(..., description="Organization ID to scope the request"),
+    ccr_id: str = Query(..., description="CCR ID"),
+    horizon: int = Query(10, ge=1, le=520, description="Number of time unit slots from the current one"),
+    session: Session = Depends(get_db)
+):
+    """Get booked hours and remaining headroom of a CCR for the next time unit slots"""
+    
+    # Validate organization access
+    organization = _validate_organization_access(session, organization_id)
+    
+    ccr = session.query(CCR).filter_by(id=ccr_id, organization_id=organization_id).first()
+    if not ccr:
+        raise HTTPException(status_code=404, detail="CCR not found")
+    
+    current_time_unit = organization.current_time_unit or 0
+    slots = ccr.get_capacity_headroom(session, current_time_unit, horizon)
+    for entry in slots:
+        entry["time_units_ahead"] = entry["slot"] - current_time_unit
+    
+    return {
+        "organization_id": organization_id,
+        "ccr_id": ccr.id,
+        "current_time_unit": current_time_unit,
+        "slots": slots
+    }
+
+
+@router.get("/capacity-load", response_model=CCRCapacityLoad)
+def get_ccr_capacity_load(
+    organization_id: str = Query(..., description="Organization ID to scope the request"),
+    horizon: int = Query(12, ge=1, le=520, description="Number of time unit slots from the current one"),
+    session: Session = Depends(get_db)
+):
+    """Get calendar capacity versus booked load of every active CCR for the next time unit slots"""
+    
+    # Validate organization access
+    _validate_organization_access(session, organization_id)
+    
+    calendar = CapacityCalendar(session)
+    return calendar.get_load_analysis(organization_id, slots=horizon)
+
+
+@router.get("/shared-ccr-load", response_model=SharedCCRLoad)
+def get_shared_ccr_load(
+    organization_id: str = Query(..., description="Organization ID to scope the request"),
+    ccr_id: str = Query(..., description="CCR ID"),
+    horizon: int = Query(12, ge=1, le=520, description="Number of time unit slots from the current one"),
+    session: Session = Depends(get_db)
+):
+    """Get the combined load per slot of all boards sharing a CCR, broken down by board"""
+    
+    # Validate organization access
+    _validate_organization_access(session, organization_id)
+    
+    ccr = session.query(CCR).filter_by(id=ccr_id, organization_id=organization_id).first()
+    if not ccr:
+        raise HTTPException(status_code=404, detail="CCR not found")
+    
+    calendar = CapacityCalendar(session)
+    return calendar.get_shared_ccr_load(ccr, slots=horizon)
+
+
+@router.get("/bottlenecks", response_model=CCRBottlenecks)
+def get_ccr_bottlenecks(
+    organization_id: str = Query(..., description="Organization ID to scope the request"),
+    threshold: float = Query(1.0, ge=0.0, description="Utilization at or above which a CCR is a bottleneck"),
+    include_done: bool = Query(True, description="Count the demand of Done work items"),
+    session: Session = Depends(get_db)
+):
+    """Get CCR demand bottlenecks across all of the organization's work items"""
+    
+    # Validate organization access
+    _validate_organization_access(session, organization_id)
+    
+    matrix_service = CCRLoadMatrixService(session)
+    return matrix_service.identify_bottlenecks(organization_id, threshold=threshold, include_done=include_done)
+
+
+@router.post("/feasibility", response_model=FeasibilityResponse)
+def check_schedule_feasibility(
+    request: FeasibilityRequest,
+    session: Session = Depends(get_db)
+):
+    """Check which candidate work item sets fit the capacity of every CCR"""
+    
+    # Validate organization access
+    _validate_organization_access(session, request.organization_id)
+    
+    matrix_service = CCRLoadMatrixService(session)
+    capacity = None
+    if request.slot is not None:
+        # Remaining headroom of the slot, aligned with the matrix columns
+        matrix = matrix_service.get_matrix(request.organization_id)
+        horizon = CapacityCalendar(session).get_horizon(
+            request.organization_id, 1, start_slot=request.slot, ccr_ids=matrix.ccr_ids
+        )
+        headroom = dict(zip(horizon.ccr_ids, horizon.headroom[:, 0]))
+        capacity = [headroom.get(ccr_id, 0.0) for ccr_id in matrix.ccr_ids]
+    
+    return {
+        "organization_id": request.organization_id,
+        "slot": request.slot,
+        "results": matrix_service.check_feasibility(request.organization_id, request.candidate_sets, capacity=capacity)
+    }
 
 
 @router.post("", response_model=ScheduleResponse, status_code=201)
@@ -148,7 +503,7 @@ def create_schedule(
     """Create a new schedule"""
     
     # Validate organization access
-    _validate_organization_access(session, schedule_data.organization_id)
+    organization = _validate_organization_access(session, schedule_data.organization_id)
     
     # Validate board configuration exists
     board_config = session.query(BoardConfig).filter_by(id=schedule_data.board_config_id).first()
@@ -175,19 +530,16 @@ def create_schedule(
             detail=f"Work items must be in Ready status. Found {len(non_ready_items)} non-ready items"
         )
     
+    # A work item can only be in one active schedule
+    _validate_not_in_active_schedule(session, schedule_data.work_item_ids)
+    
     # Get CCR for capacity validation
     ccr = session.query(CCR).filter_by(id=board_config.ccr_id).first()
     if not ccr:
         raise HTTPException(status_code=400, detail="CCR not found for board configuration")
     
     # Calculate total CCR hours and validate capacity
-    total_ccr_hours = 0.0
-    
-    for work_item in work_items:
-        if work_item.ccr_hours_required:
-            # Sum all CCR hours for this work item (since we don't know the exact key structure)
-            work_item_ccr_hours = sum(work_item.ccr_hours_required.values())
-            total_ccr_hours += work_item_ccr_hours
+    total_ccr_hours = sum_ccr_hours(session, schedule_data.work_item_ids, ccr.id)
     
     if total_ccr_hours > ccr.capacity_per_time_unit:
         raise HTTPException(
@@ -195,6 +547,24 @@ def create_schedule(
             detail=f"Total CCR hours ({total_ccr_hours}) exceeds capacity ({ccr.capacity_per_time_unit})"
         )
     
+    # New schedules enter at the start of the pre-constraint buffer; count what that slot already holds.
+    # Schedules that go to the release queue book no slot until they are released.
+    slot = (organization.current_time_unit or 0) + board_config.pre_constraint_buffer_size
+    slot_capacity = float(CapacityCalendar(session).get_capacity(ccr, slot)[0])
+    booked = get_booked_hours(session, ccr.id, slot, slot).get(slot, 0.0)
+    # The ledger is per CCR, so hours booked by every board sharing the CCR count against the slot.
+    if ReleaseQueue(session).can_place(board_config) and booked + total_ccr_hours > slot_capacity:
+        sharing_boards = session.query(BoardConfig).filter_by(
+            organization_id=schedule_data.organization_id, ccr_id=ccr.id
+        ).count()
+        raise HTTPException(
+            status_code=400,
+            detail=(
+                f"Total CCR hours ({total_ccr_hours}) exceeds remaining capacity "
+                f"({slot_capacity - booked}) in slot {slot} of CCR shared by {sharing_boards} board(s)"
+            )
+        )
+    
     # Create schedule using DBREngine
     try:
         dbr_engine = DBREngine(session)
@@ -210,16 +580,18 @@ def create_schedule(
         raise HTTPException(status_code=400, detail=str(e))
 
 
-@router.get("/{schedule_id}", response_model=ScheduleResponse)
+@router.get("/{schedule_id}", response_model=ScheduleResponse, response_model_exclude_unset=True)
 def get_schedule(
     schedule_id: str,
     organization_id: str = Query(..., description="Organization ID to scope the request"),
+    include: Optional[str] = Query(None, description="Related resources to embed, comma separated: work_items"),
     session: Session = Depends(get_db)
 ):
     """Get a specific schedule by ID"""
     
     # Validate organization access
     _validate_organization_access(session, organization_id)
+    includes = parse_include(include, SCHEDULE_INCLUDES)
     
     # Get schedule
     schedule = session.query(Schedule).filter_by(
@@ -230,7 +602,7 @@ def get_schedule(
     if not schedule:
         raise HTTPException(status_code=404, detail="Schedule not found")
     
-    return _convert_schedule_to_response(schedule)
+    return _convert_schedule_to_response(schedule, _load_included_work_items(session, [schedule], includes))
 
 
 @router.put("/{schedule_id}", response_model=ScheduleResponse)
@@ -289,6 +661,8 @@ def update_schedule(
             if len(work_items) != len(value):
                 raise HTTPException(status_code=400, detail="One or more work items not found")
             
+            _validate_not_in_active_schedule(session, value, schedule.id)
+            
             schedule.work_item_ids = value
             schedule.recalculate_total_hours(session)
             
@@ -327,6 +701,8 @@ def delete_schedule(
 
 @router.get("/{schedule_id}/analytics", response_model=ScheduleAnalytics)
 def get_schedule_analytics(
+    request: Request,
+    response: Response,
     schedule_id: str,
     organization_id: str = Query(..., description="Organization ID to scope the request"),
     session: Session = Depends(get_db)
@@ -336,6 +712,11 @@ def get_schedule_analytics(
     # Validate organization access
     _validate_organization_access(session, organization_id)
     
+    # Answer polls for an unchanged version without building the payload
+    not_modified = conditional_get(request, response, organization_id, SCHEDULE_ANALYTICS_TABLES)
+    if not_modified:
+        return not_modified
+    
     # Get schedule
     schedule = session.query(Schedule).filter_by(
         id=schedule_id,
@@ -345,6 +726,15 @@ def get_schedule_analytics(
     if not schedule:
         raise HTTPException(status_code=404, detail="Schedule not found")
     
+    return analytics_cache.get_or_compute(
+        session, organization_id, SCHEDULE_ANALYTICS_TABLES, ("schedule_analytics", schedule_id),
+        lambda: _compute_schedule_analytics(session, schedule)
+    )
+
+
+def _compute_schedule_analytics(session: Session, schedule: Schedule) -> Dict[str, Any]:
+    """Zone, position and throughput figures of one schedule"""
+    
     # Get schedule analytics
     analytics = schedule.get_analytics(session)
     
@@ -374,6 +764,8 @@ def get_schedule_analytics(
 
 @router.get("/board/{board_config_id}/analytics", response_model=BoardAnalytics)
 def get_board_analytics(
+    request: Request,
+    response: Response,
     board_config_id: str,
     organization_id: str = Query(..., description="Organization ID to scope the request"),
     session: Session = Depends(get_db)
@@ -383,6 +775,20 @@ def get_board_analytics(
     # Validate organization access
     _validate_organization_access(session, organization_id)
     
+    # Answer polls for an unchanged version without building the payload
+    not_modified = conditional_get(request, response, organization_id, BOARD_ANALYTICS_TABLES)
+    if not_modified:
+        return not_modified
+    
+    return analytics_cache.get_or_compute(
+        session, organization_id, BOARD_ANALYTICS_TABLES, ("board_analytics", board_config_id),
+        lambda: _compute_board_analytics(session, organization_id, board_config_id)
+    )
+
+
+def _compute_board_analytics(session: Session, organization_id: str, board_config_id: str) -> Dict[str, Any]:
+    """Status, zone and capacity figures of all schedules on a board"""
+    
     # Get all schedules for the board
     schedules = session.query(Schedule).filter_by(
         organization_id=organization_id,
@@ -424,4 +830,91 @@ def get_board_analytics(
         "status_distribution": status_distribution,
         "zone_occupancy": zone_occupancy,
         "capacity_utilization": capacity_utilization
-    }
\ No newline at end of file
+    }
+
+
+@router.get("/board/{board_config_id}/buffer-optimization", response_model=BufferOptimization)
+def get_buffer_optimization(
+    board_config_id: str,
+    organization_id: str = Query(..., description="Organization ID to scope the request"),
+    max_pre_size: int = Query(10, ge=1, le=100, description="Largest pre-constraint buffer size to evaluate"),
+    max_post_size: int = Query(7, ge=1, le=100, description="Largest post-constraint buffer size to evaluate"),
+    transit_units: int = Query(1, ge=0, le=52, description="Time units from release until work is ready at the CCR"),
+    max_starvation_rate: float = Query(0.05, ge=0.0, le=1.0, description="Acceptable share of time the CCR starves"),
+    session: Session = Depends(get_db)
+):
+    """Replay the board's schedule history under candidate buffer sizes and zone thresholds"""
+    
+    # Validate organization access
+    _validate_organization_access(session, organization_id)
+    
+    board_config = session.query(BoardConfig).filter_by(
+        id=board_config_id,
+        organization_id=organization_id
+    ).first()
+    if not board_config:
+        raise HTTPException(status_code=404, detail="Board configuration not found")
+    
+    optimizer = BufferOptimizer(session)
+    return optimizer.optimize(
+        board_config_id,
+        pre_sizes=range(1, max_pre_size + 1),
+        post_sizes=range(1, max_post_size + 1),
+        transit_units=transit_units,
+        max_starvation_rate=max_starvation_rate
+    )
+
+
+@router.get("/board/{board_config_id}/buffer-history", response_model=BufferHistoryResponse)
+def get_buffer_history(
+    board_config_id: str,
+    organization_id: str = Query(..., description="Organization ID to scope the request"),
+    start: Optional[datetime] = Query(None, description="Only include ticks recorded at or after this time"),
+    end: Optional[datetime] = Query(None, description="Only include ticks recorded at or before this time"),
+    limit: Optional[int] = Query(None, ge=1, le=10000, description="Maximum number of points to return"),
+    session: Session = Depends(get_db)
+):
+    """Get the recorded buffer state per time unit tick for fever charts and trends"""
+    
+    # Validate organization access
+    _validate_organization_access(session, organization_id)
+    
+    board_config = session.query(BoardConfig).filter_by(
+        id=board_config_id,
+        organization_id=organization_id
+    ).first()
+    if not board_config:
+        raise HTTPException(status_code=404, detail="Board configuration not found")
+    
+    buffer_manager = BufferZoneManager(session)
+    return {
+        "board_config_id": board_config_id,
+        "points": buffer_manager.get_buffer_history(board_config_id, start=start, end=end, limit=limit)
+    }
+
+
+@router.get("/board/{board_config_id}/release-queue", response_model=ReleaseQueueResponse)
+def get_release_queue(
+    board_config_id: str,
+    organization_id: str = Query(..., description="Organization ID to scope the request"),
+    session: Session = Depends(get_db)
+):
+    """Get the schedules waiting for room in the board's pre-constraint buffer, in release order"""
+    
+    # Validate organization access
+    _validate_organization_access(session, organization_id)
+    
+    board_config = session.query(BoardConfig).filter_by(
+        id=board_config_id,
+        organization_id=organization_id
+    ).first()
+    if not board_config:
+        raise HTTPException(status_code=404, detail="Board configuration not found")
+    
+    release_queue = ReleaseQueue(session)
+    snapshot = BufferZoneManager(session).get_snapshot(board_config_id)
+    return {
+        "board_config_id": board_config_id,
+        "free_slots": release_queue.free_slots(snapshot),
+        "queued_schedules": release_queue.get_queue(board_config_id)
+    }
@@ -1,10 +1,11 @@
 # src/dbr/api/work_items.py
-from typing import List, Optional, Dict, Any
-from fastapi import APIRouter, Depends, HTTPException, Query
-from sqlalchemy.orm import Session
-from sqlalchemy.orm.attributes import flag_modified
+from typing import List, Optional, Dict, Any, Set
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
+from sqlalchemy.orm import Session, selectinload
 from pydantic import BaseModel, Field, ConfigDict
 from dbr.core.database import get_db
+from dbr.core.etag import conditional_get
+from dbr.core.includes import parse_include
 from dbr.models.work_item import WorkItem, WorkItemStatus, WorkItemPriority
 from dbr.models.organization import Organization
 from dbr.models.user import User
@@ -20,6 +21,15 @@ except ImportError:
 
 router = APIRouter(prefix="/workitems", tags=["Work Items"])
 
+# Tables the work item list is derived from (tagged with an ETag)
+WORK_ITEM_LIST_TABLES = ("work_items",)
+
+# Related resources that can be embedded with include=, and their relationships
+WORK_ITEM_INCLUDES = {
+    "collection": WorkItem.collection,
+    "responsible_user": WorkItem.responsible_user,
+}
+
 
 # Pydantic schemas for request/response
 class TaskCreate(BaseModel):
@@ -38,6 +48,33 @@ class TaskResponse(BaseModel):
     completed: bool
 
 
+class TaskBatchUpdate(BaseModel):
+    task_ids: List[int] = Field(..., min_length=1, description="IDs of the tasks to update")
+    completed: bool = Field(..., description="Completion status to set on every task")
+
+
+class TaskProgressResponse(BaseModel):
+    work_item_id: str
+    tasks: List[TaskResponse]
+    task_count: int
+    completed_task_count: int
+    progress_percentage: float
+
+
+class CollectionSummary(BaseModel):
+    id: str
+    name: str
+    status: str
+    throughput: float
+
+
+class UserSummary(BaseModel):
+    id: str
+    username: str
+    display_name: str
+    email: str
+
+
 class WorkItemCreate(BaseModel):
     organization_id: str = Field(..., description="Organization ID")
     collection_id: Optional[str] = Field(None, description="Collection ID (optional)")
@@ -84,12 +121,30 @@ class WorkItemResponse(BaseModel):
     estimated_sales_price: Optional[float]
     estimated_variable_cost: Optional[float]
     throughput: float
+    total_ccr_hours: float
+    throughput_per_ccr_hour: Optional[float]
     tasks: List[TaskResponse]
     progress_percentage: float
     responsible_user_id: Optional[str]
     url: Optional[str]
     created_date: str
     updated_date: str
+    # Only present when requested with include=
+    collection: Optional[CollectionSummary] = None
+    responsible_user: Optional[UserSummary] = None
+
+
+# Sort keys accepted by GET /workitems; prefix with "-" for descending order
+SORT_COLUMNS = {
+    "title": WorkItem.title,
+    "created_date": WorkItem.created_date,
+    "priority": WorkItem.priority,
+    "status": WorkItem.status,
+    "throughput": WorkItem.throughput,
+    "total_ccr_hours": WorkItem.total_ccr_hours,
+    "progress": WorkItem.progress,
+    "throughput_per_ccr_hour": WorkItem.throughput_per_ccr_hour,
+}
 
 
 def _validate_organization_access(session: Session, organization_id: str) -> Organization:
@@ -100,26 +155,10 @@ def _validate_organization_access(session: Session, organization_id: str) -> Org
     return org
 
 
-def _convert_work_item_to_response(work_item: WorkItem) -> Dict[str, Any]:
-    """Convert WorkItem model to response dictionary"""
-    
-    # Convert tasks to response format
-    tasks = []
-    if work_item.tasks:
-        for task in work_item.tasks:
-            # Ensure task has an ID (generate one if missing)
-            task_id = task.get("id")
-            if task_id is None:
-                # This shouldn't happen, but handle gracefully
-                task_id = len(tasks) + 1
-            
-            tasks.append({
-                "id": int(task_id),
-                "title": task.get("title", ""),
-                "completed": task.get("completed", False)
-            })
+def _convert_work_item_to_response(work_item: WorkItem, includes: Set[str] = frozenset()) -> Dict[str, Any]:
+    """Convert WorkItem model to response dictionary, embedding the related resources in ``includes``"""
     
-    return {
+    response = {
         "id": work_item.id,
         "organization_id": work_item.organization_id,
         "collection_id": work_item.collection_id,
@@ -132,22 +171,54 @@ def _convert_work_item_to_response(work_item: WorkItem) -> Dict[str, Any]:
         "estimated_sales_price": work_item.estimated_sales_price,
         "estimated_variable_cost": work_item.estimated_variable_cost,
         "throughput": work_item.calculate_throughput(),
-        "tasks": tasks,
+        "total_ccr_hours": work_item.calculate_total_ccr_hours(),
+        "throughput_per_ccr_hour": work_item.throughput_per_ccr_hour,
+        "tasks": work_item.tasks,
         "progress_percentage": round(work_item.calculate_progress() * 100, 2),
         "responsible_user_id": work_item.responsible_user_id,
         "url": work_item.url,
         "created_date": work_item.created_date.isoformat(),
         "updated_date": work_item.updated_date.isoformat()
     }
-
-
-@router.get("", response_model=List[WorkItemResponse])
+    if "collection" in includes:
+        collection = work_item.collection
+        response["collection"] = {
+            "id": collection.id,
+            "name": collection.name,
+            "status": collection.status.value,
+            "throughput": collection.calculate_throughput()
+        } if collection else None
+    if "responsible_user" in includes:
+        user = work_item.responsible_user
+        response["responsible_user"] = {
+            "id": user.id,
+            "username": user.username,
+            "display_name": user.display_name,
+            "email": user.email
+        } if user else None
+    return response
+
+
+def _include_options(includes: Set[str]) -> List[Any]:
+    """Loader options that fetch the included relationships with one IN query each"""
+    return [selectinload(WORK_ITEM_INCLUDES[name]) for name in sorted(includes)]
+
+
+@router.get("", response_model=List[WorkItemResponse], response_model_exclude_unset=True)
 def get_work_items(
+    request: Request,
+    response: Response,
     organization_id: str = Query(..., description="Organization ID to filter by"),
     collection_id: Optional[str] = Query(None, description="Collection ID to filter by"),
     status: Optional[List[str]] = Query(None, description="Status to filter by"),
     priority: Optional[str] = Query(None, description="Priority to filter by"),
-    sort: Optional[str] = Query(None, description="Sort field"),
+    sort: Optional[str] = Query(None, description="Sort field, prefix with '-' for descending (e.g. -throughput_per_ccr_hour)"),
+    min_throughput: Optional[float] = Query(None, description="Minimum throughput (sales price - variable cost)"),
+    max_total_ccr_hours: Optional[float] = Query(None, description="Maximum total CCR hours"),
+    min_throughput_per_ccr_hour: Optional[float] = Query(None, description="Minimum throughput per CCR hour"),
+    min_progress: Optional[float] = Query(None, ge=0.0, le=100.0, description="Minimum progress percentage"),
+    max_progress: Optional[float] = Query(None, ge=0.0, le=100.0, description="Maximum progress percentage"),
+    include: Optional[str] = Query(None, description="Related resources to embed, comma separated: collection, responsible_user"),
     session: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ):
@@ -155,9 +226,18 @@ def get_work_items(
     
     # Validate organization access
     _validate_organization_access(session, organization_id)
+    includes = parse_include(include, list(WORK_ITEM_INCLUDES))
+    
+    # Answer polls for an unchanged version without building the payload.
+    # Users are not versioned per organization, so lists embedding them are never tagged.
+    if "responsible_user" not in includes:
+        tables = WORK_ITEM_LIST_TABLES + (("collections",) if "collection" in includes else ())
+        not_modified = conditional_get(request, response, organization_id, tables)
+        if not_modified:
+            return not_modified
     
     # Build query
-    query = session.query(WorkItem).filter_by(organization_id=organization_id)
+    query = session.query(WorkItem).filter_by(organization_id=organization_id).options(*_include_options(includes))
     
     # Apply filters
     if collection_id:
@@ -180,21 +260,30 @@ def get_work_items(
         except ValueError:
             raise HTTPException(status_code=422, detail=f"Invalid priority: {priority}")
     
+    # Filters on the persisted derived metrics
+    if min_throughput is not None:
+        query = query.filter(WorkItem.throughput >= min_throughput)
+    if max_total_ccr_hours is not None:
+        query = query.filter(WorkItem.total_ccr_hours <= max_total_ccr_hours)
+    if min_throughput_per_ccr_hour is not None:
+        query = query.filter(WorkItem.throughput_per_ccr_hour >= min_throughput_per_ccr_hour)
+    if min_progress is not None:
+        query = query.filter(WorkItem.progress >= min_progress / 100)
+    if max_progress is not None:
+        query = query.filter(WorkItem.progress <= max_progress / 100)
+    
     # Apply sorting
     if sort:
-        if sort == "title":
-            query = query.order_by(WorkItem.title)
-        elif sort == "created_date":
-            query = query.order_by(WorkItem.created_date)
-        elif sort == "priority":
-            query = query.order_by(WorkItem.priority)
-        elif sort == "status":
-            query = query.order_by(WorkItem.status)
+        descending = sort.startswith("-")
+        column = SORT_COLUMNS.get(sort.lstrip("-"))
+        if column is not None:
+            # Items without a value (e.g. no CCR hours) sort last either way
+            query = query.order_by(column.is_(None), column.desc() if descending else column)
     
     work_items = query.all()
     
     # Convert to response format
-    return [_convert_work_item_to_response(item) for item in work_items]
+    return [_convert_work_item_to_response(item, includes) for item in work_items]
 
 
 @router.post("", response_model=WorkItemResponse, status_code=201)
@@ -243,12 +332,7 @@ def create_work_item(
     
     # Add initial tasks
     for task_data in work_item_data.tasks:
-        work_item.add_task(task_data.title)
-        if task_data.completed:
-            # Find the task we just added and mark it completed
-            if work_item.tasks:
-                last_task = work_item.tasks[-1]
-                work_item.complete_task(last_task["id"])
+        work_item.add_task(task_data.title, completed=task_data.completed)
     
     session.add(work_item)
     session.commit()
@@ -257,27 +341,29 @@ def create_work_item(
     return _convert_work_item_to_response(work_item)
 
 
-@router.get("/{work_item_id}", response_model=WorkItemResponse)
+@router.get("/{work_item_id}", response_model=WorkItemResponse, response_model_exclude_unset=True)
 def get_work_item(
     work_item_id: str,
     organization_id: str = Query(..., description="Organization ID to scope the request"),
+    include: Optional[str] = Query(None, description="Related resources to embed, comma separated: collection, responsible_user"),
     session: Session = Depends(get_db)
 ):
     """Get a specific work item by ID"""
     
     # Validate organization access
     _validate_organization_access(session, organization_id)
+    includes = parse_include(include, list(WORK_ITEM_INCLUDES))
     
     # Get work item
     work_item = session.query(WorkItem).filter_by(
         id=work_item_id,
         organization_id=organization_id
-    ).first()
+    ).options(*_include_options(includes)).first()
     
     if not work_item:
         raise HTTPException(status_code=404, detail="Work item not found")
     
-    return _convert_work_item_to_response(work_item)
+    return _convert_work_item_to_response(work_item, includes)
 
 
 @router.put("/{work_item_id}", response_model=WorkItemResponse)
@@ -323,15 +409,8 @@ def update_work_item(
             except ValueError:
                 raise HTTPException(status_code=422, detail=f"Invalid priority: {value}")
         elif field == "tasks" and value is not None:
-            # Replace tasks entirely, ensuring each task has an ID
-            processed_tasks = []
-            for i, task_data in enumerate(value):
-                if isinstance(task_data, dict):
-                    # Ensure task has an ID
-                    if "id" not in task_data or task_data["id"] is None:
-                        task_data["id"] = i + 1
-                    processed_tasks.append(task_data)
-            work_item.tasks = processed_tasks
+            # Replace tasks entirely; tasks without an ID get the next free one
+            work_item.tasks = [task_data for task_data in value if isinstance(task_data, dict)]
         else:
             setattr(work_item, field, value)
     
@@ -390,33 +469,111 @@ def update_work_item_task(
         raise HTTPException(status_code=404, detail="Work item not found")
     
     # Find and update task
-    task_found = False
-    if work_item.tasks:
-        # Create a new list to ensure SQLAlchemy detects the change
-        updated_tasks = []
-        for task in work_item.tasks:
-            stored_task_id = task.get("id")
-            if stored_task_id is not None and int(stored_task_id) == int(task_id):
-                # Update task fields
-                if task_data.title is not None:
-                    task["title"] = task_data.title
-                
-                if task_data.completed is not None:
-                    task["completed"] = task_data.completed
-                
-                task_found = True
-            updated_tasks.append(task)
-
-        if task_found:
-            work_item.tasks = updated_tasks
-            # Force SQLAlchemy to detect the change in the JSON field
-            flag_modified(work_item, "tasks")
-
-    if not task_found:
+    if work_item.update_task(task_id, title=task_data.title, completed=task_data.completed) is None:
         raise HTTPException(status_code=404, detail="Task not found")
     
     # Mark the work item as updated and commit
     session.commit()
     session.refresh(work_item)
     
-    return _convert_work_item_to_response(work_item)
\ No newline at end of file
+    return _convert_work_item_to_response(work_item)
+
+
+def _get_work_item_for_tasks(session: Session, work_item_id: str, organization_id: str) -> WorkItem:
+    """Load a work item in the organization for task operations"""
+    _validate_organization_access(session, organization_id)
+    
+    work_item = session.query(WorkItem).filter_by(
+        id=work_item_id,
+        organization_id=organization_id
+    ).first()
+    if not work_item:
+        raise HTTPException(status_code=404, detail="Work item not found")
+    return work_item
+
+
+def _convert_task_progress_to_response(work_item: WorkItem, tasks: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """Summarize changed tasks together with the work item's maintained counters"""
+    return {
+        "work_item_id": work_item.id,
+        "tasks": tasks,
+        "task_count": work_item.task_count,
+        "completed_task_count": work_item.completed_task_count,
+        "progress_percentage": round(work_item.calculate_progress() * 100, 2)
+    }
+
+
+@router.post("/{work_item_id}/tasks", response_model=TaskProgressResponse, status_code=201)
+def add_work_item_task(
+    work_item_id: str,
+    task_data: TaskCreate,
+    organization_id: str = Query(..., description="Organization ID to scope the request"),
+    session: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    """Append a task to a work item"""
+    
+    work_item = _get_work_item_for_tasks(session, work_item_id, organization_id)
+    task = work_item.add_task(task_data.title, completed=task_data.completed)
+    session.commit()
+    
+    return _convert_task_progress_to_response(work_item, [task])
+
+
+@router.patch("/{work_item_id}/tasks/{task_id}", response_model=TaskProgressResponse)
+def patch_work_item_task(
+    work_item_id: str,
+    task_id: int,
+    task_data: TaskUpdate,
+    organization_id: str = Query(..., description="Organization ID to scope the request"),
+    session: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    """Partially update a single task; only that task's row and the counters are written"""
+    
+    work_item = _get_work_item_for_tasks(session, work_item_id, organization_id)
+    task = work_item.update_task(task_id, title=task_data.title, completed=task_data.completed)
+    if task is None:
+        raise HTTPException(status_code=404, detail="Task not found")
+    session.commit()
+    
+    return _convert_task_progress_to_response(work_item, [task])
+
+
+@router.patch("/{work_item_id}/tasks", response_model=TaskProgressResponse)
+def batch_update_work_item_tasks(
+    work_item_id: str,
+    batch_data: TaskBatchUpdate,
+    organization_id: str = Query(..., description="Organization ID to scope the request"),
+    session: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    """Set the completion status of several tasks in one request"""
+    
+    work_item = _get_work_item_for_tasks(session, work_item_id, organization_id)
+    missing = work_item.set_tasks_completed(batch_data.task_ids, batch_data.completed)
+    if missing:
+        session.rollback()
+        raise HTTPException(status_code=404, detail=f"Tasks not found: {', '.join(str(task_id) for task_id in missing)}")
+    session.commit()
+    
+    task_ids = set(batch_data.task_ids)
+    return _convert_task_progress_to_response(
+        work_item, [task for task in work_item.tasks if task["id"] in task_ids]
+    )
+
+
+@router.delete("/{work_item_id}/tasks/{task_id}", status_code=204)
+def delete_work_item_task(
+    work_item_id: str,
+    task_id: int,
+    organization_id: str = Query(..., description="Organization ID to scope the request"),
+    session: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    """Remove a task from a work item"""
+    
+    work_item = _get_work_item_for_tasks(session, work_item_id, organization_id)
+    if not work_item.remove_task(task_id):
+        raise HTTPException(status_code=404, detail="Task not found")
+    session.commit()
@@ -0,0 +1,74 @@
+# src/dbr/core/data_version.py
+from collections import defaultdict
+from threading import Lock
+from typing import Dict, Set, Tuple
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+
+# Committed change counters per (organization_id, table name)
+_versions: Dict[Tuple[str, str], int] = defaultdict(int)
+_lock = Lock()
+
+_PENDING_KEY = "dbr_changed_tables"
+
+# Pseudo table bumped by every time unit tick
+TIME_UNITS = "time_units"
+
+
+def get_data_version(organization_id: str, *tablenames: str) -> Tuple[int, ...]:
+    """Current change counters of the given tables for an organization.
+
+    Counters increase whenever a transaction that inserted, updated or
+    deleted a row of the table for the organization commits in this process,
+    so a cached value derived from those tables is stale once they differ.
+    """
+    with _lock:
+        return tuple(_versions[(organization_id, tablename)] for tablename in tablenames)
+
+
+def bump_data_version(organization_id: str, tablename: str) -> None:
+    """Mark a table as changed for an organization (for writes that bypass the ORM)"""
+    with _lock:
+        _versions[(organization_id, tablename)] += 1
+
+
+def mark_data_changed(session: Session, organization_id: str, tablename: str) -> None:
+    """Bump a table's version for an organization when the session's transaction commits"""
+    session.info.setdefault(_PENDING_KEY, set()).add((organization_id, tablename))
+
+
+def has_pending_changes(session: Session, organization_id: str) -> bool:
+    """Whether the session holds changes that other sessions cannot see yet.
+
+    Values cached by data version must not be served to such a session, as
+    they would hide its own writes.
+    """
+    if session.new or session.deleted or any(session.is_modified(obj) for obj in session.dirty):
+        return True
+    return any(pending[0] == organization_id for pending in session.info.get(_PENDING_KEY, ()))
+
+
+@event.listens_for(Session, "before_flush")
+def _collect_changed_tables(session, flush_context, instances):
+    """Remember which organizations' tables this transaction touches"""
+    pending: Set[Tuple[str, str]] = session.info.setdefault(_PENDING_KEY, set())
+    changed = list(session.new) + list(session.deleted) + [
+        obj for obj in session.dirty if session.is_modified(obj)
+    ]
+    for obj in changed:
+        organization_id = getattr(obj, "organization_id", None)
+        tablename = getattr(obj, "__tablename__", None)
+        if organization_id and tablename:
+            pending.add((organization_id, tablename))
+
+
+@event.listens_for(Session, "after_commit")
+def _bump_changed_tables(session):
+    for organization_id, tablename in session.info.pop(_PENDING_KEY, set()):
+        bump_data_version(organization_id, tablename)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_changed_tables(session):
+    session.info.pop(_PENDING_KEY, None)
@@ -1,4 +1,6 @@
 # src/dbr/core/database.py
+from contextvars import ContextVar
+from typing import Optional
 from sqlalchemy import create_engine, text
 from sqlalchemy.orm import sessionmaker, Session
 from sqlalchemy.pool import StaticPool
@@ -22,6 +24,19 @@ else:
 # Create session factory
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+# Session shared by the sub-requests of a POST /batch call (see dbr.api.batch)
+batch_session: ContextVar[Optional[Session]] = ContextVar("dbr_batch_session", default=None)
+
+
+class BatchSession(Session):
+    """Session of an atomic batch: endpoint commits only flush, the batch commits or rolls back once"""
+
+    def commit(self) -> None:
+        self.flush()
+
+    def commit_batch(self) -> None:
+        super().commit()
+
 
 def create_tables():
     """Create all database tables and perform lightweight migrations for SQLite"""
@@ -46,10 +61,138 @@ def create_tables():
                     conn.execute(text("ALTER TABLE work_items ADD COLUMN url TEXT"))
                 except Exception:
                     pass
+            # Add maintained task counters if missing
+            for column in ("task_count", "completed_task_count"):
+                if column not in cols:
+                    try:
+                        conn.execute(text(f"ALTER TABLE work_items ADD COLUMN {column} INTEGER NOT NULL DEFAULT 0"))
+                    except Exception:
+                        pass
+            # Add derived metric columns and their indexes if missing
+            for column in ("throughput", "total_ccr_hours", "progress", "throughput_per_ccr_hour"):
+                if column not in cols:
+                    try:
+                        conn.execute(text(f"ALTER TABLE work_items ADD COLUMN {column} FLOAT"))
+                    except Exception:
+                        pass
+                try:
+                    conn.execute(text(
+                        f"CREATE INDEX IF NOT EXISTS ix_work_items_org_{column} ON work_items (organization_id, {column})"
+                    ))
+                except Exception:
+                    pass
+            # Add buffer zone threshold ratios to board_configs if missing
+            try:
+                board_cols = [row[1] for row in conn.execute(text("PRAGMA table_info(board_configs);")).fetchall()]
+            except Exception:
+                board_cols = []
+            if "buffer_yellow_ratio" not in board_cols:
+                try:
+                    conn.execute(text("ALTER TABLE board_configs ADD COLUMN buffer_yellow_ratio FLOAT NOT NULL DEFAULT 0.6"))
+                except Exception:
+                    pass
+            if "buffer_green_ratio" not in board_cols:
+                try:
+                    conn.execute(text("ALTER TABLE board_configs ADD COLUMN buffer_green_ratio FLOAT NOT NULL DEFAULT 0.4"))
+                except Exception:
+                    pass
+            # Add the organization time unit counter if missing
+            try:
+                org_cols = [row[1] for row in conn.execute(text("PRAGMA table_info(organizations);")).fetchall()]
+            except Exception:
+                org_cols = []
+            if "current_time_unit" not in org_cols:
+                try:
+                    conn.execute(text("ALTER TABLE organizations ADD COLUMN current_time_unit INTEGER NOT NULL DEFAULT 0"))
+                except Exception:
+                    pass
+            # Add capacity ledger booking columns to schedules if missing
+            try:
+                schedule_cols = [row[1] for row in conn.execute(text("PRAGMA table_info(schedules);")).fetchall()]
+            except Exception:
+                schedule_cols = []
+            if "ccr_slot" not in schedule_cols:
+                try:
+                    conn.execute(text("ALTER TABLE schedules ADD COLUMN ccr_slot INTEGER"))
+                except Exception:
+                    pass
+            if "booked_ccr_hours" not in schedule_cols:
+                try:
+                    conn.execute(text("ALTER TABLE schedules ADD COLUMN booked_ccr_hours FLOAT NOT NULL DEFAULT 0.0"))
+                except Exception:
+                    pass
+            # Release queue columns
+            for column, ddl in (
+                ("is_queued", "BOOLEAN NOT NULL DEFAULT 0"),
+                ("release_priority", "INTEGER NOT NULL DEFAULT 0"),
+                ("release_due_date", "DATETIME"),
+                ("queued_date", "DATETIME"),
+            ):
+                if column not in schedule_cols:
+                    try:
+                        conn.execute(text(f"ALTER TABLE schedules ADD COLUMN {column} {ddl}"))
+                    except Exception:
+                        pass
+            try:
+                conn.execute(text(
+                    "CREATE INDEX IF NOT EXISTS ix_schedules_board_queued ON schedules (board_config_id, is_queued)"
+                ))
+                conn.execute(text(
+                    "CREATE INDEX IF NOT EXISTS ix_schedules_ccr_slot ON schedules (capability_channel_id, ccr_slot)"
+                ))
+            except Exception:
+                pass
+            # Add contribution windows to ccr_user_associations if missing
+            try:
+                association_cols = [row[1] for row in conn.execute(text("PRAGMA table_info(ccr_user_associations);")).fetchall()]
+            except Exception:
+                association_cols = []
+            for column in ("start_slot", "end_slot"):
+                if column not in association_cols:
+                    try:
+                        conn.execute(text(f"ALTER TABLE ccr_user_associations ADD COLUMN {column} INTEGER"))
+                    except Exception:
+                        pass
+            # Resolve normalized CCR hours to CCR ids (rows are resolved by the backfill below)
+            try:
+                ccr_hours_cols = [row[1] for row in conn.execute(text("PRAGMA table_info(work_item_ccr_hours);")).fetchall()]
+            except Exception:
+                ccr_hours_cols = []
+            if ccr_hours_cols and "ccr_id" not in ccr_hours_cols:
+                try:
+                    conn.execute(text("ALTER TABLE work_item_ccr_hours ADD COLUMN ccr_id VARCHAR(36) REFERENCES ccrs(id)"))
+                except Exception:
+                    pass
+            try:
+                conn.execute(text(
+                    "CREATE INDEX IF NOT EXISTS ix_work_item_ccr_hours_ccr_id ON work_item_ccr_hours (ccr_id)"
+                ))
+            except Exception:
+                pass
+    # Backfill normalized CCR hours, tasks, schedule membership, derived metrics, capacity bookings and the change log
+    from dbr.models.work_item import backfill_work_item_ccr_hours, backfill_work_item_tasks, backfill_work_item_metrics
+    from dbr.models.schedule import backfill_schedule_items, backfill_capacity_ledger
+    from dbr.models.change_log import backfill_change_log
+    
+    db = SessionLocal()
+    try:
+        backfill_work_item_ccr_hours(db)
+        backfill_work_item_tasks(db)
+        backfill_work_item_metrics(db)
+        backfill_schedule_items(db)
+        backfill_capacity_ledger(db)
+        backfill_change_log(db)
+    finally:
+        db.close()
 
 
 def get_db():
     """Dependency to get database session"""
+    shared = batch_session.get()
+    if shared is not None:
+        # Inside a batch: the batch owns and closes the session
+        yield shared
+        return
     db = SessionLocal()
     try:
         yield db
@@ -0,0 +1,50 @@
+# src/dbr/core/etag.py
+import hashlib
+import uuid
+from typing import Optional, Sequence
+from fastapi import Request, Response
+from dbr.core.data_version import get_data_version
+
+
+# Data versions restart with the process, so tags carry the process they were issued by
+_PROCESS_ID = uuid.uuid4().hex
+
+
+def make_etag(request: Request, organization_id: str, tablenames: Sequence[str]) -> str:
+    """Weak ETag of a read response: the URL plus the data version of the tables it is built from"""
+    version = get_data_version(organization_id, *tablenames)
+    key = f"{_PROCESS_ID}|{request.url.path}|{request.url.query}|{organization_id}|{version}"
+    return f'W/"{hashlib.blake2s(key.encode(), digest_size=12).hexdigest()}"'
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """Weak comparison of an If-None-Match header against an ETag"""
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    opaque = etag[2:] if etag.startswith("W/") else etag
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if (candidate[2:] if candidate.startswith("W/") else candidate) == opaque:
+            return True
+    return False
+
+
+def conditional_get(
+    request: Request,
+    response: Response,
+    organization_id: str,
+    tablenames: Sequence[str]
+) -> Optional[Response]:
+    """Tag a read response and short-circuit it when the client already has this version.
+
+    Sets the ETag header on ``response`` and returns a 304 response to send
+    instead when ``If-None-Match`` matches, so the endpoint can return
+    before building and serializing its payload. Returns None otherwise.
+    """
+    etag = make_etag(request, organization_id, tablenames)
+    response.headers["ETag"] = etag
+    if etag_matches(request.headers.get("if-none-match"), etag):
+        return Response(status_code=304, headers={"ETag": etag})
+    return None
@@ -0,0 +1,196 @@
+# src/dbr/core/events.py
+import asyncio
+import itertools
+import json
+from threading import Lock
+from typing import Any, Dict, List, Optional, Set, Tuple
+from sqlalchemy import event, inspect
+from sqlalchemy.orm import Session
+from dbr.models.schedule import Schedule
+from dbr.models.work_item import WorkItem, WorkItemStatus
+
+
+_PENDING_KEY = "dbr_pending_events"
+
+
+class Subscription:
+    """One live event stream: a bounded queue fed from any thread, drained on its event loop.
+
+    When the consumer falls behind, the oldest events are dropped and
+    ``overflowed`` is set so the stream can tell the client to resync.
+    """
+
+    def __init__(self, loop: asyncio.AbstractEventLoop, organization_id: str,
+                 board_config_id: Optional[str] = None, maxsize: int = 100):
+        self.loop = loop
+        self.organization_id = organization_id
+        self.board_config_id = board_config_id
+        self.queue: "asyncio.Queue[Dict[str, Any]]" = asyncio.Queue(maxsize=maxsize)
+        self.overflowed = False
+        self.dropped = 0
+
+    def matches(self, event_data: Dict[str, Any]) -> bool:
+        """Organization-wide events reach every stream of the organization, board events their board's"""
+        if event_data["organization_id"] != self.organization_id:
+            return False
+        board_config_id = event_data.get("board_config_id")
+        return self.board_config_id is None or board_config_id is None or board_config_id == self.board_config_id
+
+    def offer(self, event_data: Dict[str, Any]) -> None:
+        """Queue an event from any thread"""
+        try:
+            self.loop.call_soon_threadsafe(self._put, event_data)
+        except RuntimeError:
+            # Event loop already closed; the stream is gone
+            pass
+
+    def _put(self, event_data: Dict[str, Any]) -> None:
+        if self.queue.full():
+            self.queue.get_nowait()
+            self.overflowed = True
+            self.dropped += 1
+        self.queue.put_nowait(event_data)
+
+    async def get(self, timeout: Optional[float] = None) -> Optional[Dict[str, Any]]:
+        """Next event, or None if none arrived within ``timeout`` seconds"""
+        try:
+            return await asyncio.wait_for(self.queue.get(), timeout)
+        except asyncio.TimeoutError:
+            return None
+
+
+class EventBroker:
+    """In-process publish/subscribe of board change events.
+
+    Events are plain dicts with ``id``, ``type``, ``organization_id`` and
+    ``board_config_id`` (None for organization-wide events) plus a few
+    type-specific fields. Delivery is best effort and only reaches streams
+    served by this process.
+    """
+
+    def __init__(self):
+        self._subscriptions: Set[Subscription] = set()
+        self._lock = Lock()
+        self._ids = itertools.count(1)
+        # Alerts currently raised per board, so only new ones are published
+        self._active_alerts: Dict[str, Set[Tuple[str, str]]] = {}
+
+    def subscribe(self, organization_id: str, board_config_id: Optional[str] = None, maxsize: int = 100) -> Subscription:
+        """Open a stream on the running event loop"""
+        subscription = Subscription(asyncio.get_running_loop(), organization_id, board_config_id, maxsize)
+        with self._lock:
+            self._subscriptions.add(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription: Subscription) -> None:
+        with self._lock:
+            self._subscriptions.discard(subscription)
+
+    @property
+    def subscriber_count(self) -> int:
+        with self._lock:
+            return len(self._subscriptions)
+
+    def publish(self, event_data: Dict[str, Any]) -> Dict[str, Any]:
+        """Assign the event an ID and hand it to every matching stream"""
+        event_data = dict(event_data, id=next(self._ids))
+        with self._lock:
+            subscriptions = [s for s in self._subscriptions if s.matches(event_data)]
+        for subscription in subscriptions:
+            subscription.offer(event_data)
+        return event_data
+
+    def publish_buffer_alerts(self, organization_id: str, board_config_id: str, alerts: List[Dict[str, Any]]) -> None:
+        """Publish the board's alerts that were not raised at its previous tick"""
+        current = {(alert["zone"], alert["severity"]): alert for alert in alerts}
+        with self._lock:
+            previous = self._active_alerts.get(board_config_id, set())
+            self._active_alerts[board_config_id] = set(current)
+        for key, alert in current.items():
+            if key not in previous:
+                self.publish({
+                    "type": "buffer_alert",
+                    "organization_id": organization_id,
+                    "board_config_id": board_config_id,
+                    "zone": alert["zone"],
+                    "severity": alert["severity"],
+                    "message": alert["message"],
+                })
+
+
+event_broker = EventBroker()
+
+
+def publish_on_commit(session: Session, event_data: Dict[str, Any]) -> None:
+    """Publish an event once the session's transaction commits; rolled back events are dropped"""
+    session.info.setdefault(_PENDING_KEY, []).append(event_data)
+
+
+def format_sse(event_data: Dict[str, Any]) -> str:
+    """Encode an event as a text/event-stream message"""
+    return f"id: {event_data['id']}\nevent: {event_data['type']}\ndata: {json.dumps(event_data, default=str)}\n\n"
+
+
+def _previous_value(obj, attribute: str):
+    history = inspect(obj).attrs[attribute].history
+    if not history.has_changes():
+        return None, False
+    return (history.deleted[0] if history.deleted else None), True
+
+
+# Load the replaced value even when the attribute was expired, so events carry where a change came from
+for _attribute in (Schedule.time_unit_position, Schedule.status, WorkItem.status):
+    event.listen(_attribute, "set", lambda target, value, oldvalue, initiator: value, active_history=True, retval=True)
+
+
+@event.listens_for(Session, "before_flush")
+def _collect_change_events(session, flush_context, instances):
+    """Turn schedule moves, schedule status changes and newly ready work items into events"""
+    for obj in session.dirty:
+        if isinstance(obj, Schedule):
+            old_position, moved = _previous_value(obj, "time_unit_position")
+            if moved and old_position != obj.time_unit_position:
+                publish_on_commit(session, {
+                    "type": "schedule_moved",
+                    "organization_id": obj.organization_id,
+                    "board_config_id": obj.board_config_id,
+                    "schedule_id": obj.id,
+                    "from_position": old_position,
+                    "to_position": obj.time_unit_position,
+                })
+            old_status, changed = _previous_value(obj, "status")
+            if changed and old_status != obj.status:
+                publish_on_commit(session, {
+                    "type": "schedule_status_changed",
+                    "organization_id": obj.organization_id,
+                    "board_config_id": obj.board_config_id,
+                    "schedule_id": obj.id,
+                    "from_status": old_status.value if old_status is not None else None,
+                    "to_status": obj.status.value,
+                })
+        elif isinstance(obj, WorkItem):
+            old_status, changed = _previous_value(obj, "status")
+            if changed and old_status != obj.status and obj.status == WorkItemStatus.READY:
+                publish_on_commit(session, {
+                    "type": "work_item_ready",
+                    "organization_id": obj.organization_id,
+                    "board_config_id": None,
+                    "work_item_id": obj.id,
+                    "title": obj.title,
+                })
+
+
+@event.listens_for(Session, "after_commit")
+def _publish_pending_events(session):
+    for event_data in session.info.pop(_PENDING_KEY, []):
+        if event_data["type"] == "buffer_alerts":
+            event_broker.publish_buffer_alerts(
+                event_data["organization_id"], event_data["board_config_id"], event_data["alerts"]
+            )
+        else:
+            event_broker.publish(event_data)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_pending_events(session):
+    session.info.pop(_PENDING_KEY, None)
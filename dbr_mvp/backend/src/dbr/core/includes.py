@@ -0,0 +1,21 @@
+# src/dbr/core/includes.py
+from typing import Optional, Sequence, Set
+from fastapi import HTTPException
+
+
+def parse_include(include: Optional[str], allowed: Sequence[str]) -> Set[str]:
+    """Parse an ``include=a,b`` query parameter into the set of related resources to embed.
+
+    Unknown names are rejected with 422 so typos do not silently fall back
+    to one request per related row on the client.
+    """
+    if not include:
+        return set()
+    requested = {name.strip() for name in include.split(",") if name.strip()}
+    unknown = requested - set(allowed)
+    if unknown:
+        raise HTTPException(
+            status_code=422,
+            detail=f"Invalid include: {', '.join(sorted(unknown))}. Must be any of: {', '.join(allowed)}"
+        )
+    return requested
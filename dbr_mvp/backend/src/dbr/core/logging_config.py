@@ -37,6 +37,10 @@ class JSONFormatter(logging.Formatter):
             log_entry['status_code'] = record.status_code
         if hasattr(record, 'duration_ms'):
             log_entry['duration_ms'] = record.duration_ms
+        if hasattr(record, 'db_query_count'):
+            log_entry['db_query_count'] = record.db_query_count
+        if hasattr(record, 'db_duration_ms'):
+            log_entry['db_duration_ms'] = record.db_duration_ms
         
         # Add exception info if present
         if record.exc_info:
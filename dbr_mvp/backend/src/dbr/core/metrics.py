@@ -0,0 +1,223 @@
+# src/dbr/core/metrics.py
+from bisect import bisect_left
+from threading import Lock
+from typing import Dict, List, Sequence, Tuple
+
+
+# Request and query latencies in seconds
+LATENCY_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+# Statements per request
+QUERY_COUNT_BUCKETS = (1, 2, 5, 10, 20, 50, 100, 200, 500, 1000)
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(labelnames: Sequence[str], values: Sequence[str], extra: str = "") -> str:
+    pairs = [f'{name}="{_escape(value)}"' for name, value in zip(labelnames, values)]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+def _format_value(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+class _Metric:
+    """A named metric with one child per label value combination.
+
+    Children are created once and cached, and each guards its own values
+    with its own lock, so recording never takes a shared lock and allocates
+    nothing once a label combination has been seen.
+    """
+    kind = ""
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._children: Dict[Tuple[str, ...], object] = {}
+        self._lock = Lock()
+
+    def labels(self, *values: str):
+        """Child for a label value combination (created on first use)"""
+        child = self._children.get(values)
+        if child is None:
+            with self._lock:
+                child = self._children.setdefault(values, self._new_child())
+        return child
+
+    def _new_child(self):
+        raise NotImplementedError
+
+    def _default(self):
+        return self.labels(*())
+
+    def collect(self) -> List[str]:
+        lines = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} {self.kind}"]
+        with self._lock:
+            children = list(self._children.items())
+        for values, child in children:
+            lines.extend(self._sample_lines(values, child))
+        return lines
+
+    def _sample_lines(self, values, child) -> List[str]:
+        return [f"{self.name}{_format_labels(self.labelnames, values)} {_format_value(child.get())}"]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._children.clear()
+
+
+class _Value:
+    __slots__ = ("value", "lock")
+
+    def __init__(self):
+        self.value = 0.0
+        self.lock = Lock()
+
+    def inc(self, amount: float = 1.0) -> None:
+        with self.lock:
+            self.value += amount
+
+    def dec(self, amount: float = 1.0) -> None:
+        with self.lock:
+            self.value -= amount
+
+    def set(self, value: float) -> None:
+        self.value = value
+
+    def get(self) -> float:
+        return self.value
+
+
+class Counter(_Metric):
+    """Monotonically increasing count"""
+    kind = "counter"
+
+    def _new_child(self):
+        return _Value()
+
+    def inc(self, amount: float = 1.0) -> None:
+        self._default().inc(amount)
+
+
+class Gauge(_Metric):
+    """Value that can go up and down"""
+    kind = "gauge"
+
+    def _new_child(self):
+        return _Value()
+
+    def inc(self, amount: float = 1.0) -> None:
+        self._default().inc(amount)
+
+    def dec(self, amount: float = 1.0) -> None:
+        self._default().dec(amount)
+
+    def set(self, value: float) -> None:
+        self._default().set(value)
+
+
+class _HistogramValue:
+    __slots__ = ("bounds", "counts", "sum", "lock")
+
+    def __init__(self, bounds: Tuple[float, ...]):
+        self.bounds = bounds
+        self.counts = [0] * (len(bounds) + 1)  # per bucket, last one is +Inf
+        self.sum = 0.0
+        self.lock = Lock()
+
+    def observe(self, value: float) -> None:
+        index = bisect_left(self.bounds, value)
+        with self.lock:
+            self.counts[index] += 1
+            self.sum += value
+
+    def get(self) -> Tuple[List[int], float]:
+        with self.lock:
+            return list(self.counts), self.sum
+
+
+class Histogram(_Metric):
+    """Distribution of observed values over fixed buckets"""
+    kind = "histogram"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = (),
+                 buckets: Sequence[float] = LATENCY_BUCKETS):
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets))
+
+    def _new_child(self):
+        return _HistogramValue(self.buckets)
+
+    def observe(self, value: float) -> None:
+        self._default().observe(value)
+
+    def _sample_lines(self, values, child) -> List[str]:
+        counts, total = child.get()
+        lines = []
+        cumulative = 0
+        for bound, count in zip(self.buckets + (float("inf"),), counts):
+            cumulative += count
+            labels = _format_labels(self.labelnames, values, f'le="{_format_value(float(bound))}"')
+            lines.append(f"{self.name}_bucket{labels} {cumulative}")
+        labels = _format_labels(self.labelnames, values)
+        lines.append(f"{self.name}_sum{labels} {_format_value(total)}")
+        lines.append(f"{self.name}_count{labels} {cumulative}")
+        return lines
+
+
+class MetricsRegistry:
+    """The metrics exposed on /metrics"""
+
+    def __init__(self):
+        self._metrics: List[_Metric] = []
+
+    def register(self, metric: _Metric) -> _Metric:
+        self._metrics.append(metric)
+        return metric
+
+    def render(self) -> str:
+        """All metrics in the Prometheus text exposition format"""
+        lines = []
+        for metric in self._metrics:
+            lines.extend(metric.collect())
+        return "\n".join(lines) + "\n"
+
+
+registry = MetricsRegistry()
+
+HTTP_REQUESTS_IN_FLIGHT = registry.register(Gauge(
+    "dbr_http_requests_in_flight", "HTTP requests currently being handled"))
+HTTP_REQUESTS = registry.register(Counter(
+    "dbr_http_requests_total", "HTTP requests handled", ("method", "route", "status")))
+HTTP_REQUEST_DURATION = registry.register(Histogram(
+    "dbr_http_request_duration_seconds", "HTTP request latency", ("method", "route")))
+REQUEST_DB_QUERIES = registry.register(Histogram(
+    "dbr_http_request_db_queries", "SQL statements run per HTTP request", ("method", "route"),
+    buckets=QUERY_COUNT_BUCKETS))
+REQUEST_DB_DURATION = registry.register(Histogram(
+    "dbr_http_request_db_duration_seconds", "Time spent in SQL statements per HTTP request", ("method", "route")))
+DB_QUERY_DURATION = registry.register(Histogram(
+    "dbr_db_query_duration_seconds", "SQL statement latency"))
+TICK_DURATION = registry.register(Histogram(
+    "dbr_tick_duration_seconds", "Duration of one time unit tick", ("engine",)))
+TICK_SCHEDULES = registry.register(Counter(
+    "dbr_tick_schedules_total", "Schedules advanced, completed and released by ticks", ("engine", "outcome")))
+BUFFER_ZONE_OCCUPANCY = registry.register(Gauge(
+    "dbr_buffer_zone_occupancy", "Active schedules per buffer zone at the last tick", ("board_config_id", "zone")))
+BUFFER_ZONE_CAPACITY = registry.register(Gauge(
+    "dbr_buffer_zone_capacity", "Slots per buffer zone at the last tick", ("board_config_id", "zone")))
+
+
+def record_tick(engine: str, duration: float, advanced: int, completed: int, released: int) -> None:
+    """Record one tick of a time progression engine"""
+    TICK_DURATION.labels(engine).observe(duration)
+    TICK_SCHEDULES.labels(engine, "advanced").inc(advanced)
+    TICK_SCHEDULES.labels(engine, "completed").inc(completed)
+    TICK_SCHEDULES.labels(engine, "released").inc(released)
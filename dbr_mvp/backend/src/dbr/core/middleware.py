@@ -5,6 +5,14 @@ from typing import Callable
 from fastapi import Request, Response
 from starlette.middleware.base import BaseHTTPMiddleware
 from dbr.core.logging_config import get_logger, LogContext
+from dbr.core.metrics import (
+    HTTP_REQUESTS,
+    HTTP_REQUESTS_IN_FLIGHT,
+    HTTP_REQUEST_DURATION,
+    REQUEST_DB_QUERIES,
+    REQUEST_DB_DURATION,
+)
+from dbr.core.query_stats import QueryStats, current_query_stats
 import json
 
 
@@ -51,11 +59,16 @@ class RequestLoggingMiddleware(BaseHTTPMiddleware):
                 # Calculate duration
                 duration_ms = round((time.time() - start_time) * 1000, 2)
                 
-                # Log response
-                self.logger.info(f"Request completed: {request.method} {request.url.path}", extra={
+                # Log response, with the SQL statements it took when MetricsMiddleware counts them
+                extra = {
                     "status_code": response.status_code,
                     "duration_ms": duration_ms
-                })
+                }
+                query_stats = current_query_stats.get()
+                if query_stats is not None:
+                    extra["db_query_count"] = query_stats.count
+                    extra["db_duration_ms"] = round(query_stats.duration * 1000, 2)
+                self.logger.info(f"Request completed: {request.method} {request.url.path}", extra=extra)
                 
                 return response
                 
@@ -155,6 +168,90 @@ class ErrorLoggingMiddleware(BaseHTTPMiddleware):
             raise
 
 
+class MetricsMiddleware:
+    """Record request latency, in-flight requests and per-request SQL statistics for /metrics
+
+    A plain ASGI middleware rather than BaseHTTPMiddleware, so it adds no
+    task or response wrapping to every request. Requests are labelled with
+    the matched route template, not the raw path, to keep label sets bounded.
+
+    A warning is logged when one statement shape runs more than
+    query_repeat_threshold times in a request, the usual sign of an N+1
+    query. With expose_query_stats (debug mode) the statement count and DB
+    time are also returned in X-DB-Query-Count and X-DB-Duration-Ms headers.
+    """
+
+    def __init__(self, app, query_repeat_threshold: int = 10, expose_query_stats: bool = False):
+        self.app = app
+        self.query_repeat_threshold = query_repeat_threshold
+        self.expose_query_stats = expose_query_stats
+        self.logger = get_logger("database")
+        # id of the route object -> full path template, including the prefixes of the routers it was included with
+        self._templates = {}
+
+    def _route_template(self, scope) -> str:
+        route = scope.get("route")
+        if route is None:
+            return "unmatched"
+        template = self._templates.get(id(route))
+        if template is None:
+            # Depending on the FastAPI version the matched route carries the full path or only its
+            # own router's; find the include prefix as the part of the path its pattern does not cover
+            path = scope["path"]
+            prefix = ""
+            for index, char in enumerate(path):
+                if char == "/" and route.path_regex.match(path[index:]):
+                    prefix = path[:index]
+                    break
+            template = self._templates.setdefault(id(route), prefix + route.path)
+        return template
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        status_code = 500
+
+        stats = QueryStats()
+
+        async def send_with_status(message):
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                if self.expose_query_stats:
+                    message["headers"] = list(message.get("headers", [])) + [
+                        (b"x-db-query-count", str(stats.count).encode()),
+                        (b"x-db-duration-ms", str(round(stats.duration * 1000, 2)).encode()),
+                    ]
+            await send(message)
+
+        # Sub-requests of a batch run through the middleware again; their statements count towards the batch too
+        parent_stats = current_query_stats.get()
+        token = current_query_stats.set(stats)
+        HTTP_REQUESTS_IN_FLIGHT.inc()
+        start_time = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            duration = time.perf_counter() - start_time
+            HTTP_REQUESTS_IN_FLIGHT.dec()
+            current_query_stats.reset(token)
+            route_path = self._route_template(scope)
+            method = scope["method"]
+            HTTP_REQUESTS.labels(method, route_path, str(status_code)).inc()
+            HTTP_REQUEST_DURATION.labels(method, route_path).observe(duration)
+            REQUEST_DB_QUERIES.labels(method, route_path).observe(stats.count)
+            REQUEST_DB_DURATION.labels(method, route_path).observe(stats.duration)
+            if parent_stats is not None:
+                parent_stats.merge(stats)
+            for shape, count in stats.repeated(self.query_repeat_threshold):
+                self.logger.warning(f"Repeated SQL statement ({count}x, possible N+1): {method} {route_path}", extra={
+                    "statement": shape,
+                    "repeat_count": count,
+                    "db_query_count": stats.count
+                })
+
 # Utility function to log business logic events
 def log_business_event(event_type: str, details: dict = None, user_id: str = None, organization_id: str = None):
     """Log business logic events (work item creation, schedule changes, etc.)"""
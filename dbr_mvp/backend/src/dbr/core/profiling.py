@@ -0,0 +1,224 @@
+# src/dbr/core/profiling.py
+import json
+import random
+import re
+import sys
+import threading
+import time
+import uuid
+from collections import Counter
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Tuple
+from starlette.concurrency import run_in_threadpool
+from dbr.core.logging_config import get_logger
+
+
+# Request header asking for a profile of that request (honoured for super admins only)
+PROFILE_HEADER = b"x-profile"
+# Response header naming the stored profile
+PROFILE_ID_HEADER = b"x-profile-id"
+
+_PROFILE_ID = re.compile(r"^\d+-[0-9a-f]{8}$")
+# Long-lived streams would hold the profiler for as long as the client stays connected
+_EVENT_STREAM = b"text/event-stream"
+# Modules whose frames at the top of a stack mean the thread is parked, not working
+_IDLE_MODULES = frozenset({"threading", "selectors", "queue"})
+
+
+def new_profile_id() -> str:
+    """Profile ids start with the creation time in milliseconds, so they sort by age"""
+    return f"{int(time.time() * 1000)}-{uuid.uuid4().hex[:8]}"
+
+
+def _collapse(frame) -> str:
+    """Stack of a frame, outermost first, in the collapsed (flame graph) format"""
+    names = []
+    while frame is not None:
+        code = frame.f_code
+        names.append(f"{frame.f_globals.get('__name__', '?')}:{code.co_qualname}")
+        frame = frame.f_back
+    return ";".join(reversed(names))
+
+
+class StackSampler:
+    """Samples the stacks of all other threads at a fixed interval
+
+    A sampling rather than a deterministic profiler: cProfile only sees the
+    thread that enabled it, while sync endpoints run in the threadpool. Parked
+    threads (idle workers, the event loop waiting in select) are skipped, but
+    other requests running at the same time do show up in the samples.
+    """
+
+    def __init__(self, interval: float = 0.005):
+        self.interval = interval
+        self.stacks = Counter()
+        self.samples = 0
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="dbr-stack-sampler", daemon=True)
+
+    def _run(self) -> None:
+        own_id = threading.get_ident()
+        while not self._stop.wait(self.interval):
+            self.samples += 1
+            for thread_id, frame in sys._current_frames().items():
+                if thread_id == own_id or frame.f_globals.get("__name__") in _IDLE_MODULES:
+                    continue
+                self.stacks[_collapse(frame)] += 1
+
+    def start(self) -> None:
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        self._thread.join()
+
+    def collapsed(self) -> str:
+        """One "frame;frame;frame count" line per distinct stack, for flamegraph.pl or speedscope"""
+        return "".join(f"{stack} {count}\n" for stack, count in self.stacks.most_common())
+
+
+class ProfileStore:
+    """Profiles on local disk, keeping only the newest max_profiles
+
+    Each profile is a .folded file of collapsed stacks with a .json file of
+    request details next to it.
+    """
+
+    def __init__(self, directory: str, max_profiles: int = 50):
+        self.directory = Path(directory)
+        self.max_profiles = max_profiles
+        self._lock = threading.Lock()
+
+    def save(self, profile_id: str, details: Dict, collapsed: str) -> None:
+        details = dict(details, id=profile_id, created_date=datetime.now(timezone.utc).isoformat())
+        with self._lock:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            (self.directory / f"{profile_id}.folded").write_text(collapsed)
+            (self.directory / f"{profile_id}.json").write_text(json.dumps(details))
+            for stale in self._details_files()[self.max_profiles:]:
+                stale.unlink(missing_ok=True)
+                stale.with_suffix(".folded").unlink(missing_ok=True)
+
+    def _details_files(self) -> List[Path]:
+        # Newest first
+        if not self.directory.is_dir():
+            return []
+        return sorted(self.directory.glob("*.json"), key=lambda path: path.stem, reverse=True)
+
+    def list(self) -> List[Dict]:
+        profiles = []
+        for path in self._details_files():
+            try:
+                profiles.append(json.loads(path.read_text()))
+            except (OSError, ValueError):
+                continue  # Pruned or half written
+        return profiles
+
+    def get(self, profile_id: str) -> Optional[str]:
+        """Collapsed stacks of a profile, or None if there is no such profile"""
+        if not _PROFILE_ID.match(profile_id):
+            return None
+        try:
+            return (self.directory / f"{profile_id}.folded").read_text()
+        except OSError:
+            return None
+
+
+class ProfilingMiddleware:
+    """Profile requests on demand and store the result in a ProfileStore
+
+    A request is profiled when it carries the X-Profile header and authorize
+    accepts its headers, or at random with probability sample_rate. Only one
+    request is profiled at a time; others run unprofiled meanwhile. Profiled
+    responses name their profile in the X-Profile-Id header.
+
+    Event streams are never profiled: requests under excluded_paths or that
+    accept text/event-stream are passed straight through, and a profile is
+    dropped as soon as its response turns out to be an event stream.
+    authorize may query the database, so it runs in the threadpool.
+    """
+
+    def __init__(
+        self,
+        app,
+        store: ProfileStore,
+        sample_rate: float = 0.0,
+        authorize: Optional[Callable[[Dict[bytes, bytes]], bool]] = None,
+        interval: float = 0.005,
+        excluded_paths: Tuple[str, ...] = (),
+    ):
+        self.app = app
+        self.store = store
+        self.sample_rate = sample_rate
+        self.authorize = authorize
+        self.interval = interval
+        self.excluded_paths = tuple(excluded_paths)
+        self.logger = get_logger("profiling")
+        self._busy = threading.Lock()
+
+    async def _wants_profile(self, path: str, headers: Dict[bytes, bytes]) -> bool:
+        if path.startswith(self.excluded_paths) or _EVENT_STREAM in headers.get(b"accept", b""):
+            return False
+        if PROFILE_HEADER in headers:
+            return self.authorize is not None and await run_in_threadpool(self.authorize, headers)
+        return self.sample_rate > 0 and random.random() < self.sample_rate
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        headers = dict(scope["headers"])
+        if not await self._wants_profile(scope["path"], headers) or not self._busy.acquire(blocking=False):
+            await self.app(scope, receive, send)
+            return
+
+        status_code = 500
+        profile_id = new_profile_id()
+        sampler = StackSampler(self.interval)
+        profiling = True
+
+        def stop_profiling():
+            nonlocal profiling
+            if profiling:
+                profiling = False
+                sampler.stop()
+                self._busy.release()
+
+        async def send_with_profile_id(message):
+            nonlocal status_code
+            if profiling and message["type"] == "http.response.start":
+                response_headers = dict(message.get("headers", []))
+                if response_headers.get(b"content-type", b"").startswith(_EVENT_STREAM):
+                    stop_profiling()
+                    self.logger.info(f"Dropped profile {profile_id}: {scope['path']} is an event stream")
+                else:
+                    status_code = message["status"]
+                    message["headers"] = list(message.get("headers", [])) + [(PROFILE_ID_HEADER, profile_id.encode())]
+            await send(message)
+
+        start_time = time.perf_counter()
+        sampler.start()
+        try:
+            await self.app(scope, receive, send_with_profile_id)
+        finally:
+            if profiling:
+                stop_profiling()
+                duration_ms = round((time.perf_counter() - start_time) * 1000, 2)
+                self._save(profile_id, scope, status_code, duration_ms, sampler)
+
+    def _save(self, profile_id: str, scope, status_code: int, duration_ms: float, sampler: StackSampler) -> None:
+        try:
+            self.store.save(profile_id, {
+                "method": scope["method"],
+                "path": scope["path"],
+                "status_code": status_code,
+                "duration_ms": duration_ms,
+                "samples": sampler.samples,
+                "interval_ms": self.interval * 1000,
+            }, sampler.collapsed())
+            self.logger.info(f"Stored profile {profile_id}: {scope['method']} {scope['path']}", extra={
+                "duration_ms": duration_ms
+            })
+        except OSError as e:
+            self.logger.error(f"Could not store profile {profile_id}: {e}")
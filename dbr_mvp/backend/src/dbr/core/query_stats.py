@@ -0,0 +1,89 @@
+# src/dbr/core/query_stats.py
+import re
+import time
+from collections import Counter
+from contextvars import ContextVar
+from typing import List, Optional, Tuple
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from dbr.core.metrics import DB_QUERY_DURATION
+
+
+# Expanded IN lists, e.g. "IN (?, ?, ?)", whose length depends on the parameters
+_EXPANDED_IN_LIST = re.compile(r"\((?:\?|%s|:\w+)(?:, (?:\?|%s|:\w+))+\)")
+
+
+def statement_shape(statement: str) -> str:
+    """The statement with expanded IN lists collapsed, so calls differing only in parameters match"""
+    return _EXPANDED_IN_LIST.sub("(?)", statement)
+
+
+class QueryStats:
+    """SQL statements run while handling one request, and the time spent in them"""
+    __slots__ = ("count", "duration", "shapes")
+
+    def __init__(self):
+        self.count = 0
+        self.duration = 0.0
+        self.shapes = Counter()
+
+    def record(self, statement: str, duration: float) -> None:
+        self.count += 1
+        self.duration += duration
+        self.shapes[statement_shape(statement)] += 1
+
+    def merge(self, other: "QueryStats") -> None:
+        self.count += other.count
+        self.duration += other.duration
+        self.shapes.update(other.shapes)
+
+    def repeated(self, threshold: int) -> List[Tuple[str, int]]:
+        """Statement shapes run more than threshold times, most frequent first (likely N+1 queries)"""
+        return [(shape, count) for shape, count in self.shapes.most_common() if count > threshold]
+
+
+# Stats of the request being handled; set by MetricsMiddleware
+current_query_stats: ContextVar[Optional[QueryStats]] = ContextVar("dbr_query_stats", default=None)
+
+
+class QueryCounter:
+    """Count the SQL statements run on any engine inside a with block
+
+    Unlike current_query_stats this does not depend on the request context,
+    so it also sees statements run by the test client's app thread:
+
+        with QueryCounter() as queries:
+            client.get(url)
+        assert queries.count <= 5
+    """
+
+    def __init__(self):
+        self.stats = QueryStats()
+
+    @property
+    def count(self) -> int:
+        return self.stats.count
+
+    def _record(self, conn, cursor, statement, parameters, context, executemany):
+        self.stats.record(statement, 0.0)
+
+    def __enter__(self) -> "QueryCounter":
+        event.listen(Engine, "after_cursor_execute", self._record)
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        event.remove(Engine, "after_cursor_execute", self._record)
+
+
+@event.listens_for(Engine, "before_cursor_execute")
+def _start_query_timer(conn, cursor, statement, parameters, context, executemany):
+    conn.info["dbr_query_start"] = time.perf_counter()
+
+
+@event.listens_for(Engine, "after_cursor_execute")
+def _record_query(conn, cursor, statement, parameters, context, executemany):
+    duration = time.perf_counter() - conn.info.pop("dbr_query_start", time.perf_counter())
+    DB_QUERY_DURATION.observe(duration)
+    stats = current_query_stats.get()
+    if stats is not None:
+        stats.record(statement, duration)
@@ -0,0 +1,80 @@
+# src/dbr/core/response_cache.py
+from collections import OrderedDict
+from threading import Lock
+from typing import Any, Callable, Hashable, Optional, Sequence, Tuple
+import copy
+import time
+from sqlalchemy.orm import Session
+from dbr.core.data_version import get_data_version, has_pending_changes
+
+
+class VersionedCache:
+    """In-process LRU cache with TTL for values derived from an organization's data.
+
+    Every entry remembers the data version (see ``dbr.core.data_version``) it
+    was computed from and is only served while that version is current, so a
+    committed write is visible on the next read. ``ttl`` bounds how long an
+    entry may live regardless, for values that also depend on the clock.
+    Hits return deep copies, so callers may modify what they get.
+    """
+
+    def __init__(self, maxsize: int = 512, ttl: float = 30.0):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries: "OrderedDict[Hashable, Tuple[Tuple[int, ...], float, Any]]" = OrderedDict()
+        self._lock = Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def get(self, key: Hashable, version: Tuple[int, ...]) -> Optional[Any]:
+        """Cached value for the key at this version, or None"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[0] != version or entry[1] < time.monotonic():
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+        return copy.deepcopy(entry[2])
+
+    def put(self, key: Hashable, version: Tuple[int, ...], value: Any) -> None:
+        with self._lock:
+            self._entries[key] = (version, time.monotonic() + self.ttl, copy.deepcopy(value))
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def get_or_compute(
+        self,
+        session: Session,
+        organization_id: str,
+        tablenames: Sequence[str],
+        key: Hashable,
+        compute: Callable[[], Any]
+    ) -> Any:
+        """Serve ``key`` from the cache or compute and store it.
+
+        Sessions with uncommitted changes for the organization bypass the
+        cache so they read their own writes.
+        """
+        if has_pending_changes(session, organization_id):
+            return compute()
+
+        # Read the version before computing so a concurrent commit invalidates the result
+        version = get_data_version(organization_id, *tablenames)
+        cached = self.get((organization_id, key), version)
+        if cached is not None:
+            return cached
+        value = compute()
+        self.put((organization_id, key), version, value)
+        return value
+
+
+# Shared by the analytics endpoints and services
+analytics_cache = VersionedCache()
@@ -1,10 +1,17 @@
 # src/dbr/core/scheduling.py
-from typing import List, Dict, Any
+import time
+from typing import List, Dict, Any, Optional
 from sqlalchemy.orm import Session
 from dbr.models.schedule import Schedule, ScheduleStatus
 from dbr.models.work_item import WorkItem, WorkItemStatus
 from dbr.models.ccr import CCR
+from dbr.models.work_item_ccr_hours import sum_ccr_hours
 from dbr.models.board_config import BoardConfig
+from dbr.models.ccr_capacity_ledger import get_booked_hours
+from dbr.models.organization import advance_organization_time_unit
+from dbr.core.metrics import record_tick
+from dbr.services.capacity_calendar import CapacityCalendar
+from dbr.services.release_queue import ReleaseQueue
 
 
 class ScheduleValidationError(Exception):
@@ -46,8 +53,9 @@ class SchedulingEngine:
             time_unit_position=-board_config.pre_constraint_buffer_size  # Start at beginning of buffer
         )
         
-        # Calculate total hours
+        # Calculate total hours; a full pre-constraint buffer sends the schedule to the release queue
         schedule.recalculate_total_hours(self.session)
+        ReleaseQueue(self.session).place_or_enqueue(schedule, board_config)
         
         # Validate if requested
         if validate:
@@ -60,8 +68,9 @@ class SchedulingEngine:
     
     def advance_all_schedules(self, organization_id: str) -> Dict[str, Any]:
         """Advance all schedules by one time unit"""
+        start_time = time.perf_counter()
         schedules = self.session.query(Schedule).filter_by(
-            organization_id=organization_id
+            organization_id=organization_id, is_queued=False
         ).filter(Schedule.status != ScheduleStatus.COMPLETED).all()
         
         advanced_count = 0
@@ -84,12 +93,21 @@ class SchedulingEngine:
             
             advanced_count += 1
         
+        advance_organization_time_unit(self.session, organization_id)
+        
+        # The rope: fill the room the tick made in each pre-constraint buffer
+        released = ReleaseQueue(self.session).release_for_organization(
+            organization_id, [s for s in schedules if s.status != ScheduleStatus.COMPLETED]
+        )
         self.session.commit()
+        released_count = sum(len(board_released) for board_released in released.values())
+        record_tick("scheduling", time.perf_counter() - start_time, advanced_count, completed_count, released_count)
         
         return {
             "advanced_schedules_count": advanced_count,
             "completed_schedules_count": completed_count,
-            "remaining_schedules_count": advanced_count - completed_count
+            "remaining_schedules_count": advanced_count - completed_count,
+            "released_schedules_count": released_count
         }
     
     def get_schedules_by_status(self, organization_id: str, status: ScheduleStatus) -> List[Schedule]:
@@ -144,8 +162,17 @@ class SchedulingEngine:
         }
 
 
-def validate_schedule_creation(session: Session, work_item_ids: List[str], ccr_id: str) -> bool:
-    """Validate that a schedule can be created with the given work items"""
+def validate_schedule_creation(
+    session: Session,
+    work_item_ids: List[str],
+    ccr_id: str,
+    slot: Optional[int] = None
+) -> bool:
+    """Validate that a schedule can be created with the given work items
+    
+    When ``slot`` is given, hours already booked on the CCR for that slot count
+    against its calendar capacity for the slot.
+    """
     
     # Check that all work items exist and are Ready
     for work_item_id in work_item_ids:
@@ -161,18 +188,20 @@ def validate_schedule_creation(session: Session, work_item_ids: List[str], ccr_i
         raise ScheduleValidationError("CCR not found")
     
     # Calculate total hours required
-    ccr_key = ccr.name.lower().replace(" ", "_")
-    total_hours = 0.0
-    
-    for work_item_id in work_item_ids:
-        work_item = session.query(WorkItem).filter_by(id=work_item_id).first()
-        if work_item and work_item.ccr_hours_required:
-            hours = work_item.ccr_hours_required.get(ccr_key, 0.0)
-            total_hours += hours
+    total_hours = sum_ccr_hours(session, work_item_ids, ccr.id)
     
     if total_hours > ccr.capacity_per_time_unit:
         raise ScheduleValidationError(
             f"Total hours ({total_hours}) exceeds CCR capacity ({ccr.capacity_per_time_unit})"
         )
     
+    if slot is not None:
+        capacity = float(CapacityCalendar(session).get_capacity(ccr, slot)[0])
+        booked = get_booked_hours(session, ccr.id, slot, slot).get(slot, 0.0)
+        if booked + total_hours > capacity:
+            raise ScheduleValidationError(
+                f"Total hours ({total_hours}) exceeds remaining CCR capacity "
+                f"({capacity - booked}) in slot {slot}"
+            )
+    
     return True
\ No newline at end of file
@@ -1,13 +1,21 @@
 # src/dbr/core/time_progression.py
+import time
 from typing import Dict, Any, List, Optional
 from datetime import datetime, timezone, timedelta
+from sqlalchemy import func
 from sqlalchemy.orm import Session
 from dbr.models.schedule import Schedule, ScheduleStatus
+from dbr.models.schedule_item import ScheduleItem
 from dbr.models.work_item import WorkItem, WorkItemStatus
 from dbr.models.board_config import BoardConfig
 from dbr.models.ccr import CCR
+from dbr.models.organization import advance_organization_time_unit
 from dbr.core.time_manager import TimeManager
+from dbr.core.metrics import record_tick
 from dbr.core.dependencies import can_work_item_be_ready
+from dbr.services.buffer_zone_manager import BufferZoneManager, BUFFER_TABLES
+from dbr.core.response_cache import analytics_cache
+from dbr.services.release_queue import ReleaseQueue
 
 
 class BufferOverflowError(Exception):
@@ -25,12 +33,14 @@ class TimeProgressionEngine:
     def advance_time(self, organization_id: str, check_overflow: bool = False) -> Dict[str, Any]:
         """Advance time by one unit for all schedules in an organization"""
         
+        start_time = time.perf_counter()
+        
         # Get current time before advancement
         previous_time = self.time_manager.get_current_time()
         
         # Get all active schedules
         schedules = self.session.query(Schedule).filter_by(
-            organization_id=organization_id
+            organization_id=organization_id, is_queued=False
         ).filter(Schedule.status != ScheduleStatus.COMPLETED).all()
         
         # Check for buffer overflow
@@ -41,6 +51,7 @@ class TimeProgressionEngine:
         # Advance each schedule
         advanced_count = 0
         completed_count = 0
+        completed_by_board = {}
         status_changes = []
         
         for schedule in schedules:
@@ -65,18 +76,36 @@ class TimeProgressionEngine:
             
             if schedule.status == ScheduleStatus.COMPLETED:
                 completed_count += 1
+                completed_by_board[schedule.board_config_id] = completed_by_board.get(schedule.board_config_id, 0) + 1
             
             advanced_count += 1
         
         # Advance time manager
         self.time_manager.advance_time(weeks=1)  # Advance by one time unit
+        advance_organization_time_unit(self.session, organization_id)
         current_time = self.time_manager.get_current_time()
         
         # Check for dependency updates
         dependency_updates = self._check_dependency_updates(organization_id)
         
+        # The rope: release queued schedules into the room the tick made in each pre-constraint buffer
+        remaining = [s for s in schedules if s.status != ScheduleStatus.COMPLETED]
+        released = ReleaseQueue(self.session, self.time_manager).release_for_organization(organization_id, remaining)
+        released_schedule_ids = [schedule.id for board_released in released.values() for schedule in board_released]
+        remaining.extend(schedule for board_released in released.values() for schedule in board_released)
+        
+        # Append the post-tick buffer state to the buffer history
+        BufferZoneManager(self.session).record_buffer_history(
+            organization_id,
+            current_time,
+            schedules=remaining,
+            completed_by_board=completed_by_board
+        )
+        
         # Commit all changes
         self.session.commit()
+        record_tick("time_progression", time.perf_counter() - start_time,
+                    advanced_count, completed_count, len(released_schedule_ids))
         
         return {
             "organization_id": organization_id,
@@ -84,6 +113,7 @@ class TimeProgressionEngine:
             "completed_schedules_count": completed_count,
             "remaining_schedules_count": advanced_count - completed_count,
             "status_changes": status_changes,
+            "released_schedule_ids": released_schedule_ids,
             "buffer_overflow_warnings": overflow_warnings,
             "dependency_updates": dependency_updates,
             "time_advancement": {
@@ -109,33 +139,27 @@ class TimeProgressionEngine:
             schedule.release_to_pre_constraint()
         elif schedule.status == ScheduleStatus.PRE_CONSTRAINT and buffer_zone == "post_constraint":
             schedule.move_to_post_constraint()
-        elif schedule.time_unit_position > 2:  # Beyond post-constraint buffer
+        
+        # Same completion rule as DBREngine.advance_time_unit
+        board_config = self.session.get(BoardConfig, schedule.board_config_id)
+        if board_config is not None and board_config.is_completed_position(schedule.time_unit_position):
             schedule.mark_completed()
     
     def _check_buffer_overflow(self, organization_id: str, schedules: List[Schedule]) -> int:
         """Check for potential buffer overflow issues"""
         warnings = 0
-        
-        # Get all board configs for the organization
-        board_configs = self.session.query(BoardConfig).filter_by(
-            organization_id=organization_id,
-            is_active=True
-        ).all()
-        
-        for board_config in board_configs:
-            buffer_status = self.get_buffer_status(organization_id, board_config.id)
-            
+
+        # One snapshot per active board, built from the schedules already loaded for this tick
+        snapshots = BufferZoneManager(self.session).get_organization_snapshots(organization_id, schedules)
+
+        for snapshot in snapshots.values():
+            buffer_status = self._buffer_status_from_snapshot(snapshot)
+
             # Check pre-constraint buffer
             if buffer_status["pre_constraint"]["is_full"]:
                 # Count schedules that would move into pre-constraint buffer
-                incoming_schedules = [
-                    s for s in schedules 
-                    if s.board_config_id == board_config.id 
-                    and s.time_unit_position == -board_config.pre_constraint_buffer_size - 1
-                ]
-                if incoming_schedules:
-                    warnings += len(incoming_schedules)
-        
+                warnings += snapshot.positions.count(-snapshot.pre_constraint_buffer_size - 1)
+
         return warnings
     
     def _check_dependency_updates(self, organization_id: str) -> Dict[str, Any]:
@@ -164,120 +188,109 @@ class TimeProgressionEngine:
     
     def get_buffer_status(self, organization_id: str, board_config_id: str) -> Dict[str, Any]:
         """Get current buffer status for a board configuration"""
-        board_config = self.session.query(BoardConfig).filter_by(id=board_config_id).first()
-        if not board_config:
+        try:
+            snapshot = BufferZoneManager(self.session).get_snapshot(board_config_id)
+        except ValueError:
             return {}
         
-        # Get schedules in each buffer zone
-        schedules = self.session.query(Schedule).filter_by(
-            organization_id=organization_id,
-            board_config_id=board_config_id
-        ).filter(Schedule.status != ScheduleStatus.COMPLETED).all()
-        
-        # Count schedules by buffer zone
-        pre_constraint_schedules = []
-        constraint_schedules = []
-        post_constraint_schedules = []
-        
-        for schedule in schedules:
-            zone = schedule.get_buffer_zone(self.session)
-            if zone == "pre_constraint":
-                pre_constraint_schedules.append(schedule)
-            elif zone == "constraint":
-                constraint_schedules.append(schedule)
-            elif zone == "post_constraint":
-                post_constraint_schedules.append(schedule)
+        return self._buffer_status_from_snapshot(snapshot)
+    
+    @staticmethod
+    def _buffer_status_from_snapshot(snapshot) -> Dict[str, Any]:
+        """Format a BufferSnapshot as buffer status counts per zone"""
+        pre_constraint_schedules = snapshot.zone_schedule_ids("pre_constraint")
+        constraint_schedules = snapshot.zone_schedule_ids("constraint")
+        post_constraint_schedules = snapshot.zone_schedule_ids("post_constraint")
         
         return {
-            "board_config_id": board_config_id,
+            "board_config_id": snapshot.board_config_id,
             "pre_constraint": {
                 "current_count": len(pre_constraint_schedules),
-                "max_capacity": board_config.pre_constraint_buffer_size,
-                "is_full": len(pre_constraint_schedules) >= board_config.pre_constraint_buffer_size,
-                "schedules": [s.id for s in pre_constraint_schedules]
+                "max_capacity": snapshot.pre_constraint_buffer_size,
+                "is_full": len(pre_constraint_schedules) >= snapshot.pre_constraint_buffer_size,
+                "schedules": pre_constraint_schedules
             },
             "constraint": {
                 "current_count": len(constraint_schedules),
                 "max_capacity": 1,  # CCR can only handle one schedule at a time
                 "is_full": len(constraint_schedules) >= 1,
-                "schedules": [s.id for s in constraint_schedules]
+                "schedules": constraint_schedules
             },
             "post_constraint": {
                 "current_count": len(post_constraint_schedules),
-                "max_capacity": board_config.post_constraint_buffer_size,
-                "is_full": len(post_constraint_schedules) >= board_config.post_constraint_buffer_size,
-                "schedules": [s.id for s in post_constraint_schedules]
+                "max_capacity": snapshot.post_constraint_buffer_size,
+                "is_full": len(post_constraint_schedules) >= snapshot.post_constraint_buffer_size,
+                "schedules": post_constraint_schedules
             }
         }
     
     def get_organization_progression_analytics(self, organization_id: str) -> Dict[str, Any]:
-        """Get comprehensive analytics for time progression in an organization"""
+        """Get comprehensive analytics for time progression in an organization
+
+        Board figures are cached until a schedule or board of the organization
+        changes or time advances; dependency status is always checked live.
+        """
+        flow = analytics_cache.get_or_compute(
+            self.session, organization_id, BUFFER_TABLES, ("progression_analytics",),
+            lambda: self._get_flow_analytics(organization_id)
+        )
+        
+        # Get dependency status
+        dependency_updates = self._check_dependency_updates(organization_id)
         
-        # Get all board configs
-        board_configs = self.session.query(BoardConfig).filter_by(
-            organization_id=organization_id,
-            is_active=True
+        return {
+            "organization_id": organization_id,
+            "current_time": self.time_manager.get_current_time(),
+            "total_active_schedules": flow["total_active_schedules"],
+            "total_work_items_in_flow": flow["total_work_items_in_flow"],
+            "buffer_analytics": flow["buffer_analytics"],
+            "dependency_status": dependency_updates,
+            "board_count": flow["board_count"]
+        }
+    
+    def _get_flow_analytics(self, organization_id: str) -> Dict[str, Any]:
+        """Schedules, work items and buffer status on the organization's active boards"""
+        # Load all active schedules once and group them by board
+        schedules = self.session.query(
+            Schedule.id, Schedule.board_config_id, Schedule.time_unit_position
+        ).filter(
+            Schedule.organization_id == organization_id,
+            Schedule.status != ScheduleStatus.COMPLETED,
+            Schedule.is_queued.is_(False)
         ).all()
+        snapshots = BufferZoneManager(self.session).get_organization_snapshots(organization_id, schedules)
         
         total_schedules = 0
         total_work_items = 0
         buffer_analytics = {}
         
-        for board_config in board_configs:
-            buffer_status = self.get_buffer_status(organization_id, board_config.id)
-            buffer_analytics[board_config.id] = buffer_status
-            
-            # Count schedules and work items
-            board_schedules = self.session.query(Schedule).filter_by(
-                organization_id=organization_id,
-                board_config_id=board_config.id
-            ).filter(Schedule.status != ScheduleStatus.COMPLETED).all()
-            
-            total_schedules += len(board_schedules)
-            for schedule in board_schedules:
-                total_work_items += len(schedule.work_item_ids)
+        for board_config_id, snapshot in snapshots.items():
+            buffer_analytics[board_config_id] = self._buffer_status_from_snapshot(snapshot)
+            total_schedules += len(snapshot.schedule_ids)
         
-        # Get dependency status
-        dependency_updates = self._check_dependency_updates(organization_id)
+        # Count work items on the active boards
+        if snapshots:
+            total_work_items = self.session.query(func.count(ScheduleItem.id)).join(
+                Schedule, Schedule.id == ScheduleItem.schedule_id
+            ).filter(
+                Schedule.board_config_id.in_(list(snapshots)),
+                Schedule.status != ScheduleStatus.COMPLETED,
+                Schedule.is_queued.is_(False)
+            ).scalar()
         
         return {
-            "organization_id": organization_id,
-            "current_time": self.time_manager.get_current_time(),
             "total_active_schedules": total_schedules,
             "total_work_items_in_flow": total_work_items,
             "buffer_analytics": buffer_analytics,
-            "dependency_status": dependency_updates,
-            "board_count": len(board_configs)
+            "board_count": len(snapshots)
         }
     
     def simulate_time_progression(self, organization_id: str, time_units: int) -> Dict[str, Any]:
-        """Simulate time progression without actually advancing time (for planning)"""
-        
-        # Create a copy of current state for simulation
-        simulation_results = []
-        
-        for unit in range(time_units):
-            # Get current state
-            current_analytics = self.get_organization_progression_analytics(organization_id)
-            simulation_results.append({
-                "time_unit": unit,
-                "analytics": current_analytics
-            })
-            
-            # Simulate advancement (without committing)
-            schedules = self.session.query(Schedule).filter_by(
-                organization_id=organization_id
-            ).filter(Schedule.status != ScheduleStatus.COMPLETED).all()
-            
-            # Simulate position advancement
-            for schedule in schedules:
-                schedule.time_unit_position += 1
-        
-        # Rollback simulation changes
-        self.session.rollback()
-        
-        return {
-            "organization_id": organization_id,
-            "simulated_time_units": time_units,
-            "simulation_results": simulation_results
-        }
\ No newline at end of file
+        """Simulate time progression without actually advancing time (for planning).
+
+        Delegates to BoardSimulator: the boards are read once into arrays and
+        stepped in memory, so live schedules and the session are never modified.
+        """
+        from dbr.services.board_simulator import BoardSimulator
+
+        return BoardSimulator(self.session).run(organization_id, time_units)
@@ -15,12 +15,19 @@ from dbr.core.middleware import (
     AuthLoggingMiddleware,
     DatabaseLoggingMiddleware,
     ErrorLoggingMiddleware,
+    MetricsMiddleware,
 )
+from dbr.core.profiling import ProfileStore, ProfilingMiddleware
 
 # Setup logging
 log_level = os.getenv("LOG_LEVEL", "INFO")
 log_file = os.getenv("LOG_FILE", "logs/dbr_api.log")
 enable_sql_logging = os.getenv("ENABLE_SQL_LOGGING", "false").lower() == "true"
+debug_mode = os.getenv("DEBUG", "false").lower() == "true"
+query_repeat_threshold = int(os.getenv("QUERY_REPEAT_THRESHOLD", "10"))
+profile_sample_rate = float(os.getenv("PROFILE_SAMPLE_RATE", "0"))
+profile_dir = os.getenv("PROFILE_DIR", "logs/profiles")
+profile_max_files = int(os.getenv("PROFILE_MAX_FILES", "50"))
 
 setup_logging(
     log_level=log_level, log_file=log_file, enable_sql_logging=enable_sql_logging
@@ -61,12 +68,30 @@ app.add_middleware(
 # app.add_middleware(AuthLoggingMiddleware)
 app.add_middleware(RequestLoggingMiddleware)
 
+# Profile requests sent with X-Profile by a Super Admin, or a random sample of them
+from dbr.api.profiles import authorize_profiling
+app.state.profile_store = ProfileStore(profile_dir, max_profiles=profile_max_files)
+app.add_middleware(
+    ProfilingMiddleware,
+    store=app.state.profile_store,
+    sample_rate=profile_sample_rate,
+    authorize=authorize_profiling,
+    excluded_paths=("/api/v1/events",),
+)
+app.add_middleware(
+    MetricsMiddleware,
+    query_repeat_threshold=query_repeat_threshold,
+    expose_query_stats=debug_mode,
+)
+
 logger.info(
     "DBR API starting up",
     extra={
         "version": "1.0.4",
         "log_level": log_level,
         "sql_logging": enable_sql_logging,
+        "debug": debug_mode,
+        "profile_sample_rate": profile_sample_rate,
     },
 )
 
@@ -89,6 +114,26 @@ app.include_router(organizations_router, prefix="/api/v1")
 from dbr.api.memberships import router as memberships_router
 app.include_router(memberships_router, prefix="/api/v1")
 
+# Import and include server-sent events router
+from dbr.api.events import router as events_router
+app.include_router(events_router, prefix="/api/v1")
+
+# Import and include boards router
+from dbr.api.boards import router as boards_router
+app.include_router(boards_router, prefix="/api/v1")
+
+# Import and include batch router
+from dbr.api.batch import router as batch_router
+app.include_router(batch_router, prefix="/api/v1")
+
+# Import and include profiles router
+from dbr.api.profiles import router as profiles_router
+app.include_router(profiles_router, prefix="/api/v1")
+
+# Import and include Prometheus metrics router (served at /metrics, outside the API prefix)
+from dbr.api.metrics import router as metrics_router
+app.include_router(metrics_router)
+
 
 @app.get("/")
 def read_root():
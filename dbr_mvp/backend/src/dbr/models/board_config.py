@@ -1,9 +1,18 @@
 # src/dbr/models/board_config.py
-from sqlalchemy import Column, String, Integer, Boolean, ForeignKey
+from sqlalchemy import Column, String, Integer, Float, Boolean, ForeignKey
 from sqlalchemy.orm import relationship
 from dbr.models.base import BaseModel
 
 
+def completion_position(post_constraint_buffer_size):
+    """First position past the post-constraint buffer; schedules advanced to it are completed
+
+    The one completion rule of the live ticks, the board simulator and the
+    delivery forecaster. Works elementwise on NumPy arrays of buffer sizes.
+    """
+    return post_constraint_buffer_size + 1
+
+
 class BoardConfig(BaseModel):
     """Board configuration model for DBR boards"""
     __tablename__ = "board_configs"
@@ -20,6 +29,10 @@ class BoardConfig(BaseModel):
     pre_constraint_buffer_size = Column(Integer, nullable=False, default=5)
     post_constraint_buffer_size = Column(Integer, nullable=False, default=3)
     
+    # Zone color thresholds as a fraction of buffer size
+    buffer_yellow_ratio = Column(Float, nullable=False, default=0.6)
+    buffer_green_ratio = Column(Float, nullable=False, default=0.4)
+    
     # Time configuration
     time_unit = Column(String(20), nullable=False, default="week")
     
@@ -49,6 +62,10 @@ class BoardConfig(BaseModel):
         else:
             return "post_constraint"
     
+    def is_completed_position(self, position: int) -> bool:
+        """Check if a schedule at this position has left the board"""
+        return position >= completion_position(self.post_constraint_buffer_size)
+    
     def is_position_valid(self, position: int) -> bool:
         """Check if a position is valid on this board"""
         return -self.pre_constraint_buffer_size <= position <= self.post_constraint_buffer_size
@@ -0,0 +1,35 @@
+# src/dbr/models/buffer_history.py
+from sqlalchemy import Column, String, Integer, Boolean, DateTime, ForeignKey, Index
+from dbr.models.base import BaseModel
+
+
+class BufferHistory(BaseModel):
+    """Append-only record of one board's buffer state after a time unit tick"""
+    __tablename__ = "buffer_history"
+
+    # Board the snapshot belongs to
+    organization_id = Column(String(36), ForeignKey('organizations.id'), nullable=False)
+    board_config_id = Column(String(36), ForeignKey('board_configs.id'), nullable=False)
+
+    # System time (TimeManager) the tick advanced to
+    recorded_at = Column(DateTime, nullable=False)
+
+    # Zone occupancy
+    pre_constraint_count = Column(Integer, nullable=False, default=0)
+    pre_constraint_capacity = Column(Integer, nullable=False, default=0)
+    ccr_occupied = Column(Boolean, nullable=False, default=False)
+    post_constraint_count = Column(Integer, nullable=False, default=0)
+    post_constraint_capacity = Column(Integer, nullable=False, default=0)
+
+    # Schedules beyond the buffer boundaries
+    overflow_count = Column(Integer, nullable=False, default=0)
+
+    # Schedules completed on this board during the tick
+    completed_count = Column(Integer, nullable=False, default=0)
+
+    __table_args__ = (
+        Index("ix_buffer_history_board_recorded", "board_config_id", "recorded_at"),
+    )
+
+    def __repr__(self):
+        return f"<BufferHistory(board_config_id={self.board_config_id}, recorded_at={self.recorded_at})>"
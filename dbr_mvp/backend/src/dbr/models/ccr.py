@@ -90,6 +90,24 @@ class CCR(BaseModel):
         """Check if work items can be scheduled within capacity"""
         return self.get_available_capacity(session, work_items) >= 0
     
+    def get_capacity_headroom(self, session: Session, start_slot: int, slots: int) -> List[Dict[str, Any]]:
+        """Calendar capacity, booked hours and remaining headroom for ``slots`` slots starting at ``start_slot``"""
+        from dbr.models.ccr_capacity_ledger import get_booked_hours
+        from dbr.services.capacity_calendar import CapacityCalendar
+        
+        capacity = CapacityCalendar(session).get_capacity(self, start_slot, slots)
+        booked_by_slot = get_booked_hours(session, self.id, start_slot, start_slot + slots - 1)
+        headroom = []
+        for offset, slot in enumerate(range(start_slot, start_slot + slots)):
+            booked = booked_by_slot.get(slot, 0.0)
+            headroom.append({
+                "slot": slot,
+                "capacity": float(capacity[offset]),
+                "booked_hours": booked,
+                "headroom_hours": float(capacity[offset]) - booked,
+            })
+        return headroom
+    
     def get_associated_users(self, session: Session) -> List:
         """Get all users associated with this CCR"""
         from dbr.models.ccr_user_association import CCRUserAssociation
@@ -142,21 +160,24 @@ class CCR(BaseModel):
     
     def get_analytics(self, session: Session) -> Dict[str, Any]:
         """Get comprehensive analytics for this CCR"""
+        from sqlalchemy import func
         from dbr.models.work_item import WorkItem
+        from dbr.models.work_item_ccr_hours import WorkItemCCRHours
         
-        # Get all work items in the organization that require this CCR
-        ccr_key = self.name.lower().replace(" ", "_")
-        all_work_items = session.query(WorkItem).filter_by(organization_id=self.organization_id).all()
-        
-        # Filter work items that require this CCR
-        requiring_work_items = []
-        for item in all_work_items:
-            if item.ccr_hours_required and ccr_key in item.ccr_hours_required:
-                requiring_work_items.append(item)
+        # Aggregate the demand of the organization's work items that require this CCR
+        work_items_count = session.query(func.count(WorkItem.id)).filter(
+            WorkItem.organization_id == self.organization_id
+        ).scalar()
+        requiring_count, total_demand = session.query(
+            func.count(WorkItemCCRHours.id), func.coalesce(func.sum(WorkItemCCRHours.hours), 0.0)
+        ).join(WorkItem, WorkItem.id == WorkItemCCRHours.work_item_id).filter(
+            WorkItem.organization_id == self.organization_id,
+            WorkItemCCRHours.ccr_id == self.id
+        ).one()
         
-        total_demand = self.calculate_total_demand(session, requiring_work_items)
-        utilization = self.calculate_utilization(session, requiring_work_items)
-        available_capacity = self.get_available_capacity(session, requiring_work_items)
+        total_demand = float(total_demand)
+        utilization = total_demand / self.capacity_per_time_unit if self.capacity_per_time_unit else 0.0
+        available_capacity = self.capacity_per_time_unit - total_demand
         
         return {
             "ccr_name": self.name,
@@ -167,8 +188,8 @@ class CCR(BaseModel):
             "utilization": utilization,
             "available_capacity": available_capacity,
             "is_over_capacity": available_capacity < 0,
-            "work_items_count": len(all_work_items),
-            "work_items_requiring_ccr": len(requiring_work_items),
+            "work_items_count": work_items_count,
+            "work_items_requiring_ccr": requiring_count,
             "associated_users_count": len(self.get_associated_users(session)),
             "user_capacity": self.calculate_capacity_from_users(session),
         }
@@ -176,18 +197,51 @@ class CCR(BaseModel):
     @staticmethod
     def get_organization_ccr_analytics(session: Session, organization_id: str) -> Dict[str, Any]:
         """Get organization-wide CCR analytics"""
-        ccrs = session.query(CCR).filter_by(organization_id=organization_id, is_active=True).all()
+        from sqlalchemy import func
+        from dbr.models.ccr_user_association import CCRUserAssociation
+        from dbr.services.ccr_load_matrix import CCRLoadMatrixService
+        
+        ccrs = {ccr.id: ccr for ccr in session.query(CCR).filter_by(organization_id=organization_id, is_active=True).all()}
+        
+        # Demand per CCR from the cached load matrix; user capacity in one grouped query
+        matrix = CCRLoadMatrixService(session).get_matrix(organization_id)
+        demand = matrix.demand()
+        requiring = (matrix.hours > 0).sum(axis=0)
+        user_rows = session.query(
+            CCRUserAssociation.ccr_id,
+            func.count(CCRUserAssociation.id),
+            func.coalesce(func.sum(CCRUserAssociation.capacity_contribution), 0.0)
+        ).filter(
+            CCRUserAssociation.ccr_id.in_(list(ccrs)),
+            CCRUserAssociation.is_active.is_(True)
+        ).group_by(CCRUserAssociation.ccr_id).all()
+        users = {ccr_id: (count, float(capacity)) for ccr_id, count, capacity in user_rows}
         
         ccr_utilization = {}
         total_capacity = 0.0
         total_demand = 0.0
         
-        for ccr in ccrs:
-            analytics = ccr.get_analytics(session)
-            ccr_key = ccr.name.lower().replace(" ", "_")
-            ccr_utilization[ccr_key] = analytics
-            total_capacity += analytics["capacity"]
-            total_demand += analytics["total_demand"]
+        for column, ccr_id in enumerate(matrix.ccr_ids):
+            ccr = ccrs[ccr_id]
+            ccr_demand = float(demand[column])
+            available_capacity = ccr.capacity_per_time_unit - ccr_demand
+            users_count, user_capacity = users.get(ccr_id, (0, 0.0))
+            ccr_utilization[ccr.name.lower().replace(" ", "_")] = {
+                "ccr_name": ccr.name,
+                "ccr_type": ccr.ccr_type.value,
+                "capacity": ccr.capacity_per_time_unit,
+                "time_unit": ccr.time_unit,
+                "total_demand": ccr_demand,
+                "utilization": ccr_demand / ccr.capacity_per_time_unit if ccr.capacity_per_time_unit else 0.0,
+                "available_capacity": available_capacity,
+                "is_over_capacity": available_capacity < 0,
+                "work_items_count": len(matrix.work_item_ids),
+                "work_items_requiring_ccr": int(requiring[column]),
+                "associated_users_count": users_count,
+                "user_capacity": user_capacity,
+            }
+            total_capacity += ccr.capacity_per_time_unit
+            total_demand += ccr_demand
         
         return {
             "organization_id": organization_id,
@@ -200,18 +254,13 @@ class CCR(BaseModel):
     
     @staticmethod
     def identify_bottlenecks(session: Session, organization_id: str, threshold: float = 1.0) -> List['CCR']:
-        """Identify CCRs that are bottlenecks (utilization >= threshold)"""
-        ccrs = session.query(CCR).filter_by(organization_id=organization_id, is_active=True).all()
-        bottlenecks = []
-        
-        for ccr in ccrs:
-            analytics = ccr.get_analytics(session)
-            if analytics["utilization"] >= threshold:
-                bottlenecks.append(ccr)
-        
-        # Sort by utilization (highest first)
-        bottlenecks.sort(key=lambda c: c.get_analytics(session)["utilization"], reverse=True)
-        return bottlenecks
+        """Identify CCRs that are bottlenecks (utilization >= threshold), highest utilization first"""
+        from dbr.services.ccr_load_matrix import CCRLoadMatrixService
+        
+        result = CCRLoadMatrixService(session).identify_bottlenecks(organization_id, threshold=threshold)
+        ccr_ids = [bottleneck["ccr_id"] for bottleneck in result["bottlenecks"]]
+        ccrs = {ccr.id: ccr for ccr in session.query(CCR).filter(CCR.id.in_(ccr_ids)).all()}
+        return [ccrs[ccr_id] for ccr_id in ccr_ids if ccr_id in ccrs]
     
     def __repr__(self):
         return f"<CCR(id={self.id}, name='{self.name}', type='{self.ccr_type.value}', capacity={self.capacity_per_time_unit})>"
\ No newline at end of file
@@ -0,0 +1,29 @@
+# src/dbr/models/ccr_capacity_exception.py
+from sqlalchemy import Column, String, Integer, Float, ForeignKey, Index
+from dbr.models.base import BaseModel
+
+
+class CCRCapacityException(BaseModel):
+    """Calendar exception to a CCR's capacity for a range of time unit slots.
+
+    Slots are absolute (Organization.current_time_unit scale) and the range is
+    inclusive. ``capacity_factor`` scales the regular capacity (0 for a
+    holiday, 0.6 for a three-day week); ``capacity_hours`` replaces it
+    outright. When both are set the override wins.
+    """
+    __tablename__ = "ccr_capacity_exceptions"
+
+    organization_id = Column(String(36), ForeignKey('organizations.id'), nullable=False)
+    ccr_id = Column(String(36), ForeignKey('ccrs.id'), nullable=False)
+    start_slot = Column(Integer, nullable=False)
+    end_slot = Column(Integer, nullable=False)
+    capacity_factor = Column(Float, nullable=True)
+    capacity_hours = Column(Float, nullable=True)
+    reason = Column(String(255), nullable=True)
+
+    __table_args__ = (
+        Index("ix_ccr_capacity_exceptions_ccr_slots", "ccr_id", "start_slot", "end_slot"),
+    )
+
+    def __repr__(self):
+        return f"<CCRCapacityException(ccr_id={self.ccr_id}, slots={self.start_slot}-{self.end_slot}, reason='{self.reason}')>"
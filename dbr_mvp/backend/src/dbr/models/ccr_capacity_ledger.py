@@ -0,0 +1,68 @@
+# src/dbr/models/ccr_capacity_ledger.py
+from typing import Dict
+from sqlalchemy import Column, String, Integer, Float, ForeignKey, UniqueConstraint, delete, func, insert, update
+from sqlalchemy.orm import Session
+from dbr.models.base import BaseModel
+
+
+class CCRCapacityLedger(BaseModel):
+    """Hours booked on a CCR for one time unit slot.
+
+    ``slot`` is absolute: it is the organization's time unit counter
+    (Organization.current_time_unit) at which the booked schedules sit on the
+    CCR. Rows are maintained by the schedule flush hook, so booked hours and
+    headroom for any horizon are indexed range lookups.
+    """
+    __tablename__ = "ccr_capacity_ledger"
+
+    organization_id = Column(String(36), ForeignKey('organizations.id'), nullable=False)
+    ccr_id = Column(String(36), ForeignKey('ccrs.id'), nullable=False)
+    slot = Column(Integer, nullable=False)
+    booked_hours = Column(Float, nullable=False, default=0.0)
+    schedule_count = Column(Integer, nullable=False, default=0)
+
+    __table_args__ = (
+        UniqueConstraint("ccr_id", "slot", name="uq_ccr_capacity_ledger_ccr_slot"),
+    )
+
+    def __repr__(self):
+        return f"<CCRCapacityLedger(ccr_id={self.ccr_id}, slot={self.slot}, booked_hours={self.booked_hours})>"
+
+
+def get_booked_hours(session: Session, ccr_id: str, start_slot: int, end_slot: int) -> Dict[int, float]:
+    """Booked hours per slot for a CCR, for slots in [start_slot, end_slot]; empty slots are omitted"""
+    rows = session.query(CCRCapacityLedger.slot, CCRCapacityLedger.booked_hours).filter(
+        CCRCapacityLedger.ccr_id == ccr_id,
+        CCRCapacityLedger.slot >= start_slot,
+        CCRCapacityLedger.slot <= end_slot
+    ).all()
+    return {slot: float(booked_hours) for slot, booked_hours in rows}
+
+
+def apply_booking(session: Session, organization_id: str, ccr_id: str, slot: int, hours: float, schedules: int) -> None:
+    """Add (or with negative values, release) booked hours and schedules on a CCR slot
+
+    The increments are applied in SQL rather than read and written back, so
+    concurrent bookings of the same slot do not lose each other's hours.
+    """
+    ledger = CCRCapacityLedger.__table__
+    connection = session.connection()
+    result = connection.execute(
+        update(ledger).where(ledger.c.ccr_id == ccr_id, ledger.c.slot == slot).values(
+            booked_hours=func.round(ledger.c.booked_hours + hours, 6),
+            schedule_count=ledger.c.schedule_count + schedules
+        )
+    )
+    if result.rowcount == 0 and schedules > 0:
+        connection.execute(insert(ledger).values(
+            organization_id=organization_id, ccr_id=ccr_id, slot=slot,
+            booked_hours=round(hours, 6), schedule_count=schedules
+        ))
+
+    # Drop slots that no longer hold any schedule
+    connection.execute(
+        delete(ledger).where(ledger.c.ccr_id == ccr_id, ledger.c.slot == slot, ledger.c.schedule_count <= 0)
+    )
+    for obj in list(session.identity_map.values()):
+        if isinstance(obj, CCRCapacityLedger) and obj.ccr_id == ccr_id and obj.slot == slot:
+            session.expire(obj)
@@ -1,5 +1,5 @@
 # src/dbr/models/ccr_user_association.py
-from sqlalchemy import Column, String, Float, Boolean, ForeignKey
+from sqlalchemy import Column, String, Integer, Float, Boolean, ForeignKey
 from sqlalchemy.orm import relationship
 from dbr.models.base import BaseModel
 
@@ -17,6 +17,10 @@ class CCRUserAssociation(BaseModel):
     skill_level = Column(String(50), nullable=True)  # junior, mid, senior, expert, etc.
     is_active = Column(Boolean, nullable=False, default=True)
     
+    # Time unit slots the contribution applies to (inclusive, open-ended when None)
+    start_slot = Column(Integer, nullable=True)
+    end_slot = Column(Integer, nullable=True)
+    
     # Relationships (can be added later when needed)
     # ccr = relationship("CCR", back_populates="user_associations")
     # user = relationship("User", back_populates="ccr_associations")
@@ -0,0 +1,94 @@
+# src/dbr/models/change_log.py
+import uuid
+from datetime import datetime, timezone
+from typing import Dict
+from sqlalchemy import Column, String, Integer, DateTime, ForeignKey, Index, event, func, insert
+from sqlalchemy.orm import Session
+from dbr.models.base import Base
+
+
+# __tablename__ -> entity type of the models whose changes are logged
+TRACKED_ENTITIES: Dict[str, str] = {}
+
+
+def track_changes(entity_type: str):
+    """Class decorator: log inserts, updates and deletes of the model in change_log"""
+    def register(cls):
+        TRACKED_ENTITIES[cls.__tablename__] = entity_type
+        return cls
+    return register
+
+
+class ChangeLogEntry(Base):
+    """One insert, update or delete of a synced entity, in commit order.
+
+    Rows are written in the same transaction as the change by a flush hook,
+    so a client that read everything up to ``seq`` only needs the rows after
+    it. ``seq`` is an autoincrement integer rather than the usual UUID so it
+    can serve as that cursor.
+    """
+    __tablename__ = "change_log"
+
+    seq = Column(Integer, primary_key=True, autoincrement=True)
+    organization_id = Column(String(36), ForeignKey('organizations.id'), nullable=False)
+    entity_type = Column(String(50), nullable=False)
+    entity_id = Column(String(36), nullable=False)
+    op = Column(String(10), nullable=False)  # insert, update or delete
+    changed_date = Column(DateTime, default=lambda: datetime.now(timezone.utc), nullable=False)
+
+    __table_args__ = (
+        Index("ix_change_log_org_seq", "organization_id", "seq"),
+        {"sqlite_autoincrement": True},
+    )
+
+    def __repr__(self):
+        return f"<ChangeLogEntry(seq={self.seq}, {self.op} {self.entity_type} {self.entity_id})>"
+
+
+@event.listens_for(Session, "before_flush")
+def _record_changes(session, flush_context, instances):
+    """Append a change_log row for every tracked object this flush inserts, updates or deletes"""
+    changes = (
+        ("insert", list(session.new)),
+        ("update", [obj for obj in session.dirty if session.is_modified(obj)]),
+        ("delete", list(session.deleted)),
+    )
+    for op, objects in changes:
+        for obj in objects:
+            entity_type = TRACKED_ENTITIES.get(getattr(obj, "__tablename__", None))
+            if entity_type is None or not obj.organization_id:
+                continue
+            if obj.id is None:
+                # IDs are otherwise only generated on insert
+                obj.id = str(uuid.uuid4())
+            session.add(ChangeLogEntry(
+                organization_id=obj.organization_id,
+                entity_type=entity_type,
+                entity_id=obj.id,
+                op=op
+            ))
+
+
+def backfill_change_log(session: Session) -> None:
+    """Log existing rows of tracked tables as inserts when the change log is still empty"""
+    from dbr.models.base import BaseModel
+
+    if session.query(func.count(ChangeLogEntry.seq)).scalar():
+        return
+    models = {
+        mapper.class_.__tablename__: mapper.class_
+        for mapper in BaseModel.registry.mappers
+        if getattr(mapper.class_, "__tablename__", None) in TRACKED_ENTITIES
+    }
+    rows = []
+    for tablename, model in models.items():
+        for entity_id, organization_id in session.query(model.id, model.organization_id).order_by(model.created_date):
+            rows.append({
+                "organization_id": organization_id,
+                "entity_type": TRACKED_ENTITIES[tablename],
+                "entity_id": entity_id,
+                "op": "insert",
+            })
+    if rows:
+        session.execute(insert(ChangeLogEntry), rows)
+        session.commit()
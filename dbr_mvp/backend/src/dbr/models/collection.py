@@ -2,6 +2,7 @@
 from sqlalchemy import Column, String, Enum, Float, DateTime, ForeignKey
 from sqlalchemy.orm import relationship
 from dbr.models.base import BaseModel
+from dbr.models.change_log import track_changes
 import enum
 
 
@@ -13,6 +14,7 @@ class CollectionStatus(enum.Enum):
     COMPLETED = "completed"
 
 
+@track_changes("collection")
 class Collection(BaseModel):
     """Collection model - container for related work items"""
     __tablename__ = "collections"
@@ -1,7 +1,8 @@
 # src/dbr/models/organization.py
-from sqlalchemy import Column, String, Enum
-from sqlalchemy.orm import relationship
+from sqlalchemy import Column, String, Integer, Enum
+from sqlalchemy.orm import relationship, Session
 from dbr.models.base import BaseModel
+from dbr.core.data_version import mark_data_changed, TIME_UNITS
 import enum
 
 
@@ -31,9 +32,22 @@ class Organization(BaseModel):
     # Default board reference (will be added later when we create BoardConfig)
     default_board_id = Column(String(36), nullable=True)
     
+    # Number of time units the organization's boards have advanced (absolute CCR slot counter)
+    current_time_unit = Column(Integer, nullable=False, default=0)
+    
     # Relationships
     work_items = relationship("WorkItem", back_populates="organization")
     collections = relationship("Collection", back_populates="organization")
     
     def __repr__(self):
-        return f"<Organization(id={self.id}, name='{self.name}', status='{self.status.value}')>"
\ No newline at end of file
+        return f"<Organization(id={self.id}, name='{self.name}', status='{self.status.value}')>"
+
+
+def advance_organization_time_unit(session: Session, organization_id: str) -> int:
+    """Increment the organization's time unit counter; call in the same transaction as a board tick"""
+    organization = session.get(Organization, organization_id)
+    if organization is None:
+        return 0
+    organization.current_time_unit = (organization.current_time_unit or 0) + 1
+    mark_data_changed(session, organization_id, TIME_UNITS)
+    return organization.current_time_unit
@@ -1,7 +1,11 @@
 # src/dbr/models/schedule.py
-from sqlalchemy import Column, String, Enum, Integer, Float, DateTime, JSON, ForeignKey
+from sqlalchemy import Column, String, Enum, Integer, Float, Boolean, DateTime, JSON, ForeignKey, Index, event, inspect
 from sqlalchemy.orm import relationship, Session
+from sqlalchemy.ext.orderinglist import ordering_list
 from dbr.models.base import BaseModel
+from dbr.models.change_log import track_changes
+from dbr.models.schedule_item import ScheduleItem
+from dbr.models.ccr_capacity_ledger import apply_booking, get_booked_hours
 import enum
 from datetime import datetime, timezone
 from typing import List, Optional
@@ -15,6 +19,7 @@ class ScheduleStatus(enum.Enum):
     COMPLETED = "Completed"
 
 
+@track_changes("schedule")
 class Schedule(BaseModel):
     """Schedule model - time unit-sized bundle of work items"""
     __tablename__ = "schedules"
@@ -29,32 +34,84 @@ class Schedule(BaseModel):
     time_unit_position = Column(Integer, nullable=False, default=0)  # Position relative to CCR
     
     # Work items and capacity
-    work_item_ids = Column(JSON, nullable=False, default=list)  # Ordered list of work item IDs
+    # Membership lives in schedule_items; the legacy JSON list is only read by backfill_schedule_items
+    legacy_work_item_ids = Column("work_item_ids", JSON, nullable=False, default=list)
     total_ccr_hours = Column(Float, nullable=False, default=0.0)
     
+    # Booking held in ccr_capacity_ledger (ccr_slot is None when nothing is booked)
+    ccr_slot = Column(Integer, nullable=True)
+    booked_ccr_hours = Column(Float, nullable=False, default=0.0)
+    
+    # Rope: planned schedules wait in the board's release queue until the pre-constraint buffer has room
+    is_queued = Column(Boolean, nullable=False, default=False)
+    release_priority = Column(Integer, nullable=False, default=0)  # highest work item priority (see ReleaseQueue)
+    release_due_date = Column(DateTime, nullable=True)  # earliest work item due date
+    queued_date = Column(DateTime, nullable=True)
+    
     # Lifecycle dates
     released_date = Column(DateTime, nullable=True)  # When moved to pre-constraint
     completed_date = Column(DateTime, nullable=True)  # When marked as complete
     
+    # Ordered work item membership
+    items = relationship(
+        "ScheduleItem",
+        order_by=ScheduleItem.ordinal,
+        collection_class=ordering_list("ordinal"),
+        cascade="all, delete-orphan",
+        lazy="selectin"
+    )
+    
+    __table_args__ = (
+        Index("ix_schedules_board_queued", "board_config_id", "is_queued"),
+        Index("ix_schedules_ccr_slot", "capability_channel_id", "ccr_slot"),
+    )
+    
     # Relationships (can be added later when needed)
     # organization = relationship("Organization", back_populates="schedules")
     # board_config = relationship("BoardConfig", back_populates="schedules")
     # ccr = relationship("CCR", back_populates="schedules")
     
+    @property
+    def work_item_ids(self) -> List[str]:
+        """Ordered list of work item IDs in this schedule"""
+        return [item.work_item_id for item in self.items]
+    
+    @work_item_ids.setter
+    def work_item_ids(self, work_item_ids: List[str]) -> None:
+        """Replace the membership, keeping the rows of work items that stay"""
+        work_item_ids = list(dict.fromkeys(work_item_ids or []))
+        existing = {item.work_item_id: item for item in self.items}
+        if work_item_ids != list(existing):
+            # A reorder only updates schedule_items rows; touch the schedule so it is flushed as changed
+            self.updated_date = datetime.now(timezone.utc)
+        is_active = self.status != ScheduleStatus.COMPLETED
+        self.items = [
+            existing.get(work_item_id) or ScheduleItem(work_item_id=work_item_id, is_active=is_active)
+            for work_item_id in work_item_ids
+        ]
+        self.items.reorder()
+    
+    @staticmethod
+    def get_active_schedule_for_work_item(session: Session, work_item_id: str) -> Optional["Schedule"]:
+        """Get the active (not Completed) schedule that contains a work item"""
+        return session.query(Schedule).join(ScheduleItem, ScheduleItem.schedule_id == Schedule.id).filter(
+            ScheduleItem.work_item_id == work_item_id,
+            ScheduleItem.is_active.is_(True)
+        ).first()
+    
     def get_work_items(self, session: Session) -> List:
         """Get all work items in this schedule"""
         from dbr.models.work_item import WorkItem
         
-        if not self.work_item_ids:
+        work_item_ids = self.work_item_ids
+        if not work_item_ids:
             return []
         
-        work_items = []
-        for work_item_id in self.work_item_ids:
-            work_item = session.query(WorkItem).filter_by(id=work_item_id).first()
-            if work_item:
-                work_items.append(work_item)
-        
-        return work_items
+        work_items = {
+            work_item.id: work_item
+            for work_item in session.query(WorkItem).filter(WorkItem.id.in_(work_item_ids)).all()
+        }
+        return [work_items[work_item_id] for work_item_id in work_item_ids if work_item_id in work_items]
     
     def add_work_item(self, session: Session, work_item_id: str) -> bool:
         """Add a work item to this schedule"""
@@ -65,10 +122,10 @@ class Schedule(BaseModel):
             return False
         
         if work_item_id not in self.work_item_ids:
-            # Create a new list to trigger SQLAlchemy change detection
-            new_work_item_ids = self.work_item_ids.copy()
-            new_work_item_ids.append(work_item_id)
-            self.work_item_ids = new_work_item_ids
+            self.items.append(ScheduleItem(
+                work_item_id=work_item_id,
+                is_active=self.status != ScheduleStatus.COMPLETED
+            ))
             self.recalculate_total_hours(session)
             session.commit()
             return True
@@ -77,14 +134,13 @@ class Schedule(BaseModel):
     
     def remove_work_item(self, session: Session, work_item_id: str) -> bool:
         """Remove a work item from this schedule"""
-        if work_item_id in self.work_item_ids:
-            # Create a new list to trigger SQLAlchemy change detection
-            new_work_item_ids = self.work_item_ids.copy()
-            new_work_item_ids.remove(work_item_id)
-            self.work_item_ids = new_work_item_ids
-            self.recalculate_total_hours(session)
-            session.commit()
-            return True
+        for item in self.items:
+            if item.work_item_id == work_item_id:
+                self.items.remove(item)
+                self.items.reorder()
+                self.recalculate_total_hours(session)
+                session.commit()
+                return True
         
         return False
     
@@ -101,17 +157,11 @@ class Schedule(BaseModel):
         session.commit()
     
     def calculate_total_ccr_hours(self, session: Session) -> float:
-        """Calculate total CCR hours for all work items in this schedule"""
-        work_items = self.get_work_items(session)
-        
-        total_hours = 0.0
-        for work_item in work_items:
-            if work_item.ccr_hours_required:
-                # Sum all CCR hours for this work item (handles multi-CCR scenarios)
-                work_item_ccr_hours = sum(work_item.ccr_hours_required.values())
-                total_hours += work_item_ccr_hours
+        """Calculate the hours the work items in this schedule need on the board's CCR"""
+        from dbr.models.work_item_ccr_hours import sum_ccr_hours
         
-        return total_hours
+        # Hours for other CCRs do not load this schedule's CCR slot
+        return sum_ccr_hours(session, self.work_item_ids or [], self.capability_channel_id)
     
     def recalculate_total_hours(self, session: Session) -> None:
         """Recalculate and update total CCR hours"""
@@ -131,9 +181,10 @@ class Schedule(BaseModel):
         return True
     
     def validate_capacity(self, session: Session) -> bool:
-        """Validate that schedule doesn't exceed CCR capacity"""
+        """Validate that schedule doesn't exceed CCR capacity, including hours already booked for its slot"""
         from dbr.models.ccr import CCR
         from dbr.core.scheduling import ScheduleValidationError
+        from dbr.services.capacity_calendar import CapacityCalendar
         
         ccr = session.query(CCR).filter_by(id=self.capability_channel_id).first()
         if not ccr:
@@ -144,6 +195,22 @@ class Schedule(BaseModel):
                 f"Schedule requires {self.total_ccr_hours} hours but CCR capacity is {ccr.capacity_per_time_unit} hours"
             )
         
+        # Queued schedules get their slot when the rope releases them
+        if self.is_queued:
+            return True
+        
+        # Calendar capacity of the slot, less the hours other schedules hold on it
+        slot = self.get_ccr_slot(session)
+        capacity = float(CapacityCalendar(session).get_capacity(ccr, slot)[0])
+        booked = get_booked_hours(session, ccr.id, slot, slot).get(slot, 0.0)
+        if self.ccr_slot == slot and self.capability_channel_id == ccr.id:
+            booked -= self.booked_ccr_hours or 0.0
+        if booked + self.total_ccr_hours > capacity:
+            raise ScheduleValidationError(
+                f"Schedule requires {self.total_ccr_hours} hours but CCR has only "
+                f"{max(capacity - booked, 0.0)} of {capacity} hours free in slot {slot}"
+            )
+        
         return True
     
     def validate(self, session: Session) -> bool:
@@ -152,6 +219,15 @@ class Schedule(BaseModel):
         self.validate_capacity(session)
         return True
     
+    def get_ccr_slot(self, session: Session) -> int:
+        """Absolute time unit slot in which this schedule sits on the CCR"""
+        from dbr.models.organization import Organization
+        
+        with session.no_autoflush:
+            organization = session.get(Organization, self.organization_id)
+        current_time_unit = (organization.current_time_unit or 0) if organization else 0
+        return current_time_unit - (self.time_unit_position or 0)
+    
     def advance_position(self) -> None:
         """Advance the schedule position by one time unit"""
         self.time_unit_position += 1
@@ -209,4 +285,120 @@ class Schedule(BaseModel):
         }
     
     def __repr__(self):
-        return f"<Schedule(id={self.id}, status='{self.status.value}', position={self.time_unit_position}, items={len(self.work_item_ids)})>"
\ No newline at end of file
+        return f"<Schedule(id={self.id}, status='{self.status.value}', position={self.time_unit_position}, items={len(self.work_item_ids)})>"
+
+
+@event.listens_for(Session, "before_flush")
+def _sync_schedule_item_activity(session, flush_context, instances):
+    """Mirror schedule completion onto schedule_items.is_active"""
+    for obj in list(session.new) + list(session.dirty):
+        if not isinstance(obj, Schedule):
+            continue
+        if obj not in session.new and not inspect(obj).attrs.status.history.has_changes():
+            continue
+        is_active = obj.status != ScheduleStatus.COMPLETED
+        for item in obj.items:
+            if item.is_active != is_active:
+                item.is_active = is_active
+
+
+@event.listens_for(Session, "before_flush", insert=True)
+def _touch_schedules_of_changed_items(session, flush_context, instances):
+    """Record schedule_items edits as edits of their schedule
+
+    Membership rows carry no organization_id, so the change log and data
+    versions only see them through their schedule. Adding and removing rows
+    through Schedule.items already changes the schedule; this covers rows
+    edited or deleted on their own, such as a new ordinal.
+    Registered first so the other flush hooks see the touched schedules.
+    """
+    items = list(session.new) + list(session.deleted) + [obj for obj in session.dirty if session.is_modified(obj)]
+    schedule_ids = {obj.schedule_id for obj in items if isinstance(obj, ScheduleItem) and obj.schedule_id}
+    if not schedule_ids:
+        return
+    now = datetime.now(timezone.utc)
+    with session.no_autoflush:
+        for schedule_id in schedule_ids:
+            schedule = session.get(Schedule, schedule_id)
+            if schedule is not None and schedule not in session.deleted:
+                schedule.updated_date = now
+
+
+def sync_capacity_booking(session: Session, schedule: Schedule, deleted: bool = False) -> None:
+    """Move the schedule's booking in ccr_capacity_ledger to match its CCR slot and hours
+
+    Active schedules book their total CCR hours on their slot. Completed
+    schedules keep the booking of the slot they went through, but release it
+    if they were completed before reaching the CCR. Queued schedules are not
+    on the board yet and book nothing.
+    """
+    if deleted or schedule.status == ScheduleStatus.COMPLETED:
+        keep = not deleted and schedule.ccr_slot is not None and (schedule.time_unit_position or 0) > 0
+        slot = schedule.ccr_slot if keep else None
+    elif schedule.is_queued:
+        slot = None
+    else:
+        slot = schedule.get_ccr_slot(session)
+    hours = (schedule.total_ccr_hours or 0.0) if slot is not None else 0.0
+    
+    if slot == schedule.ccr_slot and hours == (schedule.booked_ccr_hours or 0.0):
+        return
+    if slot is not None and slot == schedule.ccr_slot:
+        apply_booking(session, schedule.organization_id, schedule.capability_channel_id,
+                      slot, hours - (schedule.booked_ccr_hours or 0.0), 0)
+    else:
+        if schedule.ccr_slot is not None:
+            apply_booking(session, schedule.organization_id, schedule.capability_channel_id,
+                          schedule.ccr_slot, -(schedule.booked_ccr_hours or 0.0), -1)
+        if slot is not None:
+            apply_booking(session, schedule.organization_id, schedule.capability_channel_id, slot, hours, 1)
+    if not deleted:
+        schedule.ccr_slot = slot
+        schedule.booked_ccr_hours = hours
+
+
+@event.listens_for(Session, "before_flush")
+def _sync_capacity_ledger(session, flush_context, instances):
+    """Keep ccr_capacity_ledger in step with created, edited, moved, completed and deleted schedules"""
+    for obj in list(session.new) + list(session.dirty):
+        if isinstance(obj, Schedule):
+            sync_capacity_booking(session, obj)
+    for obj in list(session.deleted):
+        if isinstance(obj, Schedule):
+            sync_capacity_booking(session, obj, deleted=True)
+
+
+def backfill_capacity_ledger(session: Session) -> int:
+    """Book schedules created before the capacity ledger existed"""
+    schedules = session.query(Schedule).filter(
+        Schedule.ccr_slot.is_(None),
+        Schedule.status != ScheduleStatus.COMPLETED,
+        Schedule.is_queued.is_(False)
+    ).all()
+    for schedule in schedules:
+        sync_capacity_booking(session, schedule)
+    if schedules:
+        session.commit()
+    return len(schedules)
+
+
+def backfill_schedule_items(session: Session) -> int:
+    """Move work item IDs from the legacy JSON column into schedule_items"""
+    schedules = session.query(Schedule).filter(~Schedule.items.any()).order_by(Schedule.created_date).all()
+    schedules = [schedule for schedule in schedules if schedule.legacy_work_item_ids]
+    if not schedules:
+        return 0
+    
+    # A work item may only sit in one active schedule; keep the earliest membership
+    active_work_item_ids = {
+        row.work_item_id for row in session.query(ScheduleItem.work_item_id).filter(ScheduleItem.is_active.is_(True)).all()
+    }
+    for schedule in schedules:
+        work_item_ids = list(schedule.legacy_work_item_ids)
+        if schedule.status != ScheduleStatus.COMPLETED:
+            work_item_ids = [work_item_id for work_item_id in work_item_ids if work_item_id not in active_work_item_ids]
+            active_work_item_ids.update(work_item_ids)
+        schedule.work_item_ids = work_item_ids
+        schedule.legacy_work_item_ids = []
+    session.commit()
+    return len(schedules)
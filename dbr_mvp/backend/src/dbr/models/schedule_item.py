@@ -0,0 +1,33 @@
+# src/dbr/models/schedule_item.py
+from sqlalchemy import Column, String, Integer, Boolean, ForeignKey, Index, UniqueConstraint, text
+from dbr.models.base import BaseModel
+
+
+class ScheduleItem(BaseModel):
+    """Membership of a work item in a schedule, ordered by ``ordinal``.
+
+    ``is_active`` mirrors whether the owning schedule is still on the board
+    (not Completed); a partial unique index on it stops a work item from
+    sitting in two active schedules.
+    """
+    __tablename__ = "schedule_items"
+
+    schedule_id = Column(String(36), ForeignKey('schedules.id', ondelete="CASCADE"), nullable=False)
+    work_item_id = Column(String(36), ForeignKey('work_items.id'), nullable=False)
+    ordinal = Column(Integer, nullable=False, default=0)
+    is_active = Column(Boolean, nullable=False, default=True)
+
+    __table_args__ = (
+        UniqueConstraint("schedule_id", "work_item_id", name="uq_schedule_items_schedule_work_item"),
+        Index("ix_schedule_items_schedule_ordinal", "schedule_id", "ordinal"),
+        Index("ix_schedule_items_work_item", "work_item_id"),
+        Index(
+            "uq_schedule_items_active_work_item", "work_item_id",
+            unique=True,
+            sqlite_where=text("is_active = 1"),
+            postgresql_where=text("is_active"),
+        ),
+    )
+
+    def __repr__(self):
+        return f"<ScheduleItem(schedule_id={self.schedule_id}, work_item_id={self.work_item_id}, ordinal={self.ordinal})>"
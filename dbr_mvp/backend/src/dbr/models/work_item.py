@@ -1,9 +1,14 @@
 # src/dbr/models/work_item.py
-from sqlalchemy import Column, String, Enum, Float, DateTime, Text, JSON, ForeignKey
-from sqlalchemy.orm import relationship
+from sqlalchemy import Column, String, Enum, Float, Integer, DateTime, Text, JSON, ForeignKey, Index, case, event, func, inspect, select, update
+from sqlalchemy.orm import relationship, Session
+from sqlalchemy.ext.orderinglist import ordering_list
 from dbr.models.base import BaseModel
+from dbr.models.change_log import track_changes
+from dbr.models.work_item_ccr_hours import WorkItemCCRHours, ccr_key_for_name
+from dbr.models.work_item_task import WorkItemTask
 import enum
 import json
+from datetime import datetime, timezone
 from typing import Dict, List, Any, Optional
 
 
@@ -24,6 +29,7 @@ class WorkItemPriority(enum.Enum):
     CRITICAL = "critical"
 
 
+@track_changes("work_item")
 class WorkItem(BaseModel):
     """Work item model - fundamental unit of work in the DBR system"""
     __tablename__ = "work_items"
@@ -52,13 +58,37 @@ class WorkItem(BaseModel):
     estimated_sales_price = Column(Float, nullable=True, default=0.0)
     estimated_variable_cost = Column(Float, nullable=True, default=0.0)
     
-    # Task management (JSON field)
-    tasks = Column(JSON, nullable=True, default=list)
+    # Task management
+    # Tasks live in work_item_tasks; the legacy JSON list is only read by backfill_work_item_tasks
+    legacy_tasks = Column("tasks", JSON, nullable=True, default=list)
+    task_count = Column(Integer, nullable=False, default=0)
+    completed_task_count = Column(Integer, nullable=False, default=0)
+    
+    # Derived metrics, maintained on flush so they can be sorted and filtered in SQL
+    throughput = Column(Float, nullable=True)               # sales_price - variable_cost
+    total_ccr_hours = Column(Float, nullable=True)          # sum of ccr_hours_required
+    progress = Column(Float, nullable=True)                 # completed tasks / tasks (0..1)
+    throughput_per_ccr_hour = Column(Float, nullable=True)  # TOC ranking; NULL without CCR hours
+    
+    __table_args__ = (
+        Index("ix_work_items_org_throughput", "organization_id", "throughput"),
+        Index("ix_work_items_org_total_ccr_hours", "organization_id", "total_ccr_hours"),
+        Index("ix_work_items_org_progress", "organization_id", "progress"),
+        Index("ix_work_items_org_throughput_per_ccr_hour", "organization_id", "throughput_per_ccr_hour"),
+    )
     
     # Relationships
     organization = relationship("Organization", back_populates="work_items")
     collection = relationship("Collection", back_populates="work_items")
     responsible_user = relationship("User", back_populates="assigned_work_items", foreign_keys=[responsible_user_id])
+    ccr_hour_entries = relationship("WorkItemCCRHours", cascade="all, delete-orphan")
+    task_rows = relationship(
+        "WorkItemTask",
+        order_by=WorkItemTask.ordinal,
+        collection_class=ordering_list("ordinal"),
+        cascade="all, delete-orphan",
+        lazy="selectin"
+    )
     
     def calculate_throughput(self) -> float:
         """Calculate work item throughput (sales_price - variable_cost)"""
@@ -72,17 +102,23 @@ class WorkItem(BaseModel):
             return 0.0
         return sum(self.ccr_hours_required.values())
     
+    def refresh_derived_metrics(self) -> None:
+        """Recompute the persisted throughput, CCR hours and progress columns"""
+        self.throughput = self.calculate_throughput()
+        self.total_ccr_hours = self.calculate_total_ccr_hours()
+        self.progress = self.calculate_progress()
+        self.throughput_per_ccr_hour = (
+            self.throughput / self.total_ccr_hours if self.total_ccr_hours > 0 else None
+        )
+    
     def update_ccr_hours(self, ccr_name: str, hours: float) -> None:
         """Update hours for a specific CCR"""
-        if not self.ccr_hours_required:
-            self.ccr_hours_required = {}
-        self.ccr_hours_required[ccr_name] = hours
+        # Assign a new dict so the change is detected and synced to work_item_ccr_hours
+        self.ccr_hours_required = {**(self.ccr_hours_required or {}), ccr_name: hours}
     
     def add_ccr_hours(self, ccr_name: str, hours: float) -> None:
         """Add hours for a new CCR"""
-        if not self.ccr_hours_required:
-            self.ccr_hours_required = {}
-        self.ccr_hours_required[ccr_name] = hours
+        self.ccr_hours_required = {**(self.ccr_hours_required or {}), ccr_name: hours}
     
     def get_ccr_hours(self, ccr_name: str) -> float:
         """Get hours for a specific CCR"""
@@ -90,64 +126,327 @@ class WorkItem(BaseModel):
             return 0.0
         return self.ccr_hours_required.get(ccr_name, 0.0)
     
+    def sync_ccr_hour_entries(self, ccr_ids_by_key: Optional[Dict[str, str]] = None) -> None:
+        """Reconcile the work_item_ccr_hours rows with ccr_hours_required"""
+        ccr_ids_by_key = ccr_ids_by_key or {}
+        desired = {key: float(hours or 0.0) for key, hours in (self.ccr_hours_required or {}).items()}
+        existing = {entry.ccr_key: entry for entry in self.ccr_hour_entries}
+        
+        for key, entry in existing.items():
+            if key not in desired:
+                self.ccr_hour_entries.remove(entry)
+        
+        for key, hours in desired.items():
+            entry = existing.get(key)
+            if entry is None:
+                self.ccr_hour_entries.append(
+                    WorkItemCCRHours(ccr_key=key, ccr_id=ccr_ids_by_key.get(key), hours=hours)
+                )
+            else:
+                entry.hours = hours
+                # Keep the CCR of a key that no longer resolves, e.g. the old name of a renamed CCR
+                entry.ccr_id = ccr_ids_by_key.get(key, entry.ccr_id)
+    
     # Task management methods
-    def add_task(self, title: str, task_id: int = None) -> None:
+    @property
+    def tasks(self) -> List[Dict[str, Any]]:
+        """Tasks as a list of {"id", "title", "completed"} dictionaries"""
+        return [task.to_dict() for task in self.task_rows]
+    
+    @tasks.setter
+    def tasks(self, tasks: Optional[List[Dict[str, Any]]]) -> None:
+        """Replace the task list, keeping the rows of tasks whose IDs remain"""
+        existing = {task.task_number: task for task in self.task_rows}
+        next_number = max([task.get("id") or 0 for task in tasks or []] + [0]) + 1
+        rows = []
+        seen = set()
+        for task in tasks or []:
+            task_number = task.get("id")
+            if task_number is None or int(task_number) in seen:
+                task_number = next_number
+                next_number += 1
+            task_number = int(task_number)
+            seen.add(task_number)
+            row = existing.get(task_number) or WorkItemTask(task_number=task_number)
+            row.title = task.get("title", "")
+            row.completed = bool(task.get("completed", False))
+            rows.append(row)
+        self.task_rows = rows
+        self.task_rows.reorder()
+        self._refresh_task_counters()
+    
+    def _refresh_task_counters(self) -> None:
+        """Recount the maintained task counters from the loaded task rows
+
+        These values serve reads until the next flush, which recounts the
+        rows in SQL (see ``_recount_task_counters``).
+        """
+        self.task_count = len(self.task_rows)
+        self.completed_task_count = sum(1 for task in self.task_rows if task.completed)
+    
+    def _get_task_row(self, task_id: int) -> Optional[WorkItemTask]:
+        for task in self.task_rows:
+            if task.task_number == int(task_id):
+                return task
+        return None
+    
+    def add_task(self, title: str, task_id: int = None, completed: bool = False) -> Dict[str, Any]:
         """Add a new task to the work item"""
-        if not self.tasks:
-            self.tasks = []
-        
         if task_id is None:
             # Generate next ID
-            existing_ids = [task.get("id", 0) for task in self.tasks]
-            task_id = max(existing_ids, default=0) + 1
+            task_id = max((task.task_number for task in self.task_rows), default=0) + 1
         
-        new_task = {
-            "id": task_id,
-            "title": title,
-            "completed": False
-        }
-        self.tasks.append(new_task)
+        task = WorkItemTask(task_number=task_id, title=title, completed=completed)
+        self.task_rows.append(task)
+        self._refresh_task_counters()
+        return task.to_dict()
     
-    def complete_task(self, task_id: int) -> bool:
-        """Mark a task as completed"""
-        if not self.tasks:
+    def update_task(self, task_id: int, title: Optional[str] = None, completed: Optional[bool] = None) -> Optional[Dict[str, Any]]:
+        """Update a single task's title and/or completion; returns None if not found"""
+        task = self._get_task_row(task_id)
+        if task is None:
+            return None
+        
+        if title is not None:
+            task.title = title
+        if completed is not None and task.completed != completed:
+            task.completed = completed
+            self._refresh_task_counters()
+        return task.to_dict()
+    
+    def set_tasks_completed(self, task_ids: List[int], completed: bool = True) -> List[int]:
+        """Set completion for several tasks at once; returns the IDs that were not found"""
+        missing = []
+        for task_id in task_ids:
+            if self.update_task(task_id, completed=completed) is None:
+                missing.append(task_id)
+        return missing
+    
+    def remove_task(self, task_id: int) -> bool:
+        """Remove a task from the work item"""
+        task = self._get_task_row(task_id)
+        if task is None:
             return False
         
-        for task in self.tasks:
-            if task.get("id") == task_id:
-                task["completed"] = True
-                return True
-        return False
+        self.task_rows.remove(task)
+        self.task_rows.reorder()
+        self._refresh_task_counters()
+        return True
+    
+    def complete_task(self, task_id: int) -> bool:
+        """Mark a task as completed"""
+        return self.update_task(task_id, completed=True) is not None
     
     def get_task_by_id(self, task_id: int) -> Optional[Dict[str, Any]]:
         """Get a task by its ID"""
-        if not self.tasks:
-            return None
-        
-        for task in self.tasks:
-            if task.get("id") == task_id:
-                return task
-        return None
+        task = self._get_task_row(task_id)
+        return task.to_dict() if task else None
     
     def calculate_progress(self) -> float:
         """Calculate progress based on completed tasks"""
-        if not self.tasks or len(self.tasks) == 0:
+        if not self.task_count:
             return 0.0
         
-        completed_tasks = sum(1 for task in self.tasks if task.get("completed", False))
-        return completed_tasks / len(self.tasks)
+        return (self.completed_task_count or 0) / self.task_count
     
     def get_completed_tasks(self) -> List[Dict[str, Any]]:
         """Get all completed tasks"""
-        if not self.tasks:
-            return []
-        return [task for task in self.tasks if task.get("completed", False)]
+        return [task.to_dict() for task in self.task_rows if task.completed]
     
     def get_pending_tasks(self) -> List[Dict[str, Any]]:
         """Get all pending tasks"""
-        if not self.tasks:
-            return []
-        return [task for task in self.tasks if not task.get("completed", False)]
+        return [task.to_dict() for task in self.task_rows if not task.completed]
     
     def __repr__(self):
-        return f"<WorkItem(id={self.id}, title='{self.title}', status='{self.status.value}', priority='{self.priority.value}')>"
\ No newline at end of file
+        return f"<WorkItem(id={self.id}, title='{self.title}', status='{self.status.value}', priority='{self.priority.value}')>"
+
+
+def _ccr_ids_by_key(session: Session, organization_ids: List[str]) -> Dict[tuple, str]:
+    """Map (organization_id, ccr key) to CCR id; keys are CCR name keys or CCR ids"""
+    from dbr.models.ccr import CCR
+    
+    lookup = {}
+    if not organization_ids:
+        return lookup
+    for ccr_id, organization_id, name in session.query(CCR.id, CCR.organization_id, CCR.name).filter(
+        CCR.organization_id.in_(organization_ids)
+    ).all():
+        lookup[(organization_id, ccr_key_for_name(name))] = ccr_id
+        lookup[(organization_id, ccr_id)] = ccr_id
+    return lookup
+
+
+def sync_work_item_ccr_hours(session: Session, work_items: List[WorkItem]) -> None:
+    """Rebuild the work_item_ccr_hours rows for the given work items"""
+    if not work_items:
+        return
+    with session.no_autoflush:
+        lookup = _ccr_ids_by_key(session, list({item.organization_id for item in work_items}))
+        for item in work_items:
+            keys = {key: lookup[(item.organization_id, key)]
+                    for key in (item.ccr_hours_required or {}) if (item.organization_id, key) in lookup}
+            item.sync_ccr_hour_entries(keys)
+
+
+@event.listens_for(Session, "before_flush", insert=True)
+def _touch_work_items_of_changed_tasks(session, flush_context, instances):
+    """Record task edits as edits of their work item
+
+    Task rows carry no organization_id, so the change log and data versions
+    only see a task edit through its work item. Adding and removing tasks
+    already changes the work item's task collection; this covers edits of
+    existing tasks, such as a new title, that leave the counters unchanged.
+    Registered first so the other flush hooks see the touched work items.
+    """
+    tasks = list(session.deleted) + [obj for obj in session.dirty if session.is_modified(obj)]
+    work_item_ids = {obj.work_item_id for obj in tasks if isinstance(obj, WorkItemTask) and obj.work_item_id}
+    if not work_item_ids:
+        return
+    now = datetime.now(timezone.utc)
+    with session.no_autoflush:
+        for work_item_id in work_item_ids:
+            work_item = session.get(WorkItem, work_item_id)
+            if work_item is not None and work_item not in session.deleted:
+                work_item.updated_date = now
+
+
+_RECOUNT_KEY = "dbr_recount_task_counters"
+
+
+@event.listens_for(Session, "after_flush")
+def _collect_work_items_with_changed_tasks(session, flush_context):
+    """Remember the work items whose task rows this flush wrote"""
+    work_item_ids = {
+        obj.work_item_id for obj in list(session.new) + list(session.dirty) + list(session.deleted)
+        if isinstance(obj, WorkItemTask) and obj.work_item_id
+    }
+    if work_item_ids:
+        session.info.setdefault(_RECOUNT_KEY, set()).update(work_item_ids)
+
+
+@event.listens_for(Session, "after_flush_postexec")
+def _recount_task_counters(session, flush_context):
+    """Recount task counters and progress from the task rows in SQL
+
+    Counters written from Python would lose concurrent updates and drift
+    from the rows; counting the rows after they are written cannot.
+    """
+    work_item_ids = session.info.pop(_RECOUNT_KEY, None)
+    if not work_item_ids:
+        return
+    tasks = WorkItemTask.__table__
+    task_count = select(func.count()).where(tasks.c.work_item_id == WorkItem.__table__.c.id).scalar_subquery()
+    completed_task_count = select(func.count()).where(
+        tasks.c.work_item_id == WorkItem.__table__.c.id, tasks.c.completed.is_(True)
+    ).scalar_subquery()
+    session.connection().execute(
+        update(WorkItem.__table__).where(WorkItem.__table__.c.id.in_(work_item_ids)).values(
+            task_count=task_count,
+            completed_task_count=completed_task_count,
+            progress=case((task_count > 0, completed_task_count * 1.0 / task_count), else_=0.0)
+        )
+    )
+    for obj in list(session.identity_map.values()):
+        if isinstance(obj, WorkItem) and obj.id in work_item_ids:
+            session.expire(obj, ["task_count", "completed_task_count", "progress", "updated_date"])
+
+
+@event.listens_for(Session, "before_flush")
+def _sync_ccr_hours_before_flush(session, flush_context, instances):
+    """Keep work_item_ccr_hours in step with WorkItem.ccr_hours_required"""
+    changed = [
+        obj for obj in list(session.new) + list(session.dirty)
+        if isinstance(obj, WorkItem)
+        and (obj in session.new or inspect(obj).attrs.ccr_hours_required.history.has_changes())
+    ]
+    sync_work_item_ccr_hours(session, changed)
+    
+    # Derived metrics only depend on the work item's own columns
+    for obj in list(session.new) + list(session.dirty):
+        if isinstance(obj, WorkItem):
+            obj.refresh_derived_metrics()
+
+
+_RESOLVE_CCRS_KEY = "dbr_resolve_ccr_hours"
+
+
+def _resolve_ccr_ids(connection, ccrs) -> None:
+    """Point unresolved work_item_ccr_hours rows keyed by a CCR's name key or id at that CCR
+
+    ``ccrs`` holds (organization_id, ccr_id, name) tuples.
+    """
+    hours = WorkItemCCRHours.__table__
+    work_items = WorkItem.__table__
+    for organization_id, ccr_id, name in ccrs:
+        connection.execute(update(hours).where(
+            hours.c.ccr_id.is_(None),
+            hours.c.ccr_key.in_([ccr_key_for_name(name), ccr_id]),
+            hours.c.work_item_id.in_(select(work_items.c.id).where(work_items.c.organization_id == organization_id))
+        ).values(ccr_id=ccr_id))
+
+
+@event.listens_for(Session, "after_flush")
+def _collect_new_and_renamed_ccrs(session, flush_context):
+    """Remember the CCRs whose name key may now match unresolved work_item_ccr_hours rows"""
+    from dbr.models.ccr import CCR
+    
+    ccrs = {
+        (obj.organization_id, obj.id, obj.name) for obj in list(session.new) + list(session.dirty)
+        if isinstance(obj, CCR) and (obj in session.new or inspect(obj).attrs.name.history.has_changes())
+    }
+    if ccrs:
+        session.info.setdefault(_RESOLVE_CCRS_KEY, set()).update(ccrs)
+
+
+@event.listens_for(Session, "after_flush_postexec")
+def _resolve_ccr_hours_of_new_ccrs(session, flush_context):
+    """Resolve rows written before their CCR existed, or under its new name"""
+    ccrs = session.info.pop(_RESOLVE_CCRS_KEY, None)
+    if not ccrs:
+        return
+    _resolve_ccr_ids(session.connection(), ccrs)
+    for obj in list(session.identity_map.values()):
+        if isinstance(obj, WorkItemCCRHours):
+            session.expire(obj, ["ccr_id"])
+
+
+def backfill_work_item_ccr_hours(session: Session) -> int:
+    """Populate work_item_ccr_hours from the JSON column for items that have no rows yet
+
+    Rows without a CCR are then resolved against the organizations' CCRs.
+    """
+    from dbr.models.ccr import CCR
+    
+    missing = session.query(WorkItem).filter(
+        WorkItem.ccr_hours_required.isnot(None),
+        ~WorkItem.ccr_hour_entries.any()
+    ).all()
+    missing = [item for item in missing if item.ccr_hours_required]
+    sync_work_item_ccr_hours(session, missing)
+    session.flush()
+    _resolve_ccr_ids(session.connection(), session.query(CCR.organization_id, CCR.id, CCR.name).all())
+    session.commit()
+    return len(missing)
+
+
+def backfill_work_item_tasks(session: Session) -> int:
+    """Move tasks from the legacy JSON column into work_item_tasks"""
+    work_items = session.query(WorkItem).filter(
+        WorkItem.legacy_tasks.isnot(None),
+        ~WorkItem.task_rows.any()
+    ).all()
+    work_items = [item for item in work_items if item.legacy_tasks]
+    for item in work_items:
+        item.tasks = [task for task in item.legacy_tasks if isinstance(task, dict)]
+        item.legacy_tasks = []
+    session.commit()
+    return len(work_items)
+
+
+def backfill_work_item_metrics(session: Session) -> int:
+    """Compute derived metric columns for work items created before they existed"""
+    work_items = session.query(WorkItem).filter(WorkItem.throughput.is_(None)).all()
+    for item in work_items:
+        item.refresh_derived_metrics()
+    session.commit()
+    return len(work_items)
@@ -0,0 +1,60 @@
+# src/dbr/models/work_item_ccr_hours.py
+from typing import Dict, Iterable, Optional
+from sqlalchemy import Column, String, Float, ForeignKey, Index, UniqueConstraint, func
+from sqlalchemy.orm import Session
+from dbr.models.base import BaseModel
+
+
+def ccr_key_for_name(name: str) -> str:
+    """Key used for a CCR in WorkItem.ccr_hours_required (e.g. "Senior Developers" -> "senior_developers")"""
+    return name.lower().replace(" ", "_")
+
+
+class WorkItemCCRHours(BaseModel):
+    """CCR hours required by a work item - one row per entry of WorkItem.ccr_hours_required.
+
+    Rows are kept in sync with the JSON column whenever a work item is flushed,
+    so CCR load can be aggregated in SQL. ``ccr_key`` is the key as entered
+    (a CCR name key or a CCR id); ``ccr_id`` is the organization's CCR it
+    resolves to, if any. Aggregates go by ``ccr_id``, so a resolved row stays
+    with its CCR when the CCR is renamed.
+    """
+    __tablename__ = "work_item_ccr_hours"
+
+    work_item_id = Column(String(36), ForeignKey('work_items.id', ondelete="CASCADE"), nullable=False)
+    ccr_id = Column(String(36), ForeignKey('ccrs.id'), nullable=True)
+    ccr_key = Column(String(255), nullable=False)
+    hours = Column(Float, nullable=False, default=0.0)
+
+    __table_args__ = (
+        UniqueConstraint("work_item_id", "ccr_key", name="uq_work_item_ccr_hours_item_key"),
+        Index("ix_work_item_ccr_hours_ccr_id", "ccr_id"),
+        Index("ix_work_item_ccr_hours_ccr_key", "ccr_key"),
+    )
+
+    def __repr__(self):
+        return f"<WorkItemCCRHours(work_item_id={self.work_item_id}, ccr_key='{self.ccr_key}', hours={self.hours})>"
+
+
+def sum_ccr_hours(session: Session, work_item_ids: Iterable[str], ccr_id: Optional[str] = None) -> float:
+    """Total CCR hours for the given work items, optionally for a single CCR"""
+    work_item_ids = list(work_item_ids)
+    if not work_item_ids:
+        return 0.0
+    query = session.query(func.coalesce(func.sum(WorkItemCCRHours.hours), 0.0)).filter(
+        WorkItemCCRHours.work_item_id.in_(work_item_ids)
+    )
+    if ccr_id is not None:
+        query = query.filter(WorkItemCCRHours.ccr_id == ccr_id)
+    return float(query.scalar())
+
+
+def sum_ccr_hours_by_work_item(session: Session, work_item_ids: Iterable[str]) -> Dict[str, float]:
+    """Total CCR hours per work item for the given work items"""
+    work_item_ids = list(work_item_ids)
+    if not work_item_ids:
+        return {}
+    rows = session.query(WorkItemCCRHours.work_item_id, func.sum(WorkItemCCRHours.hours)).filter(
+        WorkItemCCRHours.work_item_id.in_(work_item_ids)
+    ).group_by(WorkItemCCRHours.work_item_id).all()
+    return {work_item_id: float(hours) for work_item_id, hours in rows}
@@ -0,0 +1,35 @@
+# src/dbr/models/work_item_task.py
+from typing import Dict, Any
+from sqlalchemy import Column, String, Integer, Boolean, ForeignKey, Index, UniqueConstraint
+from dbr.models.base import BaseModel
+
+
+class WorkItemTask(BaseModel):
+    """Checklist task of a work item, ordered by ``ordinal``.
+
+    ``task_number`` is the task ID exposed by the API; it is unique within the
+    work item and stays stable when tasks are reordered or removed.
+    """
+    __tablename__ = "work_item_tasks"
+
+    work_item_id = Column(String(36), ForeignKey('work_items.id', ondelete="CASCADE"), nullable=False)
+    task_number = Column(Integer, nullable=False)
+    title = Column(String(500), nullable=False, default="")
+    completed = Column(Boolean, nullable=False, default=False)
+    ordinal = Column(Integer, nullable=False, default=0)
+
+    __table_args__ = (
+        UniqueConstraint("work_item_id", "task_number", name="uq_work_item_tasks_item_number"),
+        Index("ix_work_item_tasks_item_ordinal", "work_item_id", "ordinal"),
+    )
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Task in the dictionary shape used by the API"""
+        return {
+            "id": self.task_number,
+            "title": self.title,
+            "completed": self.completed
+        }
+
+    def __repr__(self):
+        return f"<WorkItemTask(work_item_id={self.work_item_id}, id={self.task_number}, completed={self.completed})>"
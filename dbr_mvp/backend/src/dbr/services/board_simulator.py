@@ -0,0 +1,221 @@
+# src/dbr/services/board_simulator.py
+from typing import Dict, Any, List, Optional
+from dataclasses import dataclass
+import numpy as np
+from sqlalchemy.orm import Session
+from dbr.models.schedule import Schedule, ScheduleStatus
+from dbr.models.board_config import BoardConfig, completion_position
+
+
+# Compact integer codes for schedule statuses inside the simulator arrays
+STATUS_CODES = {
+    ScheduleStatus.PLANNING: 0,
+    ScheduleStatus.PRE_CONSTRAINT: 1,
+    ScheduleStatus.POST_CONSTRAINT: 2,
+    ScheduleStatus.COMPLETED: 3,
+}
+STATUS_BY_CODE = {code: status for status, code in STATUS_CODES.items()}
+
+
+@dataclass(frozen=True)
+class BoardSnapshot:
+    """Detached, array-based copy of the active schedules on one or more boards"""
+    organization_id: str
+    board_config_ids: List[str]
+    pre_buffer_sizes: np.ndarray   # per board
+    post_buffer_sizes: np.ndarray  # per board
+    schedule_ids: List[str]
+    board_index: np.ndarray        # per schedule, index into board_config_ids
+    positions: np.ndarray          # per schedule, time_unit_position
+    statuses: np.ndarray           # per schedule, STATUS_CODES value
+    ccr_hours: np.ndarray          # per schedule, total_ccr_hours
+
+    @property
+    def schedule_count(self) -> int:
+        return len(self.schedule_ids)
+
+    @property
+    def board_count(self) -> int:
+        return len(self.board_config_ids)
+
+
+class BoardSimulator:
+    """In-memory simulator for DBR board flow.
+
+    The database is read once, when the snapshot is taken. Every simulated
+    time unit afterwards is a handful of NumPy operations over the snapshot
+    arrays, so long horizons never touch the session or live ORM objects.
+
+    Schedules complete on the live ticks' rule (completion_position of their
+    board), but queued schedules stay out of the simulation: the live tick
+    releases them into the pre-constraint buffer as slot capacity allows, the
+    simulator only follows the schedules already on the board.
+    """
+
+    def __init__(self, session: Session):
+        self.session = session
+
+    def snapshot(self, organization_id: str, board_config_id: Optional[str] = None) -> BoardSnapshot:
+        """Load active boards and schedules into a detached BoardSnapshot"""
+
+        board_query = self.session.query(
+            BoardConfig.id,
+            BoardConfig.pre_constraint_buffer_size,
+            BoardConfig.post_constraint_buffer_size,
+        ).filter_by(organization_id=organization_id)
+        if board_config_id:
+            board_query = board_query.filter_by(id=board_config_id)
+        else:
+            board_query = board_query.filter_by(is_active=True)
+        boards = board_query.order_by(BoardConfig.id).all()
+
+        board_ids = [row.id for row in boards]
+        board_lookup = {board_id: index for index, board_id in enumerate(board_ids)}
+
+        schedule_rows = []
+        if board_ids:
+            schedule_rows = self.session.query(
+                Schedule.id,
+                Schedule.board_config_id,
+                Schedule.time_unit_position,
+                Schedule.status,
+                Schedule.total_ccr_hours,
+            ).filter(
+                Schedule.organization_id == organization_id,
+                Schedule.board_config_id.in_(board_ids),
+                Schedule.status != ScheduleStatus.COMPLETED,
+                Schedule.is_queued.is_(False),
+            ).order_by(Schedule.id).all()
+
+        return BoardSnapshot(
+            organization_id=organization_id,
+            board_config_ids=board_ids,
+            pre_buffer_sizes=np.array([row.pre_constraint_buffer_size for row in boards], dtype=np.int64),
+            post_buffer_sizes=np.array([row.post_constraint_buffer_size for row in boards], dtype=np.int64),
+            schedule_ids=[row.id for row in schedule_rows],
+            board_index=np.array([board_lookup[row.board_config_id] for row in schedule_rows], dtype=np.int64),
+            positions=np.array([row.time_unit_position for row in schedule_rows], dtype=np.int64),
+            statuses=np.array([STATUS_CODES[row.status] for row in schedule_rows], dtype=np.int8),
+            ccr_hours=np.array([row.total_ccr_hours or 0.0 for row in schedule_rows], dtype=np.float64),
+        )
+
+    @staticmethod
+    def zone_occupancy(snapshot: BoardSnapshot, positions: np.ndarray, active: np.ndarray) -> Dict[str, np.ndarray]:
+        """Count active schedules per board in each buffer zone"""
+        boards = snapshot.board_count
+        index = snapshot.board_index
+        return {
+            "pre_constraint": np.bincount(index[active & (positions < 0)], minlength=boards),
+            "constraint": np.bincount(index[active & (positions == 0)], minlength=boards),
+            "post_constraint": np.bincount(index[active & (positions > 0)], minlength=boards),
+        }
+
+    @staticmethod
+    def simulate(snapshot: BoardSnapshot, time_units: int) -> Dict[str, Any]:
+        """Step the snapshot forward ``time_units`` times entirely in memory.
+
+        Row ``t`` of every returned array describes the board after ``t``
+        advancements (row 0 is the snapshot itself). Zone arrays have shape
+        ``(time_units + 1, board_count)``.
+        """
+        if time_units < 0:
+            raise ValueError("time_units must be zero or positive")
+
+        boards = snapshot.board_count
+        steps = time_units + 1
+        positions = snapshot.positions.copy()
+        completion_positions = completion_position(snapshot.post_buffer_sizes[snapshot.board_index])
+        statuses = snapshot.statuses.copy()
+        active = np.ones(snapshot.schedule_count, dtype=bool)
+
+        pre_occupancy = np.zeros((steps, boards), dtype=np.int64)
+        constraint_occupancy = np.zeros((steps, boards), dtype=np.int64)
+        post_occupancy = np.zeros((steps, boards), dtype=np.int64)
+        completions = np.zeros((steps, boards), dtype=np.int64)
+        constraint_hours = np.zeros((steps, boards), dtype=np.float64)
+        completion_unit = np.full(snapshot.schedule_count, -1, dtype=np.int64)
+
+        planning = STATUS_CODES[ScheduleStatus.PLANNING]
+        pre_constraint = STATUS_CODES[ScheduleStatus.PRE_CONSTRAINT]
+        post_constraint = STATUS_CODES[ScheduleStatus.POST_CONSTRAINT]
+        completed = STATUS_CODES[ScheduleStatus.COMPLETED]
+
+        for unit in range(steps):
+            if unit > 0:
+                positions[active] += 1
+
+                # TimeProgressionEngine._update_schedule_status over whole arrays
+                statuses[active & (positions < 0) & (statuses == planning)] = pre_constraint
+                statuses[active & (positions > 0) & (statuses == pre_constraint)] = post_constraint
+
+                finished = active & (positions >= completion_positions)
+                statuses[finished] = completed
+                completion_unit[finished] = unit
+                completions[unit] = np.bincount(snapshot.board_index[finished], minlength=boards)
+                active &= ~finished
+
+            zones = BoardSimulator.zone_occupancy(snapshot, positions, active)
+            pre_occupancy[unit] = zones["pre_constraint"]
+            constraint_occupancy[unit] = zones["constraint"]
+            post_occupancy[unit] = zones["post_constraint"]
+            at_ccr = active & (positions == 0)
+            constraint_hours[unit] = np.bincount(
+                snapshot.board_index[at_ccr], weights=snapshot.ccr_hours[at_ccr], minlength=boards
+            )
+
+        return {
+            "pre_constraint": pre_occupancy,
+            "constraint": constraint_occupancy,
+            "post_constraint": post_occupancy,
+            "completions": completions,
+            "constraint_hours": constraint_hours,
+            "final_positions": positions,
+            "final_statuses": statuses,
+            "completion_unit": completion_unit,
+        }
+
+    def run(self, organization_id: str, time_units: int, board_config_id: Optional[str] = None) -> Dict[str, Any]:
+        """Snapshot the board(s) and return a JSON-friendly per-unit simulation report"""
+
+        snapshot = self.snapshot(organization_id, board_config_id)
+        result = self.simulate(snapshot, time_units)
+
+        simulation_results = []
+        for unit in range(time_units + 1):
+            zone_occupancy = {}
+            for index, board_id in enumerate(snapshot.board_config_ids):
+                zone_occupancy[board_id] = {
+                    "pre_constraint": int(result["pre_constraint"][unit, index]),
+                    "constraint": int(result["constraint"][unit, index]),
+                    "post_constraint": int(result["post_constraint"][unit, index]),
+                    "pre_constraint_capacity": int(snapshot.pre_buffer_sizes[index]),
+                    "post_constraint_capacity": int(snapshot.post_buffer_sizes[index]),
+                    "constraint_hours": float(result["constraint_hours"][unit, index]),
+                    "completed": int(result["completions"][unit, index]),
+                }
+            active_count = int(
+                result["pre_constraint"][unit].sum()
+                + result["constraint"][unit].sum()
+                + result["post_constraint"][unit].sum()
+            )
+            simulation_results.append({
+                "time_unit": unit,
+                "total_active_schedules": active_count,
+                "completed_schedules_count": int(result["completions"][unit].sum()),
+                "zone_occupancy": zone_occupancy,
+            })
+
+        completion_units = {
+            schedule_id: int(unit)
+            for schedule_id, unit in zip(snapshot.schedule_ids, result["completion_unit"])
+            if unit >= 0
+        }
+
+        return {
+            "organization_id": organization_id,
+            "board_config_id": board_config_id,
+            "simulated_time_units": time_units,
+            "simulation_results": simulation_results,
+            "schedule_completion_units": completion_units,
+            "total_completed_schedules": len(completion_units),
+        }
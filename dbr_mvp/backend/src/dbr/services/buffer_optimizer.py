@@ -0,0 +1,278 @@
+# src/dbr/services/buffer_optimizer.py
+from typing import Dict, Any, Optional, Sequence
+from dataclasses import dataclass
+import math
+import numpy as np
+from sqlalchemy import func
+from sqlalchemy.orm import Session
+from dbr.models.board_config import BoardConfig
+from dbr.models.ccr import CCR
+from dbr.models.schedule import Schedule
+from dbr.models.schedule_item import ScheduleItem
+from dbr.models.work_item import WorkItem
+from dbr.services.delivery_forecaster import TIME_UNIT_LENGTHS
+
+
+@dataclass(frozen=True)
+class FlowHistory:
+    """Recorded demand on one board, ordered by arrival"""
+    board_config_id: str
+    arrival_units: np.ndarray   # time unit each schedule was created in
+    ccr_units: np.ndarray       # time units each schedule holds the CCR
+    due_units: np.ndarray       # earliest work item due date (time units), NaN if none
+    horizon: int                # number of time units covered by the replay
+
+    @property
+    def schedule_count(self) -> int:
+        return len(self.arrival_units)
+
+
+class BufferOptimizer:
+    """Tune buffer sizes and zone thresholds by replaying recorded board flow.
+
+    Each historical schedule arrives in the time unit it was created in and
+    is released into the pre-constraint buffer only when a slot is free (the
+    rope). A released schedule needs ``transit_units`` before it is ready at
+    the CCR, which then works schedules first-in first-out. The replay is
+    vectorized across all candidate pre-constraint sizes at once; a small
+    buffer shows up as CCR starvation (the constraint idle although demand had
+    already arrived), a large one as work-in-progress.
+    """
+
+    def __init__(self, session: Session):
+        self.session = session
+
+    def load_history(self, board_config_id: str) -> FlowHistory:
+        """Load every schedule ever placed on the board as a FlowHistory"""
+
+        board = self.session.query(
+            BoardConfig.id, BoardConfig.time_unit, CCR.capacity_per_time_unit
+        ).join(CCR, CCR.id == BoardConfig.ccr_id).filter(BoardConfig.id == board_config_id).first()
+        if not board:
+            raise ValueError(f"Board configuration {board_config_id} not found")
+
+        rows = self.session.query(
+            Schedule.id, Schedule.created_date, Schedule.total_ccr_hours
+        ).filter(Schedule.board_config_id == board_config_id).order_by(
+            Schedule.created_date, Schedule.id
+        ).all()
+
+        unit_seconds = TIME_UNIT_LENGTHS.get(board.time_unit, TIME_UNIT_LENGTHS["week"]).total_seconds()
+        if not rows:
+            empty = np.zeros(0, dtype=np.int64)
+            return FlowHistory(board_config_id, empty, empty, np.zeros(0), 0)
+
+        origin = rows[0].created_date
+        capacity = board.capacity_per_time_unit or 0.0
+
+        # Earliest due date of the work items in each schedule
+        due_dates = dict(self.session.query(ScheduleItem.schedule_id, func.min(WorkItem.due_date)).join(
+            WorkItem, WorkItem.id == ScheduleItem.work_item_id
+        ).join(Schedule, Schedule.id == ScheduleItem.schedule_id).filter(
+            Schedule.board_config_id == board_config_id, WorkItem.due_date.isnot(None)
+        ).group_by(ScheduleItem.schedule_id).all())
+
+        arrival_units = []
+        ccr_units = []
+        due_units = []
+        for row in rows:
+            arrival_units.append(int((row.created_date - origin).total_seconds() // unit_seconds))
+            hours = row.total_ccr_hours or 0.0
+            ccr_units.append(max(1, math.ceil(hours / capacity)) if capacity > 0 else 1)
+            due = due_dates.get(row.id)
+            due_units.append(
+                (due.replace(tzinfo=None) - origin.replace(tzinfo=None)).total_seconds() / unit_seconds
+                if due else np.nan
+            )
+
+        arrival_units = np.array(arrival_units, dtype=np.int64)
+        ccr_units = np.array(ccr_units, dtype=np.int64)
+        return FlowHistory(
+            board_config_id=board_config_id,
+            arrival_units=arrival_units,
+            ccr_units=ccr_units,
+            due_units=np.array(due_units, dtype=np.float64),
+            horizon=int(arrival_units[-1] + ccr_units.sum() + 1),
+        )
+
+    @staticmethod
+    def replay(history: FlowHistory, pre_sizes: np.ndarray, transit_units: int = 1) -> Dict[str, np.ndarray]:
+        """Replay the history once for every candidate pre-constraint buffer size.
+
+        Returns per-schedule ``release``/``start``/``finish`` arrays of shape
+        ``(candidates, schedules)`` plus per-candidate starvation totals.
+        """
+        pre_sizes = np.asarray(pre_sizes, dtype=np.int64)
+        if np.any(pre_sizes < 1):
+            raise ValueError("Buffer sizes must be at least 1")
+
+        candidates = len(pre_sizes)
+        count = history.schedule_count
+        release = np.zeros((candidates, count), dtype=np.int64)
+        start = np.zeros((candidates, count), dtype=np.int64)
+        finish = np.zeros((candidates, count), dtype=np.int64)
+        starvation = np.zeros(candidates, dtype=np.int64)
+        ccr_free = np.zeros(candidates, dtype=np.int64)
+        rows = np.arange(candidates)
+
+        for i in range(count):
+            arrival = history.arrival_units[i]
+            # Rope: a slot frees up when the schedule P places ahead reaches the CCR
+            slot_index = i - pre_sizes
+            slot_free = np.where(slot_index >= 0, start[rows, np.maximum(slot_index, 0)], 0)
+            release[:, i] = np.maximum(arrival, slot_free)
+            ready = release[:, i] + transit_units
+            start[:, i] = np.maximum(ready, ccr_free)
+            # Idle CCR time that an unconstrained buffer would have filled
+            unconstrained_ready = np.maximum(arrival + transit_units, ccr_free)
+            starvation += start[:, i] - unconstrained_ready
+            finish[:, i] = start[:, i] + history.ccr_units[i]
+            ccr_free = finish[:, i]
+
+        return {
+            "release": release,
+            "start": start,
+            "finish": finish,
+            "starvation_units": starvation,
+        }
+
+    @staticmethod
+    def occupancy_series(release: np.ndarray, start: np.ndarray, horizon: int) -> np.ndarray:
+        """Pre-constraint buffer occupancy per candidate and time unit"""
+        candidates = release.shape[0]
+        deltas = np.zeros((candidates, horizon + 1), dtype=np.int64)
+        rows = np.repeat(np.arange(candidates), release.shape[1])
+        np.add.at(deltas, (rows, np.minimum(release.ravel(), horizon)), 1)
+        np.add.at(deltas, (rows, np.minimum(start.ravel(), horizon)), -1)
+        return np.cumsum(deltas, axis=1)[:, :horizon]
+
+    def optimize(
+        self,
+        board_config_id: str,
+        pre_sizes: Optional[Sequence[int]] = None,
+        post_sizes: Optional[Sequence[int]] = None,
+        yellow_ratios: Optional[Sequence[float]] = None,
+        transit_units: int = 1,
+        max_starvation_rate: float = 0.05,
+        target_on_time_rate: float = 0.9,
+        target_alert_rate: float = 0.2,
+    ) -> Dict[str, Any]:
+        """Sweep buffer sizes and yellow-zone ratios over the board's history"""
+
+        board_config = self.session.query(BoardConfig).filter_by(id=board_config_id).first()
+        if not board_config:
+            raise ValueError(f"Board configuration {board_config_id} not found")
+
+        history = self.load_history(board_config_id)
+        pre_sizes = np.array(range(1, 11) if pre_sizes is None else pre_sizes, dtype=np.int64)
+        post_sizes = np.array(range(1, 8) if post_sizes is None else post_sizes, dtype=np.int64)
+        yellow_ratios = np.array(
+            [0.4, 0.5, 0.6, 0.7, 0.8] if yellow_ratios is None else yellow_ratios, dtype=np.float64
+        )
+
+        current = {
+            "pre_constraint_buffer_size": board_config.pre_constraint_buffer_size,
+            "post_constraint_buffer_size": board_config.post_constraint_buffer_size,
+            "yellow_ratio": board_config.buffer_yellow_ratio,
+            "green_ratio": board_config.buffer_green_ratio,
+        }
+        if history.schedule_count == 0:
+            return {
+                "board_config_id": board_config_id,
+                "history_schedules": 0,
+                "current": current,
+                "pre_constraint_candidates": [],
+                "post_constraint_candidates": [],
+                "threshold_candidates": [],
+                "recommendation": None,
+            }
+
+        replay = self.replay(history, pre_sizes, transit_units)
+        horizon = max(history.horizon, int(replay["finish"].max()) + 1)
+
+        # Pre-constraint trade-off: starvation vs work-in-progress
+        occupancy = self.occupancy_series(replay["release"], replay["start"], horizon)
+        starvation_rate = replay["starvation_units"] / horizon
+        average_wip = occupancy.mean(axis=1)
+        peak_wip = occupancy.max(axis=1)
+        pre_candidates = [
+            {
+                "pre_constraint_buffer_size": int(size),
+                "starvation_units": int(replay["starvation_units"][index]),
+                "starvation_rate": round(float(starvation_rate[index]), 4),
+                "average_wip": round(float(average_wip[index]), 3),
+                "peak_wip": int(peak_wip[index]),
+            }
+            for index, size in enumerate(pre_sizes)
+        ]
+        acceptable = np.flatnonzero(starvation_rate <= max_starvation_rate)
+        best_pre = int(acceptable[0]) if acceptable.size else int(np.argmin(starvation_rate))
+
+        # Post-constraint trade-off: due-date protection vs work-in-progress
+        finish = replay["finish"][best_pre]
+        delivered = finish[None, :] + post_sizes[:, None]
+        has_due = ~np.isnan(history.due_units)
+        on_time_rate = (
+            (delivered[:, has_due] <= history.due_units[has_due]).mean(axis=1)
+            if has_due.any() else np.full(len(post_sizes), np.nan)
+        )
+        post_wip = len(finish) * post_sizes / horizon
+        post_candidates = [
+            {
+                "post_constraint_buffer_size": int(size),
+                "on_time_rate": None if np.isnan(on_time_rate[index]) else round(float(on_time_rate[index]), 4),
+                "average_wip": round(float(post_wip[index]), 3),
+            }
+            for index, size in enumerate(post_sizes)
+        ]
+        if has_due.any():
+            meets_target = np.flatnonzero(on_time_rate >= target_on_time_rate)
+            best_post = int(post_sizes[meets_target[0]] if meets_target.size else post_sizes[np.argmax(on_time_rate)])
+        else:
+            best_post = board_config.post_constraint_buffer_size
+
+        # Threshold sweep at the recommended size: how often each ratio raises an alert
+        best_occupancy = occupancy[best_pre]
+        best_size = int(pre_sizes[best_pre])
+        yellow_thresholds = np.maximum(1, (best_size * yellow_ratios).astype(np.int64))
+        alert_rate = (best_occupancy[None, :] >= yellow_thresholds[:, None]).mean(axis=1)
+        red_rate = float((best_occupancy >= best_size).mean())
+        threshold_candidates = [
+            {
+                "yellow_ratio": round(float(ratio), 3),
+                "yellow_threshold": int(yellow_thresholds[index]),
+                "alert_rate": round(float(alert_rate[index]), 4),
+                "red_rate": round(red_rate, 4),
+            }
+            for index, ratio in enumerate(yellow_ratios)
+        ]
+        best_ratio = float(yellow_ratios[np.argmin(np.abs(alert_rate - target_alert_rate))])
+
+        return {
+            "board_config_id": board_config_id,
+            "history_schedules": history.schedule_count,
+            "history_time_units": horizon,
+            "current": current,
+            "pre_constraint_candidates": pre_candidates,
+            "post_constraint_candidates": post_candidates,
+            "threshold_candidates": threshold_candidates,
+            "recommendation": {
+                "pre_constraint_buffer_size": best_size,
+                "post_constraint_buffer_size": int(best_post),
+                "yellow_ratio": best_ratio,
+            },
+        }
+
+    def apply_recommendation(self, board_config_id: str, recommendation: Dict[str, Any]) -> BoardConfig:
+        """Persist a recommendation returned by optimize() on the board configuration"""
+        board_config = self.session.query(BoardConfig).filter_by(id=board_config_id).first()
+        if not board_config:
+            raise ValueError(f"Board configuration {board_config_id} not found")
+
+        board_config.pre_constraint_buffer_size = recommendation["pre_constraint_buffer_size"]
+        board_config.post_constraint_buffer_size = recommendation["post_constraint_buffer_size"]
+        board_config.buffer_yellow_ratio = recommendation["yellow_ratio"]
+        # Keep the green band below the yellow band
+        board_config.buffer_green_ratio = min(board_config.buffer_green_ratio, recommendation["yellow_ratio"])
+        self.session.commit()
+        return board_config
@@ -1,10 +1,20 @@
 # src/dbr/services/buffer_zone_manager.py
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Tuple
 from enum import Enum
 from dataclasses import dataclass
+from datetime import datetime, timezone
 from sqlalchemy.orm import Session
 from dbr.models.schedule import Schedule, ScheduleStatus
 from dbr.models.board_config import BoardConfig
+from dbr.models.buffer_history import BufferHistory
+from dbr.core.data_version import TIME_UNITS
+from dbr.core.response_cache import analytics_cache
+from dbr.core.events import publish_on_commit
+from dbr.core.metrics import BUFFER_ZONE_OCCUPANCY, BUFFER_ZONE_CAPACITY
+
+
+# Tables buffer state is derived from
+BUFFER_TABLES = ("schedules", "board_configs", TIME_UNITS)
 
 
 class BufferZoneStatus(Enum):
@@ -26,24 +36,69 @@ class BufferAlert:
     timestamp: str
 
 
-class BufferZoneManager:
-    """Manager for DBR buffer zone monitoring and health metrics"""
-    
-    def __init__(self, session: Session):
-        self.session = session
-    
-    def get_buffer_configuration(self, board_config_id: str) -> Dict[str, Any]:
-        """Get buffer zone configuration for a board"""
-        
-        board_config = self.session.query(BoardConfig).filter_by(id=board_config_id).first()
-        if not board_config:
-            raise ValueError(f"Board configuration {board_config_id} not found")
-        
-        pre_size = board_config.pre_constraint_buffer_size
-        post_size = board_config.post_constraint_buffer_size
-        
+@dataclass(frozen=True)
+class BufferSnapshot:
+    """Immutable view of one board's buffers at a point in time.
+
+    Built from one board configuration row and the positions of the board's
+    active schedules; every buffer metric is answered from these values
+    without further queries. ``schedule_ids`` is parallel to ``positions``.
+    """
+    board_config_id: str
+    pre_constraint_buffer_size: int
+    post_constraint_buffer_size: int
+    time_unit: str
+    yellow_ratio: float
+    green_ratio: float
+    positions: Tuple[int, ...]
+    schedule_ids: Tuple[str, ...] = ()
+
+    @classmethod
+    def from_board_config(
+        cls, board_config: BoardConfig, positions: List[int], schedule_ids: Optional[List[str]] = None
+    ) -> "BufferSnapshot":
+        """Build a snapshot from a board configuration and active schedule positions"""
+        return cls(
+            board_config_id=board_config.id,
+            pre_constraint_buffer_size=board_config.pre_constraint_buffer_size,
+            post_constraint_buffer_size=board_config.post_constraint_buffer_size,
+            time_unit=board_config.time_unit,
+            yellow_ratio=board_config.buffer_yellow_ratio if board_config.buffer_yellow_ratio is not None else 0.6,
+            green_ratio=board_config.buffer_green_ratio if board_config.buffer_green_ratio is not None else 0.4,
+            positions=tuple(positions),
+            schedule_ids=tuple(schedule_ids or ()),
+        )
+
+    @property
+    def pre_constraint_count(self) -> int:
+        return sum(1 for pos in self.positions if pos < 0)
+
+    @property
+    def post_constraint_count(self) -> int:
+        return sum(1 for pos in self.positions if pos > 0)
+
+    @property
+    def ccr_occupied(self) -> bool:
+        return any(pos == 0 for pos in self.positions)
+
+    def zone_schedule_ids(self, zone: str) -> List[str]:
+        """IDs of the active schedules in a zone (pre_constraint, constraint, post_constraint)"""
+        in_zone = {
+            "pre_constraint": lambda pos: pos < 0,
+            "constraint": lambda pos: pos == 0,
+            "post_constraint": lambda pos: pos > 0,
+        }[zone]
+        return [
+            schedule_id for schedule_id, pos in zip(self.schedule_ids, self.positions) if in_zone(pos)
+        ]
+
+    def configuration(self) -> Dict[str, Any]:
+        """Buffer zone configuration for the board"""
+        pre_size = self.pre_constraint_buffer_size
+        post_size = self.post_constraint_buffer_size
+
         return {
-            "board_config_id": board_config_id,
+            "board_config_id": self.board_config_id,
             "pre_constraint_buffer_size": pre_size,
             "post_constraint_buffer_size": post_size,
             "total_board_size": pre_size + 1 + post_size,  # pre + CCR + post
@@ -52,106 +107,102 @@ class BufferZoneManager:
             "ccr_position": 0,
             "post_constraint_start": 1,
             "post_constraint_end": post_size,
-            "time_unit": board_config.time_unit
+            "time_unit": self.time_unit,
+            "yellow_ratio": self.yellow_ratio,
+            "green_ratio": self.green_ratio
         }
-    
-    def get_zone_color_thresholds(self, board_config_id: str) -> Dict[str, Dict[str, int]]:
-        """Get color thresholds for buffer zones"""
-        
-        config = self.get_buffer_configuration(board_config_id)
-        pre_size = config["pre_constraint_buffer_size"]
-        post_size = config["post_constraint_buffer_size"]
-        
+
+    def thresholds(self) -> Dict[str, Dict[str, int]]:
+        """Color thresholds for buffer zones"""
+        pre_size = self.pre_constraint_buffer_size
+        post_size = self.post_constraint_buffer_size
+
         return {
             "pre_constraint": {
                 "red_threshold": pre_size,           # 100% full
-                "yellow_threshold": max(1, int(pre_size * 0.6)),  # 60% full or more
-                "green_threshold": max(0, int(pre_size * 0.4))    # Less than 40%
+                "yellow_threshold": max(1, int(pre_size * self.yellow_ratio)),  # 60% full or more by default
+                "green_threshold": max(0, int(pre_size * self.green_ratio))     # Less than 40% by default
             },
             "post_constraint": {
                 "red_threshold": post_size,          # 100% full
-                "yellow_threshold": max(1, int(post_size * 0.6)), # 60% full or more
-                "green_threshold": max(0, int(post_size * 0.4))   # Less than 40%
+                "yellow_threshold": max(1, int(post_size * self.yellow_ratio)), # 60% full or more by default
+                "green_threshold": max(0, int(post_size * self.green_ratio))    # Less than 40% by default
             }
         }
-    
-    def calculate_zone_status(self, board_config_id: str) -> Dict[str, Dict[str, Any]]:
-        """Calculate current status of all buffer zones"""
-        
-        config = self.get_buffer_configuration(board_config_id)
-        thresholds = self.get_zone_color_thresholds(board_config_id)
-        
-        # Get all active schedules for this board
-        schedules = self.session.query(Schedule).filter_by(
-            board_config_id=board_config_id
-        ).filter(Schedule.status != ScheduleStatus.COMPLETED).all()
-        
-        # Count schedules in each zone
-        pre_constraint_count = 0
-        post_constraint_count = 0
-        ccr_occupied = False
-        
-        for schedule in schedules:
-            pos = schedule.time_unit_position
-            if pos < 0:
-                pre_constraint_count += 1
-            elif pos == 0:
-                ccr_occupied = True
-            elif pos > 0:
-                post_constraint_count += 1
-        
+
+    def zone_status(self) -> Dict[str, Dict[str, Any]]:
+        """Current status of all buffer zones"""
+        thresholds = self.thresholds()
+        pre_count = self.pre_constraint_count
+        post_count = self.post_constraint_count
+        ccr_occupied = self.ccr_occupied
+
         # Calculate pre-constraint zone status
-        pre_size = config["pre_constraint_buffer_size"]
-        pre_percentage = (pre_constraint_count / pre_size) * 100 if pre_size > 0 else 0
-        pre_status = self._determine_zone_status(pre_constraint_count, thresholds["pre_constraint"])
-        
+        pre_size = self.pre_constraint_buffer_size
+        pre_percentage = (pre_count / pre_size) * 100 if pre_size > 0 else 0
+        pre_status = determine_zone_status(pre_count, thresholds["pre_constraint"])
+
         # Calculate post-constraint zone status
-        post_size = config["post_constraint_buffer_size"]
-        post_percentage = (post_constraint_count / post_size) * 100 if post_size > 0 else 0
-        post_status = self._determine_zone_status(post_constraint_count, thresholds["post_constraint"])
-        
+        post_size = self.post_constraint_buffer_size
+        post_percentage = (post_count / post_size) * 100 if post_size > 0 else 0
+        post_status = determine_zone_status(post_count, thresholds["post_constraint"])
+
         return {
             "pre_constraint": {
                 "status": pre_status,
-                "occupancy_count": pre_constraint_count,
+                "occupancy_count": pre_count,
                 "occupancy_percentage": round(pre_percentage, 2),
                 "capacity": pre_size,
-                "available_slots": max(0, pre_size - pre_constraint_count)
+                "available_slots": max(0, pre_size - pre_count)
             },
             "post_constraint": {
                 "status": post_status,
-                "occupancy_count": post_constraint_count,
+                "occupancy_count": post_count,
                 "occupancy_percentage": round(post_percentage, 2),
                 "capacity": post_size,
-                "available_slots": max(0, post_size - post_constraint_count)
+                "available_slots": max(0, post_size - post_count)
             },
             "ccr": {
                 "occupied": ccr_occupied,
                 "status": BufferZoneStatus.RED if ccr_occupied else BufferZoneStatus.GREEN
             }
         }
-    
-    def _determine_zone_status(self, count: int, thresholds: Dict[str, int]) -> BufferZoneStatus:
-        """Determine zone status based on occupancy count and thresholds"""
-        
-        if count >= thresholds["red_threshold"]:
-            return BufferZoneStatus.RED
-        elif count >= thresholds["yellow_threshold"]:
-            return BufferZoneStatus.YELLOW
-        else:
-            return BufferZoneStatus.GREEN
-    
-    def generate_buffer_alerts(self, board_config_id: str) -> List[BufferAlert]:
-        """Generate alerts for buffer zone violations"""
-        
-        from datetime import datetime, timezone
-        
-        zone_status = self.calculate_zone_status(board_config_id)
-        penetration = self.detect_buffer_penetration(board_config_id)
+
+    def penetration(self) -> Dict[str, Any]:
+        """Buffer zone penetration (overflow beyond capacity)"""
+        pre_start = -self.pre_constraint_buffer_size
+        post_end = self.post_constraint_buffer_size
+
+        penetrated_zones = []
+        overflow_positions = []
+
+        for pos in self.positions:
+            # Check pre-constraint penetration (position < -buffer_size)
+            if pos < pre_start:
+                if "pre_constraint" not in penetrated_zones:
+                    penetrated_zones.append("pre_constraint")
+                overflow_positions.append(pos)
+
+            # Check post-constraint penetration (position > buffer_size)
+            elif pos > post_end:
+                if "post_constraint" not in penetrated_zones:
+                    penetrated_zones.append("post_constraint")
+                overflow_positions.append(pos)
+
+        return {
+            "has_penetration": len(penetrated_zones) > 0,
+            "penetrated_zones": penetrated_zones,
+            "overflow_count": len(overflow_positions),
+            "overflow_positions": overflow_positions
+        }
+
+    def alerts(self, timestamp: Optional[str] = None) -> List[BufferAlert]:
+        """Alerts for buffer zone violations"""
+        zone_status = self.zone_status()
+        penetration = self.penetration()
+        current_time = timestamp or datetime.now(timezone.utc).isoformat()
         alerts = []
-        
-        current_time = datetime.now(timezone.utc).isoformat()
-        
+
         # Check for buffer penetration (critical)
         if penetration["has_penetration"]:
             for zone in penetration["penetrated_zones"]:
@@ -163,148 +214,332 @@ class BufferZoneManager:
                     capacity=0,  # Beyond capacity
                     timestamp=current_time
                 ))
-        
-        # Check pre-constraint buffer
-        pre_zone = zone_status["pre_constraint"]
-        if pre_zone["status"] == BufferZoneStatus.RED:
-            alerts.append(BufferAlert(
-                zone="pre_constraint",
-                severity="RED",
-                message=f"Pre-constraint buffer is full ({pre_zone['occupancy_count']}/{pre_zone['capacity']} slots occupied)",
-                occupancy_count=pre_zone["occupancy_count"],
-                capacity=pre_zone["capacity"],
-                timestamp=current_time
-            ))
-        elif pre_zone["status"] == BufferZoneStatus.YELLOW:
-            alerts.append(BufferAlert(
-                zone="pre_constraint",
-                severity="YELLOW",
-                message=f"Pre-constraint buffer is {pre_zone['occupancy_percentage']}% full",
-                occupancy_count=pre_zone["occupancy_count"],
-                capacity=pre_zone["capacity"],
-                timestamp=current_time
-            ))
-        
-        # Check post-constraint buffer
-        post_zone = zone_status["post_constraint"]
-        if post_zone["status"] == BufferZoneStatus.RED:
-            alerts.append(BufferAlert(
-                zone="post_constraint",
-                severity="RED",
-                message=f"Post-constraint buffer is full ({post_zone['occupancy_count']}/{post_zone['capacity']} slots occupied)",
-                occupancy_count=post_zone["occupancy_count"],
-                capacity=post_zone["capacity"],
-                timestamp=current_time
-            ))
-        elif post_zone["status"] == BufferZoneStatus.YELLOW:
-            alerts.append(BufferAlert(
-                zone="post_constraint",
-                severity="YELLOW",
-                message=f"Post-constraint buffer is {post_zone['occupancy_percentage']}% full",
-                occupancy_count=post_zone["occupancy_count"],
-                capacity=post_zone["capacity"],
-                timestamp=current_time
-            ))
-        
+
+        for zone, label in (("pre_constraint", "Pre-constraint"), ("post_constraint", "Post-constraint")):
+            zone_info = zone_status[zone]
+            if zone_info["status"] == BufferZoneStatus.RED:
+                alerts.append(BufferAlert(
+                    zone=zone,
+                    severity="RED",
+                    message=f"{label} buffer is full ({zone_info['occupancy_count']}/{zone_info['capacity']} slots occupied)",
+                    occupancy_count=zone_info["occupancy_count"],
+                    capacity=zone_info["capacity"],
+                    timestamp=current_time
+                ))
+            elif zone_info["status"] == BufferZoneStatus.YELLOW:
+                alerts.append(BufferAlert(
+                    zone=zone,
+                    severity="YELLOW",
+                    message=f"{label} buffer is {zone_info['occupancy_percentage']}% full",
+                    occupancy_count=zone_info["occupancy_count"],
+                    capacity=zone_info["capacity"],
+                    timestamp=current_time
+                ))
+
         return alerts
-    
-    def get_buffer_health_metrics(self, board_config_id: str) -> Dict[str, Any]:
-        """Get comprehensive buffer health metrics"""
-        
-        zone_status = self.calculate_zone_status(board_config_id)
-        config = self.get_buffer_configuration(board_config_id)
-        
+
+    def flow_metrics(self, zone_status: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """Flow-related metrics for buffer health"""
+        zone_status = zone_status or self.zone_status()
+
+        # Basic flow metrics calculation
+        pre_occupancy = zone_status["pre_constraint"]["occupancy_percentage"]
+        post_occupancy = zone_status["post_constraint"]["occupancy_percentage"]
+
+        # Simple throughput rate estimation (inverse of buffer fullness)
+        throughput_rate = max(0, 100 - max(pre_occupancy, post_occupancy)) / 100
+
+        # Bottleneck risk (high when pre-constraint is full and post-constraint is empty)
+        bottleneck_risk = "HIGH" if pre_occupancy >= 80 and post_occupancy <= 20 else "MEDIUM" if pre_occupancy >= 60 else "LOW"
+
+        # Buffer penetration risk
+        buffer_penetration = "HIGH" if max(pre_occupancy, post_occupancy) >= 90 else "MEDIUM" if max(pre_occupancy, post_occupancy) >= 70 else "LOW"
+
+        return {
+            "throughput_rate": round(throughput_rate, 2),
+            "bottleneck_risk": bottleneck_risk,
+            "buffer_penetration": buffer_penetration,
+            "flow_balance": abs(pre_occupancy - post_occupancy)  # Difference between buffer occupancies
+        }
+
+    def health_metrics(self) -> Dict[str, Any]:
+        """Comprehensive buffer health metrics"""
+        zone_status = self.zone_status()
+
         # Calculate overall status (worst of all zones)
         statuses = [
             zone_status["pre_constraint"]["status"],
             zone_status["post_constraint"]["status"]
         ]
-        
+
         overall_status = BufferZoneStatus.GREEN
         if BufferZoneStatus.RED in statuses:
             overall_status = BufferZoneStatus.RED
         elif BufferZoneStatus.YELLOW in statuses:
             overall_status = BufferZoneStatus.YELLOW
-        
+
         # Count total schedules
         total_schedules = (
             zone_status["pre_constraint"]["occupancy_count"] +
             zone_status["post_constraint"]["occupancy_count"] +
             (1 if zone_status["ccr"]["occupied"] else 0)
         )
-        
-        # Calculate flow metrics
-        flow_metrics = self._calculate_flow_metrics(board_config_id, zone_status)
-        
+
         return {
-            "board_config_id": board_config_id,
+            "board_config_id": self.board_config_id,
             "overall_status": overall_status,
             "total_schedules": total_schedules,
             "ccr_occupied": zone_status["ccr"]["occupied"],
             "pre_constraint": zone_status["pre_constraint"],
             "post_constraint": zone_status["post_constraint"],
-            "flow_metrics": flow_metrics,
-            "buffer_configuration": config
+            "flow_metrics": self.flow_metrics(zone_status),
+            "buffer_configuration": self.configuration()
         }
-    
-    def detect_buffer_penetration(self, board_config_id: str) -> Dict[str, Any]:
-        """Detect buffer zone penetration (overflow beyond capacity)"""
-        
-        config = self.get_buffer_configuration(board_config_id)
-        
-        # Get all active schedules
-        schedules = self.session.query(Schedule).filter_by(
-            board_config_id=board_config_id
-        ).filter(Schedule.status != ScheduleStatus.COMPLETED).all()
-        
-        penetrated_zones = []
-        overflow_positions = []
-        overflow_count = 0
-        
-        # Check for positions beyond buffer boundaries
+
+
+def determine_zone_status(count: int, thresholds: Dict[str, int]) -> BufferZoneStatus:
+    """Determine zone status based on occupancy count and thresholds"""
+
+    if count >= thresholds["red_threshold"]:
+        return BufferZoneStatus.RED
+    elif count >= thresholds["yellow_threshold"]:
+        return BufferZoneStatus.YELLOW
+    else:
+        return BufferZoneStatus.GREEN
+
+
+class BufferZoneManager:
+    """Manager for DBR buffer zone monitoring and health metrics
+
+    Every public method delegates to a BufferSnapshot. Pass ``snapshot`` to
+    answer several questions about the same board without re-querying.
+    """
+
+    def __init__(self, session: Session):
+        self.session = session
+
+    def _get_board_config(self, board_config_id: str) -> BoardConfig:
+        board_config = self.session.query(BoardConfig).filter_by(id=board_config_id).first()
+        if not board_config:
+            raise ValueError(f"Board configuration {board_config_id} not found")
+        return board_config
+
+    def get_snapshot(self, board_config_id: str) -> BufferSnapshot:
+        """Build a BufferSnapshot with one config query and one schedule query"""
+
+        board_config = self._get_board_config(board_config_id)
+        rows = self.session.query(Schedule.id, Schedule.time_unit_position).filter(
+            Schedule.board_config_id == board_config_id,
+            Schedule.status != ScheduleStatus.COMPLETED,
+            Schedule.is_queued.is_(False)
+        ).all()
+        return BufferSnapshot.from_board_config(
+            board_config, [row.time_unit_position for row in rows], [row.id for row in rows]
+        )
+
+    def get_organization_snapshots(self, organization_id: str, schedules: Optional[List[Any]] = None) -> Dict[str, BufferSnapshot]:
+        """Build a BufferSnapshot for every active board of an organization.
+
+        Loads the organization's active schedules once and groups them by board
+        in memory. Callers that already hold the active schedules (e.g. the
+        time progression tick) can pass them in to skip the schedule query.
+        """
+
+        board_configs = self.session.query(BoardConfig).filter_by(
+            organization_id=organization_id,
+            is_active=True
+        ).all()
+
+        if schedules is None:
+            schedules = self.session.query(
+                Schedule.id, Schedule.board_config_id, Schedule.time_unit_position
+            ).filter(
+                Schedule.organization_id == organization_id,
+                Schedule.status != ScheduleStatus.COMPLETED,
+                Schedule.is_queued.is_(False)
+            ).all()
+
+        grouped: Dict[str, Tuple[List[int], List[str]]] = {board_config.id: ([], []) for board_config in board_configs}
         for schedule in schedules:
-            pos = schedule.time_unit_position
-            
-            # Check pre-constraint penetration (position < -buffer_size)
-            if pos < config["pre_constraint_start"]:
-                if "pre_constraint" not in penetrated_zones:
-                    penetrated_zones.append("pre_constraint")
-                overflow_positions.append(pos)
-                overflow_count += 1
-            
-            # Check post-constraint penetration (position > buffer_size)
-            elif pos > config["post_constraint_end"]:
-                if "post_constraint" not in penetrated_zones:
-                    penetrated_zones.append("post_constraint")
-                overflow_positions.append(pos)
-                overflow_count += 1
-        
+            if schedule.board_config_id in grouped:
+                positions, schedule_ids = grouped[schedule.board_config_id]
+                positions.append(schedule.time_unit_position)
+                schedule_ids.append(schedule.id)
+
         return {
-            "has_penetration": len(penetrated_zones) > 0,
-            "penetrated_zones": penetrated_zones,
-            "overflow_count": overflow_count,
-            "overflow_positions": overflow_positions
+            board_config.id: BufferSnapshot.from_board_config(board_config, *grouped[board_config.id])
+            for board_config in board_configs
         }
-    
-    def _calculate_flow_metrics(self, board_config_id: str, zone_status: Dict[str, Any]) -> Dict[str, Any]:
-        """Calculate flow-related metrics for buffer health"""
-        
-        # Basic flow metrics calculation
-        pre_occupancy = zone_status["pre_constraint"]["occupancy_percentage"]
-        post_occupancy = zone_status["post_constraint"]["occupancy_percentage"]
-        
-        # Simple throughput rate estimation (inverse of buffer fullness)
-        throughput_rate = max(0, 100 - max(pre_occupancy, post_occupancy)) / 100
-        
-        # Bottleneck risk (high when pre-constraint is full and post-constraint is empty)
-        bottleneck_risk = "HIGH" if pre_occupancy >= 80 and post_occupancy <= 20 else "MEDIUM" if pre_occupancy >= 60 else "LOW"
-        
-        # Buffer penetration risk
-        buffer_penetration = "HIGH" if max(pre_occupancy, post_occupancy) >= 90 else "MEDIUM" if max(pre_occupancy, post_occupancy) >= 70 else "LOW"
-        
+
+    def get_buffer_configuration(self, board_config_id: str, snapshot: Optional[BufferSnapshot] = None) -> Dict[str, Any]:
+        """Get buffer zone configuration for a board"""
+        if snapshot is None:
+            # Configuration does not depend on schedules, so skip the schedule query
+            snapshot = BufferSnapshot.from_board_config(self._get_board_config(board_config_id), [])
+        return snapshot.configuration()
+
+    def get_zone_color_thresholds(self, board_config_id: str, snapshot: Optional[BufferSnapshot] = None) -> Dict[str, Dict[str, int]]:
+        """Get color thresholds for buffer zones"""
+        if snapshot is None:
+            snapshot = BufferSnapshot.from_board_config(self._get_board_config(board_config_id), [])
+        return snapshot.thresholds()
+
+    def calculate_zone_status(self, board_config_id: str, snapshot: Optional[BufferSnapshot] = None) -> Dict[str, Dict[str, Any]]:
+        """Calculate current status of all buffer zones"""
+        return (snapshot or self.get_snapshot(board_config_id)).zone_status()
+
+    def generate_buffer_alerts(self, board_config_id: str, snapshot: Optional[BufferSnapshot] = None) -> List[BufferAlert]:
+        """Generate alerts for buffer zone violations"""
+        return (snapshot or self.get_snapshot(board_config_id)).alerts()
+
+    def get_buffer_health_metrics(self, board_config_id: str, snapshot: Optional[BufferSnapshot] = None) -> Dict[str, Any]:
+        """Get comprehensive buffer health metrics (cached per board until its schedules or config change)"""
+        if snapshot is not None:
+            return snapshot.health_metrics()
+        board_config = self._get_board_config(board_config_id)
+        return analytics_cache.get_or_compute(
+            self.session, board_config.organization_id, BUFFER_TABLES, ("buffer_health", board_config_id),
+            lambda: self.get_snapshot(board_config_id).health_metrics()
+        )
+
+    def detect_buffer_penetration(self, board_config_id: str, snapshot: Optional[BufferSnapshot] = None) -> Dict[str, Any]:
+        """Detect buffer zone penetration (overflow beyond capacity)"""
+        return (snapshot or self.get_snapshot(board_config_id)).penetration()
+
+    def get_buffer_dashboard(self, board_config_id: str) -> Dict[str, Any]:
+        """Get alerts, penetration and health for a board from a single snapshot"""
+        snapshot = self.get_snapshot(board_config_id)
         return {
-            "throughput_rate": round(throughput_rate, 2),
-            "bottleneck_risk": bottleneck_risk,
-            "buffer_penetration": buffer_penetration,
-            "flow_balance": abs(pre_occupancy - post_occupancy)  # Difference between buffer occupancies
-        }
\ No newline at end of file
+            "board_config_id": board_config_id,
+            "health": snapshot.health_metrics(),
+            "penetration": snapshot.penetration(),
+            "alerts": snapshot.alerts()
+        }
+
+    def get_organization_buffer_health(self, organization_id: str) -> Dict[str, Any]:
+        """Get health, penetration and alerts for every active board of an organization"""
+        snapshots = self.get_organization_snapshots(organization_id)
+
+        boards = []
+        overall_status = BufferZoneStatus.GREEN
+        alert_count = 0
+        for board_config_id, snapshot in snapshots.items():
+            health = snapshot.health_metrics()
+            penetration = snapshot.penetration()
+            alerts = snapshot.alerts()
+            alert_count += len(alerts)
+
+            if penetration["has_penetration"]:
+                overall_status = BufferZoneStatus.CRITICAL
+            elif health["overall_status"] == BufferZoneStatus.RED and overall_status != BufferZoneStatus.CRITICAL:
+                overall_status = BufferZoneStatus.RED
+            elif health["overall_status"] == BufferZoneStatus.YELLOW and overall_status == BufferZoneStatus.GREEN:
+                overall_status = BufferZoneStatus.YELLOW
+
+            boards.append({
+                "board_config_id": board_config_id,
+                "health": health,
+                "penetration": penetration,
+                "alerts": alerts
+            })
+
+        return {
+            "organization_id": organization_id,
+            "board_count": len(boards),
+            "overall_status": overall_status,
+            "alert_count": alert_count,
+            "boards": boards
+        }
+
+    def record_buffer_history(
+        self,
+        organization_id: str,
+        recorded_at: datetime,
+        schedules: Optional[List[Any]] = None,
+        completed_by_board: Optional[Dict[str, int]] = None
+    ) -> List[BufferHistory]:
+        """Append a BufferHistory row per active board (added to the session, not committed)
+
+        Newly raised buffer alerts are published to event streams when the
+        session commits.
+        """
+        completed_by_board = completed_by_board or {}
+        snapshots = self.get_organization_snapshots(organization_id, schedules)
+
+        entries = []
+        for board_config_id, snapshot in snapshots.items():
+            entries.append(BufferHistory(
+                organization_id=organization_id,
+                board_config_id=board_config_id,
+                recorded_at=recorded_at,
+                pre_constraint_count=snapshot.pre_constraint_count,
+                pre_constraint_capacity=snapshot.pre_constraint_buffer_size,
+                ccr_occupied=snapshot.ccr_occupied,
+                post_constraint_count=snapshot.post_constraint_count,
+                post_constraint_capacity=snapshot.post_constraint_buffer_size,
+                overflow_count=snapshot.penetration()["overflow_count"],
+                completed_count=completed_by_board.get(board_config_id, 0)
+            ))
+            BUFFER_ZONE_OCCUPANCY.labels(board_config_id, "pre_constraint").set(snapshot.pre_constraint_count)
+            BUFFER_ZONE_OCCUPANCY.labels(board_config_id, "constraint").set(1 if snapshot.ccr_occupied else 0)
+            BUFFER_ZONE_OCCUPANCY.labels(board_config_id, "post_constraint").set(snapshot.post_constraint_count)
+            BUFFER_ZONE_CAPACITY.labels(board_config_id, "pre_constraint").set(snapshot.pre_constraint_buffer_size)
+            BUFFER_ZONE_CAPACITY.labels(board_config_id, "constraint").set(1)
+            BUFFER_ZONE_CAPACITY.labels(board_config_id, "post_constraint").set(snapshot.post_constraint_buffer_size)
+            # Subscribers hear about alerts raised by this tick once it commits
+            publish_on_commit(self.session, {
+                "type": "buffer_alerts",
+                "organization_id": organization_id,
+                "board_config_id": board_config_id,
+                "alerts": [
+                    {"zone": alert.zone, "severity": alert.severity, "message": alert.message}
+                    for alert in snapshot.alerts()
+                ],
+            })
+        self.session.add_all(entries)
+        return entries
+
+    def get_buffer_history(
+        self,
+        board_config_id: str,
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None,
+        limit: Optional[int] = None
+    ) -> List[Dict[str, Any]]:
+        """Get recorded buffer states for a board, oldest first, as fever chart points"""
+        query = self.session.query(
+            BufferHistory.recorded_at,
+            BufferHistory.pre_constraint_count,
+            BufferHistory.pre_constraint_capacity,
+            BufferHistory.ccr_occupied,
+            BufferHistory.post_constraint_count,
+            BufferHistory.post_constraint_capacity,
+            BufferHistory.overflow_count,
+            BufferHistory.completed_count
+        ).filter(BufferHistory.board_config_id == board_config_id)
+        if start is not None:
+            query = query.filter(BufferHistory.recorded_at >= start)
+        if end is not None:
+            query = query.filter(BufferHistory.recorded_at <= end)
+        query = query.order_by(BufferHistory.recorded_at)
+        if limit is not None:
+            query = query.limit(limit)
+
+        points = []
+        cumulative_completed = 0
+        for row in query.all():
+            cumulative_completed += row.completed_count
+            pre_percentage = (row.pre_constraint_count / row.pre_constraint_capacity) * 100 if row.pre_constraint_capacity > 0 else 0
+            post_percentage = (row.post_constraint_count / row.post_constraint_capacity) * 100 if row.post_constraint_capacity > 0 else 0
+            points.append({
+                "recorded_at": row.recorded_at.isoformat(),
+                "pre_constraint_count": row.pre_constraint_count,
+                "pre_constraint_percentage": round(pre_percentage, 2),
+                "ccr_occupied": row.ccr_occupied,
+                "post_constraint_count": row.post_constraint_count,
+                "post_constraint_percentage": round(post_percentage, 2),
+                "overflow_count": row.overflow_count,
+                "completed_count": row.completed_count,
+                "cumulative_completed_count": cumulative_completed
+            })
+        return points
@@ -0,0 +1,300 @@
+# src/dbr/services/capacity_calendar.py
+from typing import Dict, Any, List, Optional, Sequence, Tuple
+from dataclasses import dataclass
+import numpy as np
+from sqlalchemy import func
+from sqlalchemy.orm import Session
+from dbr.models.board_config import BoardConfig
+from dbr.models.ccr import CCR
+from dbr.models.ccr_capacity_exception import CCRCapacityException
+from dbr.models.ccr_capacity_ledger import CCRCapacityLedger
+from dbr.models.ccr_user_association import CCRUserAssociation
+from dbr.models.organization import Organization
+from dbr.models.schedule import Schedule
+
+
+@dataclass(frozen=True)
+class CapacityHorizon:
+    """Capacity and booked hours of an organization's CCRs over consecutive slots.
+
+    ``capacity`` and ``booked`` are ``(ccrs, slots)`` arrays; row ``i``
+    belongs to ``ccr_ids[i]`` and column ``j`` to slot ``start_slot + j``.
+    """
+    organization_id: str
+    start_slot: int
+    ccr_ids: Tuple[str, ...]
+    ccr_names: Tuple[str, ...]
+    capacity: np.ndarray
+    booked: np.ndarray
+
+    @property
+    def slots(self) -> np.ndarray:
+        return np.arange(self.start_slot, self.start_slot + self.capacity.shape[1])
+
+    @property
+    def headroom(self) -> np.ndarray:
+        return self.capacity - self.booked
+
+    @property
+    def utilization(self) -> np.ndarray:
+        """Booked hours over capacity; inf where hours are booked on a slot without capacity"""
+        with np.errstate(divide="ignore", invalid="ignore"):
+            utilization = self.booked / self.capacity
+        return np.where(self.capacity > 0, utilization, np.where(self.booked > 0, np.inf, 0.0))
+
+    @property
+    def overloaded(self) -> np.ndarray:
+        return self.booked > self.capacity + 1e-9
+
+
+class CapacityCalendar:
+    """Per-slot CCR capacity from user contributions and calendar exceptions.
+
+    The regular capacity of a CCR in a slot is the sum of the active user
+    contributions whose ``start_slot``/``end_slot`` window covers the slot;
+    CCRs without user associations fall back to ``capacity_per_time_unit``.
+    ``CCRCapacityException`` rows then scale (``capacity_factor``) or replace
+    (``capacity_hours``) it. Every CCR of an organization is materialized in
+    one pass: contribution windows are accumulated as a difference array and
+    exceptions applied as broadcast slot masks.
+    """
+
+    def __init__(self, session: Session):
+        self.session = session
+
+    def current_slot(self, organization_id: str) -> int:
+        """Slot the organization's boards are in now"""
+        organization = self.session.get(Organization, organization_id)
+        return (organization.current_time_unit or 0) if organization else 0
+
+    def get_capacity_matrix(self, ccrs: Sequence[CCR], start_slot: int, slots: int) -> np.ndarray:
+        """Return a ``(len(ccrs), slots)`` array of capacity hours from ``start_slot`` on"""
+        if slots <= 0:
+            raise ValueError("slots must be positive")
+        capacity = np.zeros((len(ccrs), slots))
+        if not ccrs:
+            return capacity
+
+        rows = {ccr.id: row for row, ccr in enumerate(ccrs)}
+        end_slot = start_slot + slots - 1
+
+        # Regular capacity: windowed user contributions, summed through a difference array
+        associations = self.session.query(
+            CCRUserAssociation.ccr_id, CCRUserAssociation.capacity_contribution,
+            CCRUserAssociation.start_slot, CCRUserAssociation.end_slot
+        ).filter(
+            CCRUserAssociation.ccr_id.in_(list(rows)),
+            CCRUserAssociation.is_active.is_(True)
+        ).all()
+        staffed = np.zeros(len(ccrs), dtype=bool)
+        if associations:
+            assoc_rows = np.array([rows[a.ccr_id] for a in associations])
+            hours = np.array([a.capacity_contribution or 0.0 for a in associations])
+            starts = np.array([start_slot if a.start_slot is None else a.start_slot for a in associations])
+            ends = np.array([end_slot if a.end_slot is None else a.end_slot for a in associations])
+            first = np.clip(starts - start_slot, 0, slots)
+            last = np.clip(ends - start_slot + 1, 0, slots)
+            covering = last > first
+
+            diff = np.zeros((len(ccrs), slots + 1))
+            np.add.at(diff, (assoc_rows[covering], first[covering]), hours[covering])
+            np.add.at(diff, (assoc_rows[covering], last[covering]), -hours[covering])
+            capacity = np.cumsum(diff[:, :-1], axis=1)
+            staffed[assoc_rows] = True
+
+        constant = np.array([ccr.capacity_per_time_unit or 0.0 for ccr in ccrs])
+        capacity = np.where(staffed[:, None], capacity, constant[:, None])
+
+        # Calendar exceptions overlapping the horizon
+        exceptions = self.session.query(CCRCapacityException).filter(
+            CCRCapacityException.ccr_id.in_(list(rows)),
+            CCRCapacityException.start_slot <= end_slot,
+            CCRCapacityException.end_slot >= start_slot
+        ).all()
+        if exceptions:
+            exception_rows = np.array([rows[e.ccr_id] for e in exceptions])
+            slot_numbers = np.arange(start_slot, end_slot + 1)
+            covers = (
+                (slot_numbers >= np.array([e.start_slot for e in exceptions])[:, None])
+                & (slot_numbers <= np.array([e.end_slot for e in exceptions])[:, None])
+            )
+
+            # Factors multiply; overlapping overrides keep the most restrictive
+            factors = np.array([1.0 if e.capacity_factor is None else e.capacity_factor for e in exceptions])
+            factor_matrix = np.ones_like(capacity)
+            np.multiply.at(factor_matrix, exception_rows, np.where(covers, factors[:, None], 1.0))
+
+            overrides = np.array([np.nan if e.capacity_hours is None else e.capacity_hours for e in exceptions])
+            override_matrix = np.full_like(capacity, np.nan)
+            np.fmin.at(override_matrix, exception_rows, np.where(covers, overrides[:, None], np.nan))
+
+            capacity = np.where(np.isnan(override_matrix), capacity * factor_matrix, override_matrix)
+
+        return np.maximum(capacity, 0.0)
+
+    def get_capacity(self, ccr: CCR, start_slot: int, slots: int = 1) -> np.ndarray:
+        """Capacity hours of one CCR for ``slots`` slots from ``start_slot`` on"""
+        return self.get_capacity_matrix([ccr], start_slot, slots)[0]
+
+    def get_horizon(
+        self,
+        organization_id: str,
+        slots: int,
+        start_slot: Optional[int] = None,
+        ccr_ids: Optional[Sequence[str]] = None
+    ) -> CapacityHorizon:
+        """Capacity and booked hours for the organization's active CCRs over the next ``slots`` slots"""
+        if start_slot is None:
+            start_slot = self.current_slot(organization_id)
+
+        query = self.session.query(CCR).filter_by(organization_id=organization_id, is_active=True)
+        if ccr_ids is not None:
+            query = query.filter(CCR.id.in_(list(ccr_ids)))
+        ccrs = query.order_by(CCR.name, CCR.id).all()
+
+        capacity = self.get_capacity_matrix(ccrs, start_slot, slots)
+
+        # Booked hours from the capacity ledger in one range query
+        booked = np.zeros_like(capacity)
+        if ccrs:
+            rows = {ccr.id: row for row, ccr in enumerate(ccrs)}
+            entries = self.session.query(
+                CCRCapacityLedger.ccr_id, CCRCapacityLedger.slot, CCRCapacityLedger.booked_hours
+            ).filter(
+                CCRCapacityLedger.ccr_id.in_(list(rows)),
+                CCRCapacityLedger.slot >= start_slot,
+                CCRCapacityLedger.slot < start_slot + slots
+            ).all()
+            if entries:
+                np.add.at(
+                    booked,
+                    (np.array([rows[e.ccr_id] for e in entries]), np.array([e.slot - start_slot for e in entries])),
+                    np.array([e.booked_hours for e in entries])
+                )
+
+        return CapacityHorizon(
+            organization_id=organization_id,
+            start_slot=start_slot,
+            ccr_ids=tuple(ccr.id for ccr in ccrs),
+            ccr_names=tuple(ccr.name for ccr in ccrs),
+            capacity=capacity,
+            booked=booked
+        )
+
+    def get_load_analysis(self, organization_id: str, slots: int = 12, start_slot: Optional[int] = None) -> Dict[str, Any]:
+        """Load versus capacity for every active CCR of the organization over the next ``slots`` slots"""
+        horizon = self.get_horizon(organization_id, slots, start_slot=start_slot)
+        headroom = horizon.headroom
+        utilization = horizon.utilization
+        overloaded = horizon.overloaded
+        slot_numbers = horizon.slots
+
+        total_capacity = horizon.capacity.sum(axis=1)
+        total_booked = horizon.booked.sum(axis=1)
+        peak_utilization = utilization.max(axis=1)
+
+        ccrs: List[Dict[str, Any]] = []
+        for row, ccr_id in enumerate(horizon.ccr_ids):
+            ccrs.append({
+                "ccr_id": ccr_id,
+                "name": horizon.ccr_names[row],
+                "capacity": horizon.capacity[row].tolist(),
+                "booked_hours": horizon.booked[row].tolist(),
+                "headroom_hours": headroom[row].tolist(),
+                "utilization": [_finite(value) for value in utilization[row]],
+                "overloaded_slots": slot_numbers[overloaded[row]].tolist(),
+                "total_capacity": float(total_capacity[row]),
+                "total_booked_hours": float(total_booked[row]),
+                "peak_utilization": _finite(peak_utilization[row]),
+            })
+
+        return {
+            "organization_id": organization_id,
+            "start_slot": horizon.start_slot,
+            "slots": slot_numbers.tolist(),
+            "ccrs": ccrs,
+            "overloaded_ccr_count": int(overloaded.any(axis=1).sum()),
+        }
+
+    def get_shared_ccr_load(self, ccr: CCR, slots: int = 12, start_slot: Optional[int] = None) -> Dict[str, Any]:
+        """Combined load per slot of every board that feeds a CCR, with each board's share.
+
+        Booked hours come from one query over the schedules' persisted
+        ``ccr_slot``/``booked_ccr_hours``, grouped by board and slot, so the
+        per-board series sum to the CCR's ledger.
+        """
+        if start_slot is None:
+            start_slot = self.current_slot(ccr.organization_id)
+        capacity = self.get_capacity(ccr, start_slot, slots)
+
+        board_configs = self.session.query(BoardConfig.id, BoardConfig.name).filter(
+            BoardConfig.organization_id == ccr.organization_id,
+            BoardConfig.ccr_id == ccr.id
+        ).order_by(BoardConfig.name, BoardConfig.id).all()
+        rows = self.session.query(
+            Schedule.board_config_id,
+            Schedule.ccr_slot,
+            func.sum(Schedule.booked_ccr_hours),
+            func.count(Schedule.id)
+        ).filter(
+            Schedule.capability_channel_id == ccr.id,
+            Schedule.ccr_slot >= start_slot,
+            Schedule.ccr_slot < start_slot + slots
+        ).group_by(Schedule.board_config_id, Schedule.ccr_slot).all()
+
+        # Boards that once fed the CCR keep their bookings even if repointed since
+        board_index = {board_config.id: row for row, board_config in enumerate(board_configs)}
+        board_names = [board_config.name for board_config in board_configs]
+        for board_config_id, _, _, _ in rows:
+            if board_config_id not in board_index:
+                board_index[board_config_id] = len(board_names)
+                board_names.append(None)
+
+        booked = np.zeros((len(board_names), slots))
+        schedule_counts = np.zeros((len(board_names), slots), dtype=np.int64)
+        if rows:
+            index = (
+                np.array([board_index[row[0]] for row in rows]),
+                np.array([row[1] - start_slot for row in rows])
+            )
+            np.add.at(booked, index, np.array([row[2] or 0.0 for row in rows]))
+            np.add.at(schedule_counts, index, np.array([row[3] for row in rows]))
+
+        total = booked.sum(axis=0)
+        horizon = CapacityHorizon(
+            organization_id=ccr.organization_id,
+            start_slot=start_slot,
+            ccr_ids=(ccr.id,),
+            ccr_names=(ccr.name,),
+            capacity=capacity[None, :],
+            booked=total[None, :]
+        )
+        slot_numbers = horizon.slots
+
+        return {
+            "organization_id": ccr.organization_id,
+            "ccr_id": ccr.id,
+            "ccr_name": ccr.name,
+            "start_slot": start_slot,
+            "slots": slot_numbers.tolist(),
+            "capacity": capacity.tolist(),
+            "booked_hours": total.tolist(),
+            "headroom_hours": horizon.headroom[0].tolist(),
+            "utilization": [_finite(value) for value in horizon.utilization[0]],
+            "overloaded_slots": slot_numbers[horizon.overloaded[0]].tolist(),
+            "boards": [
+                {
+                    "board_config_id": board_config_id,
+                    "name": board_names[row],
+                    "booked_hours": booked[row].tolist(),
+                    "schedule_counts": schedule_counts[row].tolist(),
+                    "total_booked_hours": float(booked[row].sum()),
+                }
+                for board_config_id, row in board_index.items()
+            ],
+        }
+
+
+def _finite(value: float) -> Optional[float]:
+    """JSON-safe utilization: None for booked slots without capacity"""
+    return float(value) if np.isfinite(value) else None
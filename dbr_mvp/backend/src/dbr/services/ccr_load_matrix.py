@@ -0,0 +1,236 @@
+# src/dbr/services/ccr_load_matrix.py
+from typing import Dict, Any, List, Optional, Sequence, Tuple
+from dataclasses import dataclass, field
+from threading import Lock
+import numpy as np
+from sqlalchemy.orm import Session
+from dbr.core.data_version import get_data_version, has_pending_changes
+from dbr.models.ccr import CCR
+from dbr.models.work_item import WorkItem, WorkItemStatus
+from dbr.models.work_item_ccr_hours import WorkItemCCRHours
+
+
+# Tables the matrix is derived from
+MATRIX_TABLES = ("work_items", "ccrs")
+
+
+@dataclass(frozen=True)
+class LoadMatrix:
+    """Dense work items x CCRs matrix of required CCR hours for one organization.
+
+    Row ``i`` is ``work_item_ids[i]`` and column ``j`` is ``ccr_ids[j]``;
+    ``capacity`` holds each CCR's ``capacity_per_time_unit``. Hours entered
+    under a key that matches no active CCR are not represented.
+    """
+    organization_id: str
+    version: Tuple[int, ...]
+    work_item_ids: Tuple[str, ...]
+    ccr_ids: Tuple[str, ...]
+    ccr_names: Tuple[str, ...]
+    hours: np.ndarray
+    capacity: np.ndarray
+    done: np.ndarray
+    row_index: Dict[str, int] = field(repr=False)
+
+    def rows(self, work_item_ids: Sequence[str]) -> np.ndarray:
+        """Row numbers of the given work items; unknown IDs are skipped"""
+        return np.array([self.row_index[i] for i in work_item_ids if i in self.row_index], dtype=np.int64)
+
+    def demand(self, rows: Optional[np.ndarray] = None) -> np.ndarray:
+        """CCR hours per CCR for the given rows (all work items by default)"""
+        return self.hours.sum(axis=0) if rows is None else self.hours[rows].sum(axis=0)
+
+    def utilization(self, demand: np.ndarray, capacity: Optional[np.ndarray] = None) -> np.ndarray:
+        """Demand over capacity per CCR; inf where demand meets no capacity"""
+        capacity = self.capacity if capacity is None else capacity
+        with np.errstate(divide="ignore", invalid="ignore"):
+            utilization = demand / capacity
+        return np.where(capacity > 0, utilization, np.where(demand > 0, np.inf, 0.0))
+
+    def selection(self, candidate_sets: Sequence[Sequence[str]]) -> np.ndarray:
+        """``(sets, work items)`` 0/1 matrix selecting each candidate set's rows"""
+        selection = np.zeros((len(candidate_sets), len(self.work_item_ids)))
+        for set_index, work_item_ids in enumerate(candidate_sets):
+            selection[set_index, self.rows(work_item_ids)] = 1.0
+        return selection
+
+
+class CCRLoadMatrixService:
+    """Batch CCR load questions answered from a cached items x CCRs hours matrix.
+
+    The matrix is built from one work item query and one CCR hours query and
+    cached per organization until a work item or CCR of the organization
+    changes (see ``dbr.core.data_version``). Demand, bottleneck and
+    feasibility questions are then matrix products and reductions.
+    """
+
+    _cache: Dict[str, LoadMatrix] = {}
+    _cache_lock = Lock()
+
+    def __init__(self, session: Session):
+        self.session = session
+
+    @classmethod
+    def clear_cache(cls) -> None:
+        with cls._cache_lock:
+            cls._cache.clear()
+
+    def get_matrix(self, organization_id: str) -> LoadMatrix:
+        """Cached load matrix of the organization, rebuilt when its work items or CCRs changed
+
+        Sessions with uncommitted changes for the organization get a matrix
+        built from their own writes, which is not cached.
+        """
+        if has_pending_changes(self.session, organization_id):
+            return self.build_matrix(organization_id)
+
+        # Read the version before building so a concurrent commit invalidates the result
+        version = get_data_version(organization_id, *MATRIX_TABLES)
+        with self._cache_lock:
+            cached = self._cache.get(organization_id)
+        if cached is not None and cached.version == version:
+            return cached
+
+        matrix = self.build_matrix(organization_id, version)
+        with self._cache_lock:
+            self._cache[organization_id] = matrix
+        return matrix
+
+    def build_matrix(self, organization_id: str, version: Tuple[int, ...] = ()) -> LoadMatrix:
+        """Build the load matrix from the database"""
+        ccrs = self.session.query(CCR.id, CCR.name, CCR.capacity_per_time_unit).filter(
+            CCR.organization_id == organization_id,
+            CCR.is_active.is_(True)
+        ).order_by(CCR.name, CCR.id).all()
+        items = self.session.query(WorkItem.id, WorkItem.status).filter(
+            WorkItem.organization_id == organization_id
+        ).order_by(WorkItem.id).all()
+        entries = self.session.query(
+            WorkItemCCRHours.work_item_id, WorkItemCCRHours.ccr_id, WorkItemCCRHours.hours
+        ).join(WorkItem, WorkItem.id == WorkItemCCRHours.work_item_id).filter(
+            WorkItem.organization_id == organization_id
+        ).all()
+
+        row_index = {item.id: row for row, item in enumerate(items)}
+        column_index = {ccr.id: column for column, ccr in enumerate(ccrs)}
+
+        hours = np.zeros((len(items), len(ccrs)))
+        entries = [entry for entry in entries if entry.ccr_id in column_index and entry.work_item_id in row_index]
+        if entries:
+            np.add.at(
+                hours,
+                (
+                    np.array([row_index[entry.work_item_id] for entry in entries]),
+                    np.array([column_index[entry.ccr_id] for entry in entries])
+                ),
+                np.array([entry.hours or 0.0 for entry in entries])
+            )
+
+        return LoadMatrix(
+            organization_id=organization_id,
+            version=version,
+            work_item_ids=tuple(item.id for item in items),
+            ccr_ids=tuple(ccr.id for ccr in ccrs),
+            ccr_names=tuple(ccr.name for ccr in ccrs),
+            hours=hours,
+            capacity=np.array([ccr.capacity_per_time_unit or 0.0 for ccr in ccrs]),
+            done=np.array([item.status == WorkItemStatus.DONE for item in items], dtype=bool),
+            row_index=row_index
+        )
+
+    def get_ccr_demand(
+        self,
+        organization_id: str,
+        work_item_ids: Optional[Sequence[str]] = None,
+        include_done: bool = True
+    ) -> List[Dict[str, Any]]:
+        """Demand, capacity and utilization per CCR for the given (or all) work items"""
+        matrix = self.get_matrix(organization_id)
+        if work_item_ids is not None:
+            rows = matrix.rows(work_item_ids)
+        elif include_done:
+            rows = None
+        else:
+            rows = np.flatnonzero(~matrix.done)
+        demand = matrix.demand(rows)
+        utilization = matrix.utilization(demand)
+        return [
+            {
+                "ccr_id": ccr_id,
+                "ccr_name": matrix.ccr_names[column],
+                "capacity": float(matrix.capacity[column]),
+                "demand": float(demand[column]),
+                "utilization": _finite(utilization[column]),
+                "available_capacity": float(matrix.capacity[column] - demand[column]),
+            }
+            for column, ccr_id in enumerate(matrix.ccr_ids)
+        ]
+
+    def identify_bottlenecks(
+        self,
+        organization_id: str,
+        threshold: float = 1.0,
+        include_done: bool = True
+    ) -> Dict[str, Any]:
+        """CCRs whose utilization is at or above ``threshold``, highest first, plus the active bottleneck"""
+        matrix = self.get_matrix(organization_id)
+        rows = None if include_done else np.flatnonzero(~matrix.done)
+        demand = matrix.demand(rows)
+        utilization = matrix.utilization(demand)
+
+        order = np.argsort(-utilization, kind="stable")
+        bottlenecks = [
+            {
+                "ccr_id": matrix.ccr_ids[column],
+                "ccr_name": matrix.ccr_names[column],
+                "demand": float(demand[column]),
+                "capacity": float(matrix.capacity[column]),
+                "utilization": _finite(utilization[column]),
+            }
+            for column in order if utilization[column] >= threshold
+        ]
+        active = int(order[0]) if len(order) and demand[order[0]] > 0 else None
+        return {
+            "organization_id": organization_id,
+            "work_item_count": len(matrix.work_item_ids) if rows is None else len(rows),
+            "ccr_count": len(matrix.ccr_ids),
+            "active_bottleneck_id": matrix.ccr_ids[active] if active is not None else None,
+            "bottlenecks": bottlenecks,
+        }
+
+    def check_feasibility(
+        self,
+        organization_id: str,
+        candidate_sets: Sequence[Sequence[str]],
+        capacity: Optional[np.ndarray] = None
+    ) -> List[Dict[str, Any]]:
+        """Check which candidate work item sets fit every CCR's capacity.
+
+        ``capacity`` overrides the per-CCR capacity (aligned with
+        ``LoadMatrix.ccr_ids``), e.g. the remaining headroom of a slot.
+        """
+        matrix = self.get_matrix(organization_id)
+        capacity = matrix.capacity if capacity is None else np.asarray(capacity, dtype=float)
+
+        demand = matrix.selection(candidate_sets) @ matrix.hours
+        utilization = matrix.utilization(demand, capacity[None, :])
+        over = demand > capacity[None, :] + 1e-9
+
+        results = []
+        for set_index, work_item_ids in enumerate(candidate_sets):
+            unknown = [i for i in work_item_ids if i not in matrix.row_index]
+            limiting = int(np.argmax(utilization[set_index])) if matrix.ccr_ids else None
+            results.append({
+                "work_item_ids": list(work_item_ids),
+                "feasible": not over[set_index].any() and not unknown,
+                "unknown_work_item_ids": unknown,
+                "demand": {ccr_id: float(demand[set_index, column]) for column, ccr_id in enumerate(matrix.ccr_ids)},
+                "over_capacity_ccr_ids": [matrix.ccr_ids[column] for column in np.flatnonzero(over[set_index])],
+                "limiting_ccr_id": matrix.ccr_ids[limiting] if limiting is not None else None,
+            })
+        return results
+
+
+def _finite(value: float) -> Optional[float]:
+    """JSON-safe utilization: None for demand on a CCR without capacity"""
+    return float(value) if np.isfinite(value) else None
@@ -1,9 +1,16 @@
 # src/dbr/services/dbr_engine.py
+import time
 from typing import Dict, Any, List, Optional
 from sqlalchemy.orm import Session
 from dbr.models.schedule import Schedule, ScheduleStatus
 from dbr.models.board_config import BoardConfig
+from dbr.models.ccr import CCR
+from dbr.models.work_item import WorkItem
+from dbr.models.organization import advance_organization_time_unit
 from dbr.core.time_manager import TimeManager
+from dbr.core.metrics import record_tick
+from dbr.services.buffer_zone_manager import BufferZoneManager
+from dbr.services.release_queue import ReleaseQueue
 
 
 class DBREngine:
@@ -16,13 +23,16 @@ class DBREngine:
     def advance_time_unit(self, organization_id: str) -> Dict[str, Any]:
         """Advance all schedules by one time unit (move left on the board)"""
         
+        start_time = time.perf_counter()
+        
         # Get all active schedules for the organization
         schedules = self.session.query(Schedule).filter_by(
-            organization_id=organization_id
+            organization_id=organization_id, is_queued=False
         ).filter(Schedule.status != ScheduleStatus.COMPLETED).all()
         
         advanced_count = 0
         completed_count = 0
+        completed_by_board = {}
         
         for schedule in schedules:
             # Store original position for tracking
@@ -42,23 +52,41 @@ class DBREngine:
                 self._update_schedule_status(schedule, board_config)
                 
                 # Check if schedule has completed (moved beyond post-constraint buffer)
-                if schedule.time_unit_position > board_config.post_constraint_buffer_size:
+                if board_config.is_completed_position(schedule.time_unit_position):
                     schedule.status = ScheduleStatus.COMPLETED
                     schedule.completed_date = self.time_manager.get_current_time()
                     completed_count += 1
+                    completed_by_board[schedule.board_config_id] = completed_by_board.get(schedule.board_config_id, 0) + 1
         
-        # Advance system time by one time unit
+        # Advance system time by one time unit; schedules keep their absolute CCR slot
         self.time_manager.advance_time(weeks=1)
+        advance_organization_time_unit(self.session, organization_id)
+        
+        # The rope: release queued schedules into the room the tick made in each pre-constraint buffer
+        remaining = [s for s in schedules if s.status != ScheduleStatus.COMPLETED]
+        released = ReleaseQueue(self.session, self.time_manager).release_for_organization(organization_id, remaining)
+        released_count = sum(len(board_released) for board_released in released.values())
+        remaining.extend(schedule for board_released in released.values() for schedule in board_released)
+        
+        # Append the post-tick buffer state to the buffer history
+        BufferZoneManager(self.session).record_buffer_history(
+            organization_id,
+            self.time_manager.get_current_time(),
+            schedules=remaining,
+            completed_by_board=completed_by_board
+        )
         
         # Commit all changes
         self.session.commit()
         
         remaining_count = advanced_count - completed_count
+        record_tick("dbr_engine", time.perf_counter() - start_time, advanced_count, completed_count, released_count)
         
         return {
             "advanced_schedules_count": advanced_count,
             "completed_schedules_count": completed_count,
             "remaining_schedules_count": remaining_count,
+            "released_schedules_count": released_count,
             "time_advancement": {
                 "previous_time": self.time_manager.get_current_time(),
                 "current_time": self.time_manager.get_current_time()
@@ -92,34 +120,109 @@ class DBREngine:
         if board_config_id:
             query = query.filter_by(board_config_id=board_config_id)
         
-        schedules = query.filter(Schedule.status != ScheduleStatus.COMPLETED).all()
+        schedules = query.filter(Schedule.status != ScheduleStatus.COMPLETED, Schedule.is_queued.is_(False)).all()
         
-        # Group schedules by position
+        return {
+            "organization_id": organization_id,
+            "board_config_id": board_config_id,
+            "total_active_schedules": len(schedules),
+            "status_counts": self._count_by_status(schedules),
+            "position_map": self._group_by_position(schedules),
+            "current_time": self.time_manager.get_current_time().isoformat()
+        }
+    
+    def get_board_snapshot(self, board_config: BoardConfig) -> Dict[str, Any]:
+        """Everything needed to draw a board: config, CCR, active schedules by position and their work items
+        
+        Uses a fixed number of queries however many schedules and work items
+        the board holds: CCR, schedules (plus their selectin-loaded items)
+        and one query for the work item summaries.
+        """
+        ccr = self.session.query(CCR).filter_by(id=board_config.ccr_id).first()
+        schedules = self.session.query(Schedule).filter(
+            Schedule.board_config_id == board_config.id,
+            Schedule.status != ScheduleStatus.COMPLETED,
+            Schedule.is_queued.is_(False)
+        ).order_by(Schedule.time_unit_position, Schedule.created_date).all()
+        
+        # Only the summary columns, so task and CCR hour rows are not loaded
+        work_item_ids = {work_item_id for schedule in schedules for work_item_id in schedule.work_item_ids}
+        work_items = {}
+        if work_item_ids:
+            rows = self.session.query(
+                WorkItem.id, WorkItem.title, WorkItem.status, WorkItem.priority, WorkItem.due_date,
+                WorkItem.total_ccr_hours, WorkItem.throughput, WorkItem.progress, WorkItem.responsible_user_id
+            ).filter(WorkItem.id.in_(work_item_ids)).all()
+            for row in rows:
+                work_items[row.id] = {
+                    "id": row.id,
+                    "title": row.title,
+                    "status": row.status.value,
+                    "priority": row.priority.value,
+                    "due_date": row.due_date.isoformat() if row.due_date else None,
+                    "total_ccr_hours": row.total_ccr_hours or 0.0,
+                    "throughput": row.throughput or 0.0,
+                    "progress_percentage": round((row.progress or 0.0) * 100, 2),
+                    "responsible_user_id": row.responsible_user_id
+                }
+        
+        return {
+            "organization_id": board_config.organization_id,
+            "board_config": {
+                "id": board_config.id,
+                "name": board_config.name,
+                "description": board_config.description,
+                "ccr_id": board_config.ccr_id,
+                "pre_constraint_buffer_size": board_config.pre_constraint_buffer_size,
+                "post_constraint_buffer_size": board_config.post_constraint_buffer_size,
+                "buffer_yellow_ratio": board_config.buffer_yellow_ratio,
+                "buffer_green_ratio": board_config.buffer_green_ratio,
+                "time_unit": board_config.time_unit,
+                "is_active": board_config.is_active
+            },
+            "ccr": {
+                "id": ccr.id,
+                "name": ccr.name,
+                "ccr_type": ccr.ccr_type.value,
+                "capacity_per_time_unit": ccr.capacity_per_time_unit,
+                "time_unit": ccr.time_unit,
+                "is_active": ccr.is_active
+            } if ccr else None,
+            "total_active_schedules": len(schedules),
+            "status_counts": self._count_by_status(schedules),
+            "position_map": self._group_by_position(schedules, work_items),
+            "current_time": self.time_manager.get_current_time().isoformat()
+        }
+    
+    @staticmethod
+    def _group_by_position(schedules: List[Schedule],
+                           work_items: Optional[Dict[str, Dict[str, Any]]] = None) -> Dict[int, List[Dict[str, Any]]]:
+        """Group schedule summaries by time unit position, with work item summaries when given"""
         position_map = {}
         for schedule in schedules:
             pos = schedule.time_unit_position
             if pos not in position_map:
                 position_map[pos] = []
-            position_map[pos].append({
+            entry = {
                 "id": schedule.id,
                 "status": schedule.status.value,
                 "work_item_count": len(schedule.work_item_ids),
                 "total_ccr_hours": schedule.total_ccr_hours
-            })
-        
-        # Count schedules by status
+            }
+            if work_items is not None:
+                entry["work_items"] = [
+                    work_items[work_item_id] for work_item_id in schedule.work_item_ids if work_item_id in work_items
+                ]
+            position_map[pos].append(entry)
+        return position_map
+    
+    @staticmethod
+    def _count_by_status(schedules: List[Schedule]) -> Dict[str, int]:
+        """Count schedules by status"""
         status_counts = {}
         for status in ScheduleStatus:
             status_counts[status.value] = len([s for s in schedules if s.status == status])
-        
-        return {
-            "organization_id": organization_id,
-            "board_config_id": board_config_id,
-            "total_active_schedules": len(schedules),
-            "status_counts": status_counts,
-            "position_map": position_map,
-            "current_time": self.time_manager.get_current_time().isoformat()
-        }
+        return status_counts
     
     def create_schedule(self, organization_id: str, board_config_id: str, work_item_ids: List[str]) -> Schedule:
         """Create a new schedule with the given work items"""
@@ -129,7 +232,7 @@ class DBREngine:
         if not board_config:
             raise ValueError(f"Board configuration {board_config_id} not found")
         
-        # Create schedule at the start of pre-constraint buffer
+        # Create schedule at the start of pre-constraint buffer, or in the release queue if it is full
         schedule = Schedule(
             organization_id=organization_id,
             board_config_id=board_config_id,
@@ -142,6 +245,7 @@ class DBREngine:
         
         # Calculate total CCR hours
         schedule.recalculate_total_hours(self.session)
+        ReleaseQueue(self.session, self.time_manager).place_or_enqueue(schedule, board_config)
         
         # Validate schedule
         schedule.validate(self.session)
@@ -0,0 +1,237 @@
+# src/dbr/services/delivery_forecaster.py
+from typing import Dict, Any, List, Optional
+from datetime import datetime, timedelta, timezone
+import numpy as np
+from sqlalchemy.orm import Session
+from dbr.models.board_config import BoardConfig, completion_position
+from dbr.models.ccr import CCR
+from dbr.models.collection import Collection
+from dbr.models.schedule_item import ScheduleItem
+from dbr.models.work_item import WorkItem, WorkItemStatus
+from dbr.core.time_manager import TimeManager
+from dbr.services.board_simulator import BoardSimulator, BoardSnapshot
+
+
+# Calendar length of one board time unit
+TIME_UNIT_LENGTHS = {
+    "day": timedelta(days=1),
+    "week": timedelta(weeks=1),
+    "month": timedelta(days=30),
+}
+
+FORECAST_PERCENTILES = (50, 85, 95)
+
+
+class DeliveryForecaster:
+    """Monte Carlo forecaster for schedule and collection completion dates.
+
+    All runs are sampled at once as ``(runs, schedules)`` arrays:
+
+    * CCR hours variance - each schedule that has not yet passed the CCR gets
+      a lognormal factor on its planned hours. Work that no longer fits in one
+      time unit holds the CCR for extra units, delaying everything behind it.
+    * Tick slippage - each board tick fails to advance with
+      ``slip_probability``; slips are shared by every schedule on the board.
+    """
+
+    def __init__(self, session: Session, time_manager: Optional[TimeManager] = None):
+        self.session = session
+        self.time_manager = time_manager or TimeManager()
+
+    def simulate_completion_units(
+        self,
+        snapshot: BoardSnapshot,
+        ccr_capacities: np.ndarray,
+        runs: int = 10000,
+        ccr_hours_cv: float = 0.2,
+        slip_probability: float = 0.1,
+        seed: Optional[int] = None,
+    ) -> np.ndarray:
+        """Return a ``(runs, schedules)`` array of time units until each schedule completes"""
+        if runs <= 0:
+            raise ValueError("runs must be positive")
+        if not 0.0 <= slip_probability < 1.0:
+            raise ValueError("slip_probability must be in [0, 1)")
+
+        rng = np.random.default_rng(seed)
+        schedule_count = snapshot.schedule_count
+        completion_units = np.zeros((runs, schedule_count), dtype=np.int64)
+        if schedule_count == 0:
+            return completion_units
+
+        positions = snapshot.positions
+        completion_positions = completion_position(snapshot.post_buffer_sizes[snapshot.board_index])
+        base_advances = np.maximum(completion_positions - positions, 1)
+
+        # CCR hours variance: lognormal with mean 1 and the requested CV
+        if ccr_hours_cv > 0:
+            sigma = np.sqrt(np.log1p(ccr_hours_cv ** 2))
+            factors = rng.lognormal(-sigma ** 2 / 2, sigma, size=(runs, schedule_count))
+        else:
+            factors = np.ones((runs, schedule_count))
+        capacity = ccr_capacities[snapshot.board_index]
+        safe_capacity = np.where(capacity > 0, capacity, np.inf)
+        ccr_units = np.maximum(np.ceil(snapshot.ccr_hours * factors / safe_capacity), 1)
+        extra_ccr_units = np.where(positions <= 0, ccr_units - 1, 0).astype(np.int64)
+
+        for board in range(snapshot.board_count):
+            members = np.flatnonzero(snapshot.board_index == board)
+            if members.size == 0:
+                continue
+
+            # Overruns at the CCR delay every schedule queued behind them
+            upstream = members[positions[members] <= 0]
+            if upstream.size:
+                upstream = upstream[np.argsort(-positions[upstream], kind="stable")]
+                extra_ccr_units[:, upstream] = np.cumsum(extra_ccr_units[:, upstream], axis=1)
+
+            advances = base_advances[members] + extra_ccr_units[:, members]
+
+            # Slips before the k-th successful advance, shared across the board
+            max_advances = int(advances.max())
+            if slip_probability > 0:
+                slips = rng.geometric(1.0 - slip_probability, size=(runs, max_advances)) - 1
+                slips_before = np.cumsum(slips, axis=1)
+                board_slips = np.take_along_axis(slips_before, advances - 1, axis=1)
+            else:
+                board_slips = 0
+            completion_units[:, members] = advances + board_slips
+
+        return completion_units
+
+    def forecast(
+        self,
+        organization_id: str,
+        board_config_id: Optional[str] = None,
+        runs: int = 10000,
+        ccr_hours_cv: float = 0.2,
+        slip_probability: float = 0.1,
+        seed: Optional[int] = None,
+    ) -> Dict[str, Any]:
+        """Forecast P50/P85/P95 completion dates per schedule and per collection"""
+
+        snapshot = BoardSimulator(self.session).snapshot(organization_id, board_config_id)
+
+        boards = {}
+        if snapshot.board_config_ids:
+            boards = {
+                row.id: row
+                for row in self.session.query(
+                    BoardConfig.id, BoardConfig.time_unit, CCR.capacity_per_time_unit
+                ).join(CCR, CCR.id == BoardConfig.ccr_id).filter(
+                    BoardConfig.id.in_(snapshot.board_config_ids)
+                ).all()
+            }
+        ccr_capacities = np.array(
+            [boards[board_id].capacity_per_time_unit if board_id in boards else 0.0
+             for board_id in snapshot.board_config_ids],
+            dtype=np.float64,
+        )
+        unit_days = np.array(
+            [TIME_UNIT_LENGTHS.get(boards[board_id].time_unit if board_id in boards else "week",
+                                   TIME_UNIT_LENGTHS["week"]).total_seconds() / 86400
+             for board_id in snapshot.board_config_ids],
+            dtype=np.float64,
+        )
+
+        completion_units = self.simulate_completion_units(
+            snapshot, ccr_capacities, runs, ccr_hours_cv, slip_probability, seed
+        )
+        # Work in days so schedules on boards with different time units can be combined
+        completion_days = completion_units * unit_days[snapshot.board_index]
+
+        now = self.time_manager.get_current_time()
+        work_item_ids_by_schedule = self._load_schedule_work_items(snapshot.schedule_ids)
+        work_items = self.session.query(
+            WorkItem.id, WorkItem.collection_id, WorkItem.due_date, WorkItem.status
+        ).filter(WorkItem.organization_id == organization_id).all()
+        work_item_lookup = {row.id: row for row in work_items}
+
+        schedule_index = {}
+        schedule_forecasts = []
+        for index, schedule_id in enumerate(snapshot.schedule_ids):
+            days = completion_days[:, index]
+            due_dates = [
+                work_item_lookup[work_item_id].due_date
+                for work_item_id in work_item_ids_by_schedule.get(schedule_id, [])
+                if work_item_id in work_item_lookup and work_item_lookup[work_item_id].due_date
+            ]
+            due_date = min(due_dates) if due_dates else None
+            for work_item_id in work_item_ids_by_schedule.get(schedule_id, []):
+                schedule_index[work_item_id] = index
+            schedule_forecasts.append({
+                "schedule_id": schedule_id,
+                "board_config_id": snapshot.board_config_ids[snapshot.board_index[index]],
+                "time_unit_position": int(snapshot.positions[index]),
+                **self._summarize(days, now, due_date),
+            })
+
+        collection_forecasts = []
+        items_by_collection: Dict[str, List[Any]] = {}
+        for row in work_items:
+            if row.collection_id and row.status != WorkItemStatus.DONE:
+                items_by_collection.setdefault(row.collection_id, []).append(row)
+
+        collections = self.session.query(
+            Collection.id, Collection.name, Collection.target_completion_date
+        ).filter(Collection.organization_id == organization_id).all()
+        for collection in collections:
+            items = items_by_collection.get(collection.id, [])
+            columns = sorted({schedule_index[item.id] for item in items if item.id in schedule_index})
+            unscheduled = sum(1 for item in items if item.id not in schedule_index)
+            if not columns:
+                continue
+            # A collection is delivered when its last scheduled work item completes
+            days = completion_days[:, columns].max(axis=1)
+            collection_forecasts.append({
+                "collection_id": collection.id,
+                "name": collection.name,
+                "scheduled_work_items": len(items) - unscheduled,
+                "unscheduled_work_items": unscheduled,
+                **self._summarize(days, now, collection.target_completion_date),
+            })
+
+        return {
+            "organization_id": organization_id,
+            "board_config_id": board_config_id,
+            "runs": runs,
+            "ccr_hours_cv": ccr_hours_cv,
+            "slip_probability": slip_probability,
+            "forecast_time": now.isoformat(),
+            "schedules": schedule_forecasts,
+            "collections": collection_forecasts,
+        }
+
+    def _load_schedule_work_items(self, schedule_ids: List[str]) -> Dict[str, List[str]]:
+        """Load the work item IDs for the given schedules in one query"""
+        if not schedule_ids:
+            return {}
+        rows = self.session.query(ScheduleItem.schedule_id, ScheduleItem.work_item_id).filter(
+            ScheduleItem.schedule_id.in_(schedule_ids)
+        ).order_by(ScheduleItem.schedule_id, ScheduleItem.ordinal).all()
+        work_item_ids: Dict[str, List[str]] = {}
+        for row in rows:
+            work_item_ids.setdefault(row.schedule_id, []).append(row.work_item_id)
+        return work_item_ids
+
+    @staticmethod
+    def _summarize(days: np.ndarray, now: datetime, target: Optional[datetime]) -> Dict[str, Any]:
+        """Convert simulated completion offsets (in days) into percentile dates"""
+        percentiles = np.percentile(days, FORECAST_PERCENTILES)
+        summary = {}
+        for percentile, value in zip(FORECAST_PERCENTILES, percentiles):
+            summary[f"p{percentile}_date"] = (now + timedelta(days=float(value))).isoformat()
+        summary["mean_days"] = round(float(days.mean()), 2)
+        summary["target_date"] = target.isoformat() if target else None
+        summary["on_time_probability"] = None
+        if target:
+            target_days = (_as_utc(target) - _as_utc(now)).total_seconds() / 86400
+            summary["on_time_probability"] = round(float((days <= target_days).mean()), 4)
+        return summary
+
+
+def _as_utc(value: datetime) -> datetime:
+    """Timezone-aware UTC copy of a datetime; naive datetimes are taken to be UTC"""
+    if value.tzinfo is None:
+        return value.replace(tzinfo=timezone.utc)
+    return value.astimezone(timezone.utc)
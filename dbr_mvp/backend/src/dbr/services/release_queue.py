@@ -0,0 +1,254 @@
+# src/dbr/services/release_queue.py
+from typing import Dict, Any, List, Optional, Tuple
+from datetime import datetime
+from threading import Lock
+import heapq
+import uuid
+from sqlalchemy import event, func
+from sqlalchemy.orm import Session
+from dbr.models.board_config import BoardConfig
+from dbr.models.ccr import CCR
+from dbr.models.ccr_capacity_ledger import get_booked_hours
+from dbr.models.schedule import Schedule, ScheduleStatus
+from dbr.models.work_item import WorkItem, WorkItemPriority
+from dbr.core.time_manager import TimeManager
+from dbr.services.buffer_zone_manager import BufferZoneManager, BufferSnapshot
+from dbr.services.capacity_calendar import CapacityCalendar
+
+
+# Release priority of a schedule: its most urgent work item
+PRIORITY_RANKS = {
+    WorkItemPriority.LOW: 0,
+    WorkItemPriority.MEDIUM: 1,
+    WorkItemPriority.HIGH: 2,
+    WorkItemPriority.CRITICAL: 3,
+}
+
+# (-priority, has no due date, due date, queued date, schedule id)
+QueueKey = Tuple[int, bool, str, str, str]
+
+# session.info keys: heap entries to add once the transaction commits, and boards whose heaps it popped from
+_PENDING_PUSHES_KEY = "dbr_release_queue_pushes"
+_TOUCHED_BOARDS_KEY = "dbr_release_queue_boards"
+
+
+def queue_key(release_priority: int, release_due_date: Optional[datetime], queued_date: Optional[datetime], schedule_id: str) -> QueueKey:
+    """Total order of the release queue: priority, then due date, then arrival; the ID breaks ties"""
+    return (
+        -(release_priority or 0),
+        release_due_date is None,
+        release_due_date.isoformat() if release_due_date else "",
+        queued_date.isoformat() if queued_date else "",
+        schedule_id,
+    )
+
+
+class ReleaseQueue:
+    """The rope: planned schedules wait per board until the pre-constraint buffer has room.
+
+    Each board's queue is a binary heap of ``queue_key`` tuples, loaded from
+    the queued schedules once per process and maintained by ``enqueue`` and
+    ``release``, so a tick releasing ``k`` schedules costs O(k log n). Keys
+    form a total order, so concurrent planners always see the same release
+    order. Heap entries are checked against the database when popped;
+    entries whose schedule was deleted, rolled back or released elsewhere are
+    dropped, and a heap that runs dry is reloaded.
+
+    Enqueued entries reach the heap when the transaction commits; a rolled
+    back transaction discards the heaps it popped from, so they are reloaded
+    with the schedules it failed to release.
+    """
+
+    _heaps: Dict[str, List[QueueKey]] = {}
+    _lock = Lock()
+
+    def __init__(self, session: Session, time_manager: Optional[TimeManager] = None):
+        self.session = session
+        self.time_manager = time_manager or TimeManager()
+
+    @classmethod
+    def clear_cache(cls) -> None:
+        with cls._lock:
+            cls._heaps.clear()
+
+    def _load_heap(self, board_config_id: str) -> List[QueueKey]:
+        rows = self.session.query(
+            Schedule.id, Schedule.release_priority, Schedule.release_due_date, Schedule.queued_date
+        ).filter(
+            Schedule.board_config_id == board_config_id,
+            Schedule.is_queued.is_(True)
+        ).all()
+        heap = [queue_key(row.release_priority, row.release_due_date, row.queued_date, row.id) for row in rows]
+        heapq.heapify(heap)
+        with self._lock:
+            self._heaps[board_config_id] = heap
+        return heap
+
+    def _heap(self, board_config_id: str) -> List[QueueKey]:
+        with self._lock:
+            heap = self._heaps.get(board_config_id)
+        return heap if heap is not None else self._load_heap(board_config_id)
+
+    def queued_count(self, board_config_id: str) -> int:
+        """Number of schedules waiting for release on the board"""
+        return self.session.query(func.count(Schedule.id)).filter(
+            Schedule.board_config_id == board_config_id,
+            Schedule.is_queued.is_(True)
+        ).scalar()
+
+    @staticmethod
+    def free_slots(snapshot: BufferSnapshot) -> int:
+        """Pre-constraint buffer slots not taken by schedules on the board"""
+        return max(snapshot.pre_constraint_buffer_size - snapshot.pre_constraint_count, 0)
+
+    def can_place(self, board_config: BoardConfig, snapshot: Optional[BufferSnapshot] = None) -> bool:
+        """Whether a new schedule may go straight onto the board instead of the queue"""
+        snapshot = snapshot or BufferZoneManager(self.session).get_snapshot(board_config.id)
+        return self.free_slots(snapshot) > 0 and self.queued_count(board_config.id) == 0
+
+    def prioritize(self, schedule: Schedule) -> None:
+        """Set the schedule's release priority and due date from its work items"""
+        work_item_ids = schedule.work_item_ids
+        rows = self.session.query(WorkItem.priority, WorkItem.due_date).filter(
+            WorkItem.id.in_(work_item_ids)
+        ).all() if work_item_ids else []
+        schedule.release_priority = max((PRIORITY_RANKS.get(row.priority, 0) for row in rows), default=0)
+        schedule.release_due_date = min((row.due_date for row in rows if row.due_date), default=None)
+
+    def enqueue(self, schedule: Schedule, board_config: BoardConfig) -> None:
+        """Put a planned schedule in the board's release queue"""
+        self.prioritize(schedule)
+        schedule.is_queued = True
+        schedule.status = ScheduleStatus.PLANNING
+        schedule.time_unit_position = -board_config.pre_constraint_buffer_size
+        schedule.queued_date = self.time_manager.get_current_time()
+
+        # Loaded heaps learn about the schedule on commit; unloaded ones pick it up from the database
+        if schedule.id is None:
+            schedule.id = str(uuid.uuid4())
+        key = queue_key(schedule.release_priority, schedule.release_due_date, schedule.queued_date, schedule.id)
+        self.session.info.setdefault(_PENDING_PUSHES_KEY, []).append((board_config.id, key))
+
+    def place_or_enqueue(self, schedule: Schedule, board_config: BoardConfig) -> bool:
+        """Put a new schedule at the start of the pre-constraint buffer if it has room, else queue it.
+
+        Returns True when the schedule was placed on the board.
+        """
+        if self.can_place(board_config):
+            schedule.is_queued = False
+            schedule.time_unit_position = -board_config.pre_constraint_buffer_size
+            return True
+        self.enqueue(schedule, board_config)
+        return False
+
+    def _slot_headroom(self, board_config: BoardConfig) -> Tuple[int, float]:
+        """Slot a schedule released now books on the board's CCR, and the hours still free in it"""
+        slot = CapacityCalendar(self.session).current_slot(board_config.organization_id) + board_config.pre_constraint_buffer_size
+        ccr = self.session.get(CCR, board_config.ccr_id)
+        if ccr is None:
+            return slot, 0.0
+        capacity = float(CapacityCalendar(self.session).get_capacity(ccr, slot)[0])
+        booked = get_booked_hours(self.session, ccr.id, slot, slot).get(slot, 0.0)
+        return slot, capacity - booked
+
+    def release(self, board_config: BoardConfig, count: int) -> List[Schedule]:
+        """Release up to ``count`` queued schedules, in queue order, into the pre-constraint buffer
+
+        A schedule is only released if its CCR hours fit the headroom of the
+        slot it will book; otherwise it stays at the head of the queue and
+        nothing behind it is released, so the release order is kept.
+        """
+        released: List[Schedule] = []
+        if count <= 0:
+            return released
+
+        self.session.info.setdefault(_TOUCHED_BOARDS_KEY, set()).add(board_config.id)
+        _, headroom = self._slot_headroom(board_config)
+        heap = self._heap(board_config.id)
+        reloaded = False
+        while len(released) < count:
+            if not heap:
+                if reloaded:
+                    break
+                heap = self._load_heap(board_config.id)
+                reloaded = True
+                continue
+            with self._lock:
+                key = heapq.heappop(heap) if heap else None
+            if key is None:
+                continue
+
+            schedule = self.session.get(Schedule, key[-1])
+            if schedule is None or not schedule.is_queued or schedule.board_config_id != board_config.id:
+                continue
+            if (schedule.total_ccr_hours or 0.0) > headroom + 1e-9:
+                with self._lock:
+                    heapq.heappush(heap, key)
+                break
+            headroom -= schedule.total_ccr_hours or 0.0
+            schedule.is_queued = False
+            schedule.time_unit_position = -board_config.pre_constraint_buffer_size
+            schedule.released_date = self.time_manager.get_current_time()
+            released.append(schedule)
+        return released
+
+    def release_for_organization(self, organization_id: str, schedules: Optional[List[Schedule]] = None) -> Dict[str, List[Schedule]]:
+        """Fill every board's free pre-constraint slots from its queue (called on each tick)"""
+        buffer_manager = BufferZoneManager(self.session)
+        snapshots = buffer_manager.get_organization_snapshots(organization_id, schedules)
+        board_configs = {
+            board_config.id: board_config
+            for board_config in self.session.query(BoardConfig).filter(BoardConfig.id.in_(list(snapshots))).all()
+        } if snapshots else {}
+
+        released: Dict[str, List[Schedule]] = {}
+        for board_config_id, snapshot in snapshots.items():
+            free_slots = self.free_slots(snapshot)
+            if free_slots:
+                board_released = self.release(board_configs[board_config_id], free_slots)
+                if board_released:
+                    released[board_config_id] = board_released
+        return released
+
+    def get_queue(self, board_config_id: str) -> List[Dict[str, Any]]:
+        """Queued schedules of a board in release order"""
+        schedules = self.session.query(Schedule).filter(
+            Schedule.board_config_id == board_config_id,
+            Schedule.is_queued.is_(True)
+        ).all()
+        schedules.sort(key=lambda s: queue_key(s.release_priority, s.release_due_date, s.queued_date, s.id))
+        return [
+            {
+                "schedule_id": schedule.id,
+                "queue_position": index + 1,
+                "release_priority": schedule.release_priority,
+                "release_due_date": schedule.release_due_date.isoformat() if schedule.release_due_date else None,
+                "queued_date": schedule.queued_date.isoformat() if schedule.queued_date else None,
+                "work_item_count": len(schedule.work_item_ids),
+                "total_ccr_hours": schedule.total_ccr_hours,
+            }
+            for index, schedule in enumerate(schedules)
+        ]
+
+
+@event.listens_for(Session, "after_commit")
+def _apply_heap_changes(session):
+    session.info.pop(_TOUCHED_BOARDS_KEY, None)
+    pushes = session.info.pop(_PENDING_PUSHES_KEY, None)
+    if not pushes:
+        return
+    with ReleaseQueue._lock:
+        for board_config_id, key in pushes:
+            heap = ReleaseQueue._heaps.get(board_config_id)
+            if heap is not None:
+                heapq.heappush(heap, key)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_heap_changes(session):
+    session.info.pop(_PENDING_PUSHES_KEY, None)
+    touched = session.info.pop(_TOUCHED_BOARDS_KEY, None)
+    if touched:
+        with ReleaseQueue._lock:
+            for board_config_id in touched:
+                ReleaseQueue._heaps.pop(board_config_id, None)
@@ -1,5 +1,6 @@
 # tests/conftest.py
 import pytest
+from contextlib import contextmanager
 from fastapi.testclient import TestClient
 from sqlalchemy.orm import Session
 from dbr.main import app
@@ -11,6 +12,7 @@ from dbr.models.board_config import BoardConfig
 from dbr.models.role import Role, RoleName
 from dbr.models.user import User
 from dbr.core.database import SessionLocal, create_tables
+from dbr.core.query_stats import QueryCounter
 
 
 @pytest.fixture
@@ -82,7 +84,7 @@ def test_ccr(session, test_organization):
     """Create a test CCR"""
     ccr = CCR(
         organization_id=test_organization.id,
-        name="Development CCR",
+        name="Development",
         description="Development capacity constrained resource",
         ccr_type=CCRType.SKILL_BASED,
         capacity_per_time_unit=40.0
@@ -174,4 +176,28 @@ def test_schedules(session, test_organization, test_board_config, test_work_item
     schedules.extend([schedule1, schedule2, schedule3])
     session.add_all(schedules)
     session.commit()
-    return schedules
\ No newline at end of file
+    return schedules
+
+
+@pytest.fixture
+def query_budget():
+    """Assert the SQL statements run in a with block stay within a budget
+
+        with query_budget(6):
+            client.get(url)
+
+    max_repeats additionally caps how often one statement shape may run,
+    catching N+1 queries that a loose total budget would hide.
+    """
+    @contextmanager
+    def budget(max_queries: int, max_repeats: int = None):
+        with QueryCounter() as queries:
+            yield queries
+        shapes = "\n".join(f"{count}x {shape}" for shape, count in queries.stats.shapes.most_common(5))
+        assert queries.count <= max_queries, \
+            f"{queries.count} SQL statements, budget is {max_queries}. Most frequent:\n{shapes}"
+        if max_repeats is not None:
+            repeated = queries.stats.repeated(max_repeats)
+            assert not repeated, f"Statements repeated more than {max_repeats} times:\n{shapes}"
+
+    return budget
@@ -0,0 +1,117 @@
+# tests/test_api/test_batch.py
+import pytest
+from dbr.api.auth import create_access_token
+from dbr.core.security import hash_password
+from dbr.models.role import Role, RoleName
+from dbr.models.user import User
+from dbr.models.schedule import ScheduleStatus
+from dbr.models.work_item import WorkItem
+
+
+@pytest.fixture
+def auth_headers(session):
+    """Create a planner and auth headers for it"""
+    role = Role(name=RoleName.PLANNER, description="Planner role for testing")
+    session.add(role)
+    session.commit()
+    user = User(
+        username="batch_planner",
+        email="batch_planner@example.com",
+        password_hash=hash_password("batchpassword"),
+        display_name="Batch Planner",
+        active_status=True,
+        system_role_id=role.id
+    )
+    session.add(user)
+    session.commit()
+    token = create_access_token(data={"sub": str(user.id)})
+    return {"Authorization": f"Bearer {token}"}
+
+
+def _create_item_with_task(organization_id, title):
+    return [
+        {
+            "method": "POST",
+            "path": "/api/v1/workitems",
+            "body": {"organization_id": organization_id, "title": title, "estimated_total_hours": 8.0}
+        },
+        {
+            "method": "POST",
+            "path": "/api/v1/workitems/${0.id}/tasks",
+            "query": {"organization_id": organization_id},
+            "body": {"title": "Write tests"}
+        },
+        {
+            "method": "GET",
+            "path": "/api/v1/workitems/${0.id}",
+            "query": {"organization_id": organization_id}
+        },
+    ]
+
+
+def test_batch_runs_operations_in_order(client, session, test_organization, auth_headers):
+    """Test that sub-requests run in order and can refer to earlier results"""
+    response = client.post("/api/v1/batch", headers=auth_headers, json={
+        "operations": _create_item_with_task(test_organization.id, "Batched Item")
+    })
+    assert response.status_code == 200
+    batch = response.json()
+    assert batch["committed"] is True
+    assert [result["status"] for result in batch["results"]] == [201, 201, 200]
+    work_item_id = batch["results"][0]["body"]["id"]
+    assert batch["results"][2]["body"]["id"] == work_item_id
+    assert [task["title"] for task in batch["results"][2]["body"]["tasks"]] == ["Write tests"]
+
+
+def test_atomic_batch_rolls_back_on_failure(client, session, test_organization, auth_headers):
+    """Test that a failing sub-request rolls back an atomic batch"""
+    operations = _create_item_with_task(test_organization.id, "Rolled Back Item")
+    operations[2]["path"] = "/api/v1/workitems/missing-item"
+    response = client.post("/api/v1/batch", headers=auth_headers, json={"operations": operations, "atomic": True})
+    assert response.status_code == 200
+    batch = response.json()
+    assert batch["committed"] is False
+    assert [result["status"] for result in batch["results"]] == [201, 201, 404]
+    assert session.query(WorkItem).filter_by(title="Rolled Back Item").count() == 0
+
+    response = client.post("/api/v1/batch", headers=auth_headers, json={
+        "operations": _create_item_with_task(test_organization.id, "Atomic Item"),
+        "atomic": True
+    })
+    assert response.json()["committed"] is True
+    assert session.query(WorkItem).filter_by(title="Atomic Item").count() == 1
+
+
+def test_failed_sub_request_leaves_no_writes(client, session, test_organization, test_schedules, auth_headers):
+    """Test that a failed sub-request of a non-atomic batch does not get committed by the next one"""
+    schedule = test_schedules[0]
+    assert schedule.status == ScheduleStatus.PLANNING
+    response = client.post("/api/v1/batch", headers=auth_headers, json={"operations": [
+        {
+            # Sets the status, then fails on the unknown work item
+            "method": "PUT",
+            "path": f"/api/v1/schedules/{schedule.id}",
+            "query": {"organization_id": test_organization.id},
+            "body": {"status": "Post-Constraint", "work_item_ids": ["missing-item"]}
+        },
+        {
+            "method": "POST",
+            "path": "/api/v1/workitems",
+            "body": {"organization_id": test_organization.id, "title": "After Failure", "estimated_total_hours": 8.0}
+        },
+    ]})
+    assert response.status_code == 200
+    assert [result["status"] for result in response.json()["results"]] == [400, 201]
+    session.expire_all()
+    assert session.get(type(schedule), schedule.id).status == ScheduleStatus.PLANNING
+    assert session.query(WorkItem).filter_by(title="After Failure").count() == 1
+
+
+def test_batch_validation(client, auth_headers):
+    """Test that batches require auth and reject paths outside the API"""
+    operation = {"method": "GET", "path": "/api/v1/system/time"}
+    assert client.post("/api/v1/batch", json={"operations": [operation]}).status_code in (401, 403)
+    response = client.post("/api/v1/batch", headers=auth_headers, json={
+        "operations": [{"method": "GET", "path": "/api/v1/events?organization_id=x"}]
+    })
+    assert response.status_code == 422
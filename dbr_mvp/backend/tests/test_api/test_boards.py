@@ -0,0 +1,56 @@
+# tests/test_api/test_boards.py
+from dbr.core.query_stats import QueryCounter
+from dbr.models.schedule import Schedule, ScheduleStatus
+from dbr.models.work_item import WorkItem, WorkItemStatus
+
+
+def _count_queries(client, url):
+    """Request url and count the SQL statements it ran"""
+    with QueryCounter() as queries:
+        response = client.get(url)
+    return response, queries.count
+
+
+def test_board_snapshot(client, session, test_organization, test_board_config, test_ccr, test_work_items, test_schedules):
+    """Test the single-call board snapshot and its fixed query count"""
+    url = f"/api/v1/boards/{test_board_config.id}/snapshot?organization_id={test_organization.id}"
+
+    response, query_count = _count_queries(client, url)
+    assert response.status_code == 200
+    snapshot = response.json()
+    assert snapshot["board_config"]["pre_constraint_buffer_size"] == 5
+    assert snapshot["ccr"]["id"] == test_ccr.id
+    assert snapshot["total_active_schedules"] == 3
+    assert sorted(snapshot["position_map"]) == ["-2", "-5", "2"]
+    planning = snapshot["position_map"]["-5"][0]
+    assert [item["id"] for item in planning["work_items"]] == [test_work_items[0].id, test_work_items[1].id]
+    assert planning["work_items"][0]["status"] == "Ready"
+
+    # More schedules and work items do not add queries
+    for i in range(4):
+        work_item = WorkItem(
+            organization_id=test_organization.id,
+            title=f"Extra Work Item {i+1}",
+            status=WorkItemStatus.READY,
+            ccr_hours_required={"development": 4.0}
+        )
+        session.add(work_item)
+        session.commit()
+        session.add(Schedule(
+            organization_id=test_organization.id,
+            board_config_id=test_board_config.id,
+            capability_channel_id=test_ccr.id,
+            status=ScheduleStatus.PRE_CONSTRAINT,
+            work_item_ids=[work_item.id],
+            time_unit_position=-1,
+            total_ccr_hours=4.0
+        ))
+        session.commit()
+
+    response, larger_query_count = _count_queries(client, url)
+    assert response.json()["total_active_schedules"] == 7
+    assert larger_query_count == query_count
+
+    # Boards of other organizations are not found
+    response = client.get(f"/api/v1/boards/missing-board/snapshot?organization_id={test_organization.id}")
+    assert response.status_code == 404
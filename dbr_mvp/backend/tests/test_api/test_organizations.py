@@ -495,5 +495,51 @@ class TestDeleteOrganization:
         assert response.status_code == 403
 
 
+class TestGetOrganizationChanges:
+    """Test GET /api/v1/organizations/{org_id}/changes endpoint"""
+    
+    def test_changes_since_cursor(self, session, org_admin_headers, test_organization, test_work_items):
+        """Test paging through the change log and syncing later changes"""
+        url = f"/api/v1/organizations/{test_organization.id}/changes"
+        
+        response = client.get(url, params={"since": 0, "limit": 3}, headers=org_admin_headers)
+        assert response.status_code == 200
+        first_page = response.json()
+        assert first_page["has_more"] is True
+        assert [c["op"] for c in first_page["changes"]] == ["insert"] * 3
+        
+        response = client.get(url, params={"since": first_page["next_since"]}, headers=org_admin_headers)
+        second_page = response.json()
+        assert second_page["has_more"] is False
+        synced = {c["entity_id"] for c in first_page["changes"] + second_page["changes"]}
+        assert synced == {item.id for item in test_work_items}
+        
+        # Later changes: one update (twice, reported once) and one delete
+        test_work_items[0].title = "Renamed"
+        session.commit()
+        test_work_items[0].estimated_total_hours = 12.0
+        session.commit()
+        deleted_id = test_work_items[1].id
+        session.delete(test_work_items[1])
+        session.commit()
+        
+        response = client.get(url, params={"since": second_page["next_since"]}, headers=org_admin_headers)
+        changes = {c["entity_id"]: c for c in response.json()["changes"]}
+        assert len(changes) == 2
+        assert changes[test_work_items[0].id]["op"] == "update"
+        assert changes[test_work_items[0].id]["data"]["title"] == "Renamed"
+        assert changes[deleted_id]["op"] == "delete"
+        assert changes[deleted_id]["data"] is None
+    
+    def test_changes_forbidden_for_other_organization(self, org_admin_headers, test_second_organization):
+        """Test that members cannot read another organization's changes"""
+        response = client.get(
+            f"/api/v1/organizations/{test_second_organization.id}/changes",
+            headers=org_admin_headers
+        )
+        
+        assert response.status_code == 403
+
+
 if __name__ == "__main__":
     pytest.main([__file__])
\ No newline at end of file
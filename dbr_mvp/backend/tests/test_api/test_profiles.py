@@ -0,0 +1,127 @@
+# tests/test_api/test_profiles.py
+import asyncio
+import threading
+import pytest
+from dbr.api.auth import create_access_token
+from dbr.core.profiling import ProfileStore, ProfilingMiddleware
+from dbr.core.security import hash_password
+from dbr.main import app
+from dbr.models.role import Role, RoleName
+from dbr.models.user import User
+
+
+def _auth_headers(session, role_name, username):
+    role = session.query(Role).filter_by(name=role_name).first()
+    if role is None:
+        role = Role(name=role_name, description=f"{role_name.value} role for testing")
+        session.add(role)
+        session.commit()
+    user = User(
+        username=username,
+        email=f"{username}@example.com",
+        password_hash=hash_password("profilepassword"),
+        display_name=username,
+        active_status=True,
+        system_role_id=role.id
+    )
+    session.add(user)
+    session.commit()
+    token = create_access_token(data={"sub": str(user.id)})
+    return {"Authorization": f"Bearer {token}"}
+
+
+@pytest.fixture
+def profile_dir(tmp_path, monkeypatch):
+    """Store profiles in a temporary directory"""
+    monkeypatch.setattr(app.state.profile_store, "directory", tmp_path)
+    return tmp_path
+
+
+def test_profile_on_demand(client, session, profile_dir):
+    """Test that Super Admins can profile a request with X-Profile and fetch the profile"""
+    admin_headers = _auth_headers(session, RoleName.SUPER_ADMIN, "profile_admin")
+    planner_headers = _auth_headers(session, RoleName.PLANNER, "profile_planner")
+
+    # The header is ignored for other users
+    response = client.get("/api/v1/auth/me", headers={**planner_headers, "X-Profile": "1"})
+    assert response.status_code == 200
+    assert "x-profile-id" not in response.headers
+    assert client.get("/api/v1/profiles/", headers=planner_headers).status_code == 403
+
+    response = client.get("/api/v1/auth/me", headers={**admin_headers, "X-Profile": "1"})
+    assert response.status_code == 200
+    profile_id = response.headers["x-profile-id"]
+
+    response = client.get("/api/v1/profiles/", headers=admin_headers)
+    assert response.status_code == 200
+    profiles = response.json()
+    assert [profile["id"] for profile in profiles] == [profile_id]
+    assert profiles[0]["path"] == "/api/v1/auth/me"
+    assert profiles[0]["status_code"] == 200
+
+    response = client.get(f"/api/v1/profiles/{profile_id}", headers=admin_headers)
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain")
+    assert client.get("/api/v1/profiles/missing", headers=admin_headers).status_code == 404
+
+
+def test_profile_store_keeps_newest(tmp_path):
+    """Test that the store prunes profiles beyond max_profiles"""
+    store = ProfileStore(str(tmp_path), max_profiles=2)
+    for index, profile_id in enumerate(["1000-0000000a", "2000-0000000b", "3000-0000000c"]):
+        store.save(profile_id, {"path": f"/{index}"}, f"main;handler {index + 1}\n")
+    assert [profile["id"] for profile in store.list()] == ["3000-0000000c", "2000-0000000b"]
+    assert store.get("1000-0000000a") is None
+    assert store.get("3000-0000000c") == "main;handler 3\n"
+    assert store.get("../secrets") is None
+    assert len(list(tmp_path.iterdir())) == 4
+
+
+def _run_request(middleware, path, request_headers=(), content_type=b"application/json"):
+    """Send one GET through the middleware to a bare ASGI app, returning the response headers"""
+    async def app(scope, receive, send):
+        await send({"type": "http.response.start", "status": 200, "headers": [(b"content-type", content_type)]})
+        await send({"type": "http.response.body", "body": b"{}"})
+
+    middleware.app = app
+    messages = []
+
+    async def receive():
+        return {"type": "http.request", "body": b""}
+
+    async def send(message):
+        messages.append(message)
+
+    scope = {"type": "http", "method": "GET", "path": path, "headers": list(request_headers)}
+    asyncio.run(middleware(scope, receive, send))
+    return dict(messages[0]["headers"])
+
+
+def test_event_streams_are_not_profiled(tmp_path):
+    """Test that excluded paths and event streams never hold the profiler"""
+    store = ProfileStore(str(tmp_path))
+    middleware = ProfilingMiddleware(None, store, sample_rate=1.0, excluded_paths=("/api/v1/events",))
+
+    assert b"x-profile-id" not in _run_request(middleware, "/api/v1/events")
+    assert b"x-profile-id" not in _run_request(middleware, "/api/v1/other", [(b"accept", b"text/event-stream")])
+    assert b"x-profile-id" not in _run_request(middleware, "/api/v1/other", content_type=b"text/event-stream")
+    assert store.list() == []
+
+    # The profiler is free again for the next request
+    assert b"x-profile-id" in _run_request(middleware, "/api/v1/workitems")
+    assert len(store.list()) == 1
+
+
+def test_profile_authorization_runs_in_threadpool(tmp_path):
+    """Test that authorize, which queries the database, runs off the event loop thread"""
+    event_loop_thread = threading.get_ident()
+    authorize_threads = []
+
+    def authorize(headers):
+        authorize_threads.append(threading.get_ident())
+        return True
+
+    middleware = ProfilingMiddleware(None, ProfileStore(str(tmp_path)), authorize=authorize)
+    assert b"x-profile-id" in _run_request(middleware, "/api/v1/workitems", [(b"x-profile", b"1")])
+    assert len(authorize_threads) == 1
+    assert authorize_threads[0] != event_loop_thread
@@ -50,7 +50,7 @@ def test_ccr(session, test_organization):
     """Create a test CCR"""
     ccr = CCR(
         organization_id=test_organization.id,
-        name="Development CCR",
+        name="Development",
         description="Development capacity constrained resource",
         ccr_type=CCRType.SKILL_BASED,
         capacity_per_time_unit=40.0
@@ -177,7 +177,7 @@ def test_create_schedule_api(client, session, test_organization, test_board_conf
     assert "created_date" in created_schedule
     
     # Verify CCR time calculation
-    assert created_schedule["total_ccr_time"] == 16.0  # 2 work items * 8 hours each (6 dev + 2 test)
+    assert created_schedule["total_ccr_time"] == 12.0  # 2 work items * 6 development hours; testing hours need another CCR
 
 
 def test_create_schedule_validation(client, session, test_organization, test_board_config, test_work_items):
@@ -346,7 +346,7 @@ def test_schedule_work_item_management(client, session, test_organization, test_
     assert test_work_items[4].id in updated_schedule["work_item_ids"]
     
     # Verify CCR time recalculation
-    assert updated_schedule["total_ccr_time"] == 24.0  # 3 work items * 8 hours each (6 dev + 2 test)
+    assert updated_schedule["total_ccr_time"] == 18.0  # 3 work items * 6 development hours
     
     # Test removing work items from schedule
     remove_work_items_data = {
@@ -362,7 +362,7 @@ def test_schedule_work_item_management(client, session, test_organization, test_
     updated_schedule = response.json()
     assert len(updated_schedule["work_item_ids"]) == 1
     assert updated_schedule["work_item_ids"][0] == test_work_items[0].id
-    assert updated_schedule["total_ccr_time"] == 8.0  # 1 work item * 8 hours (6 dev + 2 test)
+    assert updated_schedule["total_ccr_time"] == 6.0  # 1 work item * 6 development hours
 
 
 def test_schedule_error_handling(client, session, test_organization):
@@ -409,6 +409,71 @@ def test_schedule_analytics_and_metrics(client, session, test_organization, test
     assert "capacity_utilization" in board_analytics
 
 
+def test_schedule_conditional_get(client, session, test_organization, test_schedules):
+    """Test ETags and 304 responses on schedule reads"""
+    
+    url = f"/api/v1/schedules?organization_id={test_organization.id}"
+    response = client.get(url)
+    assert response.status_code == 200
+    etag = response.headers["ETag"]
+    assert etag.startswith('W/"')
+    
+    # An unchanged organization answers with 304 and no body
+    response = client.get(url, headers={"If-None-Match": etag})
+    assert response.status_code == 304
+    assert response.content == b""
+    assert response.headers["ETag"] == etag
+    
+    # Other query strings are tagged separately
+    response = client.get(f"{url}&board_config_id={test_schedules[0].board_config_id}", headers={"If-None-Match": etag})
+    assert response.status_code == 200
+    
+    # A committed schedule change produces a new tag
+    test_schedules[0].time_unit_position = -4
+    session.commit()
+    response = client.get(url, headers={"If-None-Match": etag})
+    assert response.status_code == 200
+    assert response.headers["ETag"] != etag
+
+
+def test_schedule_reorder_changes_etag(client, session, test_organization, test_schedules):
+    """Test that reordering a schedule's work items invalidates the schedule list ETag"""
+    
+    url = f"/api/v1/schedules?organization_id={test_organization.id}"
+    etag = client.get(url).headers["ETag"]
+    
+    # Only schedule_items rows change on a reorder
+    schedule = test_schedules[0]
+    reordered = list(reversed(schedule.work_item_ids))
+    response = client.put(
+        f"/api/v1/schedules/{schedule.id}?organization_id={test_organization.id}",
+        json={"work_item_ids": reordered}
+    )
+    assert response.status_code == 200
+    
+    response = client.get(url, headers={"If-None-Match": etag})
+    assert response.status_code == 200
+    [listed] = [item for item in response.json() if item["id"] == schedule.id]
+    assert listed["work_item_ids"] == reordered
+
+
+def test_schedule_include_work_items(client, session, test_organization, test_work_items, test_schedules, query_budget):
+    """Test embedding the work items of listed schedules with include=work_items"""
+    
+    # Work items of all schedules are loaded together, not per schedule
+    with query_budget(6, max_repeats=1):
+        response = client.get(f"/api/v1/schedules?organization_id={test_organization.id}&include=work_items")
+    assert response.status_code == 200
+    schedules = {schedule["id"]: schedule for schedule in response.json()}
+    embedded = schedules[test_schedules[0].id]["work_items"]
+    assert [item["id"] for item in embedded] == [test_work_items[0].id, test_work_items[1].id]
+    assert embedded[0]["title"] == test_work_items[0].title
+    
+    response = client.get(f"/api/v1/schedules/{test_schedules[1].id}?organization_id={test_organization.id}")
+    assert "work_items" not in response.json()
+    response = client.get(f"/api/v1/schedules/{test_schedules[1].id}?organization_id={test_organization.id}&include=work_items")
+    assert [item["id"] for item in response.json()["work_items"]] == [test_work_items[2].id]
+
 def test_schedule_deletion(client, session, test_organization, test_schedules):
     """Test schedule deletion"""
     
@@ -427,4 +492,143 @@ def test_schedule_deletion(client, session, test_organization, test_schedules):
     assert response.status_code == 200
     
     remaining_schedules = response.json()
-    assert len(remaining_schedules) == 2  # 3 - 1 deleted
\ No newline at end of file
+    assert len(remaining_schedules) == 2  # 3 - 1 deleted
+
+def test_schedule_delivery_forecast(client, session, test_organization, test_schedules):
+    """Test Monte Carlo delivery forecast endpoint"""
+    
+    board_config_id = test_schedules[0].board_config_id
+    response = client.get(
+        f"/api/v1/schedules/forecast?organization_id={test_organization.id}"
+        f"&board_config_id={board_config_id}&runs=2000&seed=1"
+    )
+    assert response.status_code == 200
+    
+    forecast = response.json()
+    assert forecast["runs"] == 2000
+    assert len(forecast["schedules"]) == len(test_schedules)
+    for schedule_forecast in forecast["schedules"]:
+        assert schedule_forecast["p50_date"] <= schedule_forecast["p85_date"] <= schedule_forecast["p95_date"]
+    
+    # Invalid run counts are rejected
+    response = client.get(f"/api/v1/schedules/forecast?organization_id={test_organization.id}&runs=0")
+    assert response.status_code == 422
+
+
+def test_organization_buffer_health(client, session, test_organization, test_schedules):
+    """Test organization-wide buffer health endpoint"""
+    
+    response = client.get(f"/api/v1/schedules/buffer-health?organization_id={test_organization.id}")
+    assert response.status_code == 200
+    
+    health = response.json()
+    assert health["organization_id"] == test_organization.id
+    assert health["board_count"] == 1
+    assert health["overall_status"] in {"green", "yellow", "red", "critical"}
+    [board] = health["boards"]
+    assert board["board_config_id"] == test_schedules[0].board_config_id
+    assert board["health"]["total_schedules"] == len(test_schedules)
+    assert health["alert_count"] == len(board["alerts"])
+    
+    # Unknown organizations are rejected
+    response = client.get("/api/v1/schedules/buffer-health?organization_id=missing-org")
+    assert response.status_code == 403
+
+
+def test_buffer_history_endpoint(client, session, test_organization, test_board_config, test_schedules):
+    """Test buffer history (fever chart) endpoint"""
+    from datetime import datetime
+    from dbr.services.buffer_zone_manager import BufferZoneManager
+    
+    buffer_manager = BufferZoneManager(session)
+    buffer_manager.record_buffer_history(test_organization.id, datetime(2025, 1, 6))
+    buffer_manager.record_buffer_history(test_organization.id, datetime(2025, 1, 13))
+    session.commit()
+    
+    response = client.get(
+        f"/api/v1/schedules/board/{test_board_config.id}/buffer-history"
+        f"?organization_id={test_organization.id}&start=2025-01-10T00:00:00"
+    )
+    assert response.status_code == 200
+    
+    history = response.json()
+    assert history["board_config_id"] == test_board_config.id
+    assert len(history["points"]) == 1
+    assert history["points"][0]["recorded_at"].startswith("2025-01-13")
+    
+    # Boards outside the organization are not found
+    response = client.get(
+        f"/api/v1/schedules/board/missing-board/buffer-history?organization_id={test_organization.id}"
+    )
+    assert response.status_code == 404
+
+
+def test_ccr_capacity_headroom(client, session, test_organization, test_ccr, test_board_config, test_work_items, test_schedules):
+    """Test CCR capacity headroom endpoint and slot-aware creation checks"""
+    
+    response = client.get(
+        f"/api/v1/schedules/capacity?organization_id={test_organization.id}&ccr_id={test_ccr.id}&horizon=6"
+    )
+    assert response.status_code == 200
+    
+    capacity = response.json()
+    assert capacity["current_time_unit"] == 0
+    booked = {entry["time_units_ahead"]: entry["booked_hours"] for entry in capacity["slots"]}
+    assert booked == {0: 0.0, 1: 0.0, 2: 8.0, 3: 0.0, 4: 0.0, 5: 16.0}
+    assert capacity["slots"][5]["headroom_hours"] == 24.0
+    
+    # New schedules enter slot 5; a schedule that does not fit its headroom is rejected
+    test_schedules[0].total_ccr_hours = 36.0
+    session.commit()
+    response = client.post("/api/v1/schedules", json={
+        "organization_id": test_organization.id,
+        "board_config_id": test_board_config.id,
+        "work_item_ids": [test_work_items[4].id]
+    })
+    assert response.status_code == 400
+    assert "remaining capacity" in response.json()["detail"]
+    
+    # Unknown CCRs are not found
+    response = client.get(f"/api/v1/schedules/capacity?organization_id={test_organization.id}&ccr_id=missing-ccr")
+    assert response.status_code == 404
+
+
+def test_shared_ccr_load(client, session, test_organization, test_ccr, test_board_config, test_work_items, test_schedules):
+    """Test combined CCR load across all boards that share the CCR"""
+    
+    shared_board = BoardConfig(
+        organization_id=test_organization.id,
+        name="Shared DBR Board",
+        ccr_id=test_ccr.id,
+        pre_constraint_buffer_size=2,
+        post_constraint_buffer_size=2,
+        time_unit="week"
+    )
+    session.add(shared_board)
+    session.commit()
+    session.add(Schedule(
+        organization_id=test_organization.id,
+        board_config_id=shared_board.id,
+        capability_channel_id=test_ccr.id,
+        status=ScheduleStatus.PRE_CONSTRAINT,
+        work_item_ids=[test_work_items[4].id],
+        time_unit_position=-2,
+        total_ccr_hours=10.0
+    ))
+    session.commit()
+    
+    response = client.get(
+        f"/api/v1/schedules/shared-ccr-load?organization_id={test_organization.id}&ccr_id={test_ccr.id}&horizon=6"
+    )
+    assert response.status_code == 200
+    
+    load = response.json()
+    assert load["booked_hours"] == [0.0, 0.0, 18.0, 0.0, 0.0, 16.0]
+    boards = {board["board_config_id"]: board for board in load["boards"]}
+    assert boards[test_board_config.id]["booked_hours"] == [0.0, 0.0, 8.0, 0.0, 0.0, 16.0]
+    assert boards[shared_board.id]["booked_hours"] == [0.0, 0.0, 10.0, 0.0, 0.0, 0.0]
+    assert boards[shared_board.id]["schedule_counts"][2] == 1
+    
+    # Unknown CCRs are not found
+    response = client.get(f"/api/v1/schedules/shared-ccr-load?organization_id={test_organization.id}&ccr_id=missing-ccr")
+    assert response.status_code == 404
@@ -560,3 +560,124 @@ def test_work_item_filtering_and_sorting(
     items = response.json()
     titles = [item["title"] for item in items]
     assert titles == sorted(titles)  # Should be sorted alphabetically
+
+
+def test_work_item_task_row_endpoints(
+    client, session, test_organization, test_work_items, test_membership, auth_headers
+):
+    """Test row-level task endpoints: add, patch, batch toggle and delete"""
+
+    work_item_id = test_work_items[0].id
+    base_url = f"/api/v1/workitems/{work_item_id}/tasks"
+    query = f"?organization_id={test_organization.id}"
+
+    # Add tasks one at a time
+    for title in ["Task A", "Task B", "Task C", "Task D"]:
+        response = client.post(base_url + query, json={"title": title}, headers=auth_headers)
+        assert response.status_code == 201
+    assert response.json()["task_count"] == 4
+    task_ids = [task["id"] for task in client.get(
+        f"/api/v1/workitems/{work_item_id}{query}", headers=auth_headers
+    ).json()["tasks"]]
+
+    # Patch a single task
+    response = client.patch(
+        f"{base_url}/{task_ids[0]}{query}", json={"completed": True}, headers=auth_headers
+    )
+    assert response.status_code == 200
+    patched = response.json()
+    assert patched["tasks"] == [{"id": task_ids[0], "title": "Task A", "completed": True}]
+    assert patched["completed_task_count"] == 1
+    assert patched["progress_percentage"] == 25.0
+
+    # Batch toggle several tasks
+    response = client.patch(
+        base_url + query, json={"task_ids": task_ids[1:3], "completed": True}, headers=auth_headers
+    )
+    assert response.status_code == 200
+    assert response.json()["completed_task_count"] == 3
+    assert len(response.json()["tasks"]) == 2
+
+    # Unknown tasks are rejected without applying the batch
+    response = client.patch(
+        base_url + query, json={"task_ids": [task_ids[3], 999], "completed": True}, headers=auth_headers
+    )
+    assert response.status_code == 404
+
+    # Delete a task
+    response = client.delete(f"{base_url}/{task_ids[0]}{query}", headers=auth_headers)
+    assert response.status_code == 204
+    work_item = client.get(f"/api/v1/workitems/{work_item_id}{query}", headers=auth_headers).json()
+    assert [task["id"] for task in work_item["tasks"]] == task_ids[1:]
+    assert work_item["progress_percentage"] == 66.67
+
+
+def test_work_item_derived_metric_sorting_and_filters(
+    client, session, test_organization, test_work_items, test_membership, auth_headers
+):
+    """Test sorting and filtering on persisted throughput and CCR hour metrics"""
+
+    base_url = f"/api/v1/workitems?organization_id={test_organization.id}"
+
+    # Throughput descending: 3500, 2100, 1750
+    response = client.get(f"{base_url}&sort=-throughput", headers=auth_headers)
+    assert response.status_code == 200
+    items = response.json()
+    assert [item["title"] for item in items] == ["Test Work Item 1", "Test Work Item 3", "Test Work Item 2"]
+    assert items[0]["total_ccr_hours"] == 16.0
+    assert items[0]["throughput_per_ccr_hour"] == 218.75
+
+    # TOC ranking: throughput per constraint hour, highest first
+    response = client.get(f"{base_url}&sort=-throughput_per_ccr_hour", headers=auth_headers)
+    assert response.json()[-1]["title"] == "Test Work Item 3"
+
+    # Filters run against the stored columns
+    response = client.get(f"{base_url}&min_throughput=2000", headers=auth_headers)
+    assert len(response.json()) == 2
+    response = client.get(f"{base_url}&max_total_ccr_hours=10", headers=auth_headers)
+    assert [item["title"] for item in response.json()] == ["Test Work Item 2"]
+    response = client.get(f"{base_url}&min_progress=50", headers=auth_headers)
+    assert response.json() == []
+
+
+def test_work_item_include_related(
+    client, session, test_organization, test_collection, test_user, test_work_items, test_membership, auth_headers,
+    query_budget
+):
+    """Test embedding collections and responsible users with include="""
+    test_work_items[0].responsible_user_id = test_user.id
+    session.commit()
+
+    # Related resources are loaded with one query per relation, not per work item
+    with query_budget(7, max_repeats=1):
+        response = client.get(
+            f"/api/v1/workitems?organization_id={test_organization.id}&include=collection,responsible_user&sort=title",
+            headers=auth_headers,
+        )
+    assert response.status_code == 200
+    items = {item["id"]: item for item in response.json()}
+    first, standalone = items[test_work_items[0].id], items[test_work_items[1].id]
+    assert first["collection"]["id"] == test_collection.id
+    assert first["responsible_user"]["username"] == test_user.username
+    assert standalone["collection"] is None
+    assert standalone["responsible_user"] is None
+
+    # Related resources are only embedded on request
+    response = client.get(
+        f"/api/v1/workitems/{test_work_items[0].id}?organization_id={test_organization.id}",
+        headers=auth_headers,
+    )
+    assert "collection" not in response.json()
+    response = client.get(
+        f"/api/v1/workitems/{test_work_items[0].id}?organization_id={test_organization.id}&include=collection",
+        headers=auth_headers,
+    )
+    assert response.json()["collection"]["name"] == test_collection.name
+    assert "responsible_user" not in response.json()
+
+    # Unknown relations are rejected
+    response = client.get(
+        f"/api/v1/workitems?organization_id={test_organization.id}&include=owner",
+        headers=auth_headers,
+    )
+    assert response.status_code == 422
@@ -0,0 +1,121 @@
+# tests/test_core/test_events.py
+import asyncio
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+
+@pytest.fixture
+def session():
+    """Create an isolated in-memory database session"""
+    from dbr.models.base import Base
+    from dbr.models.user import User  # Import to ensure table is created  # noqa: F401
+
+    engine = create_engine("sqlite:///:memory:")
+    Base.metadata.create_all(engine)
+    session = sessionmaker(bind=engine)()
+    try:
+        yield session
+    finally:
+        session.close()
+        engine.dispose()
+
+
+@pytest.fixture
+def schedule(session):
+    from dbr.models.organization import Organization, OrganizationStatus
+    from dbr.models.ccr import CCR, CCRType
+    from dbr.models.board_config import BoardConfig
+    from dbr.models.schedule import Schedule, ScheduleStatus
+
+    org = Organization(name="Events Org", status=OrganizationStatus.ACTIVE, contact_email="events@example.com", country="US")
+    session.add(org)
+    session.commit()
+    ccr = CCR(organization_id=org.id, name="Developers", ccr_type=CCRType.TEAM_BASED, capacity_per_time_unit=40.0)
+    session.add(ccr)
+    session.commit()
+    board_config = BoardConfig(organization_id=org.id, name="Events Board", ccr_id=ccr.id,
+                               pre_constraint_buffer_size=2, post_constraint_buffer_size=2)
+    session.add(board_config)
+    session.commit()
+    schedule = Schedule(
+        organization_id=org.id,
+        board_config_id=board_config.id,
+        capability_channel_id=ccr.id,
+        status=ScheduleStatus.PLANNING,
+        work_item_ids=[],
+        time_unit_position=-2,
+        total_ccr_hours=0.0
+    )
+    session.add(schedule)
+    session.commit()
+    return schedule
+
+
+async def _drain(subscription):
+    events = []
+    while True:
+        event_data = await subscription.get(timeout=0.05)
+        if event_data is None:
+            return events
+        events.append(event_data)
+
+
+def test_committed_changes_are_published(session, schedule):
+    """Schedule moves and status changes reach matching streams only after commit"""
+    from dbr.core.events import event_broker
+    from dbr.models.schedule import ScheduleStatus
+
+    async def scenario():
+        board_stream = event_broker.subscribe(schedule.organization_id, schedule.board_config_id)
+        other_board_stream = event_broker.subscribe(schedule.organization_id, "other-board")
+        try:
+            # Rolled back changes are never published
+            schedule.time_unit_position = -1
+            session.flush()
+            session.rollback()
+            assert await _drain(board_stream) == []
+
+            schedule.time_unit_position = -1
+            schedule.status = ScheduleStatus.PRE_CONSTRAINT
+            session.commit()
+
+            events = await _drain(board_stream)
+            assert [e["type"] for e in events] == ["schedule_moved", "schedule_status_changed"]
+            assert (events[0]["from_position"], events[0]["to_position"]) == (-2, -1)
+            assert events[1]["to_status"] == ScheduleStatus.PRE_CONSTRAINT.value
+            assert events[0]["id"] < events[1]["id"]
+            assert await _drain(other_board_stream) == []
+        finally:
+            event_broker.unsubscribe(board_stream)
+            event_broker.unsubscribe(other_board_stream)
+
+    asyncio.run(scenario())
+
+
+def test_bounded_queue_and_alert_deduplication(schedule):
+    """Slow streams drop their oldest events; alerts are published when first raised"""
+    from dbr.core.events import event_broker
+
+    async def scenario():
+        subscription = event_broker.subscribe(schedule.organization_id, maxsize=2)
+        try:
+            for position in range(3):
+                event_broker.publish({
+                    "type": "schedule_moved",
+                    "organization_id": schedule.organization_id,
+                    "board_config_id": schedule.board_config_id,
+                    "to_position": position,
+                })
+            events = await _drain(subscription)
+            assert [e["to_position"] for e in events] == [1, 2]
+            assert subscription.overflowed and subscription.dropped == 1
+
+            alert = {"zone": "pre_constraint", "severity": "RED", "message": "full"}
+            for _ in range(2):
+                event_broker.publish_buffer_alerts(schedule.organization_id, schedule.board_config_id, [alert])
+            assert [e["type"] for e in await _drain(subscription)] == ["buffer_alert"]
+        finally:
+            event_broker.unsubscribe(subscription)
+
+    asyncio.run(scenario())
@@ -0,0 +1,44 @@
+# tests/test_core/test_metrics.py
+from fastapi.testclient import TestClient
+
+
+def test_exposition_format():
+    """Counters, gauges and cumulative histogram buckets render in the text format"""
+    from dbr.core.metrics import Counter, Gauge, Histogram, MetricsRegistry
+
+    registry = MetricsRegistry()
+    requests = registry.register(Counter("test_requests_total", "Requests", ("route",)))
+    in_flight = registry.register(Gauge("test_in_flight", "In flight"))
+    latency = registry.register(Histogram("test_latency_seconds", "Latency", buckets=(0.1, 1.0)))
+
+    requests.labels('/items/"{id}"').inc()
+    requests.labels('/items/"{id}"').inc(2)
+    in_flight.inc()
+    in_flight.dec()
+    for value in (0.05, 0.5, 0.5, 3.0):
+        latency.observe(value)
+
+    lines = registry.render().splitlines()
+    assert "# TYPE test_requests_total counter" in lines
+    assert 'test_requests_total{route="/items/\\"{id}\\""} 3.0' in lines
+    assert "test_in_flight 0.0" in lines
+    assert 'test_latency_seconds_bucket{le="0.1"} 1' in lines
+    assert 'test_latency_seconds_bucket{le="1.0"} 3' in lines
+    assert 'test_latency_seconds_bucket{le="+Inf"} 4' in lines
+    assert "test_latency_seconds_sum 4.05" in lines
+    assert "test_latency_seconds_count 4" in lines
+
+
+def test_metrics_endpoint_records_requests():
+    """Requests are recorded per route template, with their SQL statement counts"""
+    from dbr.main import app
+
+    client = TestClient(app)
+    client.get("/api/v1/workitems/some-id", params={"organization_id": "missing-org"})
+    response = client.get("/metrics")
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain")
+    body = response.text
+    assert 'dbr_http_requests_total{method="GET",route="/api/v1/workitems/{work_item_id}",status="403"}' in body
+    assert 'dbr_http_request_db_queries_count{method="GET",route="/api/v1/workitems/{work_item_id}"}' in body
+    assert "dbr_http_requests_in_flight" in body
@@ -0,0 +1,47 @@
+# tests/test_core/test_query_stats.py
+import logging
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, text
+from dbr.core.middleware import MetricsMiddleware
+from dbr.core.query_stats import QueryStats, statement_shape
+
+
+def test_statement_shape_collapses_in_lists():
+    """Statements differing only in the length of an IN list have the same shape"""
+    assert statement_shape("SELECT * FROM t WHERE id IN (?, ?, ?)") == "SELECT * FROM t WHERE id IN (?)"
+    assert statement_shape("SELECT * FROM t WHERE id IN (?)") == "SELECT * FROM t WHERE id IN (?)"
+    assert statement_shape("INSERT INTO t (a, b) VALUES (?, ?)") == "INSERT INTO t (a, b) VALUES (?)"
+
+    stats = QueryStats()
+    for _ in range(3):
+        stats.record("SELECT * FROM t WHERE id = ?", 0.001)
+    stats.record("SELECT * FROM u", 0.001)
+    assert stats.count == 4
+    assert stats.repeated(2) == [("SELECT * FROM t WHERE id = ?", 3)]
+    assert stats.repeated(3) == []
+
+
+def test_middleware_reports_queries_and_repeats(caplog):
+    """Per-request statement counts go into debug headers, and repeated statements are logged"""
+    engine = create_engine("sqlite://")
+    app = FastAPI()
+    app.add_middleware(MetricsMiddleware, query_repeat_threshold=2, expose_query_stats=True)
+
+    @app.get("/items")
+    def list_items():
+        with engine.connect() as conn:
+            for item_id in range(3):
+                conn.execute(text("SELECT :id"), {"id": item_id})
+        return []
+
+    with caplog.at_level(logging.WARNING, logger="dbr.database"):
+        response = TestClient(app).get("/items")
+    engine.dispose()
+
+    assert response.status_code == 200
+    assert response.headers["x-db-query-count"] == "3"
+    assert float(response.headers["x-db-duration-ms"]) >= 0
+    warnings = [record for record in caplog.records if "possible N+1" in record.getMessage()]
+    assert len(warnings) == 1
+    assert warnings[0].repeat_count == 3
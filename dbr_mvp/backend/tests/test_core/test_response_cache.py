@@ -0,0 +1,98 @@
+# tests/test_core/test_response_cache.py
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+
+@pytest.fixture
+def session():
+    """Create an isolated in-memory database session"""
+    from dbr.models.base import Base
+    from dbr.models.user import User  # Import to ensure table is created  # noqa: F401
+
+    engine = create_engine("sqlite:///:memory:")
+    Base.metadata.create_all(engine)
+    session = sessionmaker(bind=engine)()
+    try:
+        yield session
+    finally:
+        session.close()
+        engine.dispose()
+
+
+@pytest.fixture
+def board_config(session):
+    from dbr.models.organization import Organization, OrganizationStatus
+    from dbr.models.ccr import CCR, CCRType
+    from dbr.models.board_config import BoardConfig
+
+    org = Organization(name="Cache Org", status=OrganizationStatus.ACTIVE, contact_email="cache@example.com", country="US")
+    session.add(org)
+    session.commit()
+    ccr = CCR(organization_id=org.id, name="Developers", ccr_type=CCRType.TEAM_BASED, capacity_per_time_unit=40.0)
+    session.add(ccr)
+    session.commit()
+    board_config = BoardConfig(organization_id=org.id, name="Cache Board", ccr_id=ccr.id)
+    session.add(board_config)
+    session.commit()
+    return board_config
+
+
+def test_versioned_cache_lru_and_ttl():
+    """Entries are served only at their version, expire after the TTL and are evicted least recently used"""
+    from dbr.core.response_cache import VersionedCache
+
+    cache = VersionedCache(maxsize=2, ttl=60.0)
+    cache.put("a", (1,), {"value": 1})
+    cache.put("b", (1,), {"value": 2})
+
+    hit = cache.get("a", (1,))
+    assert hit == {"value": 1}
+    hit["value"] = 99  # Hits are copies
+    assert cache.get("a", (1,)) == {"value": 1}
+    assert cache.get("a", (2,)) is None
+
+    cache.put("c", (1,), {"value": 3})
+    assert cache.get("b", (1,)) is None  # Least recently used
+    assert cache.get("a", (1,)) == {"value": 1}
+
+    expired = VersionedCache(ttl=0.0)
+    expired.put("a", (1,), {"value": 1})
+    assert expired.get("a", (1,)) is None
+
+
+def test_buffer_health_cached_until_write_or_tick(session, board_config):
+    """Buffer health is served from memory until a schedule write or a tick commits"""
+    from dbr.models.schedule import Schedule, ScheduleStatus
+    from dbr.models.organization import advance_organization_time_unit
+    from dbr.core.response_cache import analytics_cache
+    from dbr.services.buffer_zone_manager import BufferZoneManager
+
+    analytics_cache.clear()
+    manager = BufferZoneManager(session)
+    assert manager.get_buffer_health_metrics(board_config.id)["pre_constraint"]["occupancy_count"] == 0
+    manager.get_buffer_health_metrics(board_config.id)
+    assert analytics_cache.hits == 1
+
+    # The writing session reads its own uncommitted schedule, then everyone sees it after commit
+    session.add(Schedule(
+        organization_id=board_config.organization_id,
+        board_config_id=board_config.id,
+        capability_channel_id=board_config.ccr_id,
+        status=ScheduleStatus.PLANNING,
+        work_item_ids=[],
+        time_unit_position=-1,
+        total_ccr_hours=0.0
+    ))
+    assert manager.get_buffer_health_metrics(board_config.id)["pre_constraint"]["occupancy_count"] == 1
+    session.commit()
+    assert manager.get_buffer_health_metrics(board_config.id)["pre_constraint"]["occupancy_count"] == 1
+    assert analytics_cache.hits == 1
+
+    # A tick invalidates the cache even without schedule changes
+    manager.get_buffer_health_metrics(board_config.id)
+    assert analytics_cache.hits == 2
+    advance_organization_time_unit(session, board_config.organization_id)
+    session.commit()
+    manager.get_buffer_health_metrics(board_config.id)
+    assert analytics_cache.hits == 2
@@ -79,19 +79,23 @@ def test_time_progression_basic():
             session.add(collection)
             session.commit()
 
-            work_item = WorkItem(
-                organization_id=org.id,
-                collection_id=collection.id,
-                title="Test Work Item",
-                description="Test work item",
-                status=WorkItemStatus.READY,
-                priority=WorkItemPriority.MEDIUM,
-                estimated_total_hours=8.0,
-                ccr_hours_required={"senior_developers": 8.0},
-                estimated_sales_price=1000.0,
-                estimated_variable_cost=200.0,
-            )
-            session.add(work_item)
+            # One work item per schedule: a work item can only be in one active schedule
+            work_items = []
+            for i in range(3):
+                work_item = WorkItem(
+                    organization_id=org.id,
+                    collection_id=collection.id,
+                    title=f"Test Work Item {i + 1}",
+                    description="Test work item",
+                    status=WorkItemStatus.READY,
+                    priority=WorkItemPriority.MEDIUM,
+                    estimated_total_hours=8.0,
+                    ccr_hours_required={"senior_developers": 8.0},
+                    estimated_sales_price=1000.0,
+                    estimated_variable_cost=200.0,
+                )
+                work_items.append(work_item)
+                session.add(work_item)
             session.commit()
 
             # Create schedules at different positions
@@ -102,7 +106,7 @@ def test_time_progression_basic():
                     board_config_id=board_config.id,
                     capability_channel_id=ccr.id,
                     status=ScheduleStatus.PLANNING,
-                    work_item_ids=[work_item.id],
+                    work_item_ids=[work_items[i].id],
                     total_ccr_hours=8.0,
                     time_unit_position=-3 + i,  # Positions: -3, -2, -1
                 )
@@ -615,3 +615,342 @@ def test_schedule_work_item_management():
             assert schedule.total_ccr_hours == 0.0
     finally:
         engine.dispose()
+
+
+def test_schedule_item_membership():
+    """Test schedule membership rows, reverse lookup and the one-active-schedule rule"""
+    from sqlalchemy.exc import IntegrityError
+    from dbr.models.schedule import Schedule, ScheduleStatus, backfill_schedule_items
+    from dbr.models.schedule_item import ScheduleItem
+    from dbr.models.work_item import WorkItem, WorkItemStatus
+    from dbr.models.organization import Organization, OrganizationStatus
+    from dbr.models.ccr import CCR, CCRType
+    from dbr.models.board_config import BoardConfig
+    from dbr.models.user import User  # Import to ensure table is created  # noqa: F401
+    from dbr.models.role import Role  # Import to ensure table is created  # noqa: F401
+    from dbr.models.base import Base
+
+    engine = create_engine("sqlite:///:memory:")
+    try:
+        Base.metadata.create_all(engine)
+        SessionLocal = sessionmaker(bind=engine)
+
+        with SessionLocal() as session:
+            org = Organization(
+                name="Test Organization",
+                status=OrganizationStatus.ACTIVE,
+                contact_email="test@org.com",
+                country="US",
+            )
+            session.add(org)
+            session.commit()
+
+            ccr = CCR(
+                organization_id=org.id,
+                name="Senior Developers",
+                ccr_type=CCRType.SKILL_BASED,
+                capacity_per_time_unit=40.0,
+            )
+            session.add(ccr)
+            session.commit()
+
+            board_config = BoardConfig(
+                organization_id=org.id,
+                name="Default Board",
+                ccr_id=ccr.id,
+                pre_constraint_buffer_size=5,
+                post_constraint_buffer_size=3,
+            )
+            session.add(board_config)
+            session.commit()
+
+            work_items = [
+                WorkItem(organization_id=org.id, title=f"Work Item {i + 1}", status=WorkItemStatus.READY)
+                for i in range(3)
+            ]
+            session.add_all(work_items)
+            session.commit()
+
+            def make_schedule(work_item_ids, status=ScheduleStatus.PLANNING):
+                return Schedule(
+                    organization_id=org.id,
+                    board_config_id=board_config.id,
+                    capability_channel_id=ccr.id,
+                    status=status,
+                    work_item_ids=work_item_ids,
+                    time_unit_position=-1,
+                )
+
+            schedule = make_schedule([work_items[1].id, work_items[0].id])
+            session.add(schedule)
+            session.commit()
+
+            # Test: Membership is stored as ordered rows
+            rows = session.query(ScheduleItem).filter_by(schedule_id=schedule.id).order_by(ScheduleItem.ordinal).all()
+            assert [(row.work_item_id, row.ordinal) for row in rows] == [(work_items[1].id, 0), (work_items[0].id, 1)]
+
+            # Test: Reverse lookup by work item
+            assert Schedule.get_active_schedule_for_work_item(session, work_items[0].id).id == schedule.id
+            assert Schedule.get_active_schedule_for_work_item(session, work_items[2].id) is None
+
+            # Test: A work item cannot sit in two active schedules
+            session.add(make_schedule([work_items[0].id]))
+            with pytest.raises(IntegrityError):
+                session.commit()
+            session.rollback()
+
+            # Test: Completing a schedule frees its work items
+            schedule.status = ScheduleStatus.COMPLETED
+            session.commit()
+            assert Schedule.get_active_schedule_for_work_item(session, work_items[0].id) is None
+            session.add(make_schedule([work_items[0].id]))
+            session.commit()
+
+            # Test: Legacy JSON membership is backfilled into rows
+            legacy = make_schedule([])
+            legacy.legacy_work_item_ids = [work_items[2].id]
+            session.add(legacy)
+            session.commit()
+            assert backfill_schedule_items(session) == 1
+            session.refresh(legacy)
+            assert legacy.work_item_ids == [work_items[2].id]
+            assert legacy.legacy_work_item_ids == []
+    finally:
+        engine.dispose()
+
+
+
+def test_schedule_item_edits_are_logged_on_schedule():
+    """Test that reordering and editing membership rows log a schedule update and bump its version"""
+    from dbr.core.data_version import get_data_version
+    from dbr.models.change_log import ChangeLogEntry
+    from dbr.models.schedule import Schedule, ScheduleStatus
+    from dbr.models.work_item import WorkItem, WorkItemStatus
+    from dbr.models.organization import Organization, OrganizationStatus
+    from dbr.models.ccr import CCR, CCRType
+    from dbr.models.board_config import BoardConfig
+    from dbr.models.base import Base
+
+    engine = create_engine("sqlite:///:memory:")
+    try:
+        Base.metadata.create_all(engine)
+        SessionLocal = sessionmaker(bind=engine)
+
+        with SessionLocal() as session:
+            org = Organization(
+                name="Test Organization",
+                status=OrganizationStatus.ACTIVE,
+                contact_email="test@org.com",
+                country="US",
+            )
+            session.add(org)
+            session.commit()
+
+            ccr = CCR(
+                organization_id=org.id,
+                name="Senior Developers",
+                ccr_type=CCRType.SKILL_BASED,
+                capacity_per_time_unit=40.0,
+            )
+            session.add(ccr)
+            session.commit()
+
+            board_config = BoardConfig(organization_id=org.id, name="Default Board", ccr_id=ccr.id)
+            session.add(board_config)
+            session.commit()
+
+            work_items = [
+                WorkItem(organization_id=org.id, title=f"Work Item {i + 1}", status=WorkItemStatus.READY)
+                for i in range(2)
+            ]
+            session.add_all(work_items)
+            session.commit()
+
+            schedule = Schedule(
+                organization_id=org.id,
+                board_config_id=board_config.id,
+                capability_channel_id=ccr.id,
+                status=ScheduleStatus.PLANNING,
+                work_item_ids=[work_items[0].id, work_items[1].id],
+                time_unit_position=-1,
+            )
+            session.add(schedule)
+            session.commit()
+
+            def logged_ops():
+                return [entry.op for entry in session.query(ChangeLogEntry).filter_by(
+                    entity_id=schedule.id
+                ).order_by(ChangeLogEntry.seq)]
+
+            assert logged_ops() == ["insert"]
+            version = get_data_version(org.id, "schedules")
+
+            # Test: A reorder only changes schedule_items rows but is logged on the schedule
+            schedule.work_item_ids = [work_items[1].id, work_items[0].id]
+            session.commit()
+            assert logged_ops() == ["insert", "update"]
+            assert get_data_version(org.id, "schedules") != version
+
+            # Test: So is a membership row edited on its own
+            first, second = schedule.items
+            first.ordinal, second.ordinal = second.ordinal, first.ordinal
+            session.commit()
+            assert logged_ops() == ["insert", "update", "update"]
+    finally:
+        engine.dispose()
+
+
+def test_schedule_capacity_ledger():
+    """Test CCR slot bookings follow schedules through creation, ticks, moves, completion and deletion"""
+    from dbr.core.scheduling import ScheduleValidationError
+    from dbr.models.schedule import Schedule, ScheduleStatus
+    from dbr.models.ccr_capacity_ledger import CCRCapacityLedger, get_booked_hours
+    from dbr.models.organization import Organization, OrganizationStatus, advance_organization_time_unit
+    from dbr.models.ccr import CCR, CCRType
+    from dbr.models.board_config import BoardConfig
+    from dbr.models.user import User  # Import to ensure table is created  # noqa: F401
+    from dbr.models.role import Role  # Import to ensure table is created  # noqa: F401
+    from dbr.models.base import Base
+
+    engine = create_engine("sqlite:///:memory:")
+    try:
+        Base.metadata.create_all(engine)
+        SessionLocal = sessionmaker(bind=engine)
+
+        with SessionLocal() as session:
+            org = Organization(
+                name="Test Organization",
+                status=OrganizationStatus.ACTIVE,
+                contact_email="test@org.com",
+                country="US",
+            )
+            session.add(org)
+            session.commit()
+
+            ccr = CCR(
+                organization_id=org.id,
+                name="Senior Developers",
+                ccr_type=CCRType.SKILL_BASED,
+                capacity_per_time_unit=40.0,
+            )
+            session.add(ccr)
+            session.commit()
+
+            board_config = BoardConfig(
+                organization_id=org.id,
+                name="Default Board",
+                ccr_id=ccr.id,
+                pre_constraint_buffer_size=5,
+                post_constraint_buffer_size=3,
+            )
+            session.add(board_config)
+            session.commit()
+
+            def make_schedule(position, hours):
+                return Schedule(
+                    organization_id=org.id,
+                    board_config_id=board_config.id,
+                    capability_channel_id=ccr.id,
+                    status=ScheduleStatus.PLANNING,
+                    work_item_ids=[],
+                    total_ccr_hours=hours,
+                    time_unit_position=position,
+                )
+
+            def booked():
+                return get_booked_hours(session, ccr.id, -10, 10)
+
+            schedule = make_schedule(-2, 24.0)
+            session.add(schedule)
+            session.commit()
+
+            # Test: A new schedule books its hours on the slot where it reaches the CCR
+            assert schedule.ccr_slot == 2
+            assert booked() == {2: 24.0}
+
+            # Test: Validation counts hours already booked on the slot
+            competing = make_schedule(-2, 24.0)
+            with pytest.raises(ScheduleValidationError, match="hours free in slot 2"):
+                competing.validate_capacity(session)
+            make_schedule(-3, 24.0).validate_capacity(session)
+
+            # Test: A tick moves schedules and the organization counter together; the booking stays
+            schedule.advance_position()
+            advance_organization_time_unit(session, org.id)
+            session.commit()
+            assert org.current_time_unit == 1
+            assert booked() == {2: 24.0}
+
+            # Test: Moving and editing a schedule moves its booking
+            schedule.time_unit_position = -3
+            schedule.total_ccr_hours = 16.0
+            session.commit()
+            assert booked() == {4: 16.0}
+            assert [entry["headroom_hours"] for entry in ccr.get_capacity_headroom(session, 3, 2)] == [40.0, 24.0]
+
+            # Test: Completing before reaching the CCR releases the booking
+            schedule.status = ScheduleStatus.COMPLETED
+            session.commit()
+            assert booked() == {}
+            assert session.query(CCRCapacityLedger).count() == 0
+
+            # Test: Completing after the CCR keeps the booking; deleting releases it
+            passed = make_schedule(1, 8.0)
+            session.add(passed)
+            session.commit()
+            passed.status = ScheduleStatus.COMPLETED
+            session.commit()
+            assert booked() == {0: 8.0}
+            session.delete(passed)
+            session.commit()
+            assert booked() == {}
+    finally:
+        engine.dispose()
+
+
+def test_capacity_ledger_concurrent_bookings(tmp_path):
+    """Test that bookings of one slot from sessions with stale ledger rows all count"""
+    from dbr.models.ccr_capacity_ledger import CCRCapacityLedger, apply_booking, get_booked_hours
+    from dbr.models.organization import Organization, OrganizationStatus
+    from dbr.models.ccr import CCR, CCRType
+    from dbr.models.base import Base
+
+    engine = create_engine(f"sqlite:///{tmp_path / 'ledger.db'}")
+    try:
+        Base.metadata.create_all(engine)
+        SessionLocal = sessionmaker(bind=engine)
+
+        with SessionLocal() as session:
+            org = Organization(
+                name="Test Organization",
+                status=OrganizationStatus.ACTIVE,
+                contact_email="test@org.com",
+                country="US",
+            )
+            session.add(org)
+            session.commit()
+            ccr = CCR(organization_id=org.id, name="Developers", ccr_type=CCRType.TEAM_BASED, capacity_per_time_unit=40.0)
+            session.add(ccr)
+            session.commit()
+            org_id, ccr_id = org.id, ccr.id
+            apply_booking(session, org_id, ccr_id, 3, 8.0, 1)
+            session.commit()
+
+        with SessionLocal() as first, SessionLocal() as second:
+            # The first session has read the slot before the second books it
+            entry = first.query(CCRCapacityLedger).filter_by(ccr_id=ccr_id, slot=3).one()
+            assert entry.booked_hours == 8.0
+            apply_booking(second, org_id, ccr_id, 3, 10.0, 1)
+            second.commit()
+            apply_booking(first, org_id, ccr_id, 3, 5.0, 1)
+            first.commit()
+
+            assert get_booked_hours(first, ccr_id, 3, 3) == {3: 23.0}
+            assert entry.schedule_count == 3
+
+            # Releasing every schedule drops the slot
+            apply_booking(first, org_id, ccr_id, 3, -23.0, -3)
+            first.commit()
+            assert first.query(CCRCapacityLedger).count() == 0
+    finally:
+        engine.dispose()
@@ -369,3 +369,278 @@ def test_work_item_ccr_hours_json():
             assert retrieved_item.ccr_hours_required["product_manager"] == 4.0
     finally:
         engine.dispose()
+
+
+def test_work_item_ccr_hours_table_sync():
+    """Test that CCR hours are mirrored into the normalized work_item_ccr_hours table"""
+    from dbr.models.work_item import WorkItem, WorkItemStatus, backfill_work_item_ccr_hours
+    from dbr.models.work_item_ccr_hours import WorkItemCCRHours, sum_ccr_hours, sum_ccr_hours_by_work_item
+    from dbr.models.organization import Organization, OrganizationStatus
+    from dbr.models.ccr import CCR, CCRType
+    from dbr.models.user import User  # Import to ensure table is created  # noqa: F401
+    from dbr.models.role import Role  # Import to ensure table is created  # noqa: F401
+    from dbr.models.base import Base
+
+    engine = create_engine("sqlite:///:memory:")
+    try:
+        Base.metadata.create_all(engine)
+        SessionLocal = sessionmaker(bind=engine)
+
+        with SessionLocal() as session:
+            org = Organization(
+                name="Test Organization",
+                status=OrganizationStatus.ACTIVE,
+                contact_email="test@org.com",
+                country="US",
+            )
+            session.add(org)
+            session.commit()
+
+            ccr = CCR(
+                organization_id=org.id,
+                name="Senior Developer",
+                ccr_type=CCRType.SKILL_BASED,
+                capacity_per_time_unit=40.0,
+            )
+            session.add(ccr)
+            session.commit()
+
+            items = [
+                WorkItem(
+                    organization_id=org.id,
+                    title=f"Item {i}",
+                    status=WorkItemStatus.READY,
+                    ccr_hours_required={"senior_developer": 8.0 * (i + 1), "qa_engineer": 2.0},
+                )
+                for i in range(2)
+            ]
+            session.add_all(items)
+            session.commit()
+
+            # Test: Rows are created on insert and resolved to the CCR by name key
+            rows = session.query(WorkItemCCRHours).filter_by(work_item_id=items[0].id).all()
+            assert {row.ccr_key: row.hours for row in rows} == {"senior_developer": 8.0, "qa_engineer": 2.0}
+            assert {row.ccr_key: row.ccr_id for row in rows} == {"senior_developer": ccr.id, "qa_engineer": None}
+
+            # Test: SQL aggregates match the JSON sums
+            item_ids = [item.id for item in items]
+            assert sum_ccr_hours(session, item_ids) == 28.0
+            assert sum_ccr_hours(session, item_ids, ccr.id) == 24.0
+            assert sum_ccr_hours_by_work_item(session, item_ids) == {items[0].id: 10.0, items[1].id: 18.0}
+
+            # Test: Updates and removals are synced
+            items[0].update_ccr_hours("senior_developer", 12.0)
+            items[1].ccr_hours_required = {"senior_developer": 16.0}
+            session.commit()
+            assert sum_ccr_hours(session, item_ids) == 30.0
+            assert session.query(WorkItemCCRHours).filter_by(work_item_id=items[1].id).count() == 1
+
+            # Test: Deleting a work item removes its rows
+            session.delete(items[1])
+            session.commit()
+            assert session.query(WorkItemCCRHours).filter_by(work_item_id=item_ids[1]).count() == 0
+
+            # Test: Backfill rebuilds rows for items that have none
+            session.query(WorkItemCCRHours).delete()
+            session.commit()
+            session.expire_all()
+            assert backfill_work_item_ccr_hours(session) == 1
+            assert sum_ccr_hours(session, item_ids) == 14.0
+
+            # Test: Rows written before their CCR existed are resolved when it is created
+            qa = CCR(
+                organization_id=org.id,
+                name="QA Engineer",
+                ccr_type=CCRType.SKILL_BASED,
+                capacity_per_time_unit=20.0,
+            )
+            session.add(qa)
+            session.commit()
+            assert sum_ccr_hours(session, item_ids, qa.id) == 2.0
+
+            # Test: Renaming a CCR keeps its hours, also when the item is edited afterwards
+            ccr.name = "Lead Developer"
+            session.commit()
+            assert sum_ccr_hours(session, item_ids, ccr.id) == 12.0
+            items[0].update_ccr_hours("senior_developer", 10.0)
+            session.commit()
+            assert sum_ccr_hours(session, item_ids, ccr.id) == 10.0
+
+            # Test: Backfill resolves rows that have no CCR yet
+            session.query(WorkItemCCRHours).update({WorkItemCCRHours.ccr_id: None})
+            session.commit()
+            backfill_work_item_ccr_hours(session)
+            assert sum_ccr_hours(session, item_ids, qa.id) == 2.0
+    finally:
+        engine.dispose()
+
+
+def test_work_item_task_rows_and_counters():
+    """Test that tasks are stored as rows with maintained progress counters"""
+    from dbr.models.work_item import WorkItem, WorkItemStatus, backfill_work_item_tasks
+    from dbr.models.work_item_task import WorkItemTask
+    from dbr.models.organization import Organization, OrganizationStatus
+    from dbr.models.user import User  # Import to ensure table is created  # noqa: F401
+    from dbr.models.role import Role  # Import to ensure table is created  # noqa: F401
+    from dbr.models.base import Base
+
+    engine = create_engine("sqlite:///:memory:")
+    try:
+        Base.metadata.create_all(engine)
+        SessionLocal = sessionmaker(bind=engine)
+
+        with SessionLocal() as session:
+            org = Organization(
+                name="Test Organization",
+                status=OrganizationStatus.ACTIVE,
+                contact_email="test@org.com",
+                country="US",
+            )
+            session.add(org)
+            session.commit()
+
+            work_item = WorkItem(
+                organization_id=org.id,
+                title="Checklist",
+                status=WorkItemStatus.IN_PROGRESS,
+                tasks=[
+                    {"id": 1, "title": "First", "completed": True},
+                    {"title": "Second"},
+                    {"id": 7, "title": "Third"},
+                ],
+            )
+            session.add(work_item)
+            session.commit()
+
+            # Test: Rows keep order, and tasks without IDs get the next free one
+            rows = session.query(WorkItemTask).filter_by(work_item_id=work_item.id).order_by(WorkItemTask.ordinal).all()
+            assert [(row.task_number, row.title) for row in rows] == [(1, "First"), (8, "Second"), (7, "Third")]
+            assert (work_item.task_count, work_item.completed_task_count) == (3, 1)
+
+            # Test: Single and batch updates maintain the counters
+            work_item.update_task(8, completed=True)
+            assert work_item.set_tasks_completed([1, 7, 42], completed=False) == [42]
+            session.commit()
+            assert (work_item.task_count, work_item.completed_task_count) == (3, 1)
+            assert work_item.calculate_progress() == pytest.approx(1 / 3)
+
+            # Test: Removing a task updates the counters
+            assert work_item.remove_task(8) is True
+            session.commit()
+            assert (work_item.task_count, work_item.completed_task_count) == (2, 0)
+            assert session.query(WorkItemTask).filter_by(work_item_id=work_item.id).count() == 2
+
+            # Test: Legacy JSON tasks are backfilled into rows
+            legacy = WorkItem(organization_id=org.id, title="Legacy", status=WorkItemStatus.READY)
+            legacy.legacy_tasks = [{"id": 1, "title": "Old", "completed": True}, {"id": 2, "title": "Older"}]
+            session.add(legacy)
+            session.commit()
+            assert backfill_work_item_tasks(session) == 1
+            session.refresh(legacy)
+            assert legacy.tasks == [
+                {"id": 1, "title": "Old", "completed": True},
+                {"id": 2, "title": "Older", "completed": False},
+            ]
+            assert legacy.calculate_progress() == 0.5
+            assert legacy.legacy_tasks == []
+    finally:
+        engine.dispose()
+
+
+def test_task_edit_is_tracked_on_work_item():
+    """Test that a task edit leaving the counters alone still logs a work item change and bumps its version"""
+    from dbr.core.data_version import get_data_version
+    from dbr.models.change_log import ChangeLogEntry
+    from dbr.models.work_item import WorkItem, WorkItemStatus
+    from dbr.models.organization import Organization, OrganizationStatus
+    from dbr.models.base import Base
+
+    engine = create_engine("sqlite:///:memory:")
+    try:
+        Base.metadata.create_all(engine)
+        SessionLocal = sessionmaker(bind=engine)
+
+        with SessionLocal() as session:
+            org = Organization(
+                name="Test Organization",
+                status=OrganizationStatus.ACTIVE,
+                contact_email="test@org.com",
+                country="US",
+            )
+            session.add(org)
+            session.commit()
+
+            work_item = WorkItem(
+                organization_id=org.id,
+                title="Checklist",
+                status=WorkItemStatus.IN_PROGRESS,
+                tasks=[{"id": 1, "title": "First"}],
+            )
+            session.add(work_item)
+            session.commit()
+            changes = session.query(ChangeLogEntry).filter_by(entity_id=work_item.id).count()
+            version = get_data_version(org.id, "work_items")
+
+            work_item.update_task(1, title="Renamed")
+            session.commit()
+
+            assert session.query(ChangeLogEntry).filter_by(entity_id=work_item.id, op="update").count() == 1
+            assert session.query(ChangeLogEntry).filter_by(entity_id=work_item.id).count() == changes + 1
+            assert get_data_version(org.id, "work_items") != version
+    finally:
+        engine.dispose()
+
+
+def test_task_counters_recounted_from_rows(tmp_path):
+    """Test that concurrent task completions and out-of-sync counters end up matching the task rows"""
+    from sqlalchemy import text
+    from dbr.models.work_item import WorkItem, WorkItemStatus
+    from dbr.models.organization import Organization, OrganizationStatus
+    from dbr.models.base import Base
+
+    engine = create_engine(f"sqlite:///{tmp_path / 'tasks.db'}")
+    try:
+        Base.metadata.create_all(engine)
+        SessionLocal = sessionmaker(bind=engine)
+
+        with SessionLocal() as session:
+            org = Organization(
+                name="Test Organization",
+                status=OrganizationStatus.ACTIVE,
+                contact_email="test@org.com",
+                country="US",
+            )
+            session.add(org)
+            session.commit()
+            work_item = WorkItem(
+                organization_id=org.id,
+                title="Checklist",
+                status=WorkItemStatus.IN_PROGRESS,
+                tasks=[{"id": 1, "title": "First"}, {"id": 2, "title": "Second"}, {"id": 3, "title": "Third"}],
+            )
+            session.add(work_item)
+            session.commit()
+            work_item_id = work_item.id
+
+        # Two sessions complete different tasks from the same loaded state
+        with SessionLocal() as first, SessionLocal() as second:
+            first_item = first.get(WorkItem, work_item_id)
+            second_item = second.get(WorkItem, work_item_id)
+            assert first_item.tasks and second_item.tasks
+            first_item.update_task(1, completed=True)
+            first.commit()
+            second_item.update_task(2, completed=True)
+            second.commit()
+            assert (second_item.task_count, second_item.completed_task_count) == (3, 2)
+
+        # A stale counter is corrected by the next task change
+        with SessionLocal() as session:
+            session.execute(text("UPDATE work_items SET completed_task_count = 0"))
+            session.commit()
+            work_item = session.get(WorkItem, work_item_id)
+            work_item.update_task(3, completed=True)
+            session.commit()
+            assert work_item.completed_task_count == 3
+            assert work_item.progress == 1.0
+    finally:
+        engine.dispose()
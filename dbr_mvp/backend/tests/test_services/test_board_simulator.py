@@ -0,0 +1,186 @@
+# tests/test_services/test_board_simulator.py
+import pytest
+import numpy as np
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from dbr.models.base import Base
+from dbr.models.organization import Organization, OrganizationStatus
+from dbr.models.schedule import Schedule, ScheduleStatus
+from dbr.models.ccr import CCR, CCRType
+from dbr.models.board_config import BoardConfig
+from dbr.services.board_simulator import BoardSimulator, STATUS_BY_CODE
+from dbr.services.dbr_engine import DBREngine
+from dbr.services.delivery_forecaster import DeliveryForecaster
+from dbr.core.time_progression import TimeProgressionEngine
+
+
+@pytest.fixture
+def session():
+    """Create an isolated in-memory database session"""
+    engine = create_engine("sqlite:///:memory:")
+    Base.metadata.create_all(engine)
+    session = sessionmaker(bind=engine)()
+    try:
+        yield session
+    finally:
+        session.close()
+        engine.dispose()
+
+
+@pytest.fixture
+def board(session):
+    """Create an organization with one board (pre=3, post=2) and four schedules"""
+    org = Organization(
+        name="Simulator Org",
+        status=OrganizationStatus.ACTIVE,
+        contact_email="sim@example.com",
+        country="US"
+    )
+    session.add(org)
+    session.commit()
+
+    ccr = CCR(
+        organization_id=org.id,
+        name="Test CCR",
+        ccr_type=CCRType.SKILL_BASED,
+        capacity_per_time_unit=40.0
+    )
+    session.add(ccr)
+    session.commit()
+
+    board_config = BoardConfig(
+        organization_id=org.id,
+        name="Simulator Board",
+        ccr_id=ccr.id,
+        pre_constraint_buffer_size=3,
+        post_constraint_buffer_size=2
+    )
+    session.add(board_config)
+    session.commit()
+
+    layout = [
+        (-3, ScheduleStatus.PLANNING, 10.0),
+        (-1, ScheduleStatus.PRE_CONSTRAINT, 20.0),
+        (0, ScheduleStatus.PRE_CONSTRAINT, 30.0),
+        (2, ScheduleStatus.POST_CONSTRAINT, 5.0),
+    ]
+    schedules = []
+    for position, status, hours in layout:
+        schedule = Schedule(
+            organization_id=org.id,
+            board_config_id=board_config.id,
+            capability_channel_id=ccr.id,
+            status=status,
+            work_item_ids=[],
+            time_unit_position=position,
+            total_ccr_hours=hours
+        )
+        schedules.append(schedule)
+    session.add_all(schedules)
+    session.commit()
+    return org, board_config, schedules
+
+
+def test_snapshot_is_array_based(session, board):
+    """The snapshot holds compact arrays for every active schedule"""
+    org, board_config, schedules = board
+
+    snapshot = BoardSimulator(session).snapshot(org.id)
+
+    assert snapshot.board_config_ids == [board_config.id]
+    assert snapshot.schedule_count == 4
+    assert sorted(snapshot.positions.tolist()) == [-3, -1, 0, 2]
+    assert snapshot.ccr_hours.sum() == pytest.approx(65.0)
+    assert snapshot.pre_buffer_sizes.tolist() == [3]
+    assert snapshot.post_buffer_sizes.tolist() == [2]
+
+
+def test_simulate_zone_occupancy_and_completions(session, board):
+    """Zone occupancy and completions are reported for every simulated unit"""
+    org, board_config, schedules = board
+
+    simulator = BoardSimulator(session)
+    result = simulator.simulate(simulator.snapshot(org.id), 4)
+
+    # unit 0 is the current board
+    assert result["pre_constraint"][:, 0].tolist() == [2, 1, 1, 0, 0]
+    assert result["constraint"][:, 0].tolist() == [1, 1, 0, 1, 0]
+    assert result["post_constraint"][:, 0].tolist() == [1, 1, 2, 1, 1]
+    assert result["completions"][:, 0].tolist() == [0, 1, 0, 1, 1]
+    assert result["constraint_hours"][:, 0].tolist() == [30.0, 20.0, 0.0, 10.0, 0.0]
+
+
+def test_simulation_never_touches_live_objects(session, board):
+    """Simulating does not mutate schedules or leave pending session changes"""
+    org, board_config, schedules = board
+    positions_before = [s.time_unit_position for s in schedules]
+
+    engine = TimeProgressionEngine(session)
+    report = engine.simulate_time_progression(org.id, 10)
+
+    assert report["simulated_time_units"] == 10
+    assert len(report["simulation_results"]) == 11
+    assert report["total_completed_schedules"] == 4
+    assert [s.time_unit_position for s in schedules] == positions_before
+    assert not session.dirty
+    assert all(s.status != ScheduleStatus.COMPLETED for s in schedules)
+
+
+def test_simulate_long_horizon(session, board):
+    """Horizons of hundreds of units run in memory and drain the board"""
+    org, board_config, schedules = board
+
+    simulator = BoardSimulator(session)
+    result = simulator.simulate(simulator.snapshot(org.id), 500)
+
+    assert result["pre_constraint"].shape == (501, 1)
+    assert result["completions"].sum() == 4
+    assert np.all(result["final_statuses"] == 3)
+
+
+@pytest.mark.parametrize("post_buffer_size", [1, 2, 4])
+@pytest.mark.parametrize("live_engine", ["dbr_engine", "time_progression"])
+def test_simulation_agrees_with_live_ticks(session, board, post_buffer_size, live_engine):
+    """Simulated units match both live ticks, whatever the post-constraint buffer size"""
+    org, board_config, schedules = board
+    board_config.post_constraint_buffer_size = post_buffer_size
+    # A schedule reaching the post-constraint buffer and, on small boards, leaving it in one unit
+    schedules[1].time_unit_position = 2
+    session.commit()
+
+    simulator = BoardSimulator(session)
+    snapshot = simulator.snapshot(org.id)
+    result = simulator.simulate(snapshot, 8)
+
+    if live_engine == "dbr_engine":
+        tick = DBREngine(session).advance_time_unit
+    else:
+        tick = TimeProgressionEngine(session).advance_time
+    for unit in range(1, 9):
+        assert tick(org.id)["completed_schedules_count"] == result["completions"][unit, 0]
+
+    schedules_by_id = {s.id: s for s in schedules}
+    live = [schedules_by_id[schedule_id] for schedule_id in snapshot.schedule_ids]
+    assert result["final_positions"].tolist() == [s.time_unit_position for s in live]
+    simulated_statuses = [STATUS_BY_CODE[code] for code in result["final_statuses"]]
+    if live_engine == "time_progression":
+        assert simulated_statuses == [s.status for s in live]
+    completed = ScheduleStatus.COMPLETED
+    assert [status == completed for status in simulated_statuses] == [s.status == completed for s in live]
+
+
+@pytest.mark.parametrize("post_buffer_size", [1, 2, 4])
+def test_forecast_agrees_with_simulation(session, board, post_buffer_size):
+    """Without variance or slips the forecaster completes schedules when the simulator does"""
+    org, board_config, schedules = board
+    board_config.post_constraint_buffer_size = post_buffer_size
+    session.commit()
+
+    simulator = BoardSimulator(session)
+    snapshot = simulator.snapshot(org.id)
+    result = simulator.simulate(snapshot, 10)
+    units = DeliveryForecaster(session).simulate_completion_units(
+        snapshot, np.array([1000.0]), runs=1, ccr_hours_cv=0.0, slip_probability=0.0
+    )
+
+    assert units[0].tolist() == result["completion_unit"].tolist()
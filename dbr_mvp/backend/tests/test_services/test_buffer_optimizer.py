@@ -0,0 +1,121 @@
+# tests/test_services/test_buffer_optimizer.py
+import pytest
+from datetime import datetime, timedelta
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from dbr.models.base import Base
+from dbr.models.organization import Organization, OrganizationStatus
+from dbr.models.schedule import Schedule, ScheduleStatus
+from dbr.models.ccr import CCR, CCRType
+from dbr.models.board_config import BoardConfig
+from dbr.services.buffer_optimizer import BufferOptimizer
+from dbr.services.buffer_zone_manager import BufferZoneManager
+
+
+START = datetime(2025, 1, 6)
+
+
+@pytest.fixture
+def session():
+    """Create an isolated in-memory database session"""
+    engine = create_engine("sqlite:///:memory:")
+    Base.metadata.create_all(engine)
+    session = sessionmaker(bind=engine)()
+    try:
+        yield session
+    finally:
+        session.close()
+        engine.dispose()
+
+
+@pytest.fixture
+def board_with_history(session):
+    """A board whose history is a burst of six one-unit schedules in week 0"""
+    org = Organization(
+        name="Optimizer Org",
+        status=OrganizationStatus.ACTIVE,
+        contact_email="optimizer@example.com",
+        country="US"
+    )
+    session.add(org)
+    session.commit()
+
+    ccr = CCR(
+        organization_id=org.id,
+        name="Test CCR",
+        ccr_type=CCRType.SKILL_BASED,
+        capacity_per_time_unit=40.0
+    )
+    session.add(ccr)
+    session.commit()
+
+    board_config = BoardConfig(
+        organization_id=org.id,
+        name="Optimizer Board",
+        ccr_id=ccr.id,
+        pre_constraint_buffer_size=5,
+        post_constraint_buffer_size=3,
+        time_unit="week"
+    )
+    session.add(board_config)
+    session.commit()
+
+    for i in range(6):
+        session.add(Schedule(
+            organization_id=org.id,
+            board_config_id=board_config.id,
+            capability_channel_id=ccr.id,
+            status=ScheduleStatus.COMPLETED,
+            work_item_ids=[],
+            time_unit_position=4,
+            total_ccr_hours=30.0,
+            created_date=START + timedelta(hours=i)
+        ))
+    session.commit()
+    return board_config
+
+
+def test_load_history(session, board_with_history):
+    """History is built from recorded schedules on the board"""
+    history = BufferOptimizer(session).load_history(board_with_history.id)
+
+    assert history.schedule_count == 6
+    assert history.arrival_units.tolist() == [0] * 6
+    assert history.ccr_units.tolist() == [1] * 6
+
+
+def test_small_buffers_starve_the_ccr(session, board_with_history):
+    """A buffer smaller than the release-to-CCR transit starves the constraint"""
+    optimizer = BufferOptimizer(session)
+    history = optimizer.load_history(board_with_history.id)
+
+    replay = optimizer.replay(history, [1, 2, 3, 6], transit_units=3)
+
+    starvation = replay["starvation_units"].tolist()
+    assert starvation[0] > starvation[1] > 0
+    assert starvation[2] == 0
+    assert starvation[3] == 0
+
+
+def test_optimize_reports_trade_off_and_recommendation(session, board_with_history):
+    """The sweep recommends the smallest buffer that keeps the CCR fed"""
+    optimizer = BufferOptimizer(session)
+
+    result = optimizer.optimize(board_with_history.id, pre_sizes=range(1, 7), transit_units=3)
+
+    assert result["history_schedules"] == 6
+    assert len(result["pre_constraint_candidates"]) == 6
+    wip = [c["average_wip"] for c in result["pre_constraint_candidates"]]
+    assert wip == sorted(wip)
+    assert result["recommendation"]["pre_constraint_buffer_size"] == 3
+    assert len(result["threshold_candidates"]) == 5
+
+    optimizer.apply_recommendation(board_with_history.id, result["recommendation"])
+    thresholds = BufferZoneManager(session).get_zone_color_thresholds(board_with_history.id)
+    assert thresholds["pre_constraint"]["red_threshold"] == 3
+
+
+def test_optimize_rejects_unknown_board(session):
+    """Unknown boards raise ValueError"""
+    with pytest.raises(ValueError):
+        BufferOptimizer(session).optimize("missing-board")
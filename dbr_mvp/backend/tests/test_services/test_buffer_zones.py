@@ -306,4 +306,129 @@ def test_buffer_zone_penetration_detection(session, test_organization, test_boar
     alerts = buffer_manager.generate_buffer_alerts(test_board_config.id)
     penetration_alerts = [alert for alert in alerts if "penetration" in alert.message.lower()]
     assert len(penetration_alerts) >= 1
-    assert penetration_alerts[0].severity == "CRITICAL"
\ No newline at end of file
+    assert penetration_alerts[0].severity == "CRITICAL"
+
+def test_buffer_dashboard_uses_single_snapshot(session, test_organization, test_board_config, test_work_items):
+    """Alerts, penetration and health for one board are answered from two queries"""
+    from sqlalchemy import event
+
+    for i, position in enumerate([-6, -3, -1, 0, 2]):
+        session.add(Schedule(
+            organization_id=test_organization.id,
+            board_config_id=test_board_config.id,
+            capability_channel_id=test_board_config.ccr_id,
+            status=ScheduleStatus.PLANNING,
+            work_item_ids=[test_work_items[i].id],
+            time_unit_position=position,
+            total_ccr_hours=8.0
+        ))
+    session.commit()
+    board_config_id = test_board_config.id
+    session.expire_all()
+
+    statements = []
+
+    def count_statement(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    engine = session.get_bind()
+    event.listen(engine, "before_cursor_execute", count_statement)
+    try:
+        dashboard = BufferZoneManager(session).get_buffer_dashboard(board_config_id)
+    finally:
+        event.remove(engine, "before_cursor_execute", count_statement)
+
+    assert len(statements) == 2
+    assert dashboard["health"]["total_schedules"] == 5
+    assert dashboard["health"]["ccr_occupied"]
+    assert dashboard["penetration"]["overflow_positions"] == [-6]
+    assert any(alert.severity == "CRITICAL" for alert in dashboard["alerts"])
+
+    # The snapshot can be reused by the individual methods without re-querying
+    buffer_manager = BufferZoneManager(session)
+    snapshot = buffer_manager.get_snapshot(board_config_id)
+    assert buffer_manager.calculate_zone_status(board_config_id, snapshot) == snapshot.zone_status()
+    assert buffer_manager.get_buffer_health_metrics(board_config_id, snapshot)["pre_constraint"]["occupancy_count"] == 3
+
+
+def test_organization_buffer_health(session, test_organization, test_board_config, test_work_items):
+    """Every active board of an organization is summarized from one schedule query"""
+    second_board = BoardConfig(
+        organization_id=test_organization.id,
+        name="Second Board",
+        ccr_id=test_board_config.ccr_id,
+        pre_constraint_buffer_size=2,
+        post_constraint_buffer_size=2,
+        time_unit="week"
+    )
+    session.add(second_board)
+    session.commit()
+
+    placements = [(test_board_config.id, -1), (test_board_config.id, 1), (second_board.id, -3), (second_board.id, -2)]
+    for i, (board_config_id, position) in enumerate(placements):
+        session.add(Schedule(
+            organization_id=test_organization.id,
+            board_config_id=board_config_id,
+            capability_channel_id=test_board_config.ccr_id,
+            status=ScheduleStatus.PLANNING,
+            work_item_ids=[test_work_items[i].id],
+            time_unit_position=position,
+            total_ccr_hours=8.0
+        ))
+    session.commit()
+
+    buffer_manager = BufferZoneManager(session)
+    snapshots = buffer_manager.get_organization_snapshots(test_organization.id)
+    assert sorted(snapshots[test_board_config.id].positions) == [-1, 1]
+    assert sorted(snapshots[second_board.id].positions) == [-3, -2]
+
+    health = buffer_manager.get_organization_buffer_health(test_organization.id)
+    assert health["board_count"] == 2
+    assert health["overall_status"] == BufferZoneStatus.CRITICAL
+    by_board = {board["board_config_id"]: board for board in health["boards"]}
+    assert by_board[second_board.id]["penetration"]["overflow_positions"] == [-3]
+    assert not by_board[test_board_config.id]["penetration"]["has_penetration"]
+    assert health["alert_count"] == sum(len(board["alerts"]) for board in health["boards"])
+
+
+def test_buffer_history_recorded_per_tick(session, test_organization, test_board_config, test_work_items):
+    """Each time unit tick appends the board's buffer state to the history"""
+    from dbr.core.time_manager import TimeManager
+    from dbr.services.dbr_engine import DBREngine
+
+    for i, position in enumerate([-1, 3]):
+        session.add(Schedule(
+            organization_id=test_organization.id,
+            board_config_id=test_board_config.id,
+            capability_channel_id=test_board_config.ccr_id,
+            status=ScheduleStatus.PRE_CONSTRAINT,
+            work_item_ids=[test_work_items[i].id],
+            time_unit_position=position,
+            total_ccr_hours=8.0
+        ))
+    session.commit()
+
+    time_manager = TimeManager()
+    time_manager.set_current_time(datetime(2025, 1, 6, tzinfo=timezone.utc))
+    try:
+        engine = DBREngine(session, time_manager)
+        engine.advance_time_unit(test_organization.id)
+        engine.advance_time_unit(test_organization.id)
+    finally:
+        time_manager.reset()
+
+    buffer_manager = BufferZoneManager(session)
+    history = buffer_manager.get_buffer_history(test_board_config.id)
+
+    assert len(history) == 2
+    assert history[0]["recorded_at"].startswith("2025-01-13")
+    assert history[0]["ccr_occupied"]
+    assert history[0]["pre_constraint_count"] == 0
+    assert history[0]["completed_count"] == 1
+    assert history[1]["post_constraint_count"] == 1
+    assert history[1]["post_constraint_percentage"] == 33.33
+    assert history[1]["cumulative_completed_count"] == 1
+
+    # Range queries only return ticks inside the window
+    later = buffer_manager.get_buffer_history(test_board_config.id, start=datetime(2025, 1, 15))
+    assert [point["recorded_at"][:10] for point in later] == ["2025-01-20"]
@@ -0,0 +1,123 @@
+# tests/test_services/test_capacity_calendar.py
+import pytest
+import numpy as np
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from dbr.models.base import Base
+from dbr.models.organization import Organization, OrganizationStatus
+from dbr.models.schedule import Schedule, ScheduleStatus
+from dbr.models.ccr import CCR, CCRType
+from dbr.models.ccr_capacity_exception import CCRCapacityException
+from dbr.models.ccr_user_association import CCRUserAssociation
+from dbr.models.board_config import BoardConfig
+from dbr.models.user import User  # Import to ensure table is created  # noqa: F401
+from dbr.services.capacity_calendar import CapacityCalendar
+
+
+@pytest.fixture
+def session():
+    """Create an isolated in-memory database session"""
+    engine = create_engine("sqlite:///:memory:")
+    Base.metadata.create_all(engine)
+    session = sessionmaker(bind=engine)()
+    try:
+        yield session
+    finally:
+        session.close()
+        engine.dispose()
+
+
+@pytest.fixture
+def organization(session):
+    """An organization with a staffed CCR and a fixed-capacity CCR"""
+    org = Organization(
+        name="Calendar Org",
+        status=OrganizationStatus.ACTIVE,
+        contact_email="calendar@example.com",
+        country="US"
+    )
+    session.add(org)
+    session.commit()
+
+    developers = CCR(
+        organization_id=org.id,
+        name="Developers",
+        ccr_type=CCRType.TEAM_BASED,
+        capacity_per_time_unit=80.0
+    )
+    testers = CCR(
+        organization_id=org.id,
+        name="Testers",
+        ccr_type=CCRType.SKILL_BASED,
+        capacity_per_time_unit=20.0
+    )
+    session.add_all([developers, testers])
+    session.commit()
+
+    # Two permanent developers and a contractor for slots 2-3
+    session.add_all([
+        CCRUserAssociation(ccr_id=developers.id, user_id="user-1", capacity_contribution=40.0),
+        CCRUserAssociation(ccr_id=developers.id, user_id="user-2", capacity_contribution=40.0),
+        CCRUserAssociation(ccr_id=developers.id, user_id="user-3", capacity_contribution=20.0, start_slot=2, end_slot=3),
+        CCRUserAssociation(ccr_id=developers.id, user_id="user-4", capacity_contribution=40.0, is_active=False),
+    ])
+
+    # Holiday in slot 1, a three-day week in slot 3 and a fixed 5 hours for testers in slot 4
+    session.add_all([
+        CCRCapacityException(organization_id=org.id, ccr_id=developers.id, start_slot=1, end_slot=1,
+                             capacity_factor=0.0, reason="Holiday"),
+        CCRCapacityException(organization_id=org.id, ccr_id=developers.id, start_slot=3, end_slot=3,
+                             capacity_factor=0.6, reason="Short week"),
+        CCRCapacityException(organization_id=org.id, ccr_id=testers.id, start_slot=4, end_slot=6,
+                             capacity_hours=5.0, reason="Training"),
+    ])
+    session.commit()
+    return org
+
+
+def test_capacity_matrix(session, organization):
+    """Contributions, windows and exceptions are materialized per slot"""
+    calendar = CapacityCalendar(session)
+    horizon = calendar.get_horizon(organization.id, slots=6)
+
+    assert horizon.ccr_names == ("Developers", "Testers")
+    np.testing.assert_allclose(horizon.capacity, [
+        [80.0, 0.0, 100.0, 60.0, 80.0, 80.0],
+        [20.0, 20.0, 20.0, 20.0, 5.0, 5.0],
+    ])
+
+    developers = session.query(CCR).filter_by(name="Developers").one()
+    np.testing.assert_allclose(calendar.get_capacity(developers, 3, 2), [60.0, 80.0])
+
+
+def test_load_analysis(session, organization):
+    """Booked hours from the ledger are compared against calendar capacity"""
+    developers = session.query(CCR).filter_by(name="Developers").one()
+    board_config = BoardConfig(organization_id=organization.id, name="Board", ccr_id=developers.id)
+    session.add(board_config)
+    session.commit()
+
+    # One schedule reaches the CCR in the holiday slot, another in slot 2
+    for position, hours in ((-1, 30.0), (-2, 90.0)):
+        session.add(Schedule(
+            organization_id=organization.id,
+            board_config_id=board_config.id,
+            capability_channel_id=developers.id,
+            status=ScheduleStatus.PLANNING,
+            work_item_ids=[],
+            time_unit_position=position,
+            total_ccr_hours=hours
+        ))
+    session.commit()
+
+    analysis = CapacityCalendar(session).get_load_analysis(organization.id, slots=4)
+
+    assert analysis["slots"] == [0, 1, 2, 3]
+    assert analysis["overloaded_ccr_count"] == 1
+    dev = analysis["ccrs"][0]
+    assert dev["booked_hours"] == [0.0, 30.0, 90.0, 0.0]
+    assert dev["headroom_hours"] == [80.0, -30.0, 10.0, 60.0]
+    assert dev["overloaded_slots"] == [1]
+    assert dev["utilization"][1] is None
+    assert dev["utilization"][2] == pytest.approx(0.9)
+    assert analysis["ccrs"][1]["peak_utilization"] == 0.0
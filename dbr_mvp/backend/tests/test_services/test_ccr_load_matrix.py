@@ -0,0 +1,175 @@
+# tests/test_services/test_ccr_load_matrix.py
+import pytest
+import numpy as np
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from dbr.models.base import Base
+from dbr.models.organization import Organization, OrganizationStatus
+from dbr.models.ccr import CCR, CCRType
+from dbr.models.work_item import WorkItem, WorkItemStatus
+from dbr.services.ccr_load_matrix import CCRLoadMatrixService
+
+
+@pytest.fixture
+def session():
+    """Create an isolated in-memory database session"""
+    engine = create_engine("sqlite:///:memory:")
+    Base.metadata.create_all(engine)
+    session = sessionmaker(bind=engine)()
+    try:
+        yield session
+    finally:
+        session.close()
+        engine.dispose()
+
+
+@pytest.fixture
+def organization(session):
+    """An organization with three CCRs and work items spread across them"""
+    org = Organization(
+        name="Matrix Org",
+        status=OrganizationStatus.ACTIVE,
+        contact_email="matrix@example.com",
+        country="US"
+    )
+    session.add(org)
+    session.commit()
+
+    for name, capacity in (("Senior Developers", 40.0), ("QA Engineers", 30.0), ("DevOps Team", 20.0)):
+        session.add(CCR(organization_id=org.id, name=name, ccr_type=CCRType.SKILL_BASED, capacity_per_time_unit=capacity))
+
+    for title, hours, status in (
+        ("Feature A", {"senior_developers": 20.0, "qa_engineers": 10.0}, WorkItemStatus.READY),
+        ("Feature B", {"senior_developers": 15.0, "qa_engineers": 8.0, "devops_team": 5.0}, WorkItemStatus.READY),
+        ("Feature C", {"senior_developers": 10.0, "devops_team": 12.0}, WorkItemStatus.READY),
+        ("Feature D", {"devops_team": 30.0, "unknown_ccr": 99.0}, WorkItemStatus.DONE),
+    ):
+        session.add(WorkItem(organization_id=org.id, title=title, status=status, ccr_hours_required=hours))
+    session.commit()
+    return org
+
+
+def _work_item_id(session, title):
+    return session.query(WorkItem).filter_by(title=title).one().id
+
+
+def test_matrix_and_bottlenecks(session, organization):
+    """Demand per CCR and bottleneck ranking come from the items x CCRs matrix"""
+    service = CCRLoadMatrixService(session)
+    matrix = service.get_matrix(organization.id)
+
+    assert matrix.hours.shape == (4, 3)
+    assert matrix.ccr_names == ("DevOps Team", "QA Engineers", "Senior Developers")
+    np.testing.assert_allclose(matrix.demand(), [47.0, 18.0, 45.0])
+
+    result = service.identify_bottlenecks(organization.id)
+    assert [b["ccr_name"] for b in result["bottlenecks"]] == ["DevOps Team", "Senior Developers"]
+    assert result["active_bottleneck_id"] == result["bottlenecks"][0]["ccr_id"]
+
+    # Without Done work items only Senior Developers is over capacity
+    result = service.identify_bottlenecks(organization.id, include_done=False)
+    assert result["work_item_count"] == 3
+    assert [b["ccr_name"] for b in result["bottlenecks"]] == ["Senior Developers"]
+    assert [ccr.name for ccr in CCR.identify_bottlenecks(session, organization.id)] == ["DevOps Team", "Senior Developers"]
+
+
+def test_feasibility(session, organization):
+    """Candidate sets are checked against every CCR at once"""
+    service = CCRLoadMatrixService(session)
+    feature_a = _work_item_id(session, "Feature A")
+    feature_b = _work_item_id(session, "Feature B")
+    feature_c = _work_item_id(session, "Feature C")
+
+    fits, too_big, unknown = service.check_feasibility(
+        organization.id, [[feature_a, feature_b], [feature_a, feature_b, feature_c], ["missing"]]
+    )
+
+    assert fits["feasible"] is True
+    assert fits["demand"] == pytest.approx(dict(zip(
+        service.get_matrix(organization.id).ccr_ids, [5.0, 18.0, 35.0]
+    )))
+    assert too_big["feasible"] is False
+    senior_developers = session.query(CCR).filter_by(name="Senior Developers").one()
+    assert too_big["over_capacity_ccr_ids"] == [senior_developers.id]
+    assert too_big["limiting_ccr_id"] == senior_developers.id
+    assert unknown["feasible"] is False
+    assert unknown["unknown_work_item_ids"] == ["missing"]
+
+    # A tighter capacity (e.g. a slot's headroom) can be supplied per CCR
+    [result] = service.check_feasibility(organization.id, [[feature_a]], capacity=[40.0, 5.0, 40.0])
+    assert result["feasible"] is False
+
+
+def test_matrix_cache_invalidation(session, organization):
+    """The matrix is reused until a work item or CCR of the organization changes"""
+    service = CCRLoadMatrixService(session)
+    matrix = service.get_matrix(organization.id)
+    assert CCRLoadMatrixService(session).get_matrix(organization.id) is matrix
+
+    work_item = session.query(WorkItem).filter_by(title="Feature A").one()
+    work_item.ccr_hours_required = {"senior_developers": 1.0}
+    session.commit()
+
+    rebuilt = service.get_matrix(organization.id)
+    assert rebuilt is not matrix
+    np.testing.assert_allclose(rebuilt.demand(), [47.0, 8.0, 26.0])
+
+    # Rolled back changes do not invalidate the cache
+    work_item.title = "Renamed"
+    session.flush()
+    session.rollback()
+    assert service.get_matrix(organization.id) is rebuilt
+
+
+
+def _demand(session, organization_id, ccr_name):
+    rows = CCRLoadMatrixService(session).get_ccr_demand(organization_id)
+    return next(row["demand"] for row in rows if row["ccr_name"] == ccr_name)
+
+
+@pytest.fixture
+def two_sessions(tmp_path):
+    """A writer and a reader session on one file database, with an organization and a QA CCR"""
+    CCRLoadMatrixService.clear_cache()
+    engine = create_engine(f"sqlite:///{tmp_path / 'matrix.db'}")
+    Base.metadata.create_all(engine)
+    Session = sessionmaker(bind=engine)
+    writer, reader = Session(), Session()
+    org = Organization(name="Pending Org", status=OrganizationStatus.ACTIVE, contact_email="p@example.com", country="US")
+    writer.add(org)
+    writer.commit()
+    writer.add(CCR(organization_id=org.id, name="QA Engineers", ccr_type=CCRType.SKILL_BASED, capacity_per_time_unit=30.0))
+    writer.commit()
+    try:
+        yield writer, reader, org.id
+    finally:
+        writer.close()
+        reader.close()
+        engine.dispose()
+        CCRLoadMatrixService.clear_cache()
+
+
+def _add_pending_work_item(session, organization_id):
+    session.add(WorkItem(organization_id=organization_id, title="Pending", status=WorkItemStatus.READY,
+                         ccr_hours_required={"qa_engineers": 50.0}))
+    session.flush()
+
+
+def test_matrix_reads_own_uncommitted_changes(two_sessions):
+    """A session with flushed writes gets a matrix of its own writes, not the cached one"""
+    writer, reader, organization_id = two_sessions
+    assert _demand(reader, organization_id, "QA Engineers") == 0.0
+
+    _add_pending_work_item(writer, organization_id)
+    assert _demand(writer, organization_id, "QA Engineers") == 50.0
+
+
+def test_matrix_of_uncommitted_changes_not_cached(two_sessions):
+    """A matrix built from flushed rows is not served to other sessions after a rollback"""
+    writer, reader, organization_id = two_sessions
+    _add_pending_work_item(writer, organization_id)
+    assert _demand(writer, organization_id, "QA Engineers") == 50.0
+
+    writer.rollback()
+    assert _demand(reader, organization_id, "QA Engineers") == 0.0
+    assert _demand(writer, organization_id, "QA Engineers") == 0.0
@@ -0,0 +1,193 @@
+# tests/test_services/test_delivery_forecaster.py
+import pytest
+import numpy as np
+from datetime import datetime, timedelta, timezone
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from dbr.models.base import Base
+from dbr.models.organization import Organization, OrganizationStatus
+from dbr.models.collection import Collection, CollectionStatus
+from dbr.models.schedule import Schedule, ScheduleStatus
+from dbr.models.work_item import WorkItem, WorkItemStatus
+from dbr.models.ccr import CCR, CCRType
+from dbr.models.board_config import BoardConfig
+from dbr.core.time_manager import TimeManager
+from dbr.services.board_simulator import BoardSimulator
+from dbr.services.delivery_forecaster import DeliveryForecaster
+
+
+NOW = datetime(2025, 1, 6, tzinfo=timezone.utc)
+
+
+@pytest.fixture
+def session():
+    """Create an isolated in-memory database session"""
+    engine = create_engine("sqlite:///:memory:")
+    Base.metadata.create_all(engine)
+    session = sessionmaker(bind=engine)()
+    try:
+        yield session
+    finally:
+        session.close()
+        engine.dispose()
+
+
+@pytest.fixture
+def time_manager():
+    """Pin the system time for deterministic forecast dates"""
+    manager = TimeManager()
+    manager.set_current_time(NOW)
+    yield manager
+    manager.reset()
+
+
+@pytest.fixture
+def board(session):
+    """Create a board (pre=2, post=1) with two schedules and a collection"""
+    org = Organization(
+        name="Forecast Org",
+        status=OrganizationStatus.ACTIVE,
+        contact_email="forecast@example.com",
+        country="US"
+    )
+    session.add(org)
+    session.commit()
+
+    ccr = CCR(
+        organization_id=org.id,
+        name="Test CCR",
+        ccr_type=CCRType.SKILL_BASED,
+        capacity_per_time_unit=40.0
+    )
+    session.add(ccr)
+    session.commit()
+
+    board_config = BoardConfig(
+        organization_id=org.id,
+        name="Forecast Board",
+        ccr_id=ccr.id,
+        pre_constraint_buffer_size=2,
+        post_constraint_buffer_size=1,
+        time_unit="week"
+    )
+    collection = Collection(
+        organization_id=org.id,
+        name="Release 1",
+        status=CollectionStatus.ACTIVE,
+        target_completion_date=datetime(2025, 2, 3)
+    )
+    session.add_all([board_config, collection])
+    session.commit()
+
+    items = [
+        WorkItem(
+            organization_id=org.id,
+            collection_id=collection.id,
+            title=f"Item {i}",
+            status=WorkItemStatus.IN_PROGRESS,
+            estimated_total_hours=10.0,
+            ccr_hours_required={"test_ccr": 30.0},
+        )
+        for i in range(2)
+    ]
+    session.add_all(items)
+    session.commit()
+
+    schedules = [
+        Schedule(
+            organization_id=org.id,
+            board_config_id=board_config.id,
+            capability_channel_id=ccr.id,
+            status=ScheduleStatus.PRE_CONSTRAINT,
+            work_item_ids=[items[0].id],
+            time_unit_position=0,
+            total_ccr_hours=30.0
+        ),
+        Schedule(
+            organization_id=org.id,
+            board_config_id=board_config.id,
+            capability_channel_id=ccr.id,
+            status=ScheduleStatus.PLANNING,
+            work_item_ids=[items[1].id],
+            time_unit_position=-2,
+            total_ccr_hours=30.0
+        ),
+    ]
+    session.add_all(schedules)
+    session.commit()
+    return org, board_config, collection, schedules
+
+
+def test_deterministic_forecast_without_variance(session, board, time_manager):
+    """With no variance every run completes exactly when the board says"""
+    org, board_config, collection, schedules = board
+
+    result = DeliveryForecaster(session, time_manager).forecast(
+        org.id, runs=100, ccr_hours_cv=0.0, slip_probability=0.0
+    )
+
+    by_id = {s["schedule_id"]: s for s in result["schedules"]}
+    # position 0 with post=1 completes after 2 advances, position -2 after 4
+    assert by_id[schedules[0].id]["p50_date"] == (NOW + timedelta(weeks=2)).isoformat()
+    assert by_id[schedules[1].id]["p95_date"] == (NOW + timedelta(weeks=4)).isoformat()
+
+    [collection_forecast] = result["collections"]
+    assert collection_forecast["collection_id"] == collection.id
+    assert collection_forecast["p50_date"] == (NOW + timedelta(weeks=4)).isoformat()
+    assert collection_forecast["on_time_probability"] == 1.0
+
+
+def test_ccr_overrun_delays_schedules_behind(session, board, time_manager):
+    """Hours that overflow the CCR hold it and push queued schedules back"""
+    org, board_config, collection, schedules = board
+    simulator = BoardSimulator(session)
+    snapshot = simulator.snapshot(org.id)
+    forecaster = DeliveryForecaster(session, time_manager)
+
+    # 30h on a 20h CCR needs two units at the constraint
+    units = forecaster.simulate_completion_units(
+        snapshot, np.array([20.0]), runs=10, ccr_hours_cv=0.0, slip_probability=0.0
+    )
+    by_position = dict(zip(snapshot.positions.tolist(), units[0].tolist()))
+    assert by_position[0] == 3
+    assert by_position[-2] == 6
+
+
+def test_percentiles_are_ordered_with_variance(session, board, time_manager):
+    """Slippage and hours variance spread the forecast into ordered percentiles"""
+    org, board_config, collection, schedules = board
+
+    result = DeliveryForecaster(session, time_manager).forecast(
+        org.id, runs=10000, ccr_hours_cv=0.5, slip_probability=0.3, seed=7
+    )
+
+    for forecast in result["schedules"] + result["collections"]:
+        assert forecast["p50_date"] <= forecast["p85_date"] <= forecast["p95_date"]
+    [collection_forecast] = result["collections"]
+    assert 0.0 < collection_forecast["on_time_probability"] < 1.0
+
+
+def test_forecast_rejects_invalid_parameters(session, board, time_manager):
+    """Invalid sampling parameters raise ValueError"""
+    org, board_config, collection, schedules = board
+    forecaster = DeliveryForecaster(session, time_manager)
+
+    with pytest.raises(ValueError):
+        forecaster.forecast(org.id, runs=0)
+    with pytest.raises(ValueError):
+        forecaster.forecast(org.id, slip_probability=1.0)
+
+
+def test_on_time_probability_mixes_naive_and_aware_dates():
+    """Naive and timezone-aware dates are compared in UTC"""
+    days = np.array([7.0, 14.0, 21.0, 28.0])
+    # 15 days after NOW, written in UTC-05:00
+    target = datetime(2025, 1, 20, 19, tzinfo=timezone(timedelta(hours=-5)))
+
+    naive_now = DeliveryForecaster._summarize(days, NOW.replace(tzinfo=None), target)
+    aware_now = DeliveryForecaster._summarize(days, NOW, target)
+    naive_target = DeliveryForecaster._summarize(days, NOW, datetime(2025, 1, 21))
+
+    assert naive_now["on_time_probability"] == 0.5
+    assert aware_now["on_time_probability"] == 0.5
+    assert naive_target["on_time_probability"] == 0.5
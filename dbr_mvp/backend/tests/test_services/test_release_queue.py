@@ -0,0 +1,188 @@
+# tests/test_services/test_release_queue.py
+import pytest
+from datetime import datetime, timezone
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from dbr.models.base import Base
+from dbr.models.organization import Organization, OrganizationStatus
+from dbr.models.schedule import Schedule
+from dbr.models.ccr import CCR, CCRType
+from dbr.models.ccr_capacity_exception import CCRCapacityException
+from dbr.models.ccr_capacity_ledger import get_booked_hours
+from dbr.models.board_config import BoardConfig
+from dbr.models.work_item import WorkItem, WorkItemPriority, WorkItemStatus
+from dbr.core.scheduling import SchedulingEngine
+from dbr.services.release_queue import ReleaseQueue
+
+
+@pytest.fixture
+def session():
+    """Create an isolated in-memory database session"""
+    ReleaseQueue.clear_cache()
+    engine = create_engine("sqlite:///:memory:")
+    Base.metadata.create_all(engine)
+    session = sessionmaker(bind=engine)()
+    try:
+        yield session
+    finally:
+        session.close()
+        engine.dispose()
+        ReleaseQueue.clear_cache()
+
+
+@pytest.fixture
+def board_config(session):
+    """A board with a two-slot pre-constraint buffer"""
+    org = Organization(
+        name="Rope Org",
+        status=OrganizationStatus.ACTIVE,
+        contact_email="rope@example.com",
+        country="US"
+    )
+    session.add(org)
+    session.commit()
+
+    ccr = CCR(organization_id=org.id, name="Developers", ccr_type=CCRType.TEAM_BASED, capacity_per_time_unit=100.0)
+    session.add(ccr)
+    session.commit()
+
+    board_config = BoardConfig(
+        organization_id=org.id,
+        name="Rope Board",
+        ccr_id=ccr.id,
+        pre_constraint_buffer_size=2,
+        post_constraint_buffer_size=2
+    )
+    session.add(board_config)
+    session.commit()
+    return board_config
+
+
+def _create(session, board_config, title, priority=WorkItemPriority.MEDIUM, due_date=None):
+    work_item = WorkItem(
+        organization_id=board_config.organization_id,
+        title=title,
+        status=WorkItemStatus.READY,
+        priority=priority,
+        due_date=due_date,
+        ccr_hours_required={"developers": 10.0}
+    )
+    session.add(work_item)
+    session.commit()
+    return SchedulingEngine(session).create_schedule(board_config.organization_id, board_config.id, [work_item.id])
+
+
+def test_full_buffer_queues_new_schedules(session, board_config):
+    """Schedules go onto the board until the pre-constraint buffer is full, then into the queue"""
+    placed = [_create(session, board_config, f"Placed {i}") for i in range(2)]
+    queued = _create(session, board_config, "Queued")
+
+    assert [schedule.is_queued for schedule in placed] == [False, False]
+    assert queued.is_queued is True
+    assert queued.ccr_slot is None
+    assert queued.booked_ccr_hours == 0.0
+
+    # While a queue exists, newcomers wait behind it even if the buffer has room
+    assert ReleaseQueue(session).queued_count(board_config.id) == 1
+
+
+def test_ticks_release_by_priority_then_due_date(session, board_config):
+    """Each tick releases as many schedules as it frees slots, most urgent first"""
+    for i in range(2):
+        _create(session, board_config, f"Placed {i}")
+    low = _create(session, board_config, "Low", priority=WorkItemPriority.LOW)
+    late = _create(session, board_config, "High late", priority=WorkItemPriority.HIGH,
+                   due_date=datetime(2030, 6, 1, tzinfo=timezone.utc))
+    early = _create(session, board_config, "High early", priority=WorkItemPriority.HIGH,
+                    due_date=datetime(2030, 1, 1, tzinfo=timezone.utc))
+
+    queue = ReleaseQueue(session).get_queue(board_config.id)
+    assert [entry["schedule_id"] for entry in queue] == [early.id, late.id, low.id]
+
+    engine = SchedulingEngine(session)
+    # The placed schedules are still in the pre-constraint buffer after the first tick
+    assert engine.advance_all_schedules(board_config.organization_id)["released_schedules_count"] == 0
+    assert engine.advance_all_schedules(board_config.organization_id)["released_schedules_count"] == 2
+
+    assert early.is_queued is False and late.is_queued is False
+    assert early.time_unit_position == -board_config.pre_constraint_buffer_size
+    assert early.ccr_slot is not None
+    assert low.is_queued is True
+
+
+def test_stale_heap_entries_are_skipped(session, board_config):
+    """Schedules deleted while queued are dropped from the heap on release"""
+    for i in range(2):
+        _create(session, board_config, f"Placed {i}")
+    deleted = _create(session, board_config, "Deleted", priority=WorkItemPriority.CRITICAL)
+    kept = _create(session, board_config, "Kept")
+
+    release_queue = ReleaseQueue(session)
+    release_queue.get_queue(board_config.id)
+    assert len(release_queue._heap(board_config.id)) == 2
+
+    session.delete(deleted)
+    session.commit()
+
+    assert release_queue.release(board_config, 2) == [kept]
+    assert session.query(Schedule).filter_by(board_config_id=board_config.id, is_queued=True).count() == 0
+
+
+def test_release_respects_slot_headroom(session, board_config):
+    """Queued schedules stay queued while the slot they would book lacks CCR headroom"""
+    for i in range(2):
+        _create(session, board_config, f"Placed {i}")
+    queued = _create(session, board_config, "Queued")
+
+    # Schedules released on the second tick book slot 2 + 2; leave it 5 hours
+    exception = CCRCapacityException(
+        organization_id=board_config.organization_id, ccr_id=board_config.ccr_id,
+        start_slot=4, end_slot=4, capacity_hours=5.0
+    )
+    session.add(exception)
+    session.commit()
+
+    engine = SchedulingEngine(session)
+    engine.advance_all_schedules(board_config.organization_id)
+    assert engine.advance_all_schedules(board_config.organization_id)["released_schedules_count"] == 0
+    assert queued.is_queued is True
+    assert get_booked_hours(session, board_config.ccr_id, 4, 4) == {}
+
+    session.delete(exception)
+    session.commit()
+    assert engine.advance_all_schedules(board_config.organization_id)["released_schedules_count"] == 1
+    assert queued.is_queued is False
+
+
+def test_heap_follows_transaction_outcome(session, board_config):
+    """Heap entries are added on commit, and releases rolled back keep their place in the queue"""
+    for i in range(2):
+        _create(session, board_config, f"Placed {i}")
+    first = _create(session, board_config, "First", priority=WorkItemPriority.HIGH)
+    second = _create(session, board_config, "Second")
+
+    release_queue = ReleaseQueue(session)
+    assert len(release_queue._heap(board_config.id)) == 2
+
+    # A rolled back release does not lose the schedule's place
+    assert release_queue.release(board_config, 1) == [first]
+    session.rollback()
+    assert release_queue.release(board_config, 1) == [first]
+    session.rollback()
+
+    # Enqueued schedules only reach the heap once committed
+    assert len(release_queue._heap(board_config.id)) == 2
+    schedule = Schedule(
+        organization_id=board_config.organization_id,
+        board_config_id=board_config.id,
+        capability_channel_id=board_config.ccr_id,
+        work_item_ids=[],
+        total_ccr_hours=0.0
+    )
+    session.add(schedule)
+    release_queue.enqueue(schedule, board_config)
+    session.flush()
+    assert len(release_queue._heap(board_config.id)) == 2
+    session.commit()
+    assert len(release_queue._heap(board_config.id)) == 3
+    assert second.is_queued is True
@@ -0,0 +1,88 @@
+from collections import OrderedDict
+from threading import Lock
+from typing import NamedTuple, Optional, Union
+import httpx
+from .types import (
+    AfterSuccessContext,
+    AfterSuccessHook,
+    BeforeRequestContext,
+    BeforeRequestHook,
+)
+
+
+class _CachedResponse(NamedTuple):
+    etag: str
+    headers: httpx.Headers
+    content: bytes
+
+
+class ETagCacheHook(BeforeRequestHook, AfterSuccessHook):
+    """Conditional GETs against the DBR API's ETags.
+
+    Remembers the ETag and body of successful GET responses and sends the tag
+    back as ``If-None-Match``. When the server answers ``304 Not Modified``
+    the remembered body is replayed as a 200 response, so operations return
+    the same models without the payload being downloaded again. Entries are
+    keyed by URL and credentials and evicted least recently used.
+    """
+
+    def __init__(self, max_entries: int = 256):
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[tuple, _CachedResponse]" = OrderedDict()
+        self._lock = Lock()
+
+    @staticmethod
+    def _key(request: httpx.Request) -> tuple:
+        return (str(request.url), request.headers.get("authorization"))
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def before_request(
+        self, hook_ctx: BeforeRequestContext, request: httpx.Request
+    ) -> Union[httpx.Request, Exception]:
+        if request.method != "GET" or "if-none-match" in request.headers:
+            return request
+        with self._lock:
+            entry = self._entries.get(self._key(request))
+        if entry is not None:
+            request.headers["If-None-Match"] = entry.etag
+        return request
+
+    def after_success(
+        self, hook_ctx: AfterSuccessContext, response: httpx.Response
+    ) -> Union[httpx.Response, Exception]:
+        request = response.request
+        if request.method != "GET":
+            return response
+        key = self._key(request)
+
+        if response.status_code == 304:
+            with self._lock:
+                entry = self._entries.get(key)
+                if entry is not None:
+                    self._entries.move_to_end(key)
+            if entry is None:
+                return response
+            return httpx.Response(
+                200, headers=entry.headers, content=entry.content, request=request
+            )
+
+        etag = response.headers.get("etag")
+        content = _read_content(response)
+        if response.status_code == 200 and etag and content is not None:
+            with self._lock:
+                self._entries[key] = _CachedResponse(etag, response.headers, content)
+                self._entries.move_to_end(key)
+                while len(self._entries) > self.max_entries:
+                    self._entries.popitem(last=False)
+        return response
+
+
+def _read_content(response: httpx.Response) -> Optional[bytes]:
+    """Body of a response that has been read; streamed responses are not cached"""
+    try:
+        return response.content
+    except httpx.ResponseNotRead:
+        return None
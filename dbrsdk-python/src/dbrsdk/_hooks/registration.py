@@ -1,3 +1,4 @@
+from .etag_cache import ETagCacheHook
 from .types import Hooks
 
 
@@ -6,8 +7,14 @@ from .types import Hooks
 # in this file or in separate files in the hooks folder.
 
 
-def init_hooks(hooks: Hooks):
+def init_hooks(hooks: Hooks, etag_cache: bool = False):
     # pylint: disable=unused-argument
     """Add hooks by calling hooks.register{sdk_init/before_request/after_success/after_error}Hook
     with an instance of a hook that implements that specific Hook interface
     Hooks are registered per SDK instance, and are valid for the lifetime of the SDK instance"""
+
+    # Conditional GETs (opt-in): re-use cached bodies when the server answers 304 Not Modified
+    if etag_cache:
+        etag_cache_hook = ETagCacheHook()
+        hooks.register_before_request_hook(etag_cache_hook)
+        hooks.register_after_success_hook(etag_cache_hook)
@@ -13,14 +13,16 @@ from .types import (
 )
 from typing import List, Optional, Tuple
 from dbrsdk.sdkconfiguration import SDKConfiguration
+from .registration import init_hooks
 
 
 class SDKHooks(Hooks):
-    def __init__(self) -> None:
+    def __init__(self, etag_cache: bool = False) -> None:
         self.sdk_init_hooks: List[SDKInitHook] = []
         self.before_request_hooks: List[BeforeRequestHook] = []
         self.after_success_hooks: List[AfterSuccessHook] = []
         self.after_error_hooks: List[AfterErrorHook] = []
+        init_hooks(self, etag_cache=etag_cache)
 
     def register_sdk_init_hook(self, hook: SDKInitHook) -> None:
         self.sdk_init_hooks.append(hook)
@@ -0,0 +1,230 @@
+"""Batch requests (POST /api/v1/batch).
+
+Not generated: ``BatchBuilder`` collects sub-requests, lets later ones refer
+to fields of earlier responses, and sends them in a single round trip.
+
+    batch = sdk.batch.builder()
+    item = batch.post("/api/v1/workitems", body={...})
+    batch.post(f"/api/v1/workitems/{item['id']}/tasks",
+               query={"organization_id": org_id}, body={"title": "Review"})
+    response = batch.execute(atomic=True)
+"""
+
+from .basesdk import BaseSDK
+from dbrsdk import errors, models, utils
+from dbrsdk._hooks import HookContext
+from dbrsdk.types import BaseModel
+from dbrsdk.utils import get_security_from_env
+from dbrsdk.utils.unmarshal_json_response import unmarshal_json_response
+from typing import Any, Dict, List, Mapping, Optional
+
+
+class BatchOperation(BaseModel):
+    method: str
+    r"""HTTP method (GET, POST, PUT, PATCH or DELETE)"""
+
+    path: str
+    r"""API path, e.g. /api/v1/workitems; may contain ${index.field} references"""
+
+    query: Optional[Dict[str, Any]] = None
+    r"""Query parameters"""
+
+    body: Optional[Any] = None
+    r"""JSON request body"""
+
+    headers: Optional[Dict[str, str]] = None
+    r"""Additional request headers"""
+
+
+class BatchRequest(BaseModel):
+    operations: List[BatchOperation]
+    r"""Sub-requests, run in order"""
+
+    atomic: Optional[bool] = False
+    r"""Run all sub-requests in one transaction and roll it back if any fails"""
+
+
+class BatchOperationResult(BaseModel):
+    status: int
+    headers: Dict[str, str]
+    body: Optional[Any] = None
+
+
+class BatchResponse(BaseModel):
+    atomic: bool
+    committed: bool
+    results: List[BatchOperationResult]
+
+
+class BatchRef:
+    r"""Placeholder for the response of an earlier sub-request.
+
+    ``ref["id"]`` (or ``ref["collection.id"]``) is replaced by the server with
+    that field of the response body before the referring sub-request runs.
+    """
+
+    def __init__(self, index: int):
+        self.index = index
+
+    def __getitem__(self, field: str) -> str:
+        return "${%d.%s}" % (self.index, field)
+
+
+class BatchBuilder:
+    r"""Collects sub-requests for :meth:`Batch.execute`"""
+
+    def __init__(self, batch: "Batch"):
+        self._batch = batch
+        self.operations: List[BatchOperation] = []
+
+    def add(
+        self,
+        method: str,
+        path: str,
+        *,
+        query: Optional[Dict[str, Any]] = None,
+        body: Optional[Any] = None,
+        headers: Optional[Dict[str, str]] = None,
+    ) -> BatchRef:
+        self.operations.append(
+            BatchOperation(method=method, path=path, query=query, body=body, headers=headers)
+        )
+        return BatchRef(len(self.operations) - 1)
+
+    def get(self, path: str, **kwargs) -> BatchRef:
+        return self.add("GET", path, **kwargs)
+
+    def post(self, path: str, **kwargs) -> BatchRef:
+        return self.add("POST", path, **kwargs)
+
+    def put(self, path: str, **kwargs) -> BatchRef:
+        return self.add("PUT", path, **kwargs)
+
+    def patch(self, path: str, **kwargs) -> BatchRef:
+        return self.add("PATCH", path, **kwargs)
+
+    def delete(self, path: str, **kwargs) -> BatchRef:
+        return self.add("DELETE", path, **kwargs)
+
+    def execute(self, *, atomic: bool = False, **kwargs) -> BatchResponse:
+        return self._batch.execute(operations=self.operations, atomic=atomic, **kwargs)
+
+    async def execute_async(self, *, atomic: bool = False, **kwargs) -> BatchResponse:
+        return await self._batch.execute_async(operations=self.operations, atomic=atomic, **kwargs)
+
+
+class Batch(BaseSDK):
+    def builder(self) -> BatchBuilder:
+        r"""Start collecting sub-requests for one batch call"""
+        return BatchBuilder(self)
+
+    def _execute_request(
+        self,
+        operations: List[BatchOperation],
+        atomic: bool,
+        server_url: Optional[str],
+        timeout_ms: Optional[int],
+        http_headers: Optional[Mapping[str, str]],
+        build,
+    ):
+        if timeout_ms is None:
+            timeout_ms = self.sdk_configuration.timeout_ms
+        base_url = server_url if server_url is not None else self._get_url(None, None)
+        request = BatchRequest(operations=operations, atomic=atomic)
+        req = build(
+            method="POST",
+            path="/api/v1/batch",
+            base_url=base_url,
+            url_variables=None,
+            request=request,
+            request_body_required=True,
+            request_has_path_params=False,
+            request_has_query_params=False,
+            user_agent_header="user-agent",
+            accept_header_value="application/json",
+            http_headers=http_headers,
+            security=self.sdk_configuration.security,
+            get_serialized_body=lambda: utils.serialize_request_body(
+                request, False, False, "json", BatchRequest
+            ),
+            timeout_ms=timeout_ms,
+        )
+        hook_ctx = HookContext(
+            config=self.sdk_configuration,
+            base_url=base_url or "",
+            operation_id="run_batch_api_v1_batch_post",
+            oauth2_scopes=[],
+            security_source=get_security_from_env(
+                self.sdk_configuration.security, models.Security
+            ),
+        )
+        return req, hook_ctx
+
+    def _handle_response(self, http_res) -> BatchResponse:
+        if utils.match_response(http_res, "200", "application/json"):
+            return unmarshal_json_response(BatchResponse, http_res)
+        if utils.match_response(http_res, "422", "application/json"):
+            response_data = unmarshal_json_response(
+                errors.HTTPValidationErrorData, http_res
+            )
+            raise errors.HTTPValidationError(response_data, http_res)
+        raise errors.APIError("API error occurred", http_res, http_res.text)
+
+    def execute(
+        self,
+        *,
+        operations: List[BatchOperation],
+        atomic: bool = False,
+        server_url: Optional[str] = None,
+        timeout_ms: Optional[int] = None,
+        http_headers: Optional[Mapping[str, str]] = None,
+    ) -> BatchResponse:
+        r"""Run Batch
+
+        Run several API requests in one round trip, in order, with one shared
+        database session. Results come back in the same order.
+
+        :param operations: Sub-requests, run in order
+        :param atomic: Run all sub-requests in one transaction and roll it back if any fails
+        :param server_url: Override the default server URL for this method
+        :param timeout_ms: Override the default request timeout configuration for this method in milliseconds
+        :param http_headers: Additional headers to set or replace on requests.
+        """
+        req, hook_ctx = self._execute_request(
+            operations, atomic, server_url, timeout_ms, http_headers, self._build_request
+        )
+        http_res = self.do_request(
+            hook_ctx=hook_ctx,
+            request=req,
+            error_status_codes=["422", "4XX", "5XX"],
+        )
+        return self._handle_response(http_res)
+
+    async def execute_async(
+        self,
+        *,
+        operations: List[BatchOperation],
+        atomic: bool = False,
+        server_url: Optional[str] = None,
+        timeout_ms: Optional[int] = None,
+        http_headers: Optional[Mapping[str, str]] = None,
+    ) -> BatchResponse:
+        r"""Run Batch
+
+        Asynchronous variant of :meth:`execute`.
+
+        :param operations: Sub-requests, run in order
+        :param atomic: Run all sub-requests in one transaction and roll it back if any fails
+        :param server_url: Override the default server URL for this method
+        :param timeout_ms: Override the default request timeout configuration for this method in milliseconds
+        :param http_headers: Additional headers to set or replace on requests.
+        """
+        req, hook_ctx = self._execute_request(
+            operations, atomic, server_url, timeout_ms, http_headers, self._build_request_async
+        )
+        http_res = await self.do_request_async(
+            hook_ctx=hook_ctx,
+            request=req,
+            error_status_codes=["422", "4XX", "5XX"],
+        )
+        return self._handle_response(http_res)
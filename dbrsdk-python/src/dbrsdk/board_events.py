@@ -0,0 +1,168 @@
+"""Server-sent board change events (GET /api/v1/events).
+
+Not generated: the stream is consumed with the SDK's ``utils.eventstreaming``
+helpers, so clients can react to schedule moves, status changes, newly ready
+work items and buffer alerts instead of polling.
+"""
+
+from .basesdk import BaseSDK
+from dbrsdk import errors, models, utils
+from dbrsdk._hooks import HookContext
+from dbrsdk.types import BaseModel, OptionalNullable, UNSET, UNSET_SENTINEL
+from dbrsdk.utils import FieldMetadata, QueryParamMetadata
+from dbrsdk.utils.eventstreaming import EventStream, EventStreamAsync
+from dbrsdk.utils import get_security_from_env
+from pydantic import model_serializer
+from typing import Any, Dict, Mapping, Optional
+from typing_extensions import Annotated
+
+
+class StreamBoardEventsRequest(BaseModel):
+    organization_id: Annotated[
+        str, FieldMetadata(query=QueryParamMetadata(style="form", explode=True))
+    ]
+    r"""Organization ID to scope the request"""
+
+    board_config_id: Annotated[
+        OptionalNullable[str],
+        FieldMetadata(query=QueryParamMetadata(style="form", explode=True)),
+    ] = UNSET
+    r"""Only stream events of this board (plus organization-wide events)"""
+
+    @model_serializer(mode="wrap")
+    def serialize_model(self, handler):
+        serialized = handler(self)
+        return {
+            k: v
+            for k, v in serialized.items()
+            if v is not None and v != UNSET_SENTINEL
+        }
+
+
+class BoardEvent(BaseModel):
+    r"""One server-sent event.
+
+    ``event`` is the event type (``schedule_moved``, ``schedule_status_changed``,
+    ``work_item_ready``, ``buffer_alert``, or ``overflow`` when events were
+    dropped and board state should be refetched); ``data`` is its payload.
+    """
+
+    id: Optional[str] = None
+    event: Optional[str] = None
+    data: Optional[Dict[str, Any]] = None
+    retry: Optional[int] = None
+
+
+def _decode(raw: str) -> BoardEvent:
+    return utils.unmarshal_json(raw, BoardEvent)
+
+
+class BoardEvents(BaseSDK):
+    def _stream_request(
+        self,
+        organization_id: str,
+        board_config_id: OptionalNullable[str],
+        server_url: Optional[str],
+        timeout_ms: Optional[int],
+        http_headers: Optional[Mapping[str, str]],
+        build,
+    ):
+        base_url = server_url if server_url is not None else self._get_url(None, None)
+        req = build(
+            method="GET",
+            path="/api/v1/events",
+            base_url=base_url,
+            url_variables=None,
+            request=StreamBoardEventsRequest(
+                organization_id=organization_id,
+                board_config_id=board_config_id,
+            ),
+            request_body_required=False,
+            request_has_path_params=False,
+            request_has_query_params=True,
+            user_agent_header="user-agent",
+            accept_header_value="text/event-stream",
+            http_headers=http_headers,
+            security=self.sdk_configuration.security,
+            timeout_ms=timeout_ms,
+        )
+        hook_ctx = HookContext(
+            config=self.sdk_configuration,
+            base_url=base_url or "",
+            operation_id="stream_board_events_api_v1_events_get",
+            oauth2_scopes=[],
+            security_source=get_security_from_env(
+                self.sdk_configuration.security, models.Security
+            ),
+        )
+        return req, hook_ctx
+
+    def stream(
+        self,
+        *,
+        organization_id: str,
+        board_config_id: OptionalNullable[str] = UNSET,
+        server_url: Optional[str] = None,
+        timeout_ms: Optional[int] = None,
+        http_headers: Optional[Mapping[str, str]] = None,
+    ) -> EventStream[BoardEvent]:
+        r"""Stream Board Events
+
+        Open the server-sent events stream of an organization (or one board).
+        Iterate the returned stream and close it (or use it as a context
+        manager) when done.
+
+        :param organization_id: Organization ID to scope the request
+        :param board_config_id: Only stream events of this board (plus organization-wide events)
+        :param server_url: Override the default server URL for this method
+        :param timeout_ms: Override the default request timeout configuration for this method in milliseconds
+        :param http_headers: Additional headers to set or replace on requests.
+        """
+        req, hook_ctx = self._stream_request(
+            organization_id, board_config_id, server_url, timeout_ms, http_headers, self._build_request
+        )
+        http_res = self.do_request(
+            hook_ctx=hook_ctx,
+            request=req,
+            error_status_codes=["403", "404", "422", "4XX", "5XX"],
+            stream=True,
+        )
+
+        if utils.match_response(http_res, "200", "text/event-stream"):
+            return EventStream(http_res, _decode)
+        http_res_text = utils.stream_to_text(http_res)
+        raise errors.APIError("API error occurred", http_res, http_res_text)
+
+    async def stream_async(
+        self,
+        *,
+        organization_id: str,
+        board_config_id: OptionalNullable[str] = UNSET,
+        server_url: Optional[str] = None,
+        timeout_ms: Optional[int] = None,
+        http_headers: Optional[Mapping[str, str]] = None,
+    ) -> EventStreamAsync[BoardEvent]:
+        r"""Stream Board Events
+
+        Asynchronous variant of :meth:`stream`.
+
+        :param organization_id: Organization ID to scope the request
+        :param board_config_id: Only stream events of this board (plus organization-wide events)
+        :param server_url: Override the default server URL for this method
+        :param timeout_ms: Override the default request timeout configuration for this method in milliseconds
+        :param http_headers: Additional headers to set or replace on requests.
+        """
+        req, hook_ctx = self._stream_request(
+            organization_id, board_config_id, server_url, timeout_ms, http_headers, self._build_request_async
+        )
+        http_res = await self.do_request_async(
+            hook_ctx=hook_ctx,
+            request=req,
+            error_status_codes=["403", "404", "422", "4XX", "5XX"],
+            stream=True,
+        )
+
+        if utils.match_response(http_res, "200", "text/event-stream"):
+            return EventStreamAsync(http_res, _decode)
+        http_res_text = await utils.stream_to_text_async(http_res)
+        raise errors.APIError("API error occurred", http_res, http_res_text)
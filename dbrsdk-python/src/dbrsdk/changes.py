@@ -0,0 +1,238 @@
+"""Organization change log (GET /api/v1/organizations/{org_id}/changes).
+
+Not generated: besides the raw ``list`` call this module provides
+``OrganizationReplica``, which keeps a local copy of an organization's
+collections, work items and schedules current by fetching only what changed
+since its cursor.
+"""
+
+from .basesdk import BaseSDK
+from dbrsdk import errors, models, utils
+from dbrsdk._hooks import HookContext
+from dbrsdk.types import BaseModel
+from dbrsdk.utils import FieldMetadata, PathParamMetadata, QueryParamMetadata
+from dbrsdk.utils import get_security_from_env
+from dbrsdk.utils.unmarshal_json_response import unmarshal_json_response
+from typing import Any, Dict, List, Mapping, Optional, TYPE_CHECKING
+from typing_extensions import Annotated
+
+if TYPE_CHECKING:
+    from dbrsdk.sdk import Dbrsdk
+
+
+class GetOrganizationChangesRequest(BaseModel):
+    org_id: Annotated[
+        str, FieldMetadata(path=PathParamMetadata(style="simple", explode=False))
+    ]
+
+    since: Annotated[
+        int, FieldMetadata(query=QueryParamMetadata(style="form", explode=True))
+    ] = 0
+    r"""Return changes after this sequence number (next_since of the previous page)"""
+
+    limit: Annotated[
+        int, FieldMetadata(query=QueryParamMetadata(style="form", explode=True))
+    ] = 500
+    r"""Maximum number of change log entries to read"""
+
+
+class Change(BaseModel):
+    r"""Latest change of one entity within a page; ``data`` is None for deletes."""
+
+    seq: int
+    entity_type: str
+    entity_id: str
+    op: str
+    data: Optional[Dict[str, Any]] = None
+
+
+class ChangesResponse(BaseModel):
+    organization_id: str
+    changes: List[Change]
+    next_since: int
+    has_more: bool
+
+
+class Changes(BaseSDK):
+    def _list_request(
+        self,
+        org_id: str,
+        since: int,
+        limit: int,
+        server_url: Optional[str],
+        timeout_ms: Optional[int],
+        http_headers: Optional[Mapping[str, str]],
+        build,
+    ):
+        if timeout_ms is None:
+            timeout_ms = self.sdk_configuration.timeout_ms
+        base_url = server_url if server_url is not None else self._get_url(None, None)
+        req = build(
+            method="GET",
+            path="/api/v1/organizations/{org_id}/changes",
+            base_url=base_url,
+            url_variables=None,
+            request=GetOrganizationChangesRequest(org_id=org_id, since=since, limit=limit),
+            request_body_required=False,
+            request_has_path_params=True,
+            request_has_query_params=True,
+            user_agent_header="user-agent",
+            accept_header_value="application/json",
+            http_headers=http_headers,
+            security=self.sdk_configuration.security,
+            timeout_ms=timeout_ms,
+        )
+        hook_ctx = HookContext(
+            config=self.sdk_configuration,
+            base_url=base_url or "",
+            operation_id="get_organization_changes_api_v1_organizations__org_id__changes_get",
+            oauth2_scopes=[],
+            security_source=get_security_from_env(
+                self.sdk_configuration.security, models.Security
+            ),
+        )
+        return req, hook_ctx
+
+    def _handle_response(self, http_res) -> ChangesResponse:
+        if utils.match_response(http_res, "200", "application/json"):
+            return unmarshal_json_response(ChangesResponse, http_res)
+        if utils.match_response(http_res, "422", "application/json"):
+            response_data = unmarshal_json_response(
+                errors.HTTPValidationErrorData, http_res
+            )
+            raise errors.HTTPValidationError(response_data, http_res)
+        raise errors.APIError("API error occurred", http_res, http_res.text)
+
+    def list(
+        self,
+        *,
+        org_id: str,
+        since: int = 0,
+        limit: int = 500,
+        server_url: Optional[str] = None,
+        timeout_ms: Optional[int] = None,
+        http_headers: Optional[Mapping[str, str]] = None,
+    ) -> ChangesResponse:
+        r"""Get Organization Changes
+
+        Get collections, work items and schedules changed since a change log
+        cursor. Start with ``since=0`` and pass ``next_since`` back until
+        ``has_more`` is false.
+
+        :param org_id:
+        :param since: Return changes after this sequence number (next_since of the previous page)
+        :param limit: Maximum number of change log entries to read
+        :param server_url: Override the default server URL for this method
+        :param timeout_ms: Override the default request timeout configuration for this method in milliseconds
+        :param http_headers: Additional headers to set or replace on requests.
+        """
+        req, hook_ctx = self._list_request(
+            org_id, since, limit, server_url, timeout_ms, http_headers, self._build_request
+        )
+        http_res = self.do_request(
+            hook_ctx=hook_ctx,
+            request=req,
+            error_status_codes=["422", "4XX", "5XX"],
+        )
+        return self._handle_response(http_res)
+
+    async def list_async(
+        self,
+        *,
+        org_id: str,
+        since: int = 0,
+        limit: int = 500,
+        server_url: Optional[str] = None,
+        timeout_ms: Optional[int] = None,
+        http_headers: Optional[Mapping[str, str]] = None,
+    ) -> ChangesResponse:
+        r"""Get Organization Changes
+
+        Asynchronous variant of :meth:`list`.
+
+        :param org_id:
+        :param since: Return changes after this sequence number (next_since of the previous page)
+        :param limit: Maximum number of change log entries to read
+        :param server_url: Override the default server URL for this method
+        :param timeout_ms: Override the default request timeout configuration for this method in milliseconds
+        :param http_headers: Additional headers to set or replace on requests.
+        """
+        req, hook_ctx = self._list_request(
+            org_id, since, limit, server_url, timeout_ms, http_headers, self._build_request_async
+        )
+        http_res = await self.do_request_async(
+            hook_ctx=hook_ctx,
+            request=req,
+            error_status_codes=["422", "4XX", "5XX"],
+        )
+        return self._handle_response(http_res)
+
+
+class OrganizationReplica:
+    r"""Local copy of an organization's collections, work items and schedules.
+
+    Entities are kept as the API's response dicts, keyed by ID. ``cursor`` is
+    the last applied change log sequence number; persist it together with the
+    entities to resume syncing later without a full download.
+
+        replica = OrganizationReplica(sdk, org_id)
+        replica.sync()              # full copy on first call
+        ...
+        replica.sync()              # only what changed since
+    """
+
+    def __init__(self, sdk: "Dbrsdk", org_id: str, cursor: int = 0, page_size: int = 500):
+        self.sdk = sdk
+        self.org_id = org_id
+        self.cursor = cursor
+        self.page_size = page_size
+        self.entities: Dict[str, Dict[str, Dict[str, Any]]] = {
+            "collection": {},
+            "work_item": {},
+            "schedule": {},
+        }
+
+    @property
+    def collections(self) -> Dict[str, Dict[str, Any]]:
+        return self.entities["collection"]
+
+    @property
+    def work_items(self) -> Dict[str, Dict[str, Any]]:
+        return self.entities["work_item"]
+
+    @property
+    def schedules(self) -> Dict[str, Dict[str, Any]]:
+        return self.entities["schedule"]
+
+    def apply(self, page: ChangesResponse) -> List[Change]:
+        r"""Apply one page of changes and advance the cursor"""
+        for change in page.changes:
+            entities = self.entities.setdefault(change.entity_type, {})
+            if change.op == "delete" or change.data is None:
+                entities.pop(change.entity_id, None)
+            else:
+                entities[change.entity_id] = change.data
+        self.cursor = page.next_since
+        return page.changes
+
+    def sync(self, **kwargs) -> List[Change]:
+        r"""Fetch and apply every change since the cursor; returns the applied changes"""
+        applied: List[Change] = []
+        while True:
+            page = self.sdk.changes.list(
+                org_id=self.org_id, since=self.cursor, limit=self.page_size, **kwargs
+            )
+            applied.extend(self.apply(page))
+            if not page.has_more:
+                return applied
+
+    async def sync_async(self, **kwargs) -> List[Change]:
+        r"""Asynchronous variant of :meth:`sync`"""
+        applied: List[Change] = []
+        while True:
+            page = await self.sdk.changes.list_async(
+                org_id=self.org_id, since=self.cursor, limit=self.page_size, **kwargs
+            )
+            applied.extend(self.apply(page))
+            if not page.has_more:
+                return applied
@@ -16,6 +16,9 @@ import weakref
 if TYPE_CHECKING:
     from dbrsdk.apihealth import APIHealth
     from dbrsdk.authentication import Authentication
+    from dbrsdk.board_events import BoardEvents
+    from dbrsdk.changes import Changes
+    from dbrsdk.batch import Batch
     from dbrsdk.collections import Collections
     from dbrsdk.health import Health
     from dbrsdk.memberships import Memberships
@@ -41,6 +44,9 @@ class Dbrsdk(BaseSDK):
     root: "Root"
     health: "Health"
     api_health: "APIHealth"
+    board_events: "BoardEvents"
+    changes: "Changes"
+    batch: "Batch"
     _sub_sdk_map = {
         "work_items": ("dbrsdk.workitems", "WorkItems"),
         "collections": ("dbrsdk.collections", "Collections"),
@@ -53,6 +59,9 @@ class Dbrsdk(BaseSDK):
         "root": ("dbrsdk.root", "Root"),
         "health": ("dbrsdk.health", "Health"),
         "api_health": ("dbrsdk.apihealth", "APIHealth"),
+        "board_events": ("dbrsdk.board_events", "BoardEvents"),
+        "changes": ("dbrsdk.changes", "Changes"),
+        "batch": ("dbrsdk.batch", "Batch"),
     }
 
     def __init__(
@@ -66,6 +75,7 @@ class Dbrsdk(BaseSDK):
         retry_config: OptionalNullable[RetryConfig] = UNSET,
         timeout_ms: Optional[int] = None,
         debug_logger: Optional[Logger] = None,
+        etag_cache: bool = False,
     ) -> None:
         r"""Instantiates the SDK configuring it with the provided parameters.
 
@@ -77,6 +87,7 @@ class Dbrsdk(BaseSDK):
         :param async_client: The Async HTTP client to use for all asynchronous methods
         :param retry_config: The retry configuration to use for all supported methods
         :param timeout_ms: Optional request timeout applied to each operation in milliseconds
+        :param etag_cache: Send If-None-Match on GET requests and replay cached bodies on 304 Not Modified
         """
         client_supplied = True
         if client is None:
@@ -126,7 +137,7 @@ class Dbrsdk(BaseSDK):
             ),
         )
 
-        hooks = SDKHooks()
+        hooks = SDKHooks(etag_cache=etag_cache)
 
         # pylint: disable=protected-access
         self.sdk_configuration.__dict__["_hooks"] = hooks
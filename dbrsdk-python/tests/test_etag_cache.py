@@ -0,0 +1,37 @@
+import httpx
+import pytest
+from dbrsdk import Dbrsdk
+
+
+def _client(seen_requests):
+    """An httpx client whose server tags every body with the same ETag"""
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen_requests.append(request)
+        if request.headers.get("if-none-match") == 'W/"v1"':
+            return httpx.Response(304, headers={"ETag": 'W/"v1"'})
+        return httpx.Response(200, json={"status": "healthy"}, headers={"ETag": 'W/"v1"'})
+
+    return httpx.Client(transport=httpx.MockTransport(handler))
+
+
+@pytest.mark.parametrize("etag_cache", [False, True])
+def test_etag_cache_is_opt_in(etag_cache):
+    seen_requests = []
+    sdk = Dbrsdk(server_url="http://dbr.test", client=_client(seen_requests), etag_cache=etag_cache)
+
+    assert sdk.health.get() == {"status": "healthy"}
+    assert sdk.health.get() == {"status": "healthy"}
+
+    sent_tags = [request.headers.get("if-none-match") for request in seen_requests]
+    assert sent_tags == ([None, 'W/"v1"'] if etag_cache else [None, None])
+
+
+def test_etag_cache_is_off_by_default():
+    seen_requests = []
+    sdk = Dbrsdk(server_url="http://dbr.test", client=_client(seen_requests))
+
+    sdk.health.get()
+    sdk.health.get()
+
+    assert all("if-none-match" not in request.headers for request in seen_requests)